@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generator hot paths.
+- Times the per-record EMS and multi-agency generator methods and a scaled-down generate_all_data
+- Reports records/sec, peak RSS and allocations per record
+- Compares against benchmark_baseline.json so regressions show up
+
+Every benchmark runs in its own subprocess (clean peak RSS, cold caches), offline
+(no network geocoding) and under a fixed seed, so each run does the same work.
+
+Usage:
+  python benchmark_generators.py                    # run everything, compare to the baseline
+  python benchmark_generators.py ems_incident person
+  python benchmark_generators.py --update-baseline  # store this run as the new baseline
+"""
+import os
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import subprocess
+import tracemalloc
+import contextlib
+from datetime import datetime
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+BENCH_SEED = 1234
+# Fixed "now" for the EMS generator so call times (and everything drawn from them) repeat
+BENCH_REFERENCE_TIME = datetime(2025, 1, 1)
+
+# Timed passes per benchmark; the fastest one is reported (least disturbed by other load)
+TIMING_REPEATS = 5
+
+# A change counts as a regression when throughput drops, or memory grows, by more than this
+DEFAULT_TOLERANCE = 0.25
+
+# generate_all_data runs at CONFIG sizes divided by this
+ALL_DATA_SCALE = 200
+
+# Records per entity type loaded by each sqlite_export call
+EXPORT_RECORDS = 2000
+
+# Narrative stage against the bundled Ollama stub: prompts per call and stub seconds per request
+NARRATIVE_PROMPTS = 40
+NARRATIVE_LATENCY = 0.05
+
+
+def _ems_generator(fast_vocabulary=False):
+    from ids import IdService
+    from ems_data_generator import EMSDataGenerator
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator = EMSDataGenerator(fast_vocabulary=fast_vocabulary)
+        generator._reference_time = BENCH_REFERENCE_TIME
+        generator._ids = IdService(BENCH_SEED)
+        generator._reseed(BENCH_SEED)
+        generator._load_address_library()
+    return generator
+
+
+def _multi_agency_generator(fast_vocabulary=False):
+    import synthetic_data
+    if fast_vocabulary:
+        synthetic_data.use_fast_vocabulary(BENCH_SEED)
+    random.seed(BENCH_SEED)
+    synthetic_data.fake.seed_instance(BENCH_SEED)
+    return synthetic_data.EnhancedDataGenerator()
+
+
+def bench_ems_incident():
+    generator = _ems_generator()
+    return lambda: generator.generate_ems_incident()
+
+
+def bench_ems_incident_fast():
+    generator = _ems_generator(fast_vocabulary=True)
+    return lambda: generator.generate_ems_incident()
+
+
+def bench_ems_patient():
+    generator = _ems_generator()
+    incidents = [generator.generate_ems_incident() for _ in range(50)]
+    return lambda: generator.generate_ems_patient(random.choice(incidents))
+
+
+def bench_ems_medication():
+    generator = _ems_generator()
+    incidents = [generator.generate_ems_incident() for _ in range(50)]
+    return lambda: generator.generate_ems_medication(random.choice(incidents))
+
+
+def bench_ems_report():
+    generator = _ems_generator()
+    linked = []
+    for _ in range(50):
+        incident = generator.generate_ems_incident()
+        linked.append((incident, [generator.generate_ems_medication(incident)], generator.generate_ems_patient(incident)))
+    return lambda: generator.generate_ems_report(*random.choice(linked))
+
+
+def bench_person():
+    generator = _multi_agency_generator()
+    return lambda: generator.generate_person(random.choice(['KCSO', 'BELLEVUE_PD']))
+
+
+def bench_person_fast():
+    generator = _multi_agency_generator(fast_vocabulary=True)
+    return lambda: generator.generate_person(random.choice(['KCSO', 'BELLEVUE_PD']))
+
+
+def bench_cad_incident():
+    generator = _multi_agency_generator()
+    return lambda: generator.generate_cad_incident()
+
+
+def bench_cad_incident_fast():
+    generator = _multi_agency_generator(fast_vocabulary=True)
+    return lambda: generator.generate_cad_incident()
+
+
+def bench_vehicle():
+    generator = _multi_agency_generator()
+    return lambda: generator.generate_vehicle(None)
+
+
+def bench_arrest():
+    generator = _multi_agency_generator()
+    persons = [generator.generate_person() for _ in range(50)]
+    incidents = [generator.generate_police_incident() for _ in range(50)]
+    return lambda: generator.generate_arrest(random.choice(incidents), random.choice(persons))
+
+
+def bench_jail_booking():
+    generator = _multi_agency_generator()
+    persons = [generator.generate_person() for _ in range(20)]
+    incidents = [generator.generate_police_incident() for _ in range(20)]
+    arrests = [generator.generate_arrest(random.choice(incidents), random.choice(persons)) for _ in range(50)]
+
+    def run():
+        arrest = random.choice(arrests)
+        return generator.generate_jail_booking(arrest.person_id, arrest.arrest_id, arrest.agency)
+    return run
+
+
+def bench_all_data():
+    """Whole generate_all_data at CONFIG / ALL_DATA_SCALE; one call = every record it makes"""
+    import synthetic_data
+    for key, value in list(synthetic_data.CONFIG.items()):
+        if key.startswith('num_'):
+            synthetic_data.CONFIG[key] = max(1, value // ALL_DATA_SCALE)
+    synthetic_data.CONFIG['output_formats'] = []
+    synthetic_data.CONFIG['stage_workers'] = 1  # Stage chunks in this process, so timings and memory cover them
+
+    def run():
+        generator = _multi_agency_generator()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.generate_all_data()
+        return sum(len(getattr(generator, entity_type)) for entity_type in synthetic_data.ENTITY_TYPES)
+    return run
+
+
+def bench_sqlite_export():
+    """record_io.SqliteDatabase load of EXPORT_RECORDS persons, vehicles and police incidents; one call = all of them"""
+    import tempfile
+    import synthetic_data
+    from record_io import SqliteDatabase
+    generator = _multi_agency_generator()
+    tables = {
+        'persons': [generator.generate_person() for _ in range(EXPORT_RECORDS)],
+        'vehicles': [generator.generate_vehicle(None) for _ in range(EXPORT_RECORDS)],
+        'police_incidents': [generator.generate_police_incident() for _ in range(EXPORT_RECORDS)],
+    }
+    path = os.path.join(tempfile.mkdtemp(prefix='bench_export_'), 'export.db')
+
+    def run():
+        with SqliteDatabase(path) as database:
+            for table, records in tables.items():
+                database.writer(table, synthetic_data.ENTITY_TYPES[table]).write_many(records)
+        return sum(len(records) for records in tables.values())
+    return run
+
+
+def bench_ollama_narratives():
+    """generate_ems_reports.iter_narratives against ollama_stub; one call = NARRATIVE_PROMPTS narratives"""
+    import generate_ems_reports
+    from ollama_stub import serve_in_thread
+    _, generate_ems_reports.OLLAMA_URL = serve_in_thread(latency=NARRATIVE_LATENCY)
+    session = generate_ems_reports.ollama_session()
+    jobs = [(i, f"Prompt {i}") for i in range(NARRATIVE_PROMPTS)]
+    return lambda: sum(1 for _ in generate_ems_reports.iter_narratives(jobs, session=session))
+
+
+# name -> (setup returning a zero-arg callable, calls timed, calls traced for allocations).
+# A callable returning an int reports that many records per call (end-to-end benchmarks).
+BENCHMARKS = {
+    'ems_incident': (bench_ems_incident, 500, 100),
+    'ems_incident_fast': (bench_ems_incident_fast, 500, 100),
+    'ems_patient': (bench_ems_patient, 2000, 200),
+    'ems_medication': (bench_ems_medication, 5000, 500),
+    'ems_report': (bench_ems_report, 2000, 200),
+    'person': (bench_person, 1000, 200),
+    'person_fast': (bench_person_fast, 1000, 200),
+    'cad_incident': (bench_cad_incident, 2000, 200),
+    'cad_incident_fast': (bench_cad_incident_fast, 2000, 200),
+    'vehicle': (bench_vehicle, 2000, 200),
+    'arrest': (bench_arrest, 2000, 200),
+    'jail_booking': (bench_jail_booking, 2000, 200),
+    'all_data': (bench_all_data, 1, 1),
+    'sqlite_export': (bench_sqlite_export, 3, 1),
+    'ollama_narratives': (bench_ollama_narratives, 1, 1),
+}
+
+
+def _run_calls(func, calls, keep=None):
+    """Call func `calls` times (appending results to keep, if given); returns the number of records produced"""
+    records = 0
+    for _ in range(calls):
+        result = func()
+        records += result if isinstance(result, int) else 1
+        if keep is not None:
+            keep.append(result)
+    return records
+
+
+def run_benchmark(name):
+    """Run one benchmark in this process and return its measurements"""
+    setup, timed_calls, traced_calls = BENCHMARKS[name]
+    func = setup()
+    _run_calls(func, min(10, timed_calls))  # Warm up caches and lazy imports
+
+    elapsed = None
+    for _ in range(TIMING_REPEATS):
+        start = time.perf_counter()
+        records = _run_calls(func, timed_calls)
+        seconds = time.perf_counter() - start
+        elapsed = seconds if elapsed is None else min(elapsed, seconds)
+
+    # Allocation pass is separate (tracemalloc slows every allocation down) and keeps
+    # its records alive, so the numbers are what each generated record costs to hold
+    kept = []
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    traced_records = _run_calls(func, traced_calls, kept)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+
+    return {
+        'records': records,
+        'seconds': round(elapsed, 4),
+        'records_per_sec': round(records / elapsed, 1),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'alloc_kb_per_record': round(traced_peak / 1024 / traced_records, 2),
+        'alloc_blocks_per_record': round((blocks_after - blocks_before) / traced_records, 1),
+    }
+
+
+def run_isolated(name):
+    """Run one benchmark in a fresh interpreter"""
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', name],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Benchmark {name} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regression messages against the baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result['records_per_sec'] < base['records_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: {result['records_per_sec']:,.0f} records/sec "
+                               f"vs baseline {base['records_per_sec']:,.0f}")
+        for key in ('peak_rss_mb', 'alloc_kb_per_record'):
+            if result[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {result[key]} vs baseline {base[key]}")
+    return regressions
+
+
+def print_results(results, baseline):
+    print(f"{'benchmark':<16}{'records/sec':>14}{'baseline':>12}{'change':>9}{'peak RSS MB':>13}"
+          f"{'alloc KB/rec':>14}{'blocks/rec':>12}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        base_rate = f"{base['records_per_sec']:,.0f}" if base else '-'
+        change = f"{result['records_per_sec'] / base['records_per_sec'] - 1:+.0%}" if base else '-'
+        print(f"{name:<16}{result['records_per_sec']:>14,.0f}{base_rate:>12}{change:>9}"
+              f"{result['peak_rss_mb']:>13}{result['alloc_kb_per_record']:>14}{result['alloc_blocks_per_record']:>12}")
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('benchmarks', {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'machine': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'processor': platform.processor() or platform.machine(),
+                'cpu_count': os.cpu_count(),
+            },
+            'recorded': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'benchmarks': results,
+        }, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('benchmarks', nargs='*', help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed relative slowdown / memory growth before a regression is reported')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_benchmark(args.worker)))
+        return 0
+
+    names = args.benchmarks or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        print(f"Running {name}...", file=sys.stderr)
+        results[name] = run_isolated(name)
+
+    baseline = load_baseline()
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        save_baseline({**baseline, **results})
+        print(f"\nBaseline updated: {BASELINE_PATH}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions (tolerance {args.tolerance:.0%}):")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print("\nNo regressions against baseline" if baseline else "\nNo baseline yet; run with --update-baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
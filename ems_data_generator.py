@@ -9,18 +9,18 @@ This module contains all EMS-specific data generation functionality including:
 """
 
 import random
-import uuid
 import os
 import json
-import numpy as np
-import pandas as pd
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-from faker import Faker
+from typing import Any, ClassVar, List, Dict, Optional
 from collections import deque
+from bisect import bisect_right, insort
 import threading
-import multiprocessing as mp
+from record_io import (DEFAULT_RECORD_FORMAT, intern_fields, open_record_writer, record_accessors, record_path,
+                       record_to_dict)
+from metrics import METRICS
+from ids import IdService
 
 # SDV imports removed for performance
 
@@ -70,8 +70,1158 @@ EMS_INCIDENT_CODES = {
     '2301083': 'Airmedical Transport'
 }
 
-@dataclass
+# CAD level of care distribution (synthetic)
+CAD_LEVEL_DISTRIBUTION = {
+    'BLS': 0.70,    # Most common
+    'AEMT': 0.27,   # Second most common
+    'P': 0.012,     # Third most common
+    'I/P': 0.011,   # Fourth most common
+    'AP': 0.006     # Least common
+}
+
+# Dispatched provider type distribution by CAD level of care (synthetic)
+PROVIDER_TYPE_DISTRIBUTIONS = {
+    'BLS': {
+        'ALS': 0.20, 'BLS': 0.17, 'BLS-EMT': 0.11, 'PARAMEDIC': 0.15,
+        'INTERMEDIATE_1': 0.03, 'AEMT/EMT': 0.017, 'INTERMEDIATE_2': 0.006,
+        'EMT': 0.0007, 'BLS-EMR': 0.0003, 'NAN': 0.003, 'No_value': 0.002,
+        'SPECIALTY_Other': 0.0002, 'NURSE_INTERMEDIATE': 0.000006, 'PHYSICIAN': 0.00004
+    },
+    'AEMT': {
+        'ALS': 0.23, 'PARAMEDIC': 0.12, 'BLS-EMT': 0.07, 'BLS': 0.06,
+        'INTERMEDIATE_1': 0.025, 'AEMT/EMT': 0.014, 'INTERMEDIATE_2': 0.006,
+        'EMT': 0.0006, 'BLS-EMR': 0.0003, 'No_value': 0.001, 'NAN': 0.0002,
+        'SPECIALTY_Other': 0.0002, 'NURSE_INTERMEDIATE': 0.000015, 'PHYSICIAN': 0.000035
+    },
+    'P': {
+        'ALS': 0.51, 'PARAMEDIC': 0.30, 'BLS-EMT': 0.11, 'INTERMEDIATE_1': 0.039,
+        'AEMT/EMT': 0.015, 'INTERMEDIATE_2': 0.004, 'BLS': 0.013, 'EMT': 0.0009,
+        'BLS-EMR': 0.0004, 'No_value': 0.001, 'SPECIALTY_Other': 0.0015, 'PHYSICIAN': 0.0005,
+        'NAN': 0.0, 'NURSE_INTERMEDIATE': 0.0
+    },
+    'I/P': {
+        'ALS': 0.50, 'PARAMEDIC': 0.25, 'BLS-EMT': 0.13, 'INTERMEDIATE_1': 0.049,
+        'AEMT/EMT': 0.017, 'INTERMEDIATE_2': 0.007, 'BLS': 0.044, 'EMT': 0.0005,
+        'BLS-EMR': 0.0003, 'No_value': 0.001, 'NAN': 0.0003, 'SPECIALTY_Other': 0.0008,
+        'PHYSICIAN': 0.0003, 'NURSE_INTERMEDIATE': 0.0
+    },
+    'AP': {
+        'ALS': 0.57, 'PARAMEDIC': 0.24, 'BLS-EMT': 0.09, 'INTERMEDIATE_1': 0.027,
+        'AEMT/EMT': 0.023, 'INTERMEDIATE_2': 0.014, 'BLS': 0.017, 'EMT': 0.001,
+        'BLS-EMR': 0.0005, 'No_value': 0.007, 'NAN': 0.004, 'SPECIALTY_Other': 0.008,
+        'PHYSICIAN': 0.0007, 'NURSE_INTERMEDIATE': 0.0
+    }
+}
+
+# Patient acuity distribution (synthetic)
+PATIENT_ACUITY_DISTRIBUTION = {
+    'EMERGENT': 0.999,
+    'CRITICAL': 0.0003,
+    'LOWER ACUITY': 0.0009,
+    'SCHEDULED TRANSFER OR STANDBY': 0.0002
+}
+
+# Situation acuity distribution by patient acuity (synthetic)
+SITUATION_ACUITY_DISTRIBUTIONS = {
+    'EMERGENT': {
+        'EMERGENT': 0.79, 'CRITICAL (R)': 0.018, 'LOWER ACU': 0.12, 'No value': 0.065,
+        'DEAD WITH': 0.002, 'DECEASED': 0.002, 'NOT APPLIC': 0.004, 'NOT RECOR': 0.0009
+    },
+    'CRITICAL': {
+        'EMERGENT': 0.50, 'CRITICAL (R)': 0.46, 'LOWER ACU': 0.016, 'DEAD WITH': 0.016,
+        'DECEASED': 0.0, 'NOT APPLIC': 0.0, 'NOT RECOR': 0.0, 'No value': 0.0
+    },
+    'LOWER ACUITY': {
+        'LOWER ACU': 0.36, 'EMERGENT': 0.63, 'CRITICAL (R)': 0.003, 'No value': 0.003,
+        'DEAD WITH': 0.003, 'DECEASED': 0.0, 'NOT APPLIC': 0.0, 'NOT RECOR': 0.0
+    },
+    'SCHEDULED TRANSFER OR STANDBY': {
+        'EMERGENT': 0.81, 'LOWER ACU': 0.16, 'NOT APPLIC': 0.027, 'CRITICAL (R)': 0.0,
+        'DEAD WITH': 0.0, 'DECEASED': 0.0, 'NOT RECOR': 0.0, 'No value': 0.0
+    }
+}
+
+# Patient disposition distribution (synthetic)
+PATIENT_DISPOSITION_DISTRIBUTION = {
+    'TREATED, TRANSPORTED BY THIS EMS UNIT': 0.377,  # Most common
+    'UNIT ASSIST (MANPOWER ONLY)': 0.175,            # Very common
+    'CANCELED (PRIOR TO ARRIVAL AT SCENE)': 0.098,   # Common
+    'PATIENT REFUSAL': 0.091,                        # Common
+    'TREATED, TRANSFERRED CARE': 0.066,              # Common
+    'CANCELED ON SCENE (NO PATIENT CONTACT)': 0.063, # Common
+    'STANDBY (FIRE, EMS OPS, OR PUBLIC SAFTEY EVENT)': 0.021,  # Uncommon
+    'CANCELED (NO PATIENT FOUND)': 0.029,            # Uncommon
+    'TREATED, TRANSPORTED WITH THIS EMS PROVIDER IN ANOTHER VEHICLE': 0.020,  # Uncommon
+    'COMMAND / SUPERVISION ONLY': 0.013,             # Uncommon
+    'CARDIAC ARREST - RESUSCITATION ATTEMPTED (NOT TRANSPORTED)': 0.007,     # Rare
+    'DEAD ON ARRIVAL': 0.005,                        # Rare
+    'PERSON EVALUATED - NO EMS REQUIRED': 0.005,     # Rare
+    'TRANSPORTED TO LANDING ZONE, CARE TRANSFERRED': 0.0002,  # Very rare
+    'MUTUAL AID TX & TRANSPORT': 0.000003            # Extremely rare
+}
+
+# Complaint reported by dispatch distribution (synthetic)
+DISPATCH_COMPLAINT_DISTRIBUTION = {
+    'TRAFFIC/TRANSPORTATION INCIDENT': 0.123,      # Most common
+    'SICK PERSON': 0.136,                          # Most common
+    'FALLS': 0.097,                               # Very common
+    'UNCONSCIOUS/FAINTING/NEAR-FAINTING': 0.072,  # Very common
+    'BREATHING PROBLEM': 0.077,                   # Very common
+    'CARDIAC ARREST/DEATH': 0.054,               # Common
+    'CHEST PAIN (NON-TRAUMATIC)': 0.048,         # Common
+    'STROKE/CVA': 0.017,                          # Common
+    'SEIZURE': 0.025,                             # Common
+    'HEMORRHAGE/LACERATION': 0.023,               # Common
+    'FIRE': 0.023,                                # Common
+    'ASSAULT': 0.012,                             # Common
+    'OVERDOSE/POISONING/INGESTION': 0.011,        # Common
+    'PANDEMIC - COVID19': 0.014,                  # Common
+    'PSYCHIATRIC PROBLEM/ABNORMAL E': 0.013,      # Common
+    'PUBLIC SERVICE': 0.014,                      # Common
+    'MEDICAL ALARM': 0.016,                       # Common
+    'HEART PROBLEMS': 0.018,                      # Common
+    'ABDOMINAL PAIN/PROBLEMS': 0.018,             # Common
+    'ALLERGIC REACTION/STINGS': 0.012,           # Common
+    'DIABETIC PROBLEM': 0.010,                    # Common
+    'HAZARD INVESTIGATION': 0.010,                # Common
+    'BACK PAIN (NON-TRAUMATIC)': 0.008,          # Uncommon
+    'UNKNOWN PROBLEM/PERSON DOWN': 0.008,        # Uncommon
+    'CHOKING': 0.005,                             # Uncommon
+    'PREGANCY/CHILDBIRTH/MISCARRIA': 0.003,      # Uncommon
+    'HEADACHE': 0.004,                            # Uncommon
+    'TECHNICAL RESCUE': 0.004,                    # Uncommon
+    'INVESTIGATION': 0.004,                       # Uncommon
+    'HEAT/COLD EXPOSURE': 0.002,                   # Uncommon
+    'WATER RESCUE': 0.001,                         # Uncommon
+    'HAZARDOUS MATERIALS INCIDENT': 0.001,        # Uncommon
+    'TRAUMATIC INJURY': 0.021,                    # Common
+    'GUNSHOT': 0.001,                              # Uncommon
+    'STAB/GUNSHOT WOUND/PENETRATIN': 0.001,       # Uncommon
+    'ASSAULT - SEXUAL': 0.0007,                     # Uncommon
+    'EYE PROBLEM/INJURY': 0.0007,                   # Uncommon
+    'INDUSTRIAL ACCIDENT (INCLUDES EN': 0.0007,    # Uncommon
+    'HAZARDOUS CONDITION': 0.0006,                  # Uncommon
+    'DROWNING': 0.0005,                             # Uncommon
+    'COMMERCIAL FIRE ALARM': 0.0005,               # Uncommon
+    'STANDBY': 0.0004,                              # Uncommon
+    'CARBON MONOXIDE/HAZMAT/INHAL': 0.0004,        # Uncommon
+    'BURNS/EXPLOSION': 0.001,                      # Uncommon
+    'RESIDENTIAL FIRE ALARM': 0.0003,              # Uncommon
+    'AIRCRAFT DOWN': 0.0003,                        # Uncommon
+    'TASER SHOCK': 0.0003,                          # Uncommon
+    'WELL PERSON CHECK': 0.0003,                    # Uncommon
+    'BARIATRIC PATIENT': 0.0001,                     # Uncommon
+    'HANGING': 0.0001,                               # Uncommon
+    'AIRMEDICAL TRANSPORT': 0.0001,                  # Uncommon
+    'PAIN': 0.0001,                                  # Uncommon
+    'RESPIRATORY ARREST': 0.0001,                    # Uncommon
+    'AUTO VS. PEDESTRIAN': 0.00008,                   # Uncommon
+    'AUTOMATED CRASH NOTIFICATION': 0.00008,         # Uncommon
+    'MOTORCYCLE COLLISION': 0.00002,                   # Uncommon
+    'EPISTAXIS (NOSEBLEED)': 0.00002,                  # Uncommon
+    'PENETRATING WOUNDS': 0.00001,                     # Uncommon
+    'SEARCH AND RESCUE': 0.00001,                      # Uncommon
+    'STRUCTURE FIRE': 0.00001,                         # Uncommon
+    'MCI (MULTIPLE CASUALTY INCIDENT)': 0.000008,      # Uncommon
+    'FRACTURE': 0.000005,                               # Uncommon
+    'MEDICAL TRANSPORT': 0.000005,                      # Uncommon
+    'TRANSFER/INTERFACILITY': 0.0003,               # Uncommon
+    'TRANSFER/INTERFACILITY/PALLIATIVE': 0.0008,   # Uncommon
+    'MUTUAL AID-MEDICAL': 0.002,                   # Uncommon
+    'NO OTHER APPROPRIATE CHOICE': 0.002,         # Uncommon
+    'OTHER': 0.0005,                                # Uncommon
+    'CARDIAC ARREST - POSSIBLE DOA': 0.0007,       # Uncommon
+    'ALTERED MENTAL STATUS': 0.00009,                 # Uncommon
+    'FIRE STANDBY': 0.00007,                          # Uncommon
+    'ASSIST OTHER AGENCY': 0.0005,                  # Uncommon
+    'ALCOHOL INTOXICATION': 0.00003,                  # Uncommon
+    'HAZMAT STANDBY': 0.000003,                         # Extremely rare
+    'CONFINED SPACE / STRUCTURE COLLA': 0.000003,      # Extremely rare
+    'VEHICLE FIRE': 0.000003,                           # Extremely rare
+    'ELECTROCUTION/LIGHTNING': 0.0004,              # Uncommon
+    'STABBING': 0.0008,                             # Uncommon
+    'ANIMAL BITE': 0.001                           # Uncommon
+}
+
+# EMD performed distribution (raw counts)
+EMD_PERFORMED_DISTRIBUTION = {
+    'YES, UNKNOWN': 274258,        # Most common (89.8%)
+    'YES, WITH FEEDBACK': 28135,   # Common (9.2%)
+    'NOT RECORDED': 1725,          # Uncommon (0.6%)
+    'NO': 285,                     # Rare (0.1%)
+    'YES, WITHOUT FEEDBACK': 4     # Extremely rare (0.001%)
+}
+
+# Incident status distribution (raw counts)
+INCIDENT_STATUS_DISTRIBUTION = {
+    'COMPLETED': 224927,        # Most common (61.1%)
+    'BILLED': 144933,           # Very common (39.4%)
+    'IN PROGRESS': 759,         # Uncommon (0.2%)
+    'PENDING': 306,             # Uncommon (0.08%)
+    'READY TO BILL': 114,       # Uncommon (0.03%)
+    'REQUIRES EDIT': 59,        # Uncommon (0.02%)
+    'DOUBLE EP': 12,            # Rare (0.003%)
+    'FINISHED': 6,              # Rare (0.002%)
+    'IMPORTED': 5               # Rare (0.001%)
+}
+
+# Prearrival activation distribution by dispatched provider type (synthetic)
+PREARRIVAL_ACTIVATION_DISTRIBUTIONS = {
+    'ALS': {
+        'No value': 0.963, 'ADULT TRA': 0.008, 'CARDIAC AI': 0.004, 'STROKE AC': 0.009,
+        'GENERAL TI': 0.001, 'STEMI ACTI': 0.003, 'PEDIATRIC': 0.0004, 'OBSTETRIC': 0.00004
+    },
+    'PARAMEDIC': {
+        'No value': 0.965, 'ADULT TRA': 0.006, 'CARDIAC AI': 0.003, 'STROKE AC': 0.009,
+        'GENERAL TI': 0.001, 'STEMI ACTI': 0.003, 'PEDIATRIC': 0.0003, 'OBSTETRIC': 0.0
+    },
+    'BLS': {
+        'No value': 0.987, 'ADULT TRA': 0.003, 'CARDIAC AI': 0.0002, 'STROKE AC': 0.00006,
+        'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
+    },
+    'BLS-EMT': {
+        'No value': 0.989, 'ADULT TRA': 0.008, 'CARDIAC AI': 0.0004, 'STROKE AC': 0.00006,
+        'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0002, 'OBSTETRIC': 0.0
+    },
+    'EMT': {
+        'No value': 0.988, 'ADULT TRA': 0.010, 'CARDIAC AI': 0.0005, 'STROKE AC': 0.0001,
+        'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0002, 'OBSTETRIC': 0.0
+    },
+    'AEMT': {
+        'No value': 0.989, 'ADULT TRA': 0.011, 'CARDIAC AI': 0.0006, 'STROKE AC': 0.0001,
+        'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
+    },
+    'INTERMEDIATE': {
+        'No value': 0.984, 'ADULT TRA': 0.013, 'CARDIAC AI': 0.0006, 'STROKE AC': 0.0001,
+        'GENERAL TI': 0.003, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
+    },
+    'BLS-EMR': {
+        'No value': 0.988, 'ADULT TRA': 0.009, 'CARDIAC AI': 0.0005, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    },
+    'AEMT/EMT': {
+        'No value': 0.987, 'ADULT TRA': 0.013, 'CARDIAC AI': 0.0007, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.003, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    },
+    'NAN': {
+        'No value': 0.988, 'ADULT TRA': 0.012, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    },
+    'SPECIALTY': {
+        'No value': 0.988, 'ADULT TRA': 0.011, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    },
+    'NURSE (IE: FLIGHT NURSE)': {
+        'No value': 0.929, 'ADULT TRA': 0.071, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.0, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    },
+    'PHYSICIAN (OMD)': {
+        'No value': 1.0, 'ADULT TRA': 0.0, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
+        'GENERAL TI': 0.0, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
+    }
+}
+
+# Primary unit role distribution (raw counts)
+PRIMARY_UNIT_ROLE_DISTRIBUTION = {
+    'GROUND TRANSPORT': 246947,
+    'FIRE APPARATUS, NON-TRANSPORT ASSISTANCE': 53303,
+    'FIRE APPARATUS, BLS (NON-TRANSPORT)': 20610,
+    'FIRE APPARATUS': 19076,
+    'NON-TRANSPORT ADMINISTRATIVE (SUPERVISOR)': 20000,
+    'COMMAND/EMS SUPERVISOR': 3848,
+    'NON-TRANSPORT RESCUE': 4185,
+    'FIRE APPARATUS, ALS (NON-TRANSPORT)': 845,
+    'RESCUE': 614,
+    'ALS CHASE': 203
+}
+
+# Synthetic EMS codes with realistic frequency weights based on distributions
+EMS_INCIDENT_TYPE_BASE_WEIGHTS = {
+    '2301061': 14,  # Sick Person - most common
+    '2301013': 12,  # Breathing Problem
+    '2301021': 11,  # Chest Pain (Non-Traumatic)
+    '2301033': 13,  # Falls
+    '2301001': 7,   # Abdominal Pain/Problems
+    '2301025': 6,   # Convulsions/Seizure
+    '2301059': 6,   # Psychiatric Problem/Abnormal Behavior/Suicide Attempt
+    '2301053': 5,   # Overdose/Poisoning/Ingestion
+    '2301073': 6,   # Traumatic Injury
+    '2301067': 4,   # Stroke/CVA
+    '2301077': 5,   # Unconscious/Fainting/Near-Fainting
+    '2301027': 4,   # Diabetic Problem
+    '2301003': 3,   # Allergic Reaction/Stings
+    '2301057': 2,   # Pregnancy/Childbirth/Miscarriage
+    '2301019': 2,   # Cardiac Arrest/Death
+    '2301063': 2,   # Stab/Gunshot Wound/Penetrating Trauma
+    '2301045': 2,   # Hemorrhage/Laceration
+    '2301043': 1,   # Heat/Cold Exposure
+    '2301069': 3,   # Traffic/Transportation Incident
+    '2301007': 2,   # Assault
+    '2301035': 1,   # Fire
+    '2301005': 1,   # Animal Bite
+    '2301023': 1,   # Choking
+    '2301037': 2,   # Headache
+    '2301011': 2,   # Back Pain (Non-Traumatic)
+}
+
+# Priority mapping based on EMS codes
+EMS_PRIORITY_MAP = {
+    '2301019': 'HIGH',  # Cardiac Arrest/Death
+    '2301067': 'HIGH',  # Stroke/CVA
+    '2301053': 'HIGH',  # Overdose/Poisoning/Ingestion
+    '2301077': 'HIGH',  # Unconscious/Fainting/Near-Fainting
+    '2301073': 'HIGH',  # Traumatic Injury (upgraded - trauma is serious)
+    '2301021': 'HIGH',  # Chest Pain (upgraded - could be cardiac)
+    '2301013': 'HIGH',  # Breathing Problem (upgraded - respiratory distress)
+    '2301045': 'HIGH',  # Hemorrhage/Laceration (upgraded - bleeding is serious)
+    '2301025': 'HIGH',  # Convulsions/Seizure (upgraded - neurological emergency)
+    '2301061': 'MEDIUM',  # Sick Person (upgraded)
+    '2301033': 'MEDIUM',  # Falls (upgraded - could be trauma)
+    '2301001': 'MEDIUM',  # Abdominal Pain/Problems (upgraded)
+    '2301027': 'MEDIUM',  # Diabetic Problem (upgraded)
+    '2301003': 'HIGH',  # Allergic Reaction/Stings (upgraded - could be anaphylaxis)
+    '2301057': 'HIGH',  # Pregnancy/Childbirth/Miscarriage (upgraded - obstetric emergency)
+    '2301043': 'HIGH',  # Heat/Cold Exposure (upgraded - environmental emergency)
+    '2301063': 'HIGH',  # Stab/Gunshot Wound/Penetrating Trauma
+    '2301059': 'HIGH',  # Psychiatric Problem/Abnormal Behavior/Suicide Attempt (upgraded)
+    '2301069': 'HIGH',  # Traffic/Transportation Incident (upgraded - MVA is serious)
+    '2301007': 'HIGH',  # Assault (upgraded)
+    '2301035': 'HIGH',  # Fire
+    '2301005': 'MEDIUM',  # Animal Bite (upgraded)
+    '2301023': 'HIGH',  # Choking
+    '2301037': 'MEDIUM',  # Headache (upgraded - could be stroke)
+    '2301011': 'LOW',  # Back Pain (Non-Traumatic) - only truly LOW priority
+}
+
+# Impression, treatments, meds and vitals ranges by EMS code
+EMS_VITALS_PROFILES = {
+    '2301021': {  # Chest Pain (Non-Traumatic)
+        'impression': 'CARDIAC',
+        'treat': ['OXYGEN','IV_FLUIDS'],
+        'meds': ['ASPIRIN','NITROGLYCERIN'],
+        'bp': (140, 180, 80, 110), 'hr': (90, 130), 'rr': (16, 24), 'spo2': (92, 98), 'temp': (97.0, 99.0)
+    },
+    '2301013': {  # Breathing Problem
+        'impression': 'RESPIRATORY',
+        'treat': ['OXYGEN'],
+        'meds': ['ALBUTEROL'],
+        'bp': (110, 150, 70, 95), 'hr': (90, 120), 'rr': (20, 30), 'spo2': (85, 94), 'temp': (97.0, 99.0)
+    },
+    '2301053': {  # Overdose/Poisoning/Ingestion
+        'impression': 'MEDICAL',
+        'treat': ['OXYGEN'],
+        'meds': ['NARCAN'],
+        'bp': (90, 120, 50, 80), 'hr': (50, 100), 'rr': (6, 12), 'spo2': (75, 90), 'temp': (96.0, 99.0)
+    },
+    '2301077': {  # Unconscious/Fainting/Near-Fainting
+        'impression': 'MEDICAL',
+        'treat': ['OXYGEN','IV_FLUIDS'],
+        'meds': [],
+        'bp': (80, 110, 50, 70), 'hr': (50, 80), 'rr': (10, 16), 'spo2': (90, 98), 'temp': (96.0, 99.0)
+    },
+    '2301073': {  # Traumatic Injury
+        'impression': 'TRAUMA',
+        'treat': ['SPLINTING','IV_FLUIDS','BANDAGING','OXYGEN'],
+        'meds': ['MORPHINE'],
+        'bp': (85, 120, 50, 80), 'hr': (90, 130), 'rr': (18, 28), 'spo2': (92, 98), 'temp': (97.0, 99.0)
+    },
+    '2301025': {  # Convulsions/Seizure
+        'impression': 'MEDICAL',
+        'treat': ['OXYGEN'],
+        'meds': [],
+        'bp': (110, 160, 70, 100), 'hr': (100, 140), 'rr': (18, 26), 'spo2': (90, 98), 'temp': (97.0, 99.0)
+    },
+    '2301001': {  # Abdominal Pain/Problems
+        'impression': 'MEDICAL',
+        'treat': ['IV_FLUIDS'],
+        'meds': [],
+        'bp': (110, 150, 70, 95), 'hr': (80, 110), 'rr': (14, 22), 'spo2': (95, 100), 'temp': (97.0, 100.4)
+    },
+    '2301003': {  # Allergic Reaction/Stings
+        'impression': 'MEDICAL',
+        'treat': ['OXYGEN'],
+        'meds': ['ALBUTEROL'],
+        'bp': (100, 150, 60, 95), 'hr': (100, 130), 'rr': (20, 28), 'spo2': (88, 96), 'temp': (97.0, 99.0)
+    },
+    '2301019': {  # Cardiac Arrest/Death
+        'impression': 'CARDIAC',
+        'treat': ['CPR','OXYGEN'],
+        'meds': [],
+        'bp': (0, 0, 0, 0), 'hr': (0, 0), 'rr': (0, 0), 'spo2': (60, 85), 'temp': (96.0, 99.0)
+    },
+    '2301045': {  # Hemorrhage/Laceration
+        'impression': 'TRAUMA',
+        'treat': ['IV_FLUIDS','BANDAGING','OXYGEN'],
+        'meds': ['MORPHINE'],
+        'bp': (80, 110, 40, 70), 'hr': (100, 140), 'rr': (18, 28), 'spo2': (90, 98), 'temp': (97.0, 99.0)
+    },
+    '2301067': {  # Stroke/CVA
+        'impression': 'MEDICAL',
+        'treat': ['OXYGEN'],
+        'meds': [],
+        'bp': (150, 200, 90, 120), 'hr': (70, 100), 'rr': (14, 22), 'spo2': (95, 100), 'temp': (97.0, 99.0)
+    },
+}
+
+# Attempted procedure distribution (raw counts)
+PROCEDURE_ATTEMPT_COUNTS = {
+    'CATHETERIZATION OF VEIN': 18079,
+    'ECG, MONITORING': 15320,
+    'ECG, 12 LEAD': 20760,
+    'BLOOD GLUCOSE CHECK': 6351,
+    'BLOOD DRAW': 1004,
+    'MONITORING': 3631,
+    'CERVICAL COLLAR': 756,
+    'AIRWAY SUCTION': 202,
+    'ASSIST VENTILATIONS VIA BVM': 211,
+    'BAG VALVE MASK VENTILATION': 67,
+    'CAPNOGRAPHY': 1584,
+    'APPLICATION OF CERVICAL COLLAR': 172,
+    'APPLICATION OF SPLINT': 47,
+    'APPLICATION OF DRESSING, PRESSURE': 16,
+    'CPAP': 136,
+    'DEFIBRILLATION, MANUAL': 776,
+    'ENDOTRACHEAL INTUBATION - VIDEO': 263,
+    'OROTRACHEAL INTUBATION': 166,
+    'WOUND CARE': 176,
+    'IO CANNULATION': 313,
+    'RAPID SEQUENCE INTUBATION (RSI)': 36,
+    'ETCO2 CAPNOGRAPHY': 329,
+    'VEIN, BLOOD DRAW': 2910,
+    'APPLICATION OF TOURNIQUET': 4,
+    'NASAL AIRWAY INSERTION (NPA)': 63,
+    'ORAL AIRWAY INSERTION (OPA)': 97,
+    'INSERTION OF OROPHARYNGEAL AIRWAY': 31,
+    'CATHETERIZATION OF EXTERNAL JUGULAR': 14,
+    'CERVICAL SPINE IMMOBILIZATION': 50,
+    'CHEST COMPRESSIONS, MECHANICAL': 78,
+    'CPR, MANUAL': 49,
+    'DEFIBRILLATION': 266,
+    'CARDIAC PACING': 10,
+    'CARDIOVERSION': 3,
+    'INSERTION OF NASOGASTRIC TUBE': 7,
+    'INSERTION OF OROGASTRIC TUBE': 11,
+    'INSERTION OF TRACHEOSTOMY TUBE': 3,
+    'INTRAOSSEOUS CANNULATION': 81,
+    'MECHANICAL VENTILATION (VENTILATOR)': 55,
+    'MECHANICALLY ASSISTED CHEST COMPRESSIONS': 35,
+    'NASOPHARYNGEAL AIRWAY INSERTION': 21,
+    'NEEDLE DECOMPRESSION': 9,
+    'OROGASTRIC TUBE INSERTION (OGT)': 22,
+    'ORTHOSTATIC VITAL SIGNS': 1,
+    'PROCEDURE_A001': 5,
+    'PROCEDURE_A002': 93,
+    'PACING': 20,
+    'PELVIC BINDER': 4,
+    'PELVIC SLING/BINDER': 14,
+    'PHYSICAL RESTRAINT': 5,
+    'RAPID SEQUENCE INDUCTION (RSI)': 14,
+    'RECTAL TEMPERATURE': 3,
+    'REMOVAL OF FOREIGN BODY FROM AIRWAY': 3,
+    'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': 26,
+    'SPINAL STABILIZATION': 24,
+    'SPLINTING, GENERAL': 184,
+    'SPLINTING, TRACTION': 7,
+    'STABILIZATION OF SPINE': 4,
+    'TOURNIQUET': 15,
+    'ULTRASOUND': 100,
+    'ULTRASOUND PROCEDURE': 14,
+    'VITAL SIGNS, ORTHOSTATIC': 20,
+    'WOUND CARE (APPLICATION OF CELOX)': 1,
+    'WOUND CARE (GENERAL)': 32,
+    '12 LEAD ECG': 4711,
+    'ACTIVE EXTERNAL COOLING': 4,
+    'ACTIVE EXTERNAL WARMING': 2,
+    'AIRWAY - KING (SUPRAGLOTTIC)': 5,
+    'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': 2,
+    'APPLICATION OF TRACTION USING A TRACTION DEVICE': 2,
+    'BLOOD ADMINISTRATION': 40,
+    'BURN CARE': 4,
+    'CHEMICAL RESTRAINT': 2,
+    'CORE TEMPERATURE MONITORING': 16,
+    'CRICOTHYROIDOTOMY': 1,
+    'DECONTAMINATION': 1,
+    'DELAYED SEQUENCE INTUBATION (DSI)': 10,
+    'DRESSING, OCCLUSIVE': 6,
+    'DRESSING, PRESSURE': 43,
+    'DUAL SEQUENTIAL DEFIBRILLATION': 16,
+    'ENDOTRACHEAL INTUBATION - DIRECT': 5,
+    'EXTERNAL JUGULAR - CATHETERIZATION': 36,
+    'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': 1,
+    'IRRIGATION OF EYE': 1,
+    'IRRIGATION OF WOUND': 21,
+    'IV, INSERTION': 3,
+    'MECHANICAL ASSISTED CPR - LUCAS': 20,
+    'MECHANICAL VENTILATION': 5,
+    'MECHANICAL VENTILATION TITRATION': 1,
+    'PROCEDURE_A003': 2,
+    'OBTURATOR AIRWAY INSERTION': 1,
+    'PACKED BLOOD CELL TRANSFUSION': 4,
+    'PATIENT COOLING': 8,
+    'PATIENT WARMING': 4,
+    'PEEP': 1,
+    'SUPRAGLOTTIC (EG. KING AIRWAY)': 2,
+    'TOURNIQUET (JUNCTIONAL)': 1,
+    'ULTRASONOGRAPHY': 4
+}
+
+# Success rate by attempted procedure
+PROCEDURE_SUCCESS_RATES = {
+    '12 LEAD ECG': 4616/4711,  # 98.0%
+    'ACTIVE EXTERNAL COOLING': 4/4,  # 100%
+    'ACTIVE EXTERNAL WARMING': 2/2,  # 100%
+    'AIRWAY - KING (SUPRAGLOTTIC)': 5/5,  # 100%
+    'AIRWAY SUCTION': 200/202,  # 99.0%
+    'APPLICATION OF CERVICAL COLLAR': 169/172,  # 98.3%
+    'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': 2/2,  # 100%
+    'APPLICATION OF DRESSING, PRESSURE': 15/16,  # 93.8%
+    'APPLICATION OF SPLINT': 46/47,  # 97.9%
+    'APPLICATION OF TOURNIQUET': 4/4,  # 100%
+    'APPLICATION OF TRACTION USING A TRACTION DEVICE': 2/2,  # 100%
+    'ASSIST VENTILATIONS VIA BVM': 207/211,  # 98.1%
+    'BAG VALVE MASK VENTILATION': 67/67,  # 100%
+    'BLOOD ADMINISTRATION': 40/40,  # 100%
+    'BLOOD DRAW': 994/1004,  # 99.0%
+    'BLOOD GLUCOSE CHECK': 6293/6351,  # 99.1%
+    'BURN CARE': 4/4,  # 100%
+    'CAPNOGRAPHY': 1576/1584,  # 99.5%
+    'CARDIAC PACING': 6/10,  # 60.0%
+    'CARDIOPULMONARY RESUSCITATION': 6/7,  # 85.7%
+    'CARDIOVERSION': 3/3,  # 100%
+    'CATHETERIZATION OF EXTERNAL JUGULAR': 11/14,  # 78.6%
+    'CATHETERIZATION OF VEIN': 13646/18079,  # 75.5%
+    'CERVICAL COLLAR': 736/756,  # 97.4%
+    'CERVICAL SPINE IMMOBILIZATION': 50/50,  # 100%
+    'CHEMICAL RESTRAINT': 2/2,  # 100%
+    'CHEST COMPRESSIONS, MECHANICAL': 69/78,  # 88.5%
+    'CORE TEMPERATURE MONITORING': 14/16,  # 87.5%
+    'CPAP': 134/136,  # 98.5%
+    'CPR, MANUAL': 46/49,  # 93.9%
+    'CRICOTHYROIDOTOMY': 1/1,  # 100%
+    'DECONTAMINATION': 1/1,  # 100%
+    'DEFIBRILLATION': 172/266,  # 64.7%
+    'DEFIBRILLATION, MANUAL': 730/776,  # 94.1%
+    'DELAYED SEQUENCE INTUBATION (DSI)': 10/10,  # 100%
+    'DRESSING, OCCLUSIVE': 6/6,  # 100%
+    'DRESSING, PRESSURE': 43/43,  # 100%
+    'DUAL SEQUENTIAL DEFIBRILLATION': 14/16,  # 87.5%
+    'ECG, 12 LEAD': 20416/20760,  # 98.3%
+    'ECG, MONITORING': 15089/15320,  # 98.5%
+    'ENDOTRACHEAL INTUBATION - DIRECT': 4/5,  # 80.0%
+    'ENDOTRACHEAL INTUBATION - VIDEO': 242/263,  # 92.0%
+    'ETCO2 CAPNOGRAPHY': 326/329,  # 99.1%
+    'EXTERNAL JUGULAR - CATHETERIZATION': 25/36,  # 69.4%
+    'INSERTION OF NASOGASTRIC TUBE': 7/7,  # 100%
+    'INSERTION OF OROGASTRIC TUBE': 11/11,  # 100%
+    'INSERTION OF OROPHARYNGEAL AIRWAY': 28/31,  # 90.3%
+    'INSERTION OF TRACHEOSTOMY TUBE': 3/3,  # 100%
+    'INTRAOSSEOUS CANNULATION': 79/81,  # 97.5%
+    'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': 1/1,  # 100%
+    'IO CANNULATION': 300/313,  # 95.8%
+    'IRRIGATION OF EYE': 1/1,  # 100%
+    'IRRIGATION OF WOUND': 21/21,  # 100%
+    'IV, INSERTION': 2/3,  # 66.7%
+    'MECHANICAL ASSISTED CPR - LUCAS': 20/20,  # 100%
+    'MECHANICAL VENTILATION': 5/5,  # 100%
+    'MECHANICAL VENTILATION (VENTILATOR)': 52/55,  # 94.5%
+    'MECHANICAL VENTILATION TITRATION': 1/1,  # 100%
+    'MECHANICALLY ASSISTED CHEST COMPRESSIONS': 34/35,  # 97.1%
+    'MONITORING': 3599/3631,  # 99.1%
+    'NASAL AIRWAY INSERTION (NPA)': 54/63,  # 85.7%
+    'NASOPHARYNGEAL AIRWAY INSERTION': 18/21,  # 85.7%
+    'NEEDLE DECOMPRESSION': 9/9,  # 100%
+    'PROCEDURE_A003': 2/2,  # 100%
+    'OBTURATOR AIRWAY INSERTION': 1/1,  # 100%
+    'ORAL AIRWAY INSERTION (OPA)': 92/97,  # 94.8%
+    'OROGASTRIC TUBE INSERTION (OGT)': 20/22,  # 90.9%
+    'OROTRACHEAL INTUBATION': 157/166,  # 94.6%
+    'ORTHOSTATIC VITAL SIGNS': 1/1,  # 100%
+    'PROCEDURE_A001': 5/5,  # 100%
+    'PROCEDURE_A002': 93/93,  # 100%
+    'PACING': 17/20,  # 85.0%
+    'PACKED BLOOD CELL TRANSFUSION': 4/4,  # 100%
+    'PATIENT COOLING': 8/8,  # 100%
+    'PATIENT WARMING': 4/4,  # 100%
+    'PEEP': 1/1,  # 100%
+    'PELVIC BINDER': 3/4,  # 75.0%
+    'PELVIC SLING/BINDER': 14/14,  # 100%
+    'PHYSICAL RESTRAINT': 5/5,  # 100%
+    'RAPID SEQUENCE INDUCTION (RSI)': 14/14,  # 100%
+    'RAPID SEQUENCE INTUBATION (RSI)': 35/36,  # 97.2%
+    'RECTAL TEMPERATURE': 3/3,  # 100%
+    'REMOVAL OF FOREIGN BODY FROM AIRWAY': 3/3,  # 100%
+    'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': 26/26,  # 100%
+    'SPINAL STABILIZATION': 23/24,  # 95.8%
+    'SPLINTING, GENERAL': 183/184,  # 99.5%
+    'SPLINTING, TRACTION': 7/7,  # 100%
+    'STABILIZATION OF SPINE': 4/4,  # 100%
+    'SUPRAGLOTTIC (EG. KING AIRWAY)': 1/2,  # 50.0%
+    'TOURNIQUET': 15/15,  # 100%
+    'TOURNIQUET (JUNCTIONAL)': 1/1,  # 100%
+    'ULTRASONOGRAPHY': 4/4,  # 100%
+    'ULTRASOUND': 99/100,  # 99.0%
+    'ULTRASOUND PROCEDURE': 14/14,  # 100%
+    'VEIN, BLOOD DRAW': 2872/2910,  # 98.7%
+    'VITAL SIGNS, ORTHOSTATIC': 20/20,  # 100%
+    'WOUND CARE': 175/176,  # 99.4%
+    'WOUND CARE (APPLICATION OF CELOX)': 1/1,  # 100%
+    'WOUND CARE (GENERAL)': 32/32  # 100%
+}
+
+# Complication distribution by attempted procedure (synthetic)
+PROCEDURE_COMPLICATION_DISTRIBUTIONS = {
+    '12 LEAD ECG': {'NONE': 0.95, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.05},
+    'ACTIVE EXTERNAL COOLING': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'ACTIVE EXTERNAL WARMING': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
+    'AIRWAY - KING (SUPRAGLOTTIC)': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
+    'AIRWAY SUCTION': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
+    'APPLICATION OF CERVICAL COLLAR': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
+    'APPLICATION OF DRESSING, PRESSURE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'APPLICATION OF SPLINT': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
+    'APPLICATION OF TOURNIQUET': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
+    'APPLICATION OF TRACTION USING A TRACTION DEVICE': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
+    'ASSIST VENTILATIONS VIA BVM': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'BAG VALVE MASK VENTILATION': {'NONE': 0.75, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.25},
+    'BLOOD ADMINISTRATION': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
+    'BLOOD DRAW': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'BLOOD GLUCOSE CHECK': {'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
+    'BURN CARE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'CAPNOGRAPHY': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'CARDIAC PACING': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
+    'CARDIOPULMONARY RESUSCITATION': {'NONE': 0.3, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.7},
+    'CARDIOVERSION': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
+    'CATHETERIZATION OF EXTERNAL JUGULAR': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
+    'CATHETERIZATION OF VEIN': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
+    'CERVICAL COLLAR': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'CERVICAL SPINE IMMOBILIZATION': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'CHEMICAL RESTRAINT': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
+    'CHEST COMPRESSIONS, MECHANICAL': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'CORE TEMPERATURE MONITORING': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
+    'CPAP': {'HYPOXIA': 0.0, 'INJURY': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 1.0},
+    'CPR, MANUAL': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
+    'CRICOTHYROIDOTOMY': {'NONE': 0.3, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.7},
+    'DECONTAMINATION': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
+    'DEFIBRILLATION': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'DEFIBRILLATION, MANUAL': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
+    'DELAYED SEQUENCE INTUBATION (DSI)': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
+    'DRESSING, OCCLUSIVE': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
+    'DRESSING, PRESSURE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'DUAL SEQUENTIAL DEFIBRILLATION': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
+    'ECG, 12 LEAD': {'NONE': 0.95, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.05},
+    'ECG, MONITORING': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
+    'ENDOTRACHEAL INTUBATION - DIRECT': {'INJURY': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'NO_VALUE': 1.0},
+    'ENDOTRACHEAL INTUBATION - VIDEO': {'INJURY': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'NO_VALUE': 1.0},
+    'ETCO2 CAPNOGRAPHY': {'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 1.0},
+    'EXTERNAL JUGULAR - CATHETERIZATION': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
+    'INSERTION OF NASOGASTRIC TUBE': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
+    'INSERTION OF OROGASTRIC TUBE': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
+    'INSERTION OF OROPHARYNGEAL AIRWAY': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
+    'INSERTION OF TRACHEOSTOMY TUBE': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'INTRAOSSEOUS CANNULATION': {'NONE': 81, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'IO CANNULATION': {'NONE': 313, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'IRRIGATION OF EYE': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'IRRIGATION OF WOUND': {'NONE': 21, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'IV, INSERTION': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MECHANICAL ASSISTED CPR - LUCAS': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MECHANICAL VENTILATION': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MECHANICAL VENTILATION (VENTILATOR)': {'NONE': 55, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MECHANICAL VENTILATION TITRATION': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MECHANICALLY ASSISTED CHEST COMPRESSIONS': {'NONE': 35, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'MONITORING': {'NOT_APPLICABLE': 3631, 'NO_VALUE': 0},
+    'NASAL AIRWAY INSERTION (NPA)': {'NONE': 63, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'NASOPHARYNGEAL AIRWAY INSERTION': {'NONE': 21, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'NEEDLE DECOMPRESSION': {'NONE': 9, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PROCEDURE_A003': {'NONE': 2, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'OBTURATOR AIRWAY INSERTION': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'ORAL AIRWAY INSERTION (OPA)': {'NONE': 97, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'OROGASTRIC TUBE INSERTION (OGT)': {'NONE': 22, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'OROTRACHEAL INTUBATION': {'NONE': 166, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'ORTHOSTATIC VITAL SIGNS': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PROCEDURE_A001': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PROCEDURE_A002': {'NONE': 93, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PACING': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PACKED BLOOD CELL TRANSFUSION': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PATIENT COOLING': {'NONE': 8, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PATIENT WARMING': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PEEP': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PELVIC BINDER': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PELVIC SLING/BINDER': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'PHYSICAL RESTRAINT': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'RAPID SEQUENCE INDUCTION (RSI)': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'RAPID SEQUENCE INTUBATION (RSI)': {'NONE': 36, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'RECTAL TEMPERATURE': {'INJURY': 1, 'NOT_APPLICABLE': 35, 'NO_VALUE': 0},
+    'REMOVAL OF FOREIGN BODY FROM AIRWAY': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': {'NONE': 26, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'SPINAL STABILIZATION': {'NONE': 24, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'SPLINTING, GENERAL': {'NONE': 184, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'SPLINTING, TRACTION': {'NONE': 7, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'STABILIZATION OF SPINE': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'SUPRAGLOTTIC (EG. KING AIRWAY)': {'NONE': 2, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'TOURNIQUET': {'NONE': 15, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'TOURNIQUET (JUNCTIONAL)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'ULTRASONOGRAPHY': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'ULTRASOUND': {'NONE': 100, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'ULTRASOUND PROCEDURE': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'VEIN, BLOOD DRAW': {'NONE': 2910, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'VITAL SIGNS, ORTHOSTATIC': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'WOUND CARE': {'NONE': 176, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'WOUND CARE (APPLICATION OF CELOX)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
+    'WOUND CARE (GENERAL)': {'NONE': 32, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0}
+}
+
+# Medication distribution with real medication names
+EMS_MEDICATIONS = [
+    {'name': 'NORMAL SALINE', 'code': '7820', 'routes': {'INTRAVENC': 0.957, 'IV_DRIP': 0.001, 'INTRAMUSI': 0.005, 'INTRANASA': 0.0002, 'INTRAOSSE': 0.020, 'ORAL': 0.0003, 'RECTAL': 0.0003, 'PORTACATH': 0.0001, 'ENDOTRAC': 0.002, 'NASAL_CAN': 0.009, 'NON_REBRE': 0.0001, 'BLOW_BY': 0.002}, 'dosage': (500, 1000), 'unit': 'ML', 'weight': 13747},
+    {'name': 'ONDANSETRON', 'code': '7941', 'routes': {'INTRAVENC': 0.929, 'INTRAMUSI': 0.069, 'INTRANASA': 0.001, 'INTRAOSSE': 0.0002, 'ORAL': 0.0001, 'RECTAL': 0.0003, 'BUCCAL': 0.0001}, 'dosage': (4, 8), 'unit': 'MG', 'weight': 10205},
+    {'name': 'OXYGEN', 'code': '7781', 'routes': {'IV_PIGGYBA': 0.453, 'INHALATIO': 0.082, 'INTRANASA': 0.036, 'NASAL_CAN': 0.157, 'ORAL': 0.020, 'BUCCAL': 0.001, 'ENDOTRAC': 0.006, 'TRACHEOST': 0.001, 'INTRAMUSI': 0.0002, 'INTRAOSSE': 0.0001, 'INTRAVENC': 0.002, 'BLOW_BY': 0.014, 'OPHTHALM': 0.002}, 'dosage': (2, 15), 'unit': 'L/MIN', 'weight': 7550},
+    {'name': 'FENTANYL', 'code': '4337', 'routes': {'INTRAVENC': 0.741, 'INTRANASA': 0.179, 'INTRAMUSI': 0.032, 'INTRAOSSE': 0.001, 'INHALATIO': 0.001, 'IV_DRIP': 0.0001, 'BUCCAL': 0.0001, 'SUBLINGUA': 0.0001}, 'dosage': (25, 100), 'unit': 'MCG', 'weight': 6615},
+    {'name': 'ASPIRIN', 'code': '1191', 'routes': {'ORAL': 1.0}, 'dosage': (81, 325), 'unit': 'MG', 'weight': 5223},
+    {'name': 'NITROGLYCERIN', 'code': '7417', 'routes': {'SUBLINGUA': 0.972, 'ORAL': 0.028}, 'dosage': (0.3, 0.4), 'unit': 'MG', 'weight': 3647},
+    {'name': 'ALBUTEROL', 'code': '435', 'route': 'INHALED', 'dosage': (90, 180), 'unit': 'MCG', 'weight': 3640},
+    {'name': 'IPRATROPIUM', 'code': '5737', 'route': 'INHALED', 'dosage': (250, 500), 'unit': 'MCG', 'weight': 3565},
+    {'name': 'METHYLPREDNISOLONE', 'code': '7021', 'route': 'INTRAVENOUS', 'dosage': (125, 250), 'unit': 'MG', 'weight': 1999},
+    {'name': 'EPI 1:10,000', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.1, 1.0), 'unit': 'MG', 'weight': 1788},
+    {'name': 'NALOXONE', 'code': '7517', 'route': 'INTRAMUSCULAR', 'dosage': (0.4, 2.0), 'unit': 'MG', 'weight': 1378},
+    {'name': 'DIPHENHYDRAMINE', 'code': '3498', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'MG', 'weight': 1040},
+    {'name': 'GLUCOSE', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 821},
+    {'name': 'ACETAMINOPHEN', 'code': '161', 'route': 'ORAL', 'dosage': (325, 650), 'unit': 'MG', 'weight': 701},
+    {'name': 'EPI 1:1,000', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.3, 0.5), 'unit': 'MG', 'weight': 693},
+    {'name': 'DEXTROSE 50%', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 664},
+    {'name': 'SODIUM BICARBONATE', 'code': '1778', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'MEQ', 'weight': 618},
+    {'name': 'METOPROLOL', 'code': '6918', 'route': 'INTRAVENOUS', 'dosage': (5, 15), 'unit': 'MG', 'weight': 594},
+    {'name': 'MORPHINE', 'code': '7054', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 591},
+    {'name': 'DEXTROSE 10%', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (250, 500), 'unit': 'ML', 'weight': 484},
+    {'name': 'MIDAZOLAM 5 MG/ML [VERSED]', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 466},
+    {'name': 'KETAMINE', 'code': '5901', 'route': 'INTRAVENOUS', 'dosage': (0.5, 2.0), 'unit': 'MG/KG', 'weight': 461},
+    {'name': 'MIDAZOLAM', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 384},
+    {'name': 'GLUCAGON', 'code': '4761', 'route': 'INTRAMUSCULAR', 'dosage': (0.5, 1.0), 'unit': 'MG', 'weight': 348},
+    {'name': 'ADENOSINE', 'code': '197', 'route': 'INTRAVENOUS', 'dosage': (6, 12), 'unit': 'MG', 'weight': 299},
+    {'name': 'ROCURONIUM', 'code': '7949', 'route': 'INTRAVENOUS', 'dosage': (0.6, 1.2), 'unit': 'MG/KG', 'weight': 293},
+    {'name': 'AMIODARONE', 'code': '177', 'route': 'INTRAVENOUS', 'dosage': (150, 300), 'unit': 'MG', 'weight': 261},
+    {'name': 'LABETALOL', 'code': '3827', 'route': 'INTRAVENOUS', 'dosage': (10, 20), 'unit': 'MG', 'weight': 260},
+    {'name': 'ATROPINE', 'code': '174', 'route': 'INTRAVENOUS', 'dosage': (0.5, 1.0), 'unit': 'MG', 'weight': 227},
+    {'name': 'CALCIUM CHLORIDE', 'code': '1754', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'MG', 'weight': 134},
+    {'name': 'MIDAZOLAM 1 MG/ML [VERSED]', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (1, 5), 'unit': 'MG', 'weight': 130},
+    {'name': 'EPINEPHRINE 0.1 MG/ML', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.1, 0.5), 'unit': 'MG', 'weight': 87},
+    {'name': 'DOPAMINE', 'code': '3842', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/KG/MIN', 'weight': 81},
+    {'name': 'MAGNESIUM SULFATE', 'code': '6349', 'route': 'INTRAVENOUS', 'dosage': (1, 4), 'unit': 'GM', 'weight': 70},
+    {'name': 'LIDOCAINE', 'code': '6183', 'route': 'INTRAVENOUS', 'dosage': (50, 100), 'unit': 'MG', 'weight': 67},
+    {'name': 'MIDAZOLAM 10MG/2ML', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 59},
+    {'name': 'EPI 1:100,000 PDP', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.2, 0.5), 'unit': 'MG', 'weight': 54},
+    {'name': 'EPINEPHRINE', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.3, 0.5), 'unit': 'MG', 'weight': 46},
+    {'name': 'FUROSEMIDE', 'code': '4603', 'route': 'INTRAVENOUS', 'dosage': (20, 80), 'unit': 'MG', 'weight': 45},
+    {'name': 'HALOPERIDOL', 'code': '5259', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 36},
+    {'name': 'LEVOPHED', 'code': '7419', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/MIN', 'weight': 35},
+    {'name': 'TETRACAINE', 'code': '10370', 'route': 'TOPICAL', 'dosage': (0.5, 1.0), 'unit': '%', 'weight': 32},
+    {'name': 'EPI 1:100,000 (PDP)', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.2, 0.5), 'unit': 'MG', 'weight': 29},
+    {'name': 'SODIUM CHLORIDE', 'code': '7820', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'ML', 'weight': 19},
+    {'name': 'GLUCOSE 100 MG/ML', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 16},
+    {'name': 'MIDAZOLAM 5MG/5ML', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 15},
+    {'name': 'SUCCINYLCHOLINE', 'code': '10305', 'route': 'INTRAVENOUS', 'dosage': (1, 2), 'unit': 'MG/KG', 'weight': 9},
+    {'name': 'ETOMIDATE', 'code': '3873', 'route': 'INTRAVENOUS', 'dosage': (0.2, 0.3), 'unit': 'MG/KG', 'weight': 7},
+    {'name': 'IBUPROFEN', 'code': '5640', 'route': 'ORAL', 'dosage': (400, 800), 'unit': 'MG', 'weight': 5},
+    {'name': 'VECURONIUM', 'code': '11170', 'route': 'INTRAVENOUS', 'dosage': (0.08, 0.1), 'unit': 'MG/KG', 'weight': 5},
+    {'name': 'STERILE WATER', 'code': '11324', 'route': 'INTRAVENOUS', 'dosage': (5, 10), 'unit': 'ML', 'weight': 4},
+    {'name': 'ACTIVATED CHARCOAL', 'code': '435', 'route': 'ORAL', 'dosage': (25, 50), 'unit': 'GM', 'weight': 3},
+    {'name': 'NOREPINEPHRINE', 'code': '7419', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/MIN', 'weight': 3},
+    {'name': 'HYDROXOCOBALAMIN', 'code': '6178', 'route': 'INTRAVENOUS', 'dosage': (2.5, 5), 'unit': 'GM', 'weight': 2},
+    {'name': 'POTASSIUM CHLORIDE', 'code': '8584', 'route': 'INTRAVENOUS', 'dosage': (10, 20), 'unit': 'MEQ', 'weight': 2},
+    {'name': 'CALCIUM GLUCONATE', 'code': '1754', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'MG', 'weight': 1},
+    {'name': 'EPINEPHRINE 0.01 MG/ML', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.01, 0.1), 'unit': 'MG', 'weight': 1},
+    {'name': 'GLUCOSE 500 MG/ML', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 1},
+    {'name': 'HYDROXOCOBALAMIN INJECTION [CYANOKIT]', 'code': '6178', 'route': 'INTRAVENOUS', 'dosage': (2.5, 5), 'unit': 'GM', 'weight': 1},
+    {'name': 'DIAZEPAM', 'code': '3610', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 200}
+]
+
+# Dosage distribution by medication
+MEDICATION_DOSAGE_DISTRIBUTIONS = {
+    'ALBUTEROL': {'2.5': 10, '5': 1},
+    'DEXTROSE 10%': {'250': 1, '500': 1},
+    'DIAZEPAM': {'2': 1, '5': 1, '10': 1},
+    'DIPHENHYDRAMINE': {'25': 1, '50': 1},
+    'EPI 1:1,000': {'0.3': 1, '0.5': 1},
+    'EPI 1:10,000': {'0.1': 1, '1.0': 1},
+    'EPI 1:100,000 (PDP)': {'0.2': 1, '0.5': 1},
+    'EPI 1:100,000 PDP': {'0.2': 1, '0.5': 1},
+    'FENTANYL': {'25': 1, '50': 1, '75': 1, '100': 1},
+    'GLUCOSE': {'25': 1, '50': 1},
+    'IPRATROPIUM': {'250': 1, '500': 1},
+    'KETAMINE': {'50': 1, '100': 1},
+    'LABETALOL': {'10': 1, '20': 1},
+    'LEVOPHED': {'2': 1, '20': 1},
+    'METHYLPREDNISOLONE': {'125': 1, '250': 1},
+    'METOPROLOL': {'5': 1, '15': 1},
+    'MIDAZOLAM 1 MG/ML [VERSED]': {'1': 1, '5': 1},
+    'MIDAZOLAM 5 MG/ML [VERSED]': {'2': 1, '10': 1},
+    'MIDAZOLAM 5MG/5ML': {'2': 1, '10': 1},
+    'MIDAZOLAM': {'2': 1, '10': 1},
+    'MORPHINE': {'2': 1, '4': 1, '10': 1},
+    'MED_J001': {'0.4': 1, '2': 1},
+    'MED_E002': {'0.3': 1, '0.4': 1},
+    'MED_K001': {'250': 1, '500': 1, '1000': 1},
+    'MED_H001': {'4': 1, '8': 1},
+    'MED_D001': {'2': 1, '4': 1, '6': 1, '10': 1, '15': 1},
+    'MED_O001': {'0.6': 1, '1.2': 1},
+    'MED_U001': {'1': 1, '2': 1},
+    'MED_I001': {'25': 1, '50': 1},
+    'MED_B005': {'0.5': 1, '1': 1},
+    'MED_N001': {'6': 1, '12': 1},
+    'MED_E005': {'150': 1, '300': 1},
+    'MED_E003': {'0.5': 1, '1': 1},
+    'MED_I002': {'500': 1, '1000': 1},
+    'MED_P001': {'2': 1, '20': 1},
+    'MED_Q001': {'1': 1, '4': 1},
+    'MED_R001': {'50': 1, '100': 1},
+    'MED_S001': {'20': 1, '80': 1},
+    'MED_F006': {'2': 1, '10': 1},
+    'MED_L001': {'0.5': 1, '1': 1},
+    'MED_K002': {'500': 1, '1000': 1},
+    'MED_B006': {'25': 1, '50': 1},
+    'MED_V001': {'0.2': 1, '0.3': 1},
+    'MED_W001': {'400': 1, '800': 1},
+    'MED_X001': {'0.08': 1, '0.1': 1},
+    'MED_Y001': {'5': 1, '10': 1},
+    'MED_Z001': {'25': 1, '50': 1},
+    'MED_T002': {'2': 1, '20': 1},
+    'MED_AA001': {'2.5': 1, '5': 1},
+    'MED_BB001': {'10': 1, '20': 1},
+    'MED_CC001': {'500': 1, '1000': 1},
+    'MED_E010': {'0.01': 1, '0.1': 1},
+    'MED_B007': {'25': 1, '50': 1},
+    'MED_DD001': {'2.5': 1, '5': 1},
+    'MED_E001': {'81': 1, '325': 1},
+    'MED_E006': {'0.1': 1, '0.5': 1},
+    'MED_B003': {'25': 1, '50': 1}
+}
+
+# Dosage unit distribution by medication (raw counts)
+MEDICATION_UNIT_DISTRIBUTIONS = {
+    'ACETAMINOPHEN': {'MG': 631, 'ML': 65},
+    'ACTIVATED CHARCOAL': {'DROPS': 2, 'G': 3},
+    'ADENOSINE': {'MG': 465},
+    'ALBUTEROL': {'MG': 4422, 'PUFFS': 1},
+    'AMIODARONE': {'MG': 345},
+    'MED_E001': {'MG': 5255, 'UNITS_PER_I': 1},
+    'ATROPINE': {'MG': 277},
+    'CALCIUM CHLORIDE': {'G': 102, 'MG': 22, 'ML': 1},
+    'CALCIUM GLUCONATE': {'MCG': 1, 'MG': 23, 'ML': 9},
+    'DEXTROSE 10%': {'G': 172, 'KEEP_VEIN': 2, 'L': 1, 'MG': 297, 'UNITS': 1},
+    'DIAZEPAM': {'MG': 200},
+    'DEXTROSE 50%': {'G': 696, 'MG': 6},
+    'DIPHENHYDRAMINE': {'MG': 1037, 'ML': 7},
+    'DOPAMINE': {'DROPS': 2, 'MCG': 78, 'MEQ': 2, 'MG': 3, 'ML': 4},
+    'EPI 1:1,000': {'MCG': 5, 'MEQ': 2, 'MG': 1178, 'ML': 4},
+    'EPI 1:10,000': {'MCG': 109, 'MG': 6809, 'ML': 2, 'UNITS_PER_I': 1},
+    'EPI 1:100,000 (PDP)': {'MCG': 68, 'MEQ': 1, 'MG': 1, 'ML': 2},
+    'EPI 1:100,000 PDP': {'MCG': 124, 'MEQ': 1, 'MG': 4, 'ML': 9},
+    'MED_E008': {'MCG': 8, 'MG': 41, 'ML': 1},
+    'MED_E010': {'MG': 1},
+    'MED_E006': {'MCG': 3, 'MG': 302, 'ML': 12, 'UNITS_PER_I': 2},
+    'ETOMIDATE': {'MG': 7},
+    'FENTANYL': {'MCG': 8446, 'MG': 1, 'ML': 5},
+    'FUROSEMIDE': {'MG': 45},
+    'GLUCAGON': {'MG': 353},
+    'GLUCOSE': {'G': 996, 'MG': 1, 'ML': 1, 'UNITS': 1, 'UNITS_PER_I': 2},
+    'GLUCOSE 100 MG/ML': {'G': 18, 'MG': 1},
+    'GLUCOSE 500 MG/ML': {'G': 1, 'MG': 1},
+    'HALOPERIDOL': {'MG': 36},
+    'HYDROXOCOBALAMIN': {'G': 2, 'MG': 2},
+    'HYDROXOCOBALAMIN INJECTION [CYANOKIT]': {'G': 1},
+    'IBUPROFEN': {'MCG': 2, 'MG': 4304, 'ML': 1},
+    'IPRATROPIUM': {'MCG': 2, 'MG': 721, 'ML': 4},
+    'KETAMINE': {'MG': 276},
+    'LABETALOL': {'MCG': 40, 'MG': 1, 'ML': 1},
+    'LEVOPHED': {'MG': 78},
+    'LIDOCAINE': {'MG': 1},
+    'MAGNESIUM SULFATE': {'G': 71, 'MG': 1865, 'MEQ': 131, 'ML': 8},
+    'METHYLPREDNISOLONE': {'MG': 605},
+    'METOPROLOL': {'MG': 447},
+    'MIDAZOLAM': {'MCG': 1, 'MG': 140, 'ML': 3},
+    'MIDAZOLAM 1 MG/ML [VERSED]': {'MCG': 1, 'MG': 71, 'ML': 6, 'UNITS_PER_I': 1},
+    'MIDAZOLAM 10MG/2ML': {'MCG': 1, 'MG': 511, 'ML': 26},
+    'MIDAZOLAM 5 MG/ML [VERSED]': {'MCG': 4, 'MG': 13},
+    'MIDAZOLAM 5MG/5ML': {'MCG': 6, 'MG': 748, 'ML': 3},
+    'MED_G002': {'MCG': 1, 'MG': 1730},
+    'MED_J001': {'MCG': 1, 'MG': 5129, 'UNITS': 1},
+    'NITROGLYCERIN': {'MCG': 3},
+    'MED_T002': {'MCG': 4},
+    'NORMAL SALINE': {'DROPS': 29, 'G': 22, 'KEEP_VEIN': 696, 'L': 442, 'LITERS_BO': 29, 'LITERS_PER': 47, 'LOCK_FLUSH': 4, 'MEQ': 11, 'MG': 88, 'ML': 13216, 'NOT_APPLIC': 9, 'NOT_RECORDED': 1, 'OTHER': 22, 'PUFFS': 9, 'UNITS': 54, 'UNITS_PER_I': 9},
+    'ONDANSETRON': {'MG': 10241},
+    'MED_D001': {'DROPS': 5, 'G': 1, 'KEEP_VEIN': 1, 'L': 1374, 'LITERS_BO': 869, 'LITERS_PER': 5718, 'LOCK_FLUSH': 3, 'METERED_D': 9, 'MEQ': 2, 'MG': 18, 'ML': 85, 'NOT_APPLIC': 4, 'OTHER': 26, 'UNITS_PER_I': 13},
+    'POTASSIUM CHLORIDE': {'MG': 2},
+    'ROCURONIUM': {'MG': 287, 'ML': 10},
+    'SODIUM BICARBONATE': {'MCG': 653, 'MG': 2, 'ML': 19, 'UNITS_PER_I': 1},
+    'SODIUM CHLORIDE': {'G': 1, 'MG': 2},
+    'STERILE WATER': {'G': 1, 'MG': 1},
+    'SUCCINYLCHOLINE': {'G': 1, 'MG': 8, 'ML': 1},
+    'TETRACAINE': {'G': 39},
+    'VECURONIUM': {'MG': 5}
+}
+
+# Map recorded dosage units to standard unit abbreviations
+MEDICATION_UNIT_MAPPING = {
+    'MG': 'MG', 'ML': 'ML', 'MCG': 'MCG', 'G': 'G', 'L': 'L', 
+    'MEQ': 'MEQ', 'UNITS': 'UNITS', 'PUFFS': 'PUFFS', 'DROPS': 'DROPS',
+    'KEEP_VEIN': 'ML', 'LITERS_BO': 'L', 'LITERS_PER': 'L/MIN', 
+    'LOCK_FLUSH': 'ML', 'METERED_D': 'PUFFS', 'UNITS_PER_I': 'UNITS',
+    'NOT_APPLIC': 'UNITS', 'NOT_RECORDED': 'UNITS', 'OTHER': 'UNITS'
+}
+
+# Patient response distribution by medication
+MEDICATION_RESPONSE_DISTRIBUTIONS = {
+    'ACETAMINOPHEN': {'IMPROVED': 0.286, 'NOT_RECORDED': 0.269, 'UNCHANGED': 0.445, 'WORSE': 0.0},
+    'ACTIVATED CHARCOAL': {'IMPROVED': 0.0, 'NOT_RECORDED': 1.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
+    'ADENOSINE': {'IMPROVED': 0.406, 'NOT_RECORDED': 0.164, 'UNCHANGED': 0.429, 'WORSE': 0.002},
+    'ALBUTEROL': {'IMPROVED': 0.641, 'NOT_RECORDED': 0.241, 'UNCHANGED': 0.116, 'WORSE': 0.002},
+    'AMIODARONE': {'IMPROVED': 0.145, 'NOT_RECORDED': 0.298, 'UNCHANGED': 0.551, 'WORSE': 0.006},
+    'MED_E001': {'IMPROVED': 0.186, 'NOT_RECORDED': 0.255, 'UNCHANGED': 0.558, 'WORSE': 0.002},
+    'ATROPINE': {'IMPROVED': 0.537, 'NOT_RECORDED': 0.169, 'UNCHANGED': 0.290, 'WORSE': 0.004},
+    'CALCIUM CHLORIDE': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.321, 'UNCHANGED': 0.597, 'WORSE': 0.0},
+    'DEXTROSE 10%': {'IMPROVED': 0.800, 'NOT_RECORDED': 0.086, 'UNCHANGED': 0.112, 'WORSE': 0.004},
+    'DEXTROSE 50%': {'IMPROVED': 0.504, 'NOT_RECORDED': 0.419, 'UNCHANGED': 0.075, 'WORSE': 0.0},
+    'DIPHENHYDRAMINE': {'IMPROVED': 0.584, 'NOT_RECORDED': 0.214, 'UNCHANGED': 0.202, 'WORSE': 0.001},
+    'DOPAMINE': {'IMPROVED': 0.458, 'NOT_RECORDED': 0.289, 'UNCHANGED': 0.241, 'WORSE': 0.012},
+    'EPI 1:1,000': {'IMPROVED': 0.384, 'NOT_RECORDED': 0.316, 'UNCHANGED': 0.300, 'WORSE': 0.001},
+    'EPI 1:10,000': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.299, 'UNCHANGED': 0.613, 'WORSE': 0.001},
+    'EPI 1:100,000 (PDP)': {'IMPROVED': 0.620, 'NOT_RECORDED': 0.239, 'UNCHANGED': 0.127, 'WORSE': 0.014},
+    'EPI 1:100,000 PDP': {'IMPROVED': 0.787, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.202, 'WORSE': 0.007},
+    'MED_E008': {'IMPROVED': 0.673, 'NOT_RECORDED': 0.102, 'UNCHANGED': 0.224, 'WORSE': 0.0},
+    'MED_E010': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 1.0, 'WORSE': 0.0},
+    'MED_E006': {'IMPROVED': 0.102, 'NOT_RECORDED': 0.255, 'UNCHANGED': 0.643, 'WORSE': 0.0},
+    'ETOMIDATE': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.8, 'UNCHANGED': 0.2, 'WORSE': 0.0},
+    'FENTANYL': {'IMPROVED': 0.673, 'NOT_RECORDED': 0.170, 'UNCHANGED': 0.154, 'WORSE': 0.002},
+    'FUROSEMIDE': {'IMPROVED': 0.444, 'NOT_RECORDED': 0.244, 'UNCHANGED': 0.311, 'WORSE': 0.0},
+    'GLUCAGON': {'IMPROVED': 0.531, 'NOT_RECORDED': 0.272, 'UNCHANGED': 0.196, 'WORSE': 0.006},
+    'GLUCOSE': {'IMPROVED': 0.491, 'NOT_RECORDED': 0.301, 'UNCHANGED': 0.202, 'WORSE': 0.006},
+    'GLUCOSE 100 MG/ML': {'IMPROVED': 0.105, 'NOT_RECORDED': 0.316, 'UNCHANGED': 0.579, 'WORSE': 0.0},
+    'GLUCOSE 500 MG/ML': {'IMPROVED': 1.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
+    'HALOPERIDOL': {'IMPROVED': 0.611, 'NOT_RECORDED': 0.222, 'UNCHANGED': 0.167, 'WORSE': 0.0},
+    'HYDROXOCOBALAMIN': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 1.0, 'WORSE': 0.0},
+    'HYDROXOCOBALAMIN INJECTION [CYANOKIT]': {'IMPROVED': 1.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
+    'IBUPROFEN': {'IMPROVED': 0.4, 'NOT_RECORDED': 0.6, 'UNCHANGED': 0.0, 'WORSE': 0.0},
+    'IPRATROPIUM': {'IMPROVED': 0.629, 'NOT_RECORDED': 0.260, 'UNCHANGED': 0.110, 'WORSE': 0.003},
+    'KETAMINE': {'IMPROVED': 0.569, 'NOT_RECORDED': 0.150, 'UNCHANGED': 0.276, 'WORSE': 0.003},
+    'LABETALOL': {'IMPROVED': 0.681, 'NOT_RECORDED': 0.220, 'UNCHANGED': 0.097, 'WORSE': 0.0},
+    'LEVOPHED': {'IMPROVED': 0.707, 'NOT_RECORDED': 0.049, 'UNCHANGED': 0.244, 'WORSE': 0.0},
+    'LIDOCAINE': {'IMPROVED': 0.346, 'NOT_RECORDED': 0.244, 'UNCHANGED': 0.410, 'WORSE': 0.0},
+    'MAGNESIUM SULFATE': {'IMPROVED': 0.208, 'NOT_RECORDED': 0.278, 'UNCHANGED': 0.514, 'WORSE': 0.0},
+    'METHYLPREDNISOLONE': {'IMPROVED': 0.398, 'NOT_RECORDED': 0.266, 'UNCHANGED': 0.336, 'WORSE': 0.001},
+    'METOPROLOL': {'IMPROVED': 0.669, 'NOT_RECORDED': 0.170, 'UNCHANGED': 0.158, 'WORSE': 0.0},
+    'MIDAZOLAM': {'IMPROVED': 0.513, 'NOT_RECORDED': 0.319, 'UNCHANGED': 0.166, 'WORSE': 0.0},
+    'MIDAZOLAM 1 MG/ML [VERSED]': {'IMPROVED': 0.748, 'NOT_RECORDED': 0.082, 'UNCHANGED': 0.163, 'WORSE': 0.007},
+    'MIDAZOLAM 10MG/2ML': {'IMPROVED': 0.671, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.329, 'WORSE': 0.0},
+    'MIDAZOLAM 5 MG/ML [VERSED]': {'IMPROVED': 0.740, 'NOT_RECORDED': 0.076, 'UNCHANGED': 0.183, 'WORSE': 0.002},
+    'MIDAZOLAM 5MG/5ML': {'IMPROVED': 0.938, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.062, 'WORSE': 0.0},
+    'MED_G002': {'IMPROVED': 0.559, 'NOT_RECORDED': 0.231, 'UNCHANGED': 0.204, 'WORSE': 0.003},
+    'MED_J001': {'IMPROVED': 0.373, 'NOT_RECORDED': 0.219, 'UNCHANGED': 0.405, 'WORSE': 0.001},
+    'NITROGLYCERIN': {'IMPROVED': 0.540, 'NOT_RECORDED': 0.185, 'UNCHANGED': 0.266, 'WORSE': 0.010},
+    'MED_T002': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.25, 'UNCHANGED': 0.5, 'WORSE': 0.0},
+    'NORMAL SALINE': {'IMPROVED': 0.297, 'NOT_RECORDED': 0.212, 'UNCHANGED': 0.492, 'WORSE': 0.003},
+    'ONDANSETRON': {'IMPROVED': 0.484, 'NOT_RECORDED': 0.234, 'UNCHANGED': 0.305, 'WORSE': 0.001},
+    'MED_D001': {'IMPROVED': 0.617, 'NOT_RECORDED': 0.211, 'UNCHANGED': 0.172, 'WORSE': 0.003},
+    'ROCURONIUM': {'IMPROVED': 0.509, 'NOT_RECORDED': 0.263, 'UNCHANGED': 0.229, 'WORSE': 0.0},
+    'SODIUM BICARBONATE': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.271, 'UNCHANGED': 0.643, 'WORSE': 0.0},
+    'SODIUM CHLORIDE': {'IMPROVED': 0.1, 'NOT_RECORDED': 0.05, 'UNCHANGED': 0.85, 'WORSE': 0.0},
+    'STERILE WATER': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0},
+    'SUCCINYLCHOLINE': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0},
+    'TETRACAINE': {'IMPROVED': 0.718, 'NOT_RECORDED': 0.154, 'UNCHANGED': 0.103, 'WORSE': 0.026},
+    'VECURONIUM': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0}
+}
+
+# Administration site distribution by medication (raw counts)
+MEDICATION_SITE_DISTRIBUTIONS = {
+    'ALBUTEROL': {'ANTECUBIT ARM-LEFT': 1, 'MOUTH': 10},
+    'DEXTROSE 10%': {'ANTECUBIT ARM-LEFT': 1, 'HAND-LEFT': 1},
+    'DIPHENHYDRAMINE': {'ANTECUBITAL-LEFT': 2, 'ARM-RIGHT': 2, 'LOWER EXT': 1},
+    'EPI 1:1,000': {'HUMERAL I': 1, 'OTHER': 1},
+    'EPI 1:10,000': {'ANTECUBIT ARM-LEFT': 1},
+    'EPI 1:100,000 (PDP)': {'HUMERAL': 2},
+    'EPI 1:100,000 PDP': {'ANTECUBITAL-LEFT': 2},
+    'FENTANYL': {'ANTECUBITAL-LEFT': 11, 'ANTECUBIT ARM-LEFT': 7, 'ARM-RIGHT': 4, 'HUMERAL I': 1, 'NOSE': 3, 'OTHER': 1},
+    'GLUCOSE': {'MOUTH': 7},
+    'IPRATROPIUM': {'MOUTH': 11},
+    'KETAMINE': {'ANTECUBITAL-LEFT': 2, 'ANTECUBIT ARM-LEFT': 4, 'ARM-RIGHT': 1, 'HAND-LEFT': 1, 'HUMERAL I': 1},
+    'LABETALOL': {'ANTECUBITAL-LEFT': 1},
+    'LEVOPHED': {'ARM-RIGHT': 1, 'HUMERAL I': 1},
+    'METHYLPREDNISOLONE': {'ANTECUBITAL-LEFT': 2, 'ANTECUBIT ARM-LEFT': 1},
+    'METOPROLOL': {'ARM-RIGHT': 1},
+    'MIDAZOLAM 1 MG/ML [VERSED]': {'LOWER EXT': 1},
+    'MIDAZOLAM 5 MG/ML [VERSED]': {'ANTECUBITAL-LEFT': 1, 'ARM-RIGHT': 1},
+    'MIDAZOLAM 5MG/5ML': {'LOWER EXT': 1},
+    'MED_G002': {'ANTECUBITAL-LEFT': 1},
+    'MED_J001': {'ANTECUBITAL-LEFT': 1, 'HUMERAL I': 1, 'NOSE': 2},
+    'NITROGLYCERIN': {'MOUTH': 13},
+    'NORMAL SALINE': {'ANTECUBITAL-LEFT': 6, 'ANTECUBIT ARM-LEFT': 7, 'ARM-RIGHT': 2, 'HAND-LEFT': 1},
+    'ONDANSETRON': {'ANTECUBITAL-LEFT': 9, 'ANTECUBIT ARM-LEFT': 9, 'ARM-RIGHT': 3, 'HAND-LEFT': 1, 'HUMERAL I': 1},
+    'MED_D001': {'MOUTH': 2, 'OTHER': 9},
+    'ROCURONIUM': {'ANTECUBIT ARM-LEFT': 1, 'HUMERAL I': 1, 'OTHER': 1},
+    'SUCCINYLCHOLINE': {'ANTECUBITAL-LEFT': 1}
+}
+
+EMS_MEDICATIONS_BY_NAME = {med['name']: med for med in EMS_MEDICATIONS}
+
+# Patient demographic, social and functional status distributions (synthetic)
+EMS_PATIENT_DISTRIBUTIONS = {
+    'marital_status_18_24': {'SINGLE': 0.8, 'MARRIED': 0.2},
+    'marital_status_25_64': {'MARRIED': 0.6, 'SINGLE': 0.25, 'DIVORCED': 0.1, 'WIDOWED': 0.05},
+    'marital_status_65_plus': {'MARRIED': 0.4, 'WIDOWED': 0.35, 'SINGLE': 0.15, 'DIVORCED': 0.1},
+    'insurance_provider': {
+        'AETNA': 0.15, 'ANTHEM': 0.15, 'BLUE_CROSS_BLUE_SHIELD': 0.20, 'CIGNA': 0.10, 'HUMANA': 0.10,
+        'KAISER_PERMANENTE': 0.05, 'MEDICARE': 0.10, 'MEDICAID': 0.05, 'UNITED_HEALTHCARE': 0.08, 'SELF_PAY': 0.02
+    },
+    'education_level_18_24': {'HIGH_SCHOOL': 0.6, 'SOME_COLLEGE': 0.4},
+    'education_level_25_plus': {
+        'LESS_THAN_HIGH_SCHOOL': 0.15, 'HIGH_SCHOOL': 0.35, 'SOME_COLLEGE': 0.25, 'BACHELORS_DEGREE': 0.15, 'GRADUATE_DEGREE': 0.10
+    },
+    'smoking_status': {'NEVER': 0.6, 'FORMER': 0.25, 'CURRENT': 0.15},
+    'alcohol_use': {'NONE': 0.4, 'OCCASIONAL': 0.35, 'MODERATE': 0.2, 'HEAVY': 0.05},
+    'drug_use': {'NONE': 0.85, 'RECREATIONAL': 0.1, 'PRESCRIPTION_MISUSE': 0.05},
+    'exercise_frequency': {'NONE': 0.3, 'OCCASIONAL': 0.4, 'REGULAR': 0.25, 'DAILY': 0.05},
+    'mobility_status': {'INDEPENDENT': 0.8, 'ASSISTED': 0.15, 'WHEELCHAIR': 0.04, 'BEDBOUND': 0.01},
+    'cognitive_status': {'NORMAL': 0.85, 'MILD_IMPAIRMENT': 0.1, 'MODERATE_IMPAIRMENT': 0.04, 'SEVERE_IMPAIRMENT': 0.01},
+    'living_situation': {'ALONE': 0.3, 'WITH_FAMILY': 0.35, 'WITH_SPOUSE': 0.25, 'ASSISTED_LIVING': 0.08, 'NURSING_HOME': 0.02},
+    'caregiver_status': {'NONE': 0.6, 'FAMILY': 0.3, 'PAID_CAREGIVER': 0.08, 'HEALTHCARE_FACILITY': 0.02},
+    'preferred_language': {'ENGLISH': 0.85, 'SPANISH': 0.1, 'CHINESE': 0.02, 'OTHER': 0.03},
+    'disability_status': {'NONE': 0.9, 'PHYSICAL': 0.06, 'COGNITIVE': 0.03, 'BOTH': 0.01},
+    'occupation_16_17': {'STUDENT': 0.8, 'PART_TIME_WORKER': 0.15, 'UNEMPLOYED': 0.05},
+    'occupation_18_64': {
+        'OFFICE_WORKER': 0.25, 'HEALTHCARE_WORKER': 0.15, 'EDUCATOR': 0.10, 'RETAIL_WORKER': 0.15, 'CONSTRUCTION_WORKER': 0.10,
+        'TECHNICAL_WORKER': 0.10, 'SERVICE_WORKER': 0.08, 'MANAGER': 0.05, 'SELF_EMPLOYED': 0.02, 'UNEMPLOYED': 0.05
+    },
+    'occupation_65_plus': {'RETIRED': 0.85, 'PART_TIME_WORKER': 0.10, 'UNEMPLOYED': 0.05},
+    'allergy_count': {1: 0.6, 2: 0.25, 3: 0.10, 4: 0.05},
+    'current_medication_count': {1: 0.4, 2: 0.3, 3: 0.15, 4: 0.10, 5: 0.05},
+    'chronic_condition_count': {1: 0.5, 2: 0.3, 3: 0.15, 4: 0.05},
+    'family_history_count': {1: 0.6, 2: 0.3, 3: 0.1},
+    'bmi_category': {
+        'UNDERWEIGHT': 0.03, 'NORMAL': 0.35, 'OVERWEIGHT': 0.35, 'OBESE_CLASS_1': 0.20, 'OBESE_CLASS_2': 0.05, 'OBESE_CLASS_3': 0.02
+    },
+    'patient_reuse_decision': {'NEW_PATIENT': 0.70, 'REUSE_EXISTING': 0.20, 'FREQUENT_CALLER': 0.10},
+    'medications_per_incident': {1: 0.5, 2: 0.35, 3: 0.15},
+}
+
+
+class AliasTable:
+    """Walker alias table for O(1) draws from a fixed {value: weight} distribution"""
+
+    def __init__(self, values, weights):
+        weights = [float(weight) for weight in weights]
+        total = sum(weights)
+        if len(weights) == 0 or total <= 0:
+            raise ValueError("Total of weights must be greater than zero")
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        self.values = list(values)
+        self._n = n
+        # Plain lists keep scalar draws (and import) free of NumPy; sample_many builds arrays on first use
+        self._prob_list = prob
+        self._alias_list = alias
+        self._arrays = None
+
+    @classmethod
+    def from_dict(cls, distribution):
+        return cls(distribution.keys(), list(distribution.values()))
+
+    def sample(self):
+        """Draw one value using the module-level random generator"""
+        x = random.random() * self._n
+        i = int(x)
+        if x - i < self._prob_list[i]:
+            return self.values[i]
+        return self.values[self._alias_list[i]]
+
+    def sample_many(self, size, rng=None):
+        """Draw `size` values as a NumPy array (uses `rng` if given)"""
+        import numpy as np
+        if self._arrays is None:
+            self._arrays = (np.array(self._prob_list), np.array(self._alias_list), np.array(self.values))
+        prob, alias, value_array = self._arrays
+        rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        x = rng.random(size) * self._n
+        i = x.astype(np.int64)
+        picks = np.where(x - i < prob[i], i, alias[i])
+        return value_array[picks]
+
+
+class SamplerRegistry:
+    """Compiles each categorical distribution once and hands out its AliasTable.
+
+    Conditional distributions ({parent: {value: weight}}) are registered under
+    (name, parent) keys.
+    """
+
+    def __init__(self):
+        self._tables = {}
+
+    def register(self, name, distribution):
+        self._tables[name] = AliasTable.from_dict(distribution)
+        return self._tables[name]
+
+    def register_conditional(self, name, distributions):
+        for parent, distribution in distributions.items():
+            self.register((name, parent), distribution)
+
+    def get_or_compile(self, key, build_distribution):
+        """Return the table for key, compiling build_distribution() on first use"""
+        table = self._tables.get(key)
+        if table is None:
+            table = self.register(key, build_distribution())
+        return table
+
+    def __contains__(self, key):
+        return key in self._tables
+
+    def __getitem__(self, key):
+        return self._tables[key]
+
+    def sample(self, key):
+        return self._tables[key].sample()
+
+
+SAMPLERS = SamplerRegistry()
+SAMPLERS.register('cad_level', CAD_LEVEL_DISTRIBUTION)
+SAMPLERS.register_conditional('provider_type', PROVIDER_TYPE_DISTRIBUTIONS)
+SAMPLERS.register('patient_acuity', PATIENT_ACUITY_DISTRIBUTION)
+SAMPLERS.register_conditional('situation_acuity', SITUATION_ACUITY_DISTRIBUTIONS)
+SAMPLERS.register('patient_disposition', PATIENT_DISPOSITION_DISTRIBUTION)
+SAMPLERS.register('dispatch_complaint', DISPATCH_COMPLAINT_DISTRIBUTION)
+SAMPLERS.register('emd_performed', EMD_PERFORMED_DISTRIBUTION)
+SAMPLERS.register('incident_status', INCIDENT_STATUS_DISTRIBUTION)
+SAMPLERS.register_conditional('prearrival_activation', PREARRIVAL_ACTIVATION_DISTRIBUTIONS)
+SAMPLERS.register('primary_unit_role', PRIMARY_UNIT_ROLE_DISTRIBUTION)
+SAMPLERS.register('attempted_procedure', PROCEDURE_ATTEMPT_COUNTS)
+SAMPLERS.register_conditional('procedure_complication', PROCEDURE_COMPLICATION_DISTRIBUTIONS)
+SAMPLERS.register_conditional('medication_route', {med['name']: med['routes'] for med in EMS_MEDICATIONS if 'routes' in med})
+SAMPLERS.register_conditional('medication_dosage', MEDICATION_DOSAGE_DISTRIBUTIONS)
+SAMPLERS.register_conditional('medication_unit', MEDICATION_UNIT_DISTRIBUTIONS)
+SAMPLERS.register_conditional('medication_response', MEDICATION_RESPONSE_DISTRIBUTIONS)
+SAMPLERS.register_conditional('medication_site', MEDICATION_SITE_DISTRIBUTIONS)
+for _name, _distribution in EMS_PATIENT_DISTRIBUTIONS.items():
+    SAMPLERS.register(_name, _distribution)
+
+# EMS records are slotted (no per-instance __dict__; serialize with record_to_dict).
+# CATEGORICAL_FIELDS are strings built per record from a small set of values; they
+# are interned on creation so equal values share one object.
+@dataclass(slots=True)
 class EMSIncident:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = (
+        'incident_subtype', 'responding_unit', 'unit_call_sign',
+        'initial_patient_assessment', 'final_patient_assessment',
+    )
+
     incident_id: str
     incident_number: str
     call_number: str
@@ -212,7 +1362,10 @@ class EMSIncident:
     pain_scale_score: Optional[int] = None
     glasgow_coma_scale: Optional[int] = None
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class EMSMedication:
     medication_id: str
     administered_prior_to_ems_care: str
@@ -234,9 +1387,11 @@ class EMSMedication:
     administered_datetime: str
     broken_seal: str
 
-@dataclass
+@dataclass(slots=True)
 class EMSReport:
     """Comprehensive EMS report that links to persons, medications, and incidents"""
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('unit_call_sign',)
+
     # Report Identification
     report_id: str
     report_number: str
@@ -340,7 +1495,11 @@ class EMSReport:
     billing_status: str
     insurance_verified: bool
     patient_signature_obtained: bool
-@dataclass
+
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class EMSPatient:
     # Basic Demographics
     patient_id: str
@@ -415,12 +1574,718 @@ class EMSPatient:
     disability_status: str
 
 
+# Record dataclass of each ems_* entity file (gives the Parquet schema)
+EMS_RECORD_TYPES = {
+    'ems_incidents': EMSIncident,
+    'ems_patients': EMSPatient,
+    'ems_medications': EMSMedication,
+    'ems_reports': EMSReport,
+}
+
+
+@dataclass
+class EMSIncidentBatch:
+    """Columnar batch of EMS incidents - one NumPy array per field"""
+    columns: Dict[str, Any]  # field -> np.ndarray (numpy is imported lazily)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    @property
+    def column_names(self):
+        return list(self.columns.keys())
+
+    def to_dataframe(self):
+        """Return the batch as a pandas DataFrame (datetime columns stay typed)"""
+        import pandas as pd
+        return pd.DataFrame(self.columns, copy=False)
+
+    def to_records(self):
+        """Return the batch as a list of dicts with datetimes formatted like EMSIncident"""
+        import numpy as np
+        plain_columns = {}
+        for name, values in self.columns.items():
+            if np.issubdtype(values.dtype, np.datetime64):
+                plain_columns[name] = [value.replace('T', ' ') for value in np.datetime_as_string(values, unit='s').tolist()]
+            else:
+                plain_columns[name] = values.tolist()
+        names = list(plain_columns.keys())
+        return [dict(zip(names, row)) for row in zip(*plain_columns.values())]
+
+
+@dataclass
+class EMSShard:
+    """One generation chunk: incidents with the patients, medications and reports linked to them"""
+    index: int
+    incidents: List[EMSIncident]
+    patients: List[EMSPatient]
+    medications: List[EMSMedication]
+    reports: List[EMSReport]
+
+    def to_dicts(self):
+        """Entity name -> list of record dicts (the layout of the ems_*.json files)"""
+        return {
+            'ems_incidents': [record_to_dict(incident) for incident in self.incidents],
+            'ems_patients': [record_to_dict(patient) for patient in self.patients],
+            'ems_medications': [record_to_dict(medication) for medication in self.medications],
+            'ems_reports': [record_to_dict(report) for report in self.reports],
+        }
+
+    def write_records(self, output_dir, fmt=DEFAULT_RECORD_FORMAT):
+        """Write each entity to <output_dir>/<entity>_shard_<index>.<ext>; returns entity -> (path, count)"""
+        os.makedirs(output_dir, exist_ok=True)
+        written = {}
+        for name, records in self.to_dicts().items():
+            path = record_path(output_dir, f"{name}_shard_{self.index:05d}", fmt)
+            with open_record_writer(path, fmt, EMS_RECORD_TYPES[name]) as writer:
+                writer.write_many(records)
+            written[name] = (path, writer.count)
+        return written
+
+
+# StagedRecordLinker: incidents joined per query batch, and the most ? parameters put in one SQL statement
+LINK_BATCH_SIZE = 1000
+SQLITE_MAX_PARAMS = 900
+
+
+class EMSRecordLinker:
+    """Hash-join of EMS incidents with their patients and medications.
+
+    Patient and medication indexes are built once; link() then streams
+    (incident, patient, [medications]) tuples in incident order. Records can be
+    dataclass instances, namespaces or plain dicts.
+    """
+
+    def __init__(self, patients, medications):
+        self._patients_by_incident = {}
+        self._patients_by_id = {}
+        for patient in patients or []:
+            incident_id = self._field(patient, 'incident_id')
+            if incident_id and incident_id not in self._patients_by_incident:
+                self._patients_by_incident[incident_id] = patient
+            patient_id = self._field(patient, 'patient_id')
+            if patient_id and patient_id not in self._patients_by_id:
+                self._patients_by_id[patient_id] = patient
+
+        self._medications_by_incident = {}
+        for medication in medications or []:
+            incident_id = self._field(medication, 'incident_id')
+            if incident_id:
+                self._medications_by_incident.setdefault(incident_id, []).append(medication)
+
+    @staticmethod
+    def _field(record, name):
+        if isinstance(record, dict):
+            return record.get(name)
+        return getattr(record, name, None)
+
+    def patient_for(self, incident):
+        """Patient recorded against this incident, else the incident's patient by id (or None)"""
+        patient = self._patients_by_incident.get(self._field(incident, 'incident_id'))
+        if patient is None:
+            patient_id = self._field(incident, 'patient_id') or self._field(incident, 'patient_person_id')
+            patient = self._patients_by_id.get(patient_id)
+        return patient
+
+    def medications_for(self, incident):
+        return self._medications_by_incident.get(self._field(incident, 'incident_id'), [])
+
+    def link(self, incidents):
+        """Yield (incident, patient, medications) for each incident"""
+        for incident in incidents:
+            yield incident, self.patient_for(incident), self.medications_for(incident)
+
+
+class StagedRecordLinker:
+    """EMSRecordLinker for inputs too big to index in memory.
+
+    Patients and medications (any iterables of dicts, e.g. iter_records) are
+    staged into a SQLite table on disk as they stream past; link() then joins
+    incidents against it a batch at a time, so memory stays bounded by the
+    batch. Pass incidents' ids as incident_ids (e.g. under --limit) to stage
+    only the records those incidents need; patient input is then read only
+    until every incident has its patient. Same matching rules as EMSRecordLinker.
+    """
+
+    def __init__(self, patients, medications, incident_ids=None, patient_ids=None, path=None,
+                 batch_size=LINK_BATCH_SIZE):
+        import sqlite3
+        import tempfile
+        self.batch_size = batch_size
+        self._path = path
+        if path is None:
+            handle, self._path = tempfile.mkstemp(prefix='ems_link_', suffix='.sqlite')
+            os.close(handle)
+        self._owns_path = path is None
+        if incident_ids is not None:
+            incident_ids = set(incident_ids)
+            patient_ids = set(patient_ids or ())
+        self._conn = sqlite3.connect(self._path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE patients (seq INTEGER PRIMARY KEY, incident_id TEXT, patient_id TEXT, record TEXT)")
+        self._conn.execute("CREATE TABLE medications (seq INTEGER PRIMARY KEY, incident_id TEXT, record TEXT)")
+        self._stage_patients(patients, incident_ids, patient_ids)
+        self._stage_medications(medications, incident_ids)
+        # Indexes after loading: one sort instead of an index update per row
+        self._conn.execute("CREATE INDEX idx_patients_incident ON patients (incident_id)")
+        self._conn.execute("CREATE INDEX idx_patients_id ON patients (patient_id)")
+        self._conn.execute("CREATE INDEX idx_medications_incident ON medications (incident_id)")
+        self._conn.commit()
+
+    def _stage_patients(self, patients, incident_ids, patient_ids):
+        rows = []
+        missing = set(incident_ids) if incident_ids is not None else None
+        for patient in patients or []:
+            incident_id = patient.get('incident_id')
+            patient_id = patient.get('patient_id')
+            if missing is not None:
+                if incident_id not in incident_ids and patient_id not in patient_ids:
+                    continue
+                missing.discard(incident_id)
+            rows.append((incident_id, patient_id, json.dumps(patient)))
+            if len(rows) >= self.batch_size:
+                self._conn.executemany("INSERT INTO patients (incident_id, patient_id, record) VALUES (?, ?, ?)", rows)
+                rows = []
+            if missing is not None and not missing:
+                break  # Every incident has the first patient recorded against it
+        self._conn.executemany("INSERT INTO patients (incident_id, patient_id, record) VALUES (?, ?, ?)", rows)
+
+    def _stage_medications(self, medications, incident_ids):
+        rows = []
+        for medication in medications or []:
+            incident_id = medication.get('incident_id')
+            if not incident_id or (incident_ids is not None and incident_id not in incident_ids):
+                continue
+            rows.append((incident_id, json.dumps(medication)))
+            if len(rows) >= self.batch_size:
+                self._conn.executemany("INSERT INTO medications (incident_id, record) VALUES (?, ?)", rows)
+                rows = []
+        self._conn.executemany("INSERT INTO medications (incident_id, record) VALUES (?, ?)", rows)
+
+    def _first_by(self, column, keys):
+        """key -> first staged patient whose column equals key"""
+        found = {}
+        keys = [key for key in set(keys) if key]
+        for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+            chunk = keys[start:start + SQLITE_MAX_PARAMS]
+            rows = self._conn.execute(
+                f"SELECT {column}, record FROM patients WHERE {column} IN ({','.join('?' * len(chunk))}) ORDER BY seq",
+                chunk
+            )
+            for key, record in rows:
+                if key not in found:
+                    found[key] = json.loads(record)
+        return found
+
+    def _medications_by_incident(self, incident_ids):
+        found = {}
+        incident_ids = [incident_id for incident_id in set(incident_ids) if incident_id]
+        for start in range(0, len(incident_ids), SQLITE_MAX_PARAMS):
+            chunk = incident_ids[start:start + SQLITE_MAX_PARAMS]
+            rows = self._conn.execute(
+                f"SELECT incident_id, record FROM medications WHERE incident_id IN ({','.join('?' * len(chunk))}) ORDER BY seq",
+                chunk
+            )
+            for incident_id, record in rows:
+                found.setdefault(incident_id, []).append(json.loads(record))
+        return found
+
+    def link(self, incidents):
+        """Yield (incident, patient, medications) for each incident, joining a batch at a time"""
+        batch = []
+        for incident in incidents:
+            batch.append(incident)
+            if len(batch) >= self.batch_size:
+                yield from self._link_batch(batch)
+                batch = []
+        yield from self._link_batch(batch)
+
+    def _link_batch(self, incidents):
+        if not incidents:
+            return
+        incident_ids = [incident.get('incident_id') for incident in incidents]
+        by_incident = self._first_by('incident_id', incident_ids)
+        unmatched = [incident.get('patient_id') or incident.get('patient_person_id')
+                     for incident in incidents if incident.get('incident_id') not in by_incident]
+        by_id = self._first_by('patient_id', unmatched) if unmatched else {}
+        medications = self._medications_by_incident(incident_ids)
+        for incident, incident_id in zip(incidents, incident_ids):
+            patient = by_incident.get(incident_id)
+            if patient is None:
+                patient = by_id.get(incident.get('patient_id') or incident.get('patient_person_id'))
+            yield incident, patient, medications.get(incident_id, [])
+
+    def close(self):
+        """Drop the staging database"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            if self._owns_path:
+                os.remove(self._path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Bundled address files used by the offline geocoder (relative to this module)
+ADDRESS_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'json')
+ADDRESS_DATA_FILES = [
+    'verified_seattle_addresses.json',
+    'real_seattle_addresses.json',
+    'public_api_addresses.json',
+    'simple_real_addresses.json',
+    'seattle_addresses.json',
+    'generated_addresses.json',
+]
+
+
+class OfflineGeocoder:
+    """Forward/reverse geocoding against the bundled address files, no network calls.
+
+    Forward lookups hit a dict keyed on the normalised (address, city, state, zip);
+    addresses without known coordinates fall back to ZIP then city centroids.
+    Reverse lookups search a lat/lon grid outward from the query cell.
+    """
+
+    GRID_DEGREES = 0.01  # ~1.1 km north-south, ~0.75 km east-west at Seattle's latitude
+    KM_PER_DEGREE_LAT = 110.57
+    KM_PER_DEGREE_LON = 75.0  # 111.32 * cos(47.6 deg)
+
+    def __init__(self):
+        self._exact = {}  # normalised address key -> (lat, lon)
+        self._grid = {}  # (lat cell, lon cell) -> [(lat, lon, address tuple)]
+        self._zip_sums = {}  # zip -> [lat sum, lon sum, count]
+        self._city_sums = {}
+        self.addresses = []  # (address, city, state, zip, lat, lon) with coordinates
+
+    @classmethod
+    def from_files(cls, paths=None):
+        """Build a geocoder from JSON address arrays (missing or unreadable files are skipped)"""
+        geocoder = cls()
+        if paths is None:
+            paths = [os.path.join(ADDRESS_DATA_DIR, name) for name in ADDRESS_DATA_FILES]
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for record in records:
+                if isinstance(record, dict):
+                    geocoder.add_address(record.get('address'), record.get('city'), record.get('state'),
+                                         record.get('zip_code'), record.get('latitude'), record.get('longitude'))
+        return geocoder
+
+    @staticmethod
+    def _key(address, city, state, zip_code):
+        return (' '.join(str(address).upper().split()), str(city).upper().strip(),
+                str(state).upper().strip(), str(zip_code).strip()[:5])
+
+    def add_address(self, address, city, state, zip_code, latitude, longitude):
+        """Index one address; records without usable coordinates are ignored"""
+        if not address or not city:
+            return False
+        try:
+            lat, lon = float(latitude), float(longitude)
+        except (TypeError, ValueError):
+            return False
+        key = self._key(address, city, state or 'WA', zip_code or '')
+        if key in self._exact:
+            return False
+        self._exact[key] = (lat, lon)
+        entry = (address, city, state or 'WA', str(zip_code or ''), lat, lon)
+        self.addresses.append(entry)
+        self._grid.setdefault(self._cell(lat, lon), []).append((lat, lon, entry))
+        for sums, name in ((self._zip_sums, key[3]), (self._city_sums, key[1])):
+            if name:
+                acc = sums.setdefault(name, [0.0, 0.0, 0])
+                acc[0] += lat
+                acc[1] += lon
+                acc[2] += 1
+        return True
+
+    def geocode(self, address, city, state, zip_code):
+        """Return (lat, lon, accuracy) for an address, or None when nothing is known about it"""
+        key = self._key(address, city, state, zip_code)
+        if key in self._exact:
+            lat, lon = self._exact[key]
+            return lat, lon, "EXACT_MATCH"
+        for sums, name, accuracy in ((self._zip_sums, key[3], "ZIP_CENTROID"), (self._city_sums, key[1], "CITY_CENTROID")):
+            if name in sums:
+                lat_sum, lon_sum, count = sums[name]
+                return lat_sum / count, lon_sum / count, accuracy
+        return None
+
+    def reverse(self, lat, lon, max_km=1.0):
+        """Nearest known (address, city, state, zip, lat, lon) within max_km, or None"""
+        cell_lat, cell_lon = self._cell(lat, lon)
+        cell_km = self.GRID_DEGREES * min(self.KM_PER_DEGREE_LAT, self.KM_PER_DEGREE_LON)
+        best, best_km = None, max_km
+        for ring in range(int(max_km / cell_km) + 2):
+            # Anything in this ring or beyond is at least (ring - 1) cells away
+            if best is not None and (ring - 1) * cell_km > best_km:
+                break
+            for d_lat in range(-ring, ring + 1):
+                for d_lon in range(-ring, ring + 1):
+                    if max(abs(d_lat), abs(d_lon)) != ring:
+                        continue
+                    for p_lat, p_lon, entry in self._grid.get((cell_lat + d_lat, cell_lon + d_lon), ()):
+                        km = (((p_lat - lat) * self.KM_PER_DEGREE_LAT) ** 2 + ((p_lon - lon) * self.KM_PER_DEGREE_LON) ** 2) ** 0.5
+                        if km <= best_km:
+                            best, best_km = entry, km
+        return best
+
+    def _cell(self, lat, lon):
+        return int(lat // self.GRID_DEGREES), int(lon // self.GRID_DEGREES)
+
+
+# Network geocoding (opt-in): Nominatim endpoint and on-disk cache location
+NOMINATIM_URL = 'https://nominatim.openstreetmap.org'
+GEOCODE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'geocode_cache.sqlite')
+
+
+class GeocodeCache:
+    """SQLite-backed geocode cache keyed by normalised address and by rounded coordinate"""
+
+    def __init__(self, path=GEOCODE_CACHE_PATH):
+        import sqlite3
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS forward_geocode ("
+                "address_key TEXT PRIMARY KEY, latitude REAL NOT NULL, longitude REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS reverse_geocode ("
+                "coord_key TEXT PRIMARY KEY, street_address TEXT NOT NULL, city TEXT)"
+            )
+
+    @staticmethod
+    def address_key(address, city, state, zip_code):
+        return '|'.join(OfflineGeocoder._key(address, city, state, zip_code))
+
+    @staticmethod
+    def coord_key(lat, lon):
+        return f"{lat:.4f},{lon:.4f}"
+
+    def get_forward(self, address_key):
+        """(lat, lon) for an address key, or None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT latitude, longitude FROM forward_geocode WHERE address_key = ?", (address_key,)
+            ).fetchone()
+
+    def get_reverse(self, coord_key):
+        """(street_address, city) for a coordinate key, or None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT street_address, city FROM reverse_geocode WHERE coord_key = ?", (coord_key,)
+            ).fetchone()
+
+    def put_many(self, forward_rows=(), reverse_rows=()):
+        """Store batches of (address_key, lat, lon) and (coord_key, street_address, city) in one transaction"""
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO forward_geocode VALUES (?, ?, ?)", forward_rows)
+            self._conn.executemany("INSERT OR REPLACE INTO reverse_geocode VALUES (?, ?, ?)", reverse_rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class AsyncGeocodeWorker:
+    """Background asyncio worker that resolves geocode requests against a Nominatim API.
+
+    submit_forward/submit_reverse return immediately; requests are drained in
+    batches, spaced by rate_limit seconds on the worker's own event loop, and
+    results are written to the GeocodeCache so later lookups hit it directly.
+    base_url can point at any server speaking the Nominatim /search and
+    /reverse JSON API (e.g. nominatim_stub.py).
+
+    Only an empty or 'error' answer counts as a miss (not asked again this run).
+    Timeouts, connection errors and HTTP 429/5xx are retried up to retries times
+    with exponential backoff from retry_backoff seconds (or the server's
+    Retry-After); a request that still fails is dropped, so a later submit tries again.
+    """
+
+    def __init__(self, cache, base_url=NOMINATIM_URL, rate_limit=1.0, batch_size=25, batch_wait=0.05,
+                 user_agent="seattle_data_generator", timeout=5, retries=2, retry_backoff=1.0):
+        import asyncio
+        self.cache = cache
+        self.base_url = base_url.rstrip('/')
+        self.rate_limit = rate_limit
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self._pending = set()  # request keys queued or in flight
+        self._failed = set()  # keys the server had no answer for (not retried this run)
+        self._idle = threading.Condition()
+        self._loop = asyncio.new_event_loop()
+        self._queue = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="geocode-worker", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def submit_forward(self, address, city, state, zip_code):
+        key = GeocodeCache.address_key(address, city, state, zip_code)
+        query = f"{address}, {city}, {state} {zip_code}"
+        return self._submit(('forward', key, query))
+
+    def submit_reverse(self, lat, lon):
+        return self._submit(('reverse', GeocodeCache.coord_key(lat, lon), (lat, lon)))
+
+    def _submit(self, request):
+        key = request[:2]
+        with self._idle:
+            if key in self._pending or key in self._failed or not self._thread.is_alive():
+                return False
+            self._pending.add(key)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, request)
+        return True
+
+    def flush(self, timeout=None):
+        """Block until every submitted request has been resolved (or timeout)"""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout=timeout)
+
+    def close(self, timeout=None):
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            self._thread.join(timeout)
+
+    def _run(self):
+        import asyncio
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._started.set()
+        try:
+            self._loop.run_until_complete(self._consume())
+        finally:
+            self._loop.close()
+
+    async def _consume(self):
+        import sqlite3
+        import asyncio
+        next_request_time = 0.0
+        stopping = False
+        while not stopping:
+            request = await self._queue.get()
+            if request is None:
+                break
+            batch = [request]
+            while len(batch) < self.batch_size:
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout=self.batch_wait)
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            forward_rows, reverse_rows, failed = [], [], []
+            for kind, key, query in batch:
+                for attempt in range(self.retries + 1):
+                    # Rate limit (and back off) on the worker loop, never in the generation thread
+                    delay = next_request_time - self._loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_request_time = self._loop.time() + self.rate_limit
+                    try:
+                        result = await self._loop.run_in_executor(None, self._fetch, kind, query)
+                        break
+                    except Exception as exc:
+                        retry_after = self._retry_after(exc)
+                        if retry_after is None:
+                            result = None  # Not worth retrying (e.g. HTTP 400); treat as a miss
+                            break
+                        next_request_time = max(next_request_time, self._loop.time() + (
+                            retry_after or self.retry_backoff * 2 ** attempt))
+                else:
+                    continue  # Still failing: drop it without marking a miss, so it can be asked again
+                if result is None:
+                    failed.append((kind, key))
+                elif kind == 'forward':
+                    forward_rows.append((key,) + result)
+                else:
+                    reverse_rows.append((key,) + result)
+            try:
+                self.cache.put_many(forward_rows, reverse_rows)
+            except sqlite3.Error:
+                pass
+            with self._idle:
+                self._failed.update(failed)
+                self._pending.difference_update((kind, key) for kind, key, _ in batch)
+                self._idle.notify_all()
+
+    @staticmethod
+    def _retry_after(exc):
+        """For a transient failure, seconds the server asked to wait (0 = use the backoff); None if not transient"""
+        import urllib.error
+        if isinstance(exc, urllib.error.HTTPError):
+            if exc.code != 429 and exc.code < 500:
+                return None
+            try:
+                return max(0.0, float(exc.headers.get('Retry-After') or 0))
+            except ValueError:
+                return 0.0
+        if isinstance(exc, (OSError, ValueError)):
+            return 0.0  # Timeouts, connection errors (URLError is an OSError), truncated / garbled replies
+        return None
+
+    def _fetch(self, kind, query):
+        """One blocking Nominatim call (runs in the loop's executor); None when the server has no match"""
+        import urllib.parse
+        import urllib.request
+        if kind == 'forward':
+            params = {'q': query, 'format': 'jsonv2', 'limit': 1}
+            url = f"{self.base_url}/search?{urllib.parse.urlencode(params)}"
+        else:
+            params = {'lat': query[0], 'lon': query[1], 'format': 'jsonv2'}
+            url = f"{self.base_url}/reverse?{urllib.parse.urlencode(params)}"
+        req = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            data = json.loads(resp.read().decode('utf-8'))
+
+        if kind == 'forward':
+            if not data:
+                return None
+            return float(data[0]['lat']), float(data[0]['lon'])
+        if not data or 'error' in data:
+            return None
+        parts = data.get('address', {})
+        street_address = ' '.join(p for p in (parts.get('house_number'), parts.get('road')) if p)
+        if not street_address:
+            street_address = data.get('display_name', '').split(', ')[0]
+        city = parts.get('city') or parts.get('town') or parts.get('village')
+        return (street_address, city) if street_address else None
+
+
+class PatientReuseIndex:
+    """Eligibility index over the patient pool for frequent-caller reuse.
+
+    Patients are bucketed by incident count; each bucket is a list of
+    (eligible_at, seq) sorted by the first datetime at which the patient may
+    be reused again.  Incident datetimes are drawn in random order, so the
+    eligible set for a given call time is a bisected prefix of every bucket.
+    """
+
+    MAX_INCIDENTS = 8  # Max 8 incidents per patient
+
+    def __init__(self):
+        self._buckets = {count: [] for count in range(1, self.MAX_INCIDENTS)}
+        self._patients = {}  # seq -> pooled patient record
+        self._members = {}  # patient_id -> seqs of pooled records sharing it
+        self._state = {}  # patient_id -> (incident_count, last_incident_date)
+        self._positions = {}  # seq -> (count, eligible_at) currently indexed
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self._patients)
+
+    @staticmethod
+    def min_days_between_incidents(incident_count):
+        """Realistic time gaps between incidents"""
+        if incident_count == 0:  # First reuse
+            return 1  # Can reuse same day
+        elif incident_count == 1:  # Second incident
+            return 7  # At least a week
+        elif incident_count < 4:  # 3rd-4th incident
+            return 14  # At least 2 weeks
+        return 30  # Frequent caller (5+ incidents): at least a month
+
+    def add_patient(self, patient):
+        """Add a pooled patient record (indexed once it has an incident)"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._patients[seq] = patient
+        self._members.setdefault(patient['patient_id'], []).append(seq)
+        if patient['patient_id'] in self._state:
+            self._index(seq, *self._state[patient['patient_id']])
+
+    def record_incident(self, patient_id, incident_datetime):
+        """Record an incident and re-index every pooled record for that patient"""
+        count, last = self._state.get(patient_id, (0, None))
+        count += 1
+        last = incident_datetime if last is None else max(last, incident_datetime)
+        self._state[patient_id] = (count, last)
+        if count > self.MAX_INCIDENTS:
+            return  # Already past reuse at its previous incident, so none of its records are indexed
+        for seq in self._members.get(patient_id, []):
+            self._unindex(seq)
+            self._index(seq, count, last)
+
+    def choose(self, incident_datetime):
+        """Pick an eligible patient weighted by 1 + 0.5 * incident_count, or None"""
+        counts = []
+        weights = []
+        for count, entries in self._buckets.items():
+            eligible = bisect_right(entries, (incident_datetime, float('inf')))
+            if eligible:
+                counts.append((count, eligible))
+                # Higher weight for patients with more incidents (frequent callers)
+                weights.append((1 + count * 0.5) * eligible)
+        if not counts:
+            return None
+        count, eligible = random.choices(counts, weights=weights, k=1)[0]
+        _, seq = self._buckets[count][random.randrange(eligible)]
+        return self._patients[seq]
+
+    def _index(self, seq, count, last):
+        if count >= self.MAX_INCIDENTS:
+            return
+        eligible_at = last + timedelta(days=self.min_days_between_incidents(count))
+        insort(self._buckets[count], (eligible_at, seq))
+        self._positions[seq] = (count, eligible_at)
+
+    def _unindex(self, seq):
+        position = self._positions.pop(seq, None)
+        if position is not None:
+            count, eligible_at = position
+            entries = self._buckets[count]
+            del entries[bisect_right(entries, (eligible_at, seq)) - 1]
+
+
+# Per-process generator for generate_incidents_batch pool workers (set by the pool initializer)
+_worker_generator = None
+
+
 class EMSDataGenerator:
     """EMS-specific data generation functionality"""
     
-    def __init__(self, fake_instance=None):
-        """Initialize with optional faker instance"""
+    INCIDENT_CHUNK_SIZE = 500  # Incidents per seeded work unit (fixed, so output doesn't depend on worker count)
+    
+    def __init__(self, fake_instance=None, fast_vocabulary=False):
+        """Initialize with optional faker instance.
+
+        fast_vocabulary serves names, timestamps and birth dates from batched
+        vocabulary pools (vocabulary.FastFaker) instead of Faker.
+        """
+        from faker import Faker
         self.fake = fake_instance or Faker()
+        self._fast_vocabulary = fast_vocabulary
+        if fast_vocabulary:
+            from vocabulary import FastFaker
+            self.fake = FastFaker(self.fake)
         
         # Address caching system (DISABLED for speed
         self._address_cache = deque(maxlen=2000)  # Cache up to 2000 addresses
@@ -428,8 +2293,12 @@ class EMSDataGenerator:
         self._cache_initialized = False
         self._bypass_address_caching = True  # Skip address cache, use optimized geocoding
         self._geocoding_cache = {}  # Cache successful geocoding results
+        self._offline_geocoder = None  # Built lazily from the bundled address files
+        self._geocoder_lock = threading.Lock()
+        self._use_network_geocoding = False  # Nominatim fallback; see enable_network_geocoding()
         self._geocoding_rate_limit = 0.5  # Minimum seconds between geocoding calls
-        self._last_geocoding_time = 0
+        self._geocode_cache = None  # On-disk GeocodeCache (network geocoding only)
+        self._geocode_worker = None  # AsyncGeocodeWorker filling the cache off the hot path
         self._real_address_pool = []  # Pool of pre-geocoded real addresses
         self._pool_initialized = False
         self._address_lock = threading.Lock()  # Thread-safe address loading
@@ -437,8 +2306,12 @@ class EMSDataGenerator:
         # Copula modeling removed for performance
         
         # Patient pool for 1:Many relationships
-        self._patient_pool = []  # Store generated patients for reuse
-        self._patient_incident_history = {}  # Track incidents per patient
+        self._reset_patient_pool()
+        
+        # Record IDs (see ids.py); seeded batch generation pins "now" and gives each chunk its own ID block
+        self._ids = IdService()
+        self._seeded_ids = None
+        self._reference_time = None
         
         # Initialize cache in background (SKIPPED for speed)
         if not self._bypass_address_caching:
@@ -446,6 +2319,20 @@ class EMSDataGenerator:
         else:
             print("Address caching bypassed for faster generation")
     
+    def _reset_patient_pool(self):
+        """Forget all generated patients (no reuse across the reset)"""
+        self._patient_pool = []  # Store generated patients for reuse
+        self._patient_incident_history = {}  # Track incidents per patient
+        self._patient_reuse_index = PatientReuseIndex()  # Reuse eligibility by incident count
+    
+    def _now(self):
+        """Current time, or the pinned reference time during seeded batch generation"""
+        return self._reference_time or datetime.now()
+    
+    def _new_uuid(self):
+        """Unique uuid4-formatted string from the ID service"""
+        return self._ids.uuid()
+    
     def _initialize_address_cache(self):
         """Initialize address cache with real geocoded addresses (DISABLED for speed)"""
         if self._bypass_address_caching:
@@ -474,9 +2361,6 @@ class EMSDataGenerator:
     
     def _generate_real_geocoded_address(self):
         """Generate a real geocoded address within King County"""
-        from geopy.geocoders import Nominatim
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        
         # King County geographic bounds
         seattle_bounds = {
             'seattle': {
@@ -523,33 +2407,18 @@ class EMSDataGenerator:
         zip_code = random.choice(city_data['zip_codes'])
         
         # Try to reverse geocode to get a real address
-        try:
-            geolocator = Nominatim(user_agent="seattle_data_generator")
-            location = geolocator.reverse(f"{lat}, {lon}", timeout=10)
+        street_address, city = self._reverse_geocode(lat, lon, timeout=10)
+        if street_address:
+            if not city:
+                city = city_name.title()
+            
+            # Add apartment number occasionally
+            full_address = street_address
+            if random.random() < 0.3:
+                apartment_number = f"Apt {random.randint(1, 500)}"
+                full_address = f"{street_address}, {apartment_number}"
             
-            if location and location.address:
-                # Parse the address components
-                address_parts = location.address.split(', ')
-                if len(address_parts) >= 2:
-                    street_address = address_parts[0]
-                    city_state_zip = address_parts[-2] if len(address_parts) >= 3 else f"{city_name.title()}, WA"
-                    
-                    # Extract city name
-                    if ',' in city_state_zip:
-                        city = city_state_zip.split(',')[0].strip()
-                    else:
-                        city = city_name.title()
-                    
-                    # Add apartment number occasionally
-                    full_address = street_address
-                    if random.random() < 0.3:
-                        apartment_number = f"Apt {random.randint(1, 500)}"
-                        full_address = f"{street_address}, {apartment_number}"
-                    
-                    return (full_address, city, 'WA', zip_code)
-        except (GeocoderTimedOut, GeocoderUnavailable, Exception) as e:
-            # Fallback to coordinate-based address if geocoding fails
-            pass
+            return (full_address, city, 'WA', zip_code)
         
         # Fallback: Generate realistic-looking address based on coordinates
         street_numbers = [str(random.randint(100, 9999))]
@@ -571,6 +2440,7 @@ class EMSDataGenerator:
         
         return (address, city_name.title(), 'WA', zip_code)
     
+    @METRICS.timed('ems.address')
     def _get_cached_address(self):
         """Get a random address from the pre-generated address library"""
         if not self._pool_initialized:
@@ -579,566 +2449,78 @@ class EMSDataGenerator:
     
     def _generate_cad_level_and_provider_type(self):
         """Generate CAD level of care and dispatched provider type"""
-        # CAD Level of Care distribution (synthetic)
-        cad_levels = {
-            'BLS': 0.70,    # Most common
-            'AEMT': 0.27,   # Second most common
-            'P': 0.012,     # Third most common
-            'I/P': 0.011,   # Fourth most common
-            'AP': 0.006     # Least common
-        }
-        
         # Select CAD level based on synthetic distribution
-        cad_names = list(cad_levels.keys())
-        cad_weights = list(cad_levels.values())
-        selected_cad_level = random.choices(cad_names, weights=cad_weights, k=1)[0]
-        
-        # Provider type distribution based on selected CAD level (synthetic)
-        provider_distributions = {
-            'BLS': {
-                'ALS': 0.20, 'BLS': 0.17, 'BLS-EMT': 0.11, 'PARAMEDIC': 0.15,
-                'INTERMEDIATE_1': 0.03, 'AEMT/EMT': 0.017, 'INTERMEDIATE_2': 0.006,
-                'EMT': 0.0007, 'BLS-EMR': 0.0003, 'NAN': 0.003, 'No_value': 0.002,
-                'SPECIALTY_Other': 0.0002, 'NURSE_INTERMEDIATE': 0.000006, 'PHYSICIAN': 0.00004
-            },
-            'AEMT': {
-                'ALS': 0.23, 'PARAMEDIC': 0.12, 'BLS-EMT': 0.07, 'BLS': 0.06,
-                'INTERMEDIATE_1': 0.025, 'AEMT/EMT': 0.014, 'INTERMEDIATE_2': 0.006,
-                'EMT': 0.0006, 'BLS-EMR': 0.0003, 'No_value': 0.001, 'NAN': 0.0002,
-                'SPECIALTY_Other': 0.0002, 'NURSE_INTERMEDIATE': 0.000015, 'PHYSICIAN': 0.000035
-            },
-            'P': {
-                'ALS': 0.51, 'PARAMEDIC': 0.30, 'BLS-EMT': 0.11, 'INTERMEDIATE_1': 0.039,
-                'AEMT/EMT': 0.015, 'INTERMEDIATE_2': 0.004, 'BLS': 0.013, 'EMT': 0.0009,
-                'BLS-EMR': 0.0004, 'No_value': 0.001, 'SPECIALTY_Other': 0.0015, 'PHYSICIAN': 0.0005,
-                'NAN': 0.0, 'NURSE_INTERMEDIATE': 0.0
-            },
-            'I/P': {
-                'ALS': 0.50, 'PARAMEDIC': 0.25, 'BLS-EMT': 0.13, 'INTERMEDIATE_1': 0.049,
-                'AEMT/EMT': 0.017, 'INTERMEDIATE_2': 0.007, 'BLS': 0.044, 'EMT': 0.0005,
-                'BLS-EMR': 0.0003, 'No_value': 0.001, 'NAN': 0.0003, 'SPECIALTY_Other': 0.0008,
-                'PHYSICIAN': 0.0003, 'NURSE_INTERMEDIATE': 0.0
-            },
-            'AP': {
-                'ALS': 0.57, 'PARAMEDIC': 0.24, 'BLS-EMT': 0.09, 'INTERMEDIATE_1': 0.027,
-                'AEMT/EMT': 0.023, 'INTERMEDIATE_2': 0.014, 'BLS': 0.017, 'EMT': 0.001,
-                'BLS-EMR': 0.0005, 'No_value': 0.007, 'NAN': 0.004, 'SPECIALTY_Other': 0.008,
-                'PHYSICIAN': 0.0007, 'NURSE_INTERMEDIATE': 0.0
-            }
-        }
+        selected_cad_level = SAMPLERS.sample('cad_level')
         
         # Select provider type based on CAD level distribution
-        provider_dist = provider_distributions[selected_cad_level]
-        provider_names = list(provider_dist.keys())
-        provider_weights = list(provider_dist.values())
-        selected_provider_type = random.choices(provider_names, weights=provider_weights, k=1)[0]
+        selected_provider_type = SAMPLERS.sample(('provider_type', selected_cad_level))
         
         return selected_cad_level, selected_provider_type
     
     def _generate_patient_and_situation_acuity(self):
         """Generate realistic patient acuity and situation acuity"""
-        # Patient Acuity distribution (synthetic)
-        patient_acuity_levels = {
-            'EMERGENT': 0.999,
-            'CRITICAL': 0.0003,
-            'LOWER ACUITY': 0.0009,
-            'SCHEDULED TRANSFER OR STANDBY': 0.0002
-        }
-        
         # Select patient acuity based on synthetic distribution
-        acuity_names = list(patient_acuity_levels.keys())
-        acuity_weights = list(patient_acuity_levels.values())
-        # Normalize to probabilities
-        acuity_total = sum(acuity_weights)
-        if acuity_total > 0:
-            acuity_probs = [w / acuity_total for w in acuity_weights]
-        else:
-            acuity_probs = [1.0 / len(acuity_weights)] * len(acuity_weights)
-        selected_patient_acuity = random.choices(acuity_names, weights=acuity_probs, k=1)[0]
-        
-        # Situation acuity distribution based on selected patient acuity (synthetic)
-        situation_distributions = {
-            'EMERGENT': {
-                'EMERGENT': 0.79, 'CRITICAL (R)': 0.018, 'LOWER ACU': 0.12, 'No value': 0.065,
-                'DEAD WITH': 0.002, 'DECEASED': 0.002, 'NOT APPLIC': 0.004, 'NOT RECOR': 0.0009
-            },
-            'CRITICAL': {
-                'EMERGENT': 0.50, 'CRITICAL (R)': 0.46, 'LOWER ACU': 0.016, 'DEAD WITH': 0.016,
-                'DECEASED': 0.0, 'NOT APPLIC': 0.0, 'NOT RECOR': 0.0, 'No value': 0.0
-            },
-            'LOWER ACUITY': {
-                'LOWER ACU': 0.36, 'EMERGENT': 0.63, 'CRITICAL (R)': 0.003, 'No value': 0.003,
-                'DEAD WITH': 0.003, 'DECEASED': 0.0, 'NOT APPLIC': 0.0, 'NOT RECOR': 0.0
-            },
-            'SCHEDULED TRANSFER OR STANDBY': {
-                'EMERGENT': 0.81, 'LOWER ACU': 0.16, 'NOT APPLIC': 0.027, 'CRITICAL (R)': 0.0,
-                'DEAD WITH': 0.0, 'DECEASED': 0.0, 'NOT RECOR': 0.0, 'No value': 0.0
-            }
-        }
+        selected_patient_acuity = SAMPLERS.sample('patient_acuity')
         
         # Select situation acuity based on patient acuity distribution
-        situation_dist = situation_distributions[selected_patient_acuity]
-        situation_names = list(situation_dist.keys())
-        situation_values = list(situation_dist.values())
-        # Normalize to probabilities
-        situation_total = sum(situation_values)
-        if situation_total > 0:
-            situation_probs = [v / situation_total for v in situation_values]
-        else:
-            situation_probs = [1.0 / len(situation_values)] * len(situation_values)
-        selected_situation_acuity = random.choices(situation_names, weights=situation_probs, k=1)[0]
+        selected_situation_acuity = SAMPLERS.sample(('situation_acuity', selected_patient_acuity))
         
         return selected_patient_acuity, selected_situation_acuity
     def _generate_patient_disposition(self):
         """Generate realistic patient disposition"""
-        disposition_levels = {
-            'TREATED, TRANSPORTED BY THIS EMS UNIT': 0.377,  # Most common
-            'UNIT ASSIST (MANPOWER ONLY)': 0.175,            # Very common
-            'CANCELED (PRIOR TO ARRIVAL AT SCENE)': 0.098,   # Common
-            'PATIENT REFUSAL': 0.091,                        # Common
-            'TREATED, TRANSFERRED CARE': 0.066,              # Common
-            'CANCELED ON SCENE (NO PATIENT CONTACT)': 0.063, # Common
-            'STANDBY (FIRE, EMS OPS, OR PUBLIC SAFTEY EVENT)': 0.021,  # Uncommon
-            'CANCELED (NO PATIENT FOUND)': 0.029,            # Uncommon
-            'TREATED, TRANSPORTED WITH THIS EMS PROVIDER IN ANOTHER VEHICLE': 0.020,  # Uncommon
-            'COMMAND / SUPERVISION ONLY': 0.013,             # Uncommon
-            'CARDIAC ARREST - RESUSCITATION ATTEMPTED (NOT TRANSPORTED)': 0.007,     # Rare
-            'DEAD ON ARRIVAL': 0.005,                        # Rare
-            'PERSON EVALUATED - NO EMS REQUIRED': 0.005,     # Rare
-            'TRANSPORTED TO LANDING ZONE, CARE TRANSFERRED': 0.0002,  # Very rare
-            'MUTUAL AID TX & TRANSPORT': 0.000003            # Extremely rare
-        }
-        
         # Select disposition based on synthetic distribution
-        disposition_names = list(disposition_levels.keys())
-        disposition_weights = list(disposition_levels.values())
-        selected_disposition = random.choices(disposition_names, weights=disposition_weights, k=1)[0]
+        selected_disposition = SAMPLERS.sample('patient_disposition')
         
         return selected_disposition
     
     def _generate_complaint_reported_by_dispatch(self):
-        # Complaint distribution (synthetic)
-        complaint_levels = {
-            'TRAFFIC/TRANSPORTATION INCIDENT': 0.123,      # Most common
-            'SICK PERSON': 0.136,                          # Most common
-            'FALLS': 0.097,                               # Very common
-            'UNCONSCIOUS/FAINTING/NEAR-FAINTING': 0.072,  # Very common
-            'BREATHING PROBLEM': 0.077,                   # Very common
-            'CARDIAC ARREST/DEATH': 0.054,               # Common
-            'CHEST PAIN (NON-TRAUMATIC)': 0.048,         # Common
-            'STROKE/CVA': 0.017,                          # Common
-            'SEIZURE': 0.025,                             # Common
-            'HEMORRHAGE/LACERATION': 0.023,               # Common
-            'FIRE': 0.023,                                # Common
-            'ASSAULT': 0.012,                             # Common
-            'OVERDOSE/POISONING/INGESTION': 0.011,        # Common
-            'PANDEMIC - COVID19': 0.014,                  # Common
-            'PSYCHIATRIC PROBLEM/ABNORMAL E': 0.013,      # Common
-            'PUBLIC SERVICE': 0.014,                      # Common
-            'MEDICAL ALARM': 0.016,                       # Common
-            'HEART PROBLEMS': 0.018,                      # Common
-            'ABDOMINAL PAIN/PROBLEMS': 0.018,             # Common
-            'ALLERGIC REACTION/STINGS': 0.012,           # Common
-            'DIABETIC PROBLEM': 0.010,                    # Common
-            'HAZARD INVESTIGATION': 0.010,                # Common
-            'BACK PAIN (NON-TRAUMATIC)': 0.008,          # Uncommon
-            'UNKNOWN PROBLEM/PERSON DOWN': 0.008,        # Uncommon
-            'CHOKING': 0.005,                             # Uncommon
-            'PREGANCY/CHILDBIRTH/MISCARRIA': 0.003,      # Uncommon
-            'HEADACHE': 0.004,                            # Uncommon
-            'TECHNICAL RESCUE': 0.004,                    # Uncommon
-            'INVESTIGATION': 0.004,                       # Uncommon
-            'HEAT/COLD EXPOSURE': 0.002,                   # Uncommon
-            'WATER RESCUE': 0.001,                         # Uncommon
-            'HAZARDOUS MATERIALS INCIDENT': 0.001,        # Uncommon
-            'TRAUMATIC INJURY': 0.021,                    # Common
-            'GUNSHOT': 0.001,                              # Uncommon
-            'STAB/GUNSHOT WOUND/PENETRATIN': 0.001,       # Uncommon
-            'ASSAULT - SEXUAL': 0.0007,                     # Uncommon
-            'EYE PROBLEM/INJURY': 0.0007,                   # Uncommon
-            'INDUSTRIAL ACCIDENT (INCLUDES EN': 0.0007,    # Uncommon
-            'HAZARDOUS CONDITION': 0.0006,                  # Uncommon
-            'DROWNING': 0.0005,                             # Uncommon
-            'COMMERCIAL FIRE ALARM': 0.0005,               # Uncommon
-            'STANDBY': 0.0004,                              # Uncommon
-            'CARBON MONOXIDE/HAZMAT/INHAL': 0.0004,        # Uncommon
-            'BURNS/EXPLOSION': 0.001,                      # Uncommon
-            'RESIDENTIAL FIRE ALARM': 0.0003,              # Uncommon
-            'AIRCRAFT DOWN': 0.0003,                        # Uncommon
-            'TASER SHOCK': 0.0003,                          # Uncommon
-            'WELL PERSON CHECK': 0.0003,                    # Uncommon
-            'BARIATRIC PATIENT': 0.0001,                     # Uncommon
-            'HANGING': 0.0001,                               # Uncommon
-            'AIRMEDICAL TRANSPORT': 0.0001,                  # Uncommon
-            'PAIN': 0.0001,                                  # Uncommon
-            'RESPIRATORY ARREST': 0.0001,                    # Uncommon
-            'AUTO VS. PEDESTRIAN': 0.00008,                   # Uncommon
-            'AUTOMATED CRASH NOTIFICATION': 0.00008,         # Uncommon
-            'MOTORCYCLE COLLISION': 0.00002,                   # Uncommon
-            'EPISTAXIS (NOSEBLEED)': 0.00002,                  # Uncommon
-            'PENETRATING WOUNDS': 0.00001,                     # Uncommon
-            'SEARCH AND RESCUE': 0.00001,                      # Uncommon
-            'STRUCTURE FIRE': 0.00001,                         # Uncommon
-            'MCI (MULTIPLE CASUALTY INCIDENT)': 0.000008,      # Uncommon
-            'FRACTURE': 0.000005,                               # Uncommon
-            'MEDICAL TRANSPORT': 0.000005,                      # Uncommon
-            'TRANSFER/INTERFACILITY': 0.0003,               # Uncommon
-            'TRANSFER/INTERFACILITY/PALLIATIVE': 0.0008,   # Uncommon
-            'MUTUAL AID-MEDICAL': 0.002,                   # Uncommon
-            'NO OTHER APPROPRIATE CHOICE': 0.002,         # Uncommon
-            'OTHER': 0.0005,                                # Uncommon
-            'CARDIAC ARREST - POSSIBLE DOA': 0.0007,       # Uncommon
-            'ALTERED MENTAL STATUS': 0.00009,                 # Uncommon
-            'FIRE STANDBY': 0.00007,                          # Uncommon
-            'ASSIST OTHER AGENCY': 0.0005,                  # Uncommon
-            'ALCOHOL INTOXICATION': 0.00003,                  # Uncommon
-            'HAZMAT STANDBY': 0.000003,                         # Extremely rare
-            'CONFINED SPACE / STRUCTURE COLLA': 0.000003,      # Extremely rare
-            'VEHICLE FIRE': 0.000003,                           # Extremely rare
-            'ELECTROCUTION/LIGHTNING': 0.0004,              # Uncommon
-            'STABBING': 0.0008,                             # Uncommon
-            'ANIMAL BITE': 0.001                           # Uncommon
-        }
-        
         # Select complaint based on synthetic distribution
-        complaint_names = list(complaint_levels.keys())
-        complaint_weights = list(complaint_levels.values())
-        selected_complaint = random.choices(complaint_names, weights=complaint_weights, k=1)[0]
+        selected_complaint = SAMPLERS.sample('dispatch_complaint')
         
         return selected_complaint
     
     def _generate_incident_emd_performed(self):
-        # EMD performed distribution
-        emd_performed_levels = {
-            'YES, UNKNOWN': 274258,        # Most common (89.8%)
-            'YES, WITH FEEDBACK': 28135,   # Common (9.2%)
-            'NOT RECORDED': 1725,          # Uncommon (0.6%)
-            'NO': 285,                     # Rare (0.1%)
-            'YES, WITHOUT FEEDBACK': 4     # Extremely rare (0.001%)
-        }
-        
         # Select EMD performed based on synthetic distribution
-        emd_names = list(emd_performed_levels.keys())
-        emd_weights = list(emd_performed_levels.values())
-        selected_emd_performed = random.choices(emd_names, weights=emd_weights, k=1)[0]
+        selected_emd_performed = SAMPLERS.sample('emd_performed')
         
         return selected_emd_performed
     
     def _generate_incident_status(self):
         """Generate realistic incident status"""
-        # Incident status distribution
-        status_levels = {
-            'COMPLETED': 224927,        # Most common (61.1%)
-            'BILLED': 144933,           # Very common (39.4%)
-            'IN PROGRESS': 759,         # Uncommon (0.2%)
-            'PENDING': 306,             # Uncommon (0.08%)
-            'READY TO BILL': 114,       # Uncommon (0.03%)
-            'REQUIRES EDIT': 59,        # Uncommon (0.02%)
-            'DOUBLE EP': 12,            # Rare (0.003%)
-            'FINISHED': 6,              # Rare (0.002%)
-            'IMPORTED': 5               # Rare (0.001%)
-        }
-        
         # Select incident status based on synthetic distribution
-        status_names = list(status_levels.keys())
-        status_weights = list(status_levels.values())
-        selected_status = random.choices(status_names, weights=status_weights, k=1)[0]
+        selected_status = SAMPLERS.sample('incident_status')
         
         return selected_status
     
     def _generate_dispatched_vs_prearrival_activation(self, dispatched_provider_type):
         """Generate realistic prearrival activation based on dispatched provider type"""
-        activation_distributions = {
-            'ALS': {
-                'No value': 0.963, 'ADULT TRA': 0.008, 'CARDIAC AI': 0.004, 'STROKE AC': 0.009,
-                'GENERAL TI': 0.001, 'STEMI ACTI': 0.003, 'PEDIATRIC': 0.0004, 'OBSTETRIC': 0.00004
-            },
-            'PARAMEDIC': {
-                'No value': 0.965, 'ADULT TRA': 0.006, 'CARDIAC AI': 0.003, 'STROKE AC': 0.009,
-                'GENERAL TI': 0.001, 'STEMI ACTI': 0.003, 'PEDIATRIC': 0.0003, 'OBSTETRIC': 0.0
-            },
-            'BLS': {
-                'No value': 0.987, 'ADULT TRA': 0.003, 'CARDIAC AI': 0.0002, 'STROKE AC': 0.00006,
-                'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
-            },
-            'BLS-EMT': {
-                'No value': 0.989, 'ADULT TRA': 0.008, 'CARDIAC AI': 0.0004, 'STROKE AC': 0.00006,
-                'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0002, 'OBSTETRIC': 0.0
-            },
-            'EMT': {
-                'No value': 0.988, 'ADULT TRA': 0.010, 'CARDIAC AI': 0.0005, 'STROKE AC': 0.0001,
-                'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0002, 'OBSTETRIC': 0.0
-            },
-            'AEMT': {
-                'No value': 0.989, 'ADULT TRA': 0.011, 'CARDIAC AI': 0.0006, 'STROKE AC': 0.0001,
-                'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
-            },
-            'INTERMEDIATE': {
-                'No value': 0.984, 'ADULT TRA': 0.013, 'CARDIAC AI': 0.0006, 'STROKE AC': 0.0001,
-                'GENERAL TI': 0.003, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0001, 'OBSTETRIC': 0.0
-            },
-            'BLS-EMR': {
-                'No value': 0.988, 'ADULT TRA': 0.009, 'CARDIAC AI': 0.0005, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.002, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            },
-            'AEMT/EMT': {
-                'No value': 0.987, 'ADULT TRA': 0.013, 'CARDIAC AI': 0.0007, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.003, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            },
-            'NAN': {
-                'No value': 0.988, 'ADULT TRA': 0.012, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            },
-            'SPECIALTY': {
-                'No value': 0.988, 'ADULT TRA': 0.011, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.004, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            },
-            'NURSE (IE: FLIGHT NURSE)': {
-                'No value': 0.929, 'ADULT TRA': 0.071, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.0, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            },
-            'PHYSICIAN (OMD)': {
-                'No value': 1.0, 'ADULT TRA': 0.0, 'CARDIAC AI': 0.0, 'STROKE AC': 0.0,
-                'GENERAL TI': 0.0, 'STEMI ACTI': 0.0, 'PEDIATRIC': 0.0, 'OBSTETRIC': 0.0
-            }
-        }
-        
         # Get distribution for the dispatched provider type, default to ALS if not found
-        distribution = activation_distributions.get(dispatched_provider_type, activation_distributions['ALS'])
+        if dispatched_provider_type not in PREARRIVAL_ACTIVATION_DISTRIBUTIONS:
+            dispatched_provider_type = 'ALS'
         
         # Select prearrival activation based on dispatched provider distribution
-        activation_names = list(distribution.keys())
-        activation_weights = list(distribution.values())
-        selected_activation = random.choices(activation_names, weights=activation_weights, k=1)[0]
+        selected_activation = SAMPLERS.sample(('prearrival_activation', dispatched_provider_type))
         
         return selected_activation
     
+    @METRICS.timed('ems.procedures.attempted')
     def _generate_attempted_procedures(self):
         """Generate realistic attempted procedures"""
         # Use default procedure distribution (copula removed for performance)
-        
-        # Default procedure generation
-        procedure_raw_counts = {
-            'CATHETERIZATION OF VEIN': 18079,
-            'ECG, MONITORING': 15320,
-            'ECG, 12 LEAD': 20760,
-            'BLOOD GLUCOSE CHECK': 6351,
-            'BLOOD DRAW': 1004,
-            'MONITORING': 3631,
-            'CERVICAL COLLAR': 756,
-            'AIRWAY SUCTION': 202,
-            'ASSIST VENTILATIONS VIA BVM': 211,
-            'BAG VALVE MASK VENTILATION': 67,
-            'CAPNOGRAPHY': 1584,
-            'APPLICATION OF CERVICAL COLLAR': 172,
-            'APPLICATION OF SPLINT': 47,
-            'APPLICATION OF DRESSING, PRESSURE': 16,
-            'CPAP': 136,
-            'DEFIBRILLATION, MANUAL': 776,
-            'ENDOTRACHEAL INTUBATION - VIDEO': 263,
-            'OROTRACHEAL INTUBATION': 166,
-            'WOUND CARE': 176,
-            'IO CANNULATION': 313,
-            'RAPID SEQUENCE INTUBATION (RSI)': 36,
-            'ETCO2 CAPNOGRAPHY': 329,
-            'VEIN, BLOOD DRAW': 2910,
-            'APPLICATION OF TOURNIQUET': 4,
-            'NASAL AIRWAY INSERTION (NPA)': 63,
-            'ORAL AIRWAY INSERTION (OPA)': 97,
-            'INSERTION OF OROPHARYNGEAL AIRWAY': 31,
-            'CATHETERIZATION OF EXTERNAL JUGULAR': 14,
-            'CERVICAL SPINE IMMOBILIZATION': 50,
-            'CHEST COMPRESSIONS, MECHANICAL': 78,
-            'CPR, MANUAL': 49,
-            'DEFIBRILLATION': 266,
-            'CARDIAC PACING': 10,
-            'CARDIOVERSION': 3,
-            'INSERTION OF NASOGASTRIC TUBE': 7,
-            'INSERTION OF OROGASTRIC TUBE': 11,
-            'INSERTION OF TRACHEOSTOMY TUBE': 3,
-            'INTRAOSSEOUS CANNULATION': 81,
-            'MECHANICAL VENTILATION (VENTILATOR)': 55,
-            'MECHANICALLY ASSISTED CHEST COMPRESSIONS': 35,
-            'NASOPHARYNGEAL AIRWAY INSERTION': 21,
-            'NEEDLE DECOMPRESSION': 9,
-            'OROGASTRIC TUBE INSERTION (OGT)': 22,
-            'ORTHOSTATIC VITAL SIGNS': 1,
-            'PROCEDURE_A001': 5,
-            'PROCEDURE_A002': 93,
-            'PACING': 20,
-            'PELVIC BINDER': 4,
-            'PELVIC SLING/BINDER': 14,
-            'PHYSICAL RESTRAINT': 5,
-            'RAPID SEQUENCE INDUCTION (RSI)': 14,
-            'RECTAL TEMPERATURE': 3,
-            'REMOVAL OF FOREIGN BODY FROM AIRWAY': 3,
-            'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': 26,
-            'SPINAL STABILIZATION': 24,
-            'SPLINTING, GENERAL': 184,
-            'SPLINTING, TRACTION': 7,
-            'STABILIZATION OF SPINE': 4,
-            'TOURNIQUET': 15,
-            'ULTRASOUND': 100,
-            'ULTRASOUND PROCEDURE': 14,
-            'VITAL SIGNS, ORTHOSTATIC': 20,
-            'WOUND CARE (APPLICATION OF CELOX)': 1,
-            'WOUND CARE (GENERAL)': 32,
-            '12 LEAD ECG': 4711,
-            'ACTIVE EXTERNAL COOLING': 4,
-            'ACTIVE EXTERNAL WARMING': 2,
-            'AIRWAY - KING (SUPRAGLOTTIC)': 5,
-            'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': 2,
-            'APPLICATION OF TRACTION USING A TRACTION DEVICE': 2,
-            'BLOOD ADMINISTRATION': 40,
-            'BURN CARE': 4,
-            'CHEMICAL RESTRAINT': 2,
-            'CORE TEMPERATURE MONITORING': 16,
-            'CRICOTHYROIDOTOMY': 1,
-            'DECONTAMINATION': 1,
-            'DELAYED SEQUENCE INTUBATION (DSI)': 10,
-            'DRESSING, OCCLUSIVE': 6,
-            'DRESSING, PRESSURE': 43,
-            'DUAL SEQUENTIAL DEFIBRILLATION': 16,
-            'ENDOTRACHEAL INTUBATION - DIRECT': 5,
-            'EXTERNAL JUGULAR - CATHETERIZATION': 36,
-            'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': 1,
-            'IRRIGATION OF EYE': 1,
-            'IRRIGATION OF WOUND': 21,
-            'IV, INSERTION': 3,
-            'MECHANICAL ASSISTED CPR - LUCAS': 20,
-            'MECHANICAL VENTILATION': 5,
-            'MECHANICAL VENTILATION TITRATION': 1,
-            'PROCEDURE_A003': 2,
-            'OBTURATOR AIRWAY INSERTION': 1,
-            'PACKED BLOOD CELL TRANSFUSION': 4,
-            'PATIENT COOLING': 8,
-            'PATIENT WARMING': 4,
-            'PEEP': 1,
-            'SUPRAGLOTTIC (EG. KING AIRWAY)': 2,
-            'TOURNIQUET (JUNCTIONAL)': 1,
-            'ULTRASONOGRAPHY': 4
-        }
-        
-        # Calculate total count and convert to proportions
-        total_count = sum(procedure_raw_counts.values())
-        procedure_proportions = {proc: count/total_count for proc, count in procedure_raw_counts.items()}
-        
         num_procedures = random.randint(1, 4)
-        procedure_names = list(procedure_proportions.keys())
-        procedure_weights = list(procedure_proportions.values())
-        selected_procedures = random.choices(procedure_names, weights=procedure_weights, k=num_procedures)
+        procedure_table = SAMPLERS['attempted_procedure']
+        selected_procedures = [procedure_table.sample() for _ in range(num_procedures)]
         
         unique_procedures = list(dict.fromkeys(selected_procedures))
         
         return unique_procedures
+    @METRICS.timed('ems.procedures.successful')
     def _generate_successful_procedures(self, attempted_procedures):
-        success_rates = {
-            '12 LEAD ECG': 4616/4711,  # 98.0%
-            'ACTIVE EXTERNAL COOLING': 4/4,  # 100%
-            'ACTIVE EXTERNAL WARMING': 2/2,  # 100%
-            'AIRWAY - KING (SUPRAGLOTTIC)': 5/5,  # 100%
-            'AIRWAY SUCTION': 200/202,  # 99.0%
-            'APPLICATION OF CERVICAL COLLAR': 169/172,  # 98.3%
-            'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': 2/2,  # 100%
-            'APPLICATION OF DRESSING, PRESSURE': 15/16,  # 93.8%
-            'APPLICATION OF SPLINT': 46/47,  # 97.9%
-            'APPLICATION OF TOURNIQUET': 4/4,  # 100%
-            'APPLICATION OF TRACTION USING A TRACTION DEVICE': 2/2,  # 100%
-            'ASSIST VENTILATIONS VIA BVM': 207/211,  # 98.1%
-            'BAG VALVE MASK VENTILATION': 67/67,  # 100%
-            'BLOOD ADMINISTRATION': 40/40,  # 100%
-            'BLOOD DRAW': 994/1004,  # 99.0%
-            'BLOOD GLUCOSE CHECK': 6293/6351,  # 99.1%
-            'BURN CARE': 4/4,  # 100%
-            'CAPNOGRAPHY': 1576/1584,  # 99.5%
-            'CARDIAC PACING': 6/10,  # 60.0%
-            'CARDIOPULMONARY RESUSCITATION': 6/7,  # 85.7%
-            'CARDIOVERSION': 3/3,  # 100%
-            'CATHETERIZATION OF EXTERNAL JUGULAR': 11/14,  # 78.6%
-            'CATHETERIZATION OF VEIN': 13646/18079,  # 75.5%
-            'CERVICAL COLLAR': 736/756,  # 97.4%
-            'CERVICAL SPINE IMMOBILIZATION': 50/50,  # 100%
-            'CHEMICAL RESTRAINT': 2/2,  # 100%
-            'CHEST COMPRESSIONS, MECHANICAL': 69/78,  # 88.5%
-            'CORE TEMPERATURE MONITORING': 14/16,  # 87.5%
-            'CPAP': 134/136,  # 98.5%
-            'CPR, MANUAL': 46/49,  # 93.9%
-            'CRICOTHYROIDOTOMY': 1/1,  # 100%
-            'DECONTAMINATION': 1/1,  # 100%
-            'DEFIBRILLATION': 172/266,  # 64.7%
-            'DEFIBRILLATION, MANUAL': 730/776,  # 94.1%
-            'DELAYED SEQUENCE INTUBATION (DSI)': 10/10,  # 100%
-            'DRESSING, OCCLUSIVE': 6/6,  # 100%
-            'DRESSING, PRESSURE': 43/43,  # 100%
-            'DUAL SEQUENTIAL DEFIBRILLATION': 14/16,  # 87.5%
-            'ECG, 12 LEAD': 20416/20760,  # 98.3%
-            'ECG, MONITORING': 15089/15320,  # 98.5%
-            'ENDOTRACHEAL INTUBATION - DIRECT': 4/5,  # 80.0%
-            'ENDOTRACHEAL INTUBATION - VIDEO': 242/263,  # 92.0%
-            'ETCO2 CAPNOGRAPHY': 326/329,  # 99.1%
-            'EXTERNAL JUGULAR - CATHETERIZATION': 25/36,  # 69.4%
-            'INSERTION OF NASOGASTRIC TUBE': 7/7,  # 100%
-            'INSERTION OF OROGASTRIC TUBE': 11/11,  # 100%
-            'INSERTION OF OROPHARYNGEAL AIRWAY': 28/31,  # 90.3%
-            'INSERTION OF TRACHEOSTOMY TUBE': 3/3,  # 100%
-            'INTRAOSSEOUS CANNULATION': 79/81,  # 97.5%
-            'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': 1/1,  # 100%
-            'IO CANNULATION': 300/313,  # 95.8%
-            'IRRIGATION OF EYE': 1/1,  # 100%
-            'IRRIGATION OF WOUND': 21/21,  # 100%
-            'IV, INSERTION': 2/3,  # 66.7%
-            'MECHANICAL ASSISTED CPR - LUCAS': 20/20,  # 100%
-            'MECHANICAL VENTILATION': 5/5,  # 100%
-            'MECHANICAL VENTILATION (VENTILATOR)': 52/55,  # 94.5%
-            'MECHANICAL VENTILATION TITRATION': 1/1,  # 100%
-            'MECHANICALLY ASSISTED CHEST COMPRESSIONS': 34/35,  # 97.1%
-            'MONITORING': 3599/3631,  # 99.1%
-            'NASAL AIRWAY INSERTION (NPA)': 54/63,  # 85.7%
-            'NASOPHARYNGEAL AIRWAY INSERTION': 18/21,  # 85.7%
-            'NEEDLE DECOMPRESSION': 9/9,  # 100%
-            'PROCEDURE_A003': 2/2,  # 100%
-            'OBTURATOR AIRWAY INSERTION': 1/1,  # 100%
-            'ORAL AIRWAY INSERTION (OPA)': 92/97,  # 94.8%
-            'OROGASTRIC TUBE INSERTION (OGT)': 20/22,  # 90.9%
-            'OROTRACHEAL INTUBATION': 157/166,  # 94.6%
-            'ORTHOSTATIC VITAL SIGNS': 1/1,  # 100%
-            'PROCEDURE_A001': 5/5,  # 100%
-            'PROCEDURE_A002': 93/93,  # 100%
-            'PACING': 17/20,  # 85.0%
-            'PACKED BLOOD CELL TRANSFUSION': 4/4,  # 100%
-            'PATIENT COOLING': 8/8,  # 100%
-            'PATIENT WARMING': 4/4,  # 100%
-            'PEEP': 1/1,  # 100%
-            'PELVIC BINDER': 3/4,  # 75.0%
-            'PELVIC SLING/BINDER': 14/14,  # 100%
-            'PHYSICAL RESTRAINT': 5/5,  # 100%
-            'RAPID SEQUENCE INDUCTION (RSI)': 14/14,  # 100%
-            'RAPID SEQUENCE INTUBATION (RSI)': 35/36,  # 97.2%
-            'RECTAL TEMPERATURE': 3/3,  # 100%
-            'REMOVAL OF FOREIGN BODY FROM AIRWAY': 3/3,  # 100%
-            'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': 26/26,  # 100%
-            'SPINAL STABILIZATION': 23/24,  # 95.8%
-            'SPLINTING, GENERAL': 183/184,  # 99.5%
-            'SPLINTING, TRACTION': 7/7,  # 100%
-            'STABILIZATION OF SPINE': 4/4,  # 100%
-            'SUPRAGLOTTIC (EG. KING AIRWAY)': 1/2,  # 50.0%
-            'TOURNIQUET': 15/15,  # 100%
-            'TOURNIQUET (JUNCTIONAL)': 1/1,  # 100%
-            'ULTRASONOGRAPHY': 4/4,  # 100%
-            'ULTRASOUND': 99/100,  # 99.0%
-            'ULTRASOUND PROCEDURE': 14/14,  # 100%
-            'VEIN, BLOOD DRAW': 2872/2910,  # 98.7%
-            'VITAL SIGNS, ORTHOSTATIC': 20/20,  # 100%
-            'WOUND CARE': 175/176,  # 99.4%
-            'WOUND CARE (APPLICATION OF CELOX)': 1/1,  # 100%
-            'WOUND CARE (GENERAL)': 32/32  # 100%
-        }
-        
         successful_procedures = []
         
         for attempted_proc in attempted_procedures:
-            if attempted_proc in success_rates:
-                success_rate = success_rates[attempted_proc]
+            if attempted_proc in PROCEDURE_SUCCESS_RATES:
+                success_rate = PROCEDURE_SUCCESS_RATES[attempted_proc]
                 if random.random() < success_rate:
                     successful_procedures.append(attempted_proc)
             else:
@@ -1148,120 +2530,15 @@ class EMSDataGenerator:
         
         return successful_procedures
     
+    @METRICS.timed('ems.procedures.complications')
     def _generate_procedure_complications(self, attempted_procedures):
         """Generate synthetic procedure complications based on distributions"""
-        procedure_complications = {
-            '12 LEAD ECG': {'NONE': 0.95, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.05},
-            'ACTIVE EXTERNAL COOLING': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'ACTIVE EXTERNAL WARMING': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
-            'AIRWAY - KING (SUPRAGLOTTIC)': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
-            'AIRWAY SUCTION': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
-            'APPLICATION OF CERVICAL COLLAR': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'APPLICATION OF CHEMICAL HEMOSTATIC AGENTS': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
-            'APPLICATION OF DRESSING, PRESSURE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'APPLICATION OF SPLINT': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
-            'APPLICATION OF TOURNIQUET': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
-            'APPLICATION OF TRACTION USING A TRACTION DEVICE': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
-            'ASSIST VENTILATIONS VIA BVM': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'BAG VALVE MASK VENTILATION': {'NONE': 0.75, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.25},
-            'BLOOD ADMINISTRATION': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
-            'BLOOD DRAW': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'BLOOD GLUCOSE CHECK': {'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
-            'BURN CARE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'CAPNOGRAPHY': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'CARDIAC PACING': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
-            'CARDIOPULMONARY RESUSCITATION': {'NONE': 0.3, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.7},
-            'CARDIOVERSION': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
-            'CATHETERIZATION OF EXTERNAL JUGULAR': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
-            'CATHETERIZATION OF VEIN': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
-            'CERVICAL COLLAR': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'CERVICAL SPINE IMMOBILIZATION': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'CHEMICAL RESTRAINT': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
-            'CHEST COMPRESSIONS, MECHANICAL': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'CORE TEMPERATURE MONITORING': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
-            'CPAP': {'HYPOXIA': 0.0, 'INJURY': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 1.0},
-            'CPR, MANUAL': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
-            'CRICOTHYROIDOTOMY': {'NONE': 0.3, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.7},
-            'DECONTAMINATION': {'NONE': 0.4, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.6},
-            'DEFIBRILLATION': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'DEFIBRILLATION, MANUAL': {'NONE': 0.85, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.15},
-            'DELAYED SEQUENCE INTUBATION (DSI)': {'NONE': 0.5, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.5},
-            'DRESSING, OCCLUSIVE': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
-            'DRESSING, PRESSURE': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'DUAL SEQUENTIAL DEFIBRILLATION': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
-            'ECG, 12 LEAD': {'NONE': 0.95, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.05},
-            'ECG, MONITORING': {'NONE': 0.9, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.1},
-            'ENDOTRACHEAL INTUBATION - DIRECT': {'INJURY': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'NO_VALUE': 1.0},
-            'ENDOTRACHEAL INTUBATION - VIDEO': {'INJURY': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'NO_VALUE': 1.0},
-            'ETCO2 CAPNOGRAPHY': {'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 1.0},
-            'EXTERNAL JUGULAR - CATHETERIZATION': {'HYPOTENSION': 0.0, 'HYPOXIA': 0.0, 'INJURY': 0.0, 'NAUSEA': 0.0, 'NOT_APPLICABLE': 0.99, 'OTHER': 0.0, 'RESPIRATORY': 0.0, 'VOMITING': 0.0, 'NO_VALUE': 0.01},
-            'INSERTION OF NASOGASTRIC TUBE': {'NONE': 0.6, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.4},
-            'INSERTION OF OROGASTRIC TUBE': {'NONE': 0.7, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.3},
-            'INSERTION OF OROPHARYNGEAL AIRWAY': {'NONE': 0.8, 'NOT_APPLICABLE': 0.0, 'NOT_RECORDED': 0.0, 'OTHER': 0.0, 'NO_VALUE': 0.2},
-            'INSERTION OF TRACHEOSTOMY TUBE': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'INTRAOSSEOUS CANNULATION': {'NONE': 81, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'INTUBATION, RAPID SEQUENCE INTUBATION (RSI)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'IO CANNULATION': {'NONE': 313, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'IRRIGATION OF EYE': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'IRRIGATION OF WOUND': {'NONE': 21, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'IV, INSERTION': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MECHANICAL ASSISTED CPR - LUCAS': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MECHANICAL VENTILATION': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MECHANICAL VENTILATION (VENTILATOR)': {'NONE': 55, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MECHANICAL VENTILATION TITRATION': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MECHANICALLY ASSISTED CHEST COMPRESSIONS': {'NONE': 35, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'MONITORING': {'NOT_APPLICABLE': 3631, 'NO_VALUE': 0},
-            'NASAL AIRWAY INSERTION (NPA)': {'NONE': 63, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'NASOPHARYNGEAL AIRWAY INSERTION': {'NONE': 21, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'NEEDLE DECOMPRESSION': {'NONE': 9, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PROCEDURE_A003': {'NONE': 2, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'OBTURATOR AIRWAY INSERTION': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'ORAL AIRWAY INSERTION (OPA)': {'NONE': 97, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'OROGASTRIC TUBE INSERTION (OGT)': {'NONE': 22, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'OROTRACHEAL INTUBATION': {'NONE': 166, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'ORTHOSTATIC VITAL SIGNS': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PROCEDURE_A001': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PROCEDURE_A002': {'NONE': 93, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PACING': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PACKED BLOOD CELL TRANSFUSION': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PATIENT COOLING': {'NONE': 8, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PATIENT WARMING': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PEEP': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PELVIC BINDER': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PELVIC SLING/BINDER': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'PHYSICAL RESTRAINT': {'NONE': 5, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'RAPID SEQUENCE INDUCTION (RSI)': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'RAPID SEQUENCE INTUBATION (RSI)': {'NONE': 36, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'RECTAL TEMPERATURE': {'INJURY': 1, 'NOT_APPLICABLE': 35, 'NO_VALUE': 0},
-            'REMOVAL OF FOREIGN BODY FROM AIRWAY': {'NONE': 3, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'RESPIRED CARBON DIOXIDE MONITORING (REGIME/THERAPY)': {'NONE': 26, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'SPINAL STABILIZATION': {'NONE': 24, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'SPLINTING, GENERAL': {'NONE': 184, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'SPLINTING, TRACTION': {'NONE': 7, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'STABILIZATION OF SPINE': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'SUPRAGLOTTIC (EG. KING AIRWAY)': {'NONE': 2, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'TOURNIQUET': {'NONE': 15, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'TOURNIQUET (JUNCTIONAL)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'ULTRASONOGRAPHY': {'NONE': 4, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'ULTRASOUND': {'NONE': 100, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'ULTRASOUND PROCEDURE': {'NONE': 14, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'VEIN, BLOOD DRAW': {'NONE': 2910, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'VITAL SIGNS, ORTHOSTATIC': {'NONE': 20, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'WOUND CARE': {'NONE': 176, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'WOUND CARE (APPLICATION OF CELOX)': {'NONE': 1, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0},
-            'WOUND CARE (GENERAL)': {'NONE': 32, 'NOT_APPLICABLE': 0, 'NOT_RECORDED': 0, 'OTHER': 0, 'NO_VALUE': 0}
-        }
-        
         procedure_complications_list = []
         
         for procedure in attempted_procedures:
-            if procedure in procedure_complications:
-                complications_dist = procedure_complications[procedure]
-                complication_names = list(complications_dist.keys())
-                complication_weights = list(complications_dist.values())
-                
+            if procedure in PROCEDURE_COMPLICATION_DISTRIBUTIONS:
                 # Select one complication based on the distribution
-                selected_complication = random.choices(complication_names, weights=complication_weights, k=1)[0]
+                selected_complication = SAMPLERS.sample(('procedure_complication', procedure))
                 procedure_complications_list.append({
                     'procedure': procedure,
                     'complication': selected_complication
@@ -1277,70 +2554,199 @@ class EMSDataGenerator:
     
     def _generate_primary_unit_role(self):
         """Generate realistic primary unit role"""
-        # Primary unit role distribution
-        unit_role_levels = {
-            'GROUND TRANSPORT': 246947,
-            'FIRE APPARATUS, NON-TRANSPORT ASSISTANCE': 53303,
-            'FIRE APPARATUS, BLS (NON-TRANSPORT)': 20610,
-            'FIRE APPARATUS': 19076,
-            'NON-TRANSPORT ADMINISTRATIVE (SUPERVISOR)': 20000,
-            'COMMAND/EMS SUPERVISOR': 3848,
-            'NON-TRANSPORT RESCUE': 4185,
-            'FIRE APPARATUS, ALS (NON-TRANSPORT)': 845,
-            'RESCUE': 614,
-            'ALS CHASE': 203
-        }
-        
         # Select primary unit role based on synthetic distribution
-        role_names = list(unit_role_levels.keys())
-        role_weights = list(unit_role_levels.values())
-        selected_unit_role = random.choices(role_names, weights=role_weights, k=1)[0]
+        selected_unit_role = SAMPLERS.sample('primary_unit_role')
         
         return selected_unit_role
     
-    def generate_incidents_batch(self, num_incidents: int, num_processes: int = None):
-        """Generate multiple incidents using parallel processing"""
+    def generate_incidents_batch(self, num_incidents: int, num_processes: int = None, seed: Optional[int] = None,
+                                 chunk_size: int = INCIDENT_CHUNK_SIZE, reference_time: Optional[datetime] = None):
+        """Generate multiple incidents using parallel processing.
+
+        Work is split into fixed-size chunks, each seeded from its own stream spawned off
+        np.random.SeedSequence(seed), so the same seed gives identical incidents for any
+        num_processes. Pool workers build their generator once; chunks come back as they
+        finish and are put back in order by chunk index.
+
+        Call times fall in the two years before reference_time, which defaults to now
+        (midnight today when seeded, so repeated seeded runs on the same day match).
+        """
+        import multiprocessing as mp
         if num_processes is None:
-            num_processes = min(mp.cpu_count(), 4)  # Limit to 4 processes max
+            num_processes = mp.cpu_count()
         
-        if num_incidents < num_processes * 10:
-            # For small batches, use sequential processing
+        if seed is None and num_incidents < num_processes * 10:
+            # For small unseeded batches, use sequential processing
             return self._generate_incidents_sequential(num_incidents)
         
-        # Split work among processes
-        incidents_per_process = num_incidents // num_processes
-        remainder = num_incidents % num_processes
-        
-        # Create process arguments
-        process_args = []
-        for i in range(num_processes):
-            count = incidents_per_process + (1 if i < remainder else 0)
-            if count > 0:
-                process_args.append(count)
-        
-        # Generate incidents in parallel
-        with mp.Pool(processes=num_processes) as pool:
-            results = pool.map(self._generate_incidents_worker, process_args)
+        chunk_results = self._map_seeded_chunks(
+            EMSDataGenerator._generate_incident_chunk, num_incidents, num_processes, seed, chunk_size, reference_time
+        )
         
-        # Flatten results
+        # Flatten results in chunk order
         all_incidents = []
-        for incident_batch in results:
+        for incident_batch in chunk_results:
             all_incidents.extend(incident_batch)
         
         return all_incidents
     
+    def generate_ems_shards(self, num_incidents: int, num_processes: int = None, seed: Optional[int] = None,
+                            chunk_size: int = INCIDENT_CHUNK_SIZE, reference_time: Optional[datetime] = None,
+                            output_dir: Optional[str] = None, output_format: str = DEFAULT_RECORD_FORMAT):
+        """Generate incidents together with their patients, medications and reports, one shard per chunk.
+
+        Each worker builds a whole shard, so the patient, medication and report stages
+        scale with the incident stage and every record links to an incident in its own
+        shard. Seeding follows generate_incidents_batch (a shard's incidents match the
+        same chunk of generate_incidents_batch).
+
+        Returns the EMSShard list in order, or, with output_dir, has each worker write
+        its shard (EMSShard.write_records) and returns the per-shard entity -> (path, count).
+        """
+        return list(self.iter_ems_shards(num_incidents, num_processes, seed, chunk_size, reference_time,
+                                         output_dir, output_format))
+    
+    def iter_ems_shards(self, num_incidents: int, num_processes: int = None, seed: Optional[int] = None,
+                        chunk_size: int = INCIDENT_CHUNK_SIZE, reference_time: Optional[datetime] = None,
+                        output_dir: Optional[str] = None, output_format: str = DEFAULT_RECORD_FORMAT):
+        """generate_ems_shards, yielding each shard in order as soon as it is ready.
+
+        Lets callers stream shards to disk while later ones are still being generated,
+        so only the shards in flight are held in memory.
+        """
+        import multiprocessing as mp
+        if num_processes is None:
+            num_processes = mp.cpu_count()
+        return self._iter_seeded_chunks(
+            EMSDataGenerator._generate_shard_chunk, num_incidents, num_processes, seed, chunk_size, reference_time,
+            task_args=(output_dir, output_format)
+        )
+    
+    def _map_seeded_chunks(self, task, num_items, num_processes, seed, chunk_size, reference_time, task_args=()):
+        """Run task(generator, index, count, chunk_seed, *task_args) per seeded chunk; results in chunk order"""
+        return list(self._iter_seeded_chunks(task, num_items, num_processes, seed, chunk_size, reference_time,
+                                             task_args))
+    
+    def _iter_seeded_chunks(self, task, num_items, num_processes, seed, chunk_size, reference_time, task_args=()):
+        """Yield task results per seeded chunk in chunk order, as each becomes available"""
+        import numpy as np
+        import multiprocessing as mp
+        num_chunks = -(-num_items // chunk_size)
+        library_stream, *chunk_streams = np.random.SeedSequence(seed).spawn(num_chunks + 1)
+        chunks = [
+            (task, index, min(chunk_size, num_items - index * chunk_size), self._seed_from_sequence(stream), task_args)
+            for index, stream in enumerate(chunk_streams)
+        ]
+        # Pin "now" so every chunk draws call times from the same two-year window
+        if reference_time is None:
+            reference_time = self._now()
+            if seed is not None:
+                reference_time = reference_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        worker_args = (self._seed_from_sequence(library_stream), reference_time, self._fast_vocabulary, num_chunks)
+        
+        if num_processes <= 1 or num_chunks <= 1:
+            # Same chunked, seeded path in this process (leaves the caller's random state alone)
+            generator = None
+            for task, index, count, chunk_seed, args in chunks:
+                random_state = random.getstate()
+                try:
+                    if generator is None:
+                        generator = self._create_seeded_worker_generator(*worker_args)
+                    result = task(generator, index, count, chunk_seed, *args)
+                finally:
+                    random.setstate(random_state)
+                yield result
+        else:
+            with mp.Pool(processes=min(num_processes, num_chunks), initializer=EMSDataGenerator._init_incidents_worker,
+                         initargs=worker_args + (METRICS.enabled,)) as pool:
+                # Workers run ahead; out-of-order results wait here until their turn
+                pending = {}
+                next_index = 0
+                for index, result, metrics in pool.imap_unordered(EMSDataGenerator._generate_incidents_worker, chunks):
+                    if metrics is not None:
+                        METRICS.merge(metrics)
+                    pending[index] = result
+                    while next_index in pending:
+                        yield pending.pop(next_index)
+                        next_index += 1
+    
     @staticmethod
-    def _generate_incidents_worker(num_incidents: int):
-        """Worker function for parallel incident generation"""
-        # Create a new generator instance for each process
-        generator = EMSDataGenerator()
-        incidents = []
-        
-        for _ in range(num_incidents):
-            incident = generator.generate_ems_incident()
-            incidents.append(incident)
-        
-        return incidents
+    def _seed_from_sequence(seed_sequence):
+        """128-bit integer seed for random/Faker from a SeedSequence"""
+        return int.from_bytes(seed_sequence.generate_state(4).tobytes(), 'little')
+    
+    @staticmethod
+    def _create_seeded_worker_generator(library_seed, reference_time, fast_vocabulary=False, num_chunks=1):
+        """Generator for seeded batch work; its address library comes from the batch's library stream"""
+        generator = EMSDataGenerator(fast_vocabulary=fast_vocabulary)
+        generator._reference_time = reference_time
+        # Every chunk draws IDs from its own block of one service, so they are unique across the batch
+        generator._seeded_ids = IdService(library_seed, num_blocks=num_chunks)
+        generator._reseed(library_seed)
+        generator._load_address_library()
+        return generator
+    
+    @staticmethod
+    def _init_incidents_worker(library_seed, reference_time, fast_vocabulary=False, num_chunks=1,
+                               metrics_enabled=False):
+        """Pool initializer: build this worker's generator once (collecting metrics if the parent is)"""
+        global _worker_generator
+        if metrics_enabled:
+            METRICS.enable()
+        _worker_generator = EMSDataGenerator._create_seeded_worker_generator(library_seed, reference_time,
+                                                                             fast_vocabulary, num_chunks)
+        METRICS.reset()
+    
+    @staticmethod
+    def _generate_incidents_worker(chunk):
+        """Worker function for parallel chunk generation"""
+        task, index, count, chunk_seed, task_args = chunk
+        result = task(_worker_generator, index, count, chunk_seed, *task_args)
+        # Ship this chunk's metrics back with it; the parent merges them into its own
+        metrics = None
+        if METRICS.enabled:
+            metrics = METRICS.report()
+            METRICS.reset()
+        return index, result, metrics
+    
+    def _generate_incident_chunk(self, index, num_incidents, chunk_seed):
+        """Generate one chunk from its own seed, independent of anything generated before"""
+        self._reseed(chunk_seed)
+        self._ids = self._seeded_ids.for_block(index)
+        # Patient reuse is scoped to the chunk so output doesn't depend on which worker ran it
+        self._reset_patient_pool()
+        return self._generate_incidents_sequential(num_incidents)
+    
+    def _generate_shard_chunk(self, index, num_incidents, chunk_seed, output_dir=None,
+                              output_format=DEFAULT_RECORD_FORMAT):
+        """Generate one shard: a chunk of incidents, then a patient, medications and a report for each"""
+        incidents = self._generate_incident_chunk(index, num_incidents, chunk_seed)
+        patients = []
+        medications = []
+        reports = []
+        for incident in incidents:
+            patient = self.generate_ems_patient(incident)
+            patients.append(patient)
+            
+            # Generate medications for this incident (0-3 medications per incident)
+            incident_medications = [self.generate_ems_medication(incident) for _ in range(random.randint(0, 3))]
+            if not incident_medications:
+                # generate_ems_report would make one up; keep it so the report's link resolves
+                incident_medications = [self.generate_ems_medication(incident)]
+            medications.extend(incident_medications)
+            
+            report = self.generate_ems_report(incident, incident_medications, patient)
+            if report:
+                reports.append(report)
+        
+        shard = EMSShard(index=index, incidents=incidents, patients=patients, medications=medications, reports=reports)
+        if output_dir is not None:
+            return shard.write_records(output_dir, output_format)
+        return shard
+    
+    def _reseed(self, seed):
+        random.seed(seed)
+        self.fake.seed_instance(seed)
     
     def _generate_incidents_sequential(self, num_incidents: int):
         """Generate incidents sequentially (for small batches)"""
@@ -1349,40 +2755,225 @@ class EMSDataGenerator:
             incident = self.generate_ems_incident()
             incidents.append(incident)
         return incidents
+
+    def generate_incidents_columnar(self, num_incidents: int, seed: Optional[int] = None):
+        """Generate incidents as an EMSIncidentBatch, drawing each field as a whole column.
+
+        Mirrors the new-patient path of generate_ems_incident: incident codes (with time of day,
+        weekend and seasonal weighting and medical-history influence), priorities, CAD level and
+        provider type, acuity, disposition, timeline offsets and vitals.  Patient reuse, addresses
+        and free-text fields stay on the scalar path.
+        """
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        n = num_incidents
+
+        # Call times - uniform over the last two years like fake.date_time_between('-2y', 'now')
+        end = np.datetime64(self._now().replace(microsecond=0), 's')
+        start = end - np.timedelta64(int(365.24 * 2 * 86400), 's')
+        call_dt = start + rng.integers(0, (end - start).astype(np.int64) + 1, size=n).astype('timedelta64[s]')
+        epoch_seconds = call_dt.astype(np.int64)
+        hours = (epoch_seconds // 3600) % 24
+        weekend = ((epoch_seconds // 86400 + 3) % 7) >= 5  # 1970-01-01 was a Thursday
+        months = call_dt.astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+        # Incident type - one weighted draw per distinct (hour, weekend, month) slot
+        incident_codes = np.empty(n, dtype='U7')
+        slot_keys = hours * 1000 + weekend * 100 + months
+        for slot_key in np.unique(slot_keys):
+            rows = np.nonzero(slot_keys == slot_key)[0]
+            table = self._incident_type_table(int(slot_key // 1000), bool(slot_key // 100 % 10), int(slot_key % 100))
+            incident_codes[rows] = table.sample_many(len(rows), rng)
+        priorities = self._map_column(incident_codes, EMS_PRIORITY_MAP, 'LOW')
+
+        # Patient demographics
+        patient_age = rng.integers(5, 86, size=n)
+        patient_sex = np.array(['M', 'F'])[rng.integers(0, 2, size=n)]
+        patient_race = np.array(['WHITE', 'BLACK', 'HISPANIC', 'ASIAN', 'OTHER'])[rng.integers(0, 5, size=n)]
+        incident_codes = self._influence_incident_codes_by_medical_history(rng, incident_codes, patient_age, patient_sex, patient_race)
+
+        # Response times based on (dispatch) priority
+        delay_ranges = {
+            'HIGH': ((15, 60), (30, 120), (3, 8)),
+            'MEDIUM': ((30, 120), (45, 180), (5, 12)),
+            'LOW': ((60, 180), (90, 300), (8, 15)),
+        }
+        dispatch_lo, dispatch_hi, en_route_lo, en_route_hi, arrive_lo, arrive_hi = (np.zeros(n, dtype=np.int64) for _ in range(6))
+        for priority_level, (dispatch_range, en_route_range, arrive_range) in delay_ranges.items():
+            rows = priorities == priority_level
+            dispatch_lo[rows], dispatch_hi[rows] = dispatch_range
+            en_route_lo[rows], en_route_hi[rows] = en_route_range
+            arrive_lo[rows], arrive_hi[rows] = arrive_range
+        dispatch_delay = rng.integers(dispatch_lo, dispatch_hi + 1)
+        en_route_delay = rng.integers(en_route_lo, en_route_hi + 1)
+        arrive_delay = rng.integers(arrive_lo, arrive_hi + 1) * 60
+        transport_delay = rng.integers(15, 46, size=n) * 60
+        hospital_delay = rng.integers(10, 31, size=n) * 60
+        clear_delay = rng.integers(30, 91, size=n) * 60
+        dispatch_dt = call_dt + dispatch_delay.astype('timedelta64[s]')
+        en_route_dt = dispatch_dt + en_route_delay.astype('timedelta64[s]')
+        arrive_dt = en_route_dt + arrive_delay.astype('timedelta64[s]')
+        transport_dt = arrive_dt + transport_delay.astype('timedelta64[s]')
+        hospital_dt = transport_dt + hospital_delay.astype('timedelta64[s]')
+        clear_dt = hospital_dt + clear_delay.astype('timedelta64[s]')
+
+        impressions, vitals = self._generate_vitals_columns(rng, incident_codes)
+
+        # Categorical fields, conditional ones grouped by their parent value
+        cad_level = self._draw_column(rng, 'cad_level', n)
+        provider_type = self._draw_conditional_column(rng, cad_level, 'provider_type')
+        patient_acuity = self._draw_column(rng, 'patient_acuity', n)
+        situation_acuity = self._draw_conditional_column(rng, patient_acuity, 'situation_acuity')
+        prearrival_activation = self._draw_conditional_column(rng, provider_type, 'prearrival_activation', default_key='ALS')
+
+        transport_mode = np.where(
+            (priorities == 'HIGH') & (rng.random(n) < 0.15), 'AIR', 'GROUND'
+        )
+        code_descriptions = self._map_column(incident_codes, EMS_INCIDENT_CODES)
+
+        columns = {
+            'incident_type_code': incident_codes,
+            'incident_type_description': code_descriptions,
+            'priority': priorities,
+            'call_datetime': call_dt,
+            'dispatch_datetime': dispatch_dt,
+            'en_route_datetime': en_route_dt,
+            'arrive_datetime': arrive_dt,
+            'transport_datetime': transport_dt,
+            'hospital_arrival_datetime': hospital_dt,
+            'clear_datetime': clear_dt,
+            'dispatch_to_enroute_seconds': en_route_delay,
+            'enroute_to_arrival_seconds': arrive_delay,
+            'arrival_to_transport_seconds': transport_delay,
+            'transport_to_hospital_seconds': hospital_delay,
+            'total_scene_time_seconds': arrive_delay + clear_delay,
+            'total_incident_time_seconds': dispatch_delay + en_route_delay + arrive_delay + transport_delay + hospital_delay + clear_delay,
+            'district': np.array(['NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL'])[rng.integers(0, 5, size=n)],
+            'patient_age': patient_age,
+            'patient_sex': patient_sex,
+            'patient_race': patient_race,
+            'primary_impression': impressions,
+            **vitals,
+            'transport_mode': transport_mode,
+            'complaint_reported_by_dispatch': self._draw_column(rng, 'dispatch_complaint', n),
+            'patient_disposition': self._draw_column(rng, 'patient_disposition', n),
+            'prearrival_activation': prearrival_activation,
+            'patient_acuity': patient_acuity,
+            'situation_patient_acuity': situation_acuity,
+            'incident_emd_performed': self._draw_column(rng, 'emd_performed', n),
+            'cad_level_of_care_provided': cad_level,
+            'crew_member_level': provider_type,
+            'primary_unit_role': self._draw_column(rng, 'primary_unit_role', n),
+            'incident_status': self._draw_column(rng, 'incident_status', n),
+        }
+        return EMSIncidentBatch(columns=columns)
+
+    def _draw_column(self, rng, sampler_key, size):
+        """Draw a column of categorical values from a registered distribution"""
+        return SAMPLERS[sampler_key].sample_many(size, rng)
+
+    def _map_column(self, values, mapping, default=None):
+        """Map a column through a dict, looking up each distinct value once"""
+        import numpy as np
+        distinct, inverse = np.unique(values, return_inverse=True)
+        return np.array([mapping.get(value, default) for value in distinct.tolist()], dtype=str)[inverse]
+
+    def _draw_conditional_column(self, rng, parent_values, sampler_name, default_key=None):
+        """Draw a column whose distribution depends on the value in parent_values"""
+        import numpy as np
+        result = np.empty(len(parent_values), dtype=object)
+        for parent in np.unique(parent_values).tolist():
+            rows = np.nonzero(parent_values == parent)[0]
+            key = (sampler_name, parent) if (sampler_name, parent) in SAMPLERS else (sampler_name, default_key)
+            result[rows] = self._draw_column(rng, key, len(rows))
+        return result.astype(str)
+
+    def _influence_incident_codes_by_medical_history(self, rng, incident_codes, ages, sexes, races):
+        """Column version of _generate_medical_history + _influence_incident_by_medical_history"""
+        import numpy as np
+        n = len(incident_codes)
+        senior = ages > 65
+        middle_aged = (ages > 45) & ~senior
+        heart_disease = (senior & (rng.random(n) < 0.25)) | (middle_aged & (rng.random(n) < 0.1))
+        diabetes = (senior & (rng.random(n) < 0.3)) | (middle_aged & (rng.random(n) < 0.15))
+        diabetes |= np.isin(races, ['Hispanic', 'Latino']) & (rng.random(n) < 0.1)
+        copd = senior & (rng.random(n) < 0.2)
+        pregnancy = (sexes == 'F') & (ages > 35) & (rng.random(n) < 0.1)
+        sickle_cell = np.isin(races, ['Black', 'African American']) & (rng.random(n) < 0.15)
+
+        # Same precedence as the elif chain in the scalar path
+        influenced = incident_codes.copy()
+        undecided = np.ones(n, dtype=bool)
+        for condition, probability, code in (
+            (heart_disease, 0.3, '2301021'),
+            (diabetes, 0.2, '2301027'),
+            (copd, 0.25, '2301013'),
+            (pregnancy, 0.15, '2301057'),
+            (sickle_cell, 0.2, '2301001'),
+        ):
+            hit = undecided & condition & (rng.random(n) < probability)
+            influenced[hit] = code
+            undecided &= ~hit
+        return influenced
+
+    def _generate_vitals_columns(self, rng, incident_codes):
+        """Draw primary impression and vital sign columns from EMS_VITALS_PROFILES"""
+        import numpy as np
+        n = len(incident_codes)
+        impressions = np.empty(n, dtype=object)
+        bounds = {key: np.zeros(n) for key in ('sys_lo', 'sys_hi', 'dia_lo', 'dia_hi', 'hr_lo', 'hr_hi',
+                                               'rr_lo', 'rr_hi', 'spo2_lo', 'spo2_hi', 't_lo', 't_hi')}
+        for code in np.unique(incident_codes):
+            rows = incident_codes == code
+            prof = EMS_VITALS_PROFILES.get(code, EMS_VITALS_PROFILES['2301001'])  # Default to Abdominal Pain
+            impressions[rows] = prof['impression']
+            bounds['sys_lo'][rows], bounds['sys_hi'][rows], bounds['dia_lo'][rows], bounds['dia_hi'][rows] = prof['bp']
+            bounds['hr_lo'][rows], bounds['hr_hi'][rows] = prof['hr']
+            bounds['rr_lo'][rows], bounds['rr_hi'][rows] = prof['rr']
+            bounds['spo2_lo'][rows], bounds['spo2_hi'][rows] = prof['spo2']
+            bounds['t_lo'][rows], bounds['t_hi'][rows] = prof['temp']
+        bounds = {key: (values if key.startswith('t_') else values.astype(np.int64)) for key, values in bounds.items()}
+
+        arrest = bounds['sys_hi'] == 0  # Cardiac arrest or similar
+        bp_sys = np.where(arrest, 0, rng.integers(bounds['sys_lo'], bounds['sys_hi'] + 1))
+        bp_dia = np.where(arrest, 0, rng.integers(bounds['dia_lo'], bounds['dia_hi'] + 1))
+        hr = np.where(arrest, 0, rng.integers(bounds['hr_lo'], bounds['hr_hi'] + 1))
+        rr = np.where(arrest, 0, rng.integers(bounds['rr_lo'], bounds['rr_hi'] + 1))
+        spo2 = rng.integers(bounds['spo2_lo'], bounds['spo2_hi'] + 1)
+        temp = np.round(rng.uniform(bounds['t_lo'], bounds['t_hi']), 1)
+
+        # 8% atypical variation, skipped for cardiac arrest
+        atypical = (rng.random(n) < 0.08) & ~arrest
+        hr = np.where(atypical, np.clip(np.trunc(rng.normal(hr, 15)), 30, 180), hr).astype(np.int64)
+        rr = np.where(atypical, np.clip(np.trunc(rng.normal(rr, 6)), 6, 40), rr).astype(np.int64)
+        spo2 = np.where(atypical, np.clip(np.trunc(rng.normal(spo2, 5)), 50, 100), spo2).astype(np.int64)
+
+        vitals = {
+            'bp_systolic': bp_sys,
+            'bp_diastolic': bp_dia,
+            'heart_rate': hr,
+            'respiratory_rate': rr,
+            'oxygen_saturation': spo2,
+            'temperature': temp,
+        }
+        return impressions.astype(str), vitals
+
+    @METRICS.timed('ems.incident_type')
     def _choose_ems_incident_type(self, dt):
         """Choose EMS incident type based on synthetic frequency and time patterns"""
-        # Synthetic EMS codes with realistic frequency weights based on distributions
-        base = {
-            '2301061': 14,  # Sick Person - most common
-            '2301013': 12,  # Breathing Problem
-            '2301021': 11,  # Chest Pain (Non-Traumatic)
-            '2301033': 13,  # Falls
-            '2301001': 7,   # Abdominal Pain/Problems
-            '2301025': 6,   # Convulsions/Seizure
-            '2301059': 6,   # Psychiatric Problem/Abnormal Behavior/Suicide Attempt
-            '2301053': 5,   # Overdose/Poisoning/Ingestion
-            '2301073': 6,   # Traumatic Injury
-            '2301067': 4,   # Stroke/CVA
-            '2301077': 5,   # Unconscious/Fainting/Near-Fainting
-            '2301027': 4,   # Diabetic Problem
-            '2301003': 3,   # Allergic Reaction/Stings
-            '2301057': 2,   # Pregnancy/Childbirth/Miscarriage
-            '2301019': 2,   # Cardiac Arrest/Death
-            '2301063': 2,   # Stab/Gunshot Wound/Penetrating Trauma
-            '2301045': 2,   # Hemorrhage/Laceration
-            '2301043': 1,   # Heat/Cold Exposure
-            '2301069': 3,   # Traffic/Transportation Incident
-            '2301007': 2,   # Assault
-            '2301035': 1,   # Fire
-            '2301005': 1,   # Animal Bite
-            '2301023': 1,   # Choking
-            '2301037': 2,   # Headache
-            '2301011': 2,   # Back Pain (Non-Traumatic)
-        }
-        hour = dt.hour
-        wknd = dt.weekday() >= 5
+        selected_code = self._incident_type_table(dt.hour, dt.weekday() >= 5, dt.month).sample()
+        return selected_code, EMS_INCIDENT_CODES[selected_code]
+    
+    def _incident_type_table(self, hour, wknd, month):
+        """Alias table for an (hour, weekend, month) slot, compiled on first use"""
+        return SAMPLERS.get_or_compile(
+            ('incident_type', hour, wknd, month),
+            lambda: dict(zip(*self._incident_type_weights(hour, wknd, month)))
+        )
 
-        mult = {k: 1.0 for k in base}
+    def _incident_type_weights(self, hour, wknd, month):
+        """Incident type codes and weights for an hour of day, weekend flag and month"""
+        mult = {k: 1.0 for k in EMS_INCIDENT_TYPE_BASE_WEIGHTS}
         
         # Enhanced time of day patterns
         if 22 <= hour or hour < 5:  # Night time (10 PM - 5 AM)
@@ -1421,7 +3012,6 @@ class EMSDataGenerator:
             mult['2301061'] *= 1.1  # More sick person calls on weekdays
         
         # Seasonal patterns (based on month)
-        month = dt.month
         if month in [12, 1, 2]:  # Winter
             mult['2301043'] *= 4.0  # Much more cold exposure in winter
             mult['2301033'] *= 1.4  # More falls in winter (ice/snow)
@@ -1439,11 +3029,11 @@ class EMSDataGenerator:
             mult['2301003'] *= 1.4  # Some allergic reactions in fall
             mult['2301033'] *= 1.2  # Slightly more falls in fall
 
-        codes = list(base.keys())
-        weights = [base[c] * mult[c] for c in codes]
-        selected_code = random.choices(codes, weights=weights, k=1)[0]
-        return selected_code, EMS_INCIDENT_CODES[selected_code]
+        codes = list(EMS_INCIDENT_TYPE_BASE_WEIGHTS.keys())
+        weights = [EMS_INCIDENT_TYPE_BASE_WEIGHTS[c] * mult[c] for c in codes]
+        return codes, weights
     
+    @METRICS.timed('ems.medical_history')
     def _generate_medical_history(self, age, ethnicity, gender):
         """Generate realistic medical history based on demographics"""
         medical_conditions = []
@@ -1526,9 +3116,7 @@ class EMSDataGenerator:
             
             # Generate realistic BMI first (18.5-40+ range)
             # Most adults are in 20-30 BMI range, but we need to include extremes
-            bmi_categories = ['UNDERWEIGHT', 'NORMAL', 'OVERWEIGHT', 'OBESE_CLASS_1', 'OBESE_CLASS_2', 'OBESE_CLASS_3']
-            bmi_weights = [0.03, 0.35, 0.35, 0.20, 0.05, 0.02]  # Synthetic distribution
-            selected_category = random.choices(bmi_categories, weights=bmi_weights, k=1)[0]
+            selected_category = SAMPLERS.sample('bmi_category')  # Synthetic distribution
             
             if selected_category == 'UNDERWEIGHT':
                 target_bmi = random.uniform(16.0, 18.4)
@@ -1566,6 +3154,7 @@ class EMSDataGenerator:
         final_weight = max(min_weight, min(max_weight, target_weight))
         return round(final_weight, 1)
 
+    @METRICS.timed('ems.name')
     def _generate_demographic_appropriate_name(self, ethnicity, gender):
         """Generate names that match ethnicity and gender"""
         # Define name pools by ethnicity and gender
@@ -1646,9 +3235,6 @@ class EMSDataGenerator:
     
     def _generate_king_county_address(self):
         """Generate synthetic addresses using synthetic Seattle/King County coordinates."""
-        from geopy.geocoders import Nominatim
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        import time
         # Synthetic Seattle/King County coordinate bounds (LAND-ONLY to avoid water bodies)
         seattle_bounds = {
             'seattle': {
@@ -1743,29 +3329,9 @@ class EMSDataGenerator:
         # ---- check to see whether we want to geocode all addresses, possible we just want to geocode a portion of the addresses ---- #
         # Try to reverse geocode to get a real address (only 10% of the time for speed)
         if random.random() < 0.1:  # Only geocode 10% of addresses for speed
-            try:
-                geolocator = Nominatim(user_agent="seattle_data_generator")
-                location = geolocator.reverse(f"{lat}, {lon}", timeout=5)
-                
-                if location and location.address:
-                    # Parse the address components
-                    address_parts = location.address.split(', ')
-                    if len(address_parts) >= 2:
-                        street_address = address_parts[0]
-                        city_state_zip = address_parts[-2] if len(address_parts) >= 3 else "Seattle, WA"
-                        
-                        # Extract city and state
-                        if ',' in city_state_zip:
-                            city_part = city_state_zip.split(',')[0]
-                            state = "WA"
-                        else:
-                            city_part = city_name.replace('_', ' ').title()
-                            state = "WA"
-                        
-                        return street_address, city_part, state, zip_code
-            except (GeocoderTimedOut, GeocoderUnavailable, Exception):
-                # Fallback to coordinate-based fake address if geocoding fails
-                pass
+            street_address, city_part = self._reverse_geocode(lat, lon, timeout=5)
+            if street_address:
+                return street_address, city_part or city_name.replace('_', ' ').title(), "WA", zip_code
         
         # Fallback: Generate a realistic-looking address based on coordinates
         street_number = random.randint(100, 9999)
@@ -1843,10 +3409,6 @@ class EMSDataGenerator:
     
     def _generate_optimized_geocoded_address(self):
         """Generate real geocoded addresses with optimizations for speed"""
-        from geopy.geocoders import Nominatim
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        import time
-        
         # Synthetic Seattle/King County coordinate bounds (LAND-ONLY to avoid water bodies)
         seattle_bounds = {
             'seattle': {
@@ -1892,49 +3454,13 @@ class EMSDataGenerator:
         if coord_key in self._geocoding_cache:
             return self._geocoding_cache[coord_key]
         
-        # Rate limiting to avoid overwhelming the geocoding service
-        import time
-        current_time = time.time()
-        time_since_last = current_time - self._last_geocoding_time
-        if time_since_last < self._geocoding_rate_limit:
-            time.sleep(self._geocoding_rate_limit - time_since_last)
-        
-        # Try to reverse geocode with optimized settings
-        try:
-            self._last_geocoding_time = time.time()
-            # Use a more efficient geocoder setup
-            geolocator = Nominatim(
-                user_agent="seattle_ems_generator",
-                timeout=3,  # Reduced timeout
-                domain="nominatim.openstreetmap.org"
-            )
-            
-            # Try reverse geocoding
-            location = geolocator.reverse(f"{lat}, {lon}", timeout=3, exactly_one=True)
-            
-            if location and location.address:
-                # Parse the address components
-                address_parts = location.address.split(', ')
-                if len(address_parts) >= 2:
-                    street_address = address_parts[0]
-                    city_state_zip = address_parts[-2] if len(address_parts) >= 3 else "Seattle, WA"
-                    
-                    # Extract city and state
-                    if ',' in city_state_zip:
-                        city_part = city_state_zip.split(',')[0]
-                        state = "WA"
-                    else:
-                        city_part = city_name.replace('_', ' ').title()
-                        state = "WA"
-                    
-                    result = (street_address, city_part, state, zip_code)
-                    # Cache the successful result
-                    self._geocoding_cache[coord_key] = result
-                    return result
-                    
-        except (GeocoderTimedOut, GeocoderUnavailable, Exception) as e:
-            # If geocoding fails, fall back to coordinate-based realistic address
-            pass
+        # Try reverse geocoding
+        street_address, city_part = self._reverse_geocode(lat, lon, timeout=3)
+        if street_address:
+            result = (street_address, city_part or city_name.replace('_', ' ').title(), "WA", zip_code)
+            # Cache the successful result
+            self._geocoding_cache[coord_key] = result
+            return result
         
         # Fallback: Generate a realistic-looking address based on coordinates
         street_number = random.randint(100, 9999)
@@ -1961,6 +3487,64 @@ class EMSDataGenerator:
         
         return full_address, city_name_clean, "WA", zip_code
     
+    def enable_network_geocoding(self, base_url=NOMINATIM_URL, cache_path=GEOCODE_CACHE_PATH, rate_limit=None):
+        """Fall back to a Nominatim API for addresses the offline geocoder doesn't know.
+
+        Lookups never block generation: results come from the on-disk cache, and
+        misses are queued to a background worker that fills the cache for later
+        lookups (and later runs) while generation continues on the fallbacks.
+        """
+        self._geocode_cache = GeocodeCache(cache_path)
+        self._geocode_worker = AsyncGeocodeWorker(
+            self._geocode_cache,
+            base_url=base_url,
+            rate_limit=self._geocoding_rate_limit if rate_limit is None else rate_limit
+        )
+        self._use_network_geocoding = True
+    
+    def close_network_geocoding(self, flush_timeout=0):
+        """Stop the geocode worker (optionally waiting for queued lookups) and close the cache"""
+        if self._geocode_worker is not None:
+            if flush_timeout:
+                self._geocode_worker.flush(flush_timeout)
+            self._geocode_worker.close(timeout=5)
+            self._geocode_cache.close()
+        self._geocode_worker = None
+        self._geocode_cache = None
+        self._use_network_geocoding = False
+    
+    def _get_offline_geocoder(self):
+        """Load the offline geocoder from the bundled address files (thread-safe, once)"""
+        if self._offline_geocoder is None:
+            with self._geocoder_lock:
+                if self._offline_geocoder is None:
+                    geocoder = OfflineGeocoder.from_files()
+                    print(f"Offline geocoder loaded {len(geocoder.addresses)} addresses with coordinates")
+                    self._offline_geocoder = geocoder
+        return self._offline_geocoder
+    
+    def _reverse_geocode(self, lat, lon, timeout=5):
+        """Return (street_address, city) for coordinates, or (None, None)"""
+        nearest = self._get_offline_geocoder().reverse(lat, lon)
+        if nearest:
+            return nearest[0], nearest[1].title()
+        
+        if not self._use_network_geocoding:
+            return None, None
+        
+        # Cached result from an earlier run, otherwise queue it and let the caller fall back
+        cached = self._geocode_cache.get_reverse(GeocodeCache.coord_key(lat, lon))
+        if cached:
+            return cached[0], cached[1]
+        self._geocode_worker.submit_reverse(lat, lon)
+        return None, None
+    
+    def _generate_synthetic_address(self):
+        """Generate a synthetic address tuple with offline coordinates"""
+        address, city, state, zip_code = self._generate_fast_address()
+        lat, lon, _ = self._generate_gps_coordinates_from_address(address, city, state, zip_code)
+        return (address, city, state, zip_code, lat, lon)
+    
     def _extract_addresses_from_ems_data(self):
         """Generate synthetic addresses instead of extracting from real data"""
         addresses = set()
@@ -1988,9 +3572,11 @@ class EMSDataGenerator:
             self._real_address_pool = []
             
             # Generate 1000 synthetic Seattle-area addresses
+            geocoder = self._get_offline_geocoder()
             for i in range(1000):
                 address = self._generate_synthetic_address()
                 self._real_address_pool.append(address)
+                geocoder.add_address(*address)
             
             self._pool_initialized = True
             print(f"Generated {len(self._real_address_pool)} synthetic addresses")
@@ -2018,6 +3604,7 @@ class EMSDataGenerator:
         
         self._pool_initialized = True
         print(f"Address pool initialized with {len(self._real_address_pool)} real geocoded addresses")
+    @METRICS.timed('ems.incident')
     def generate_ems_incident(self, cad_incident=None, persons_list=None):
         """Generate a comprehensive EMS incident with realistic medical data and 1:Many patient relationships"""
         # Use CAD incident data if available, otherwise generate new
@@ -2027,7 +3614,7 @@ class EMSDataGenerator:
             address = cad_incident.address
             apartment_number = cad_incident.apartment_number
         else:
-            incident_datetime = self.fake.date_time_between(start_date='-2y', end_date='now')
+            incident_datetime = self.fake.date_time_between(start_date=self._now() - timedelta(days=730.48), end_date=self._now())
             
             # Check if we should reuse an existing patient
             existing_patient, should_reuse = self._should_reuse_existing_patient(incident_datetime)
@@ -2047,35 +3634,7 @@ class EMSDataGenerator:
                 lat, lon = None, None
             apartment_number = f"Apt {random.randint(1, 500)}" if random.random() < 0.3 else None
 
-        # Priority mapping based on EMS codes
-        priority_map = {
-            '2301019': 'HIGH',  # Cardiac Arrest/Death
-            '2301067': 'HIGH',  # Stroke/CVA
-            '2301053': 'HIGH',  # Overdose/Poisoning/Ingestion
-            '2301077': 'HIGH',  # Unconscious/Fainting/Near-Fainting
-            '2301073': 'HIGH',  # Traumatic Injury (upgraded - trauma is serious)
-            '2301021': 'HIGH',  # Chest Pain (upgraded - could be cardiac)
-            '2301013': 'HIGH',  # Breathing Problem (upgraded - respiratory distress)
-            '2301045': 'HIGH',  # Hemorrhage/Laceration (upgraded - bleeding is serious)
-            '2301025': 'HIGH',  # Convulsions/Seizure (upgraded - neurological emergency)
-            '2301061': 'MEDIUM',  # Sick Person (upgraded)
-            '2301033': 'MEDIUM',  # Falls (upgraded - could be trauma)
-            '2301001': 'MEDIUM',  # Abdominal Pain/Problems (upgraded)
-            '2301027': 'MEDIUM',  # Diabetic Problem (upgraded)
-            '2301003': 'HIGH',  # Allergic Reaction/Stings (upgraded - could be anaphylaxis)
-            '2301057': 'HIGH',  # Pregnancy/Childbirth/Miscarriage (upgraded - obstetric emergency)
-            '2301043': 'HIGH',  # Heat/Cold Exposure (upgraded - environmental emergency)
-            '2301063': 'HIGH',  # Stab/Gunshot Wound/Penetrating Trauma
-            '2301059': 'HIGH',  # Psychiatric Problem/Abnormal Behavior/Suicide Attempt (upgraded)
-            '2301069': 'HIGH',  # Traffic/Transportation Incident (upgraded - MVA is serious)
-            '2301007': 'HIGH',  # Assault (upgraded)
-            '2301035': 'HIGH',  # Fire
-            '2301005': 'MEDIUM',  # Animal Bite (upgraded)
-            '2301023': 'HIGH',  # Choking
-            '2301037': 'MEDIUM',  # Headache (upgraded - could be stroke)
-            '2301011': 'LOW',  # Back Pain (Non-Traumatic) - only truly LOW priority
-        }
-        priority = priority_map.get(incident_type_code if 'incident_type_code' in locals() else '2301001', 'LOW')
+        priority = EMS_PRIORITY_MAP.get(incident_type_code if 'incident_type_code' in locals() else '2301001', 'LOW')
 
         address_tuple = self._get_cached_address()
         if len(address_tuple) >= 6:
@@ -2143,75 +3702,7 @@ class EMSDataGenerator:
         cc = incident_type
         def clamp(v, lo, hi):
             return max(lo, min(hi, v))
-        profile = {
-            '2301021': {  # Chest Pain (Non-Traumatic)
-                'impression': 'CARDIAC',
-                'treat': ['OXYGEN','IV_FLUIDS'],
-                'meds': ['ASPIRIN','NITROGLYCERIN'],
-                'bp': (140, 180, 80, 110), 'hr': (90, 130), 'rr': (16, 24), 'spo2': (92, 98), 'temp': (97.0, 99.0)
-            },
-            '2301013': {  # Breathing Problem
-                'impression': 'RESPIRATORY',
-                'treat': ['OXYGEN'],
-                'meds': ['ALBUTEROL'],
-                'bp': (110, 150, 70, 95), 'hr': (90, 120), 'rr': (20, 30), 'spo2': (85, 94), 'temp': (97.0, 99.0)
-            },
-            '2301053': {  # Overdose/Poisoning/Ingestion
-                'impression': 'MEDICAL',
-                'treat': ['OXYGEN'],
-                'meds': ['NARCAN'],
-                'bp': (90, 120, 50, 80), 'hr': (50, 100), 'rr': (6, 12), 'spo2': (75, 90), 'temp': (96.0, 99.0)
-            },
-            '2301077': {  # Unconscious/Fainting/Near-Fainting
-                'impression': 'MEDICAL',
-                'treat': ['OXYGEN','IV_FLUIDS'],
-                'meds': [],
-                'bp': (80, 110, 50, 70), 'hr': (50, 80), 'rr': (10, 16), 'spo2': (90, 98), 'temp': (96.0, 99.0)
-            },
-            '2301073': {  # Traumatic Injury
-                'impression': 'TRAUMA',
-                'treat': ['SPLINTING','IV_FLUIDS','BANDAGING','OXYGEN'],
-                'meds': ['MORPHINE'],
-                'bp': (85, 120, 50, 80), 'hr': (90, 130), 'rr': (18, 28), 'spo2': (92, 98), 'temp': (97.0, 99.0)
-            },
-            '2301025': {  # Convulsions/Seizure
-                'impression': 'MEDICAL',
-                'treat': ['OXYGEN'],
-                'meds': [],
-                'bp': (110, 160, 70, 100), 'hr': (100, 140), 'rr': (18, 26), 'spo2': (90, 98), 'temp': (97.0, 99.0)
-            },
-            '2301001': {  # Abdominal Pain/Problems
-                'impression': 'MEDICAL',
-                'treat': ['IV_FLUIDS'],
-                'meds': [],
-                'bp': (110, 150, 70, 95), 'hr': (80, 110), 'rr': (14, 22), 'spo2': (95, 100), 'temp': (97.0, 100.4)
-            },
-            '2301003': {  # Allergic Reaction/Stings
-                'impression': 'MEDICAL',
-                'treat': ['OXYGEN'],
-                'meds': ['ALBUTEROL'],
-                'bp': (100, 150, 60, 95), 'hr': (100, 130), 'rr': (20, 28), 'spo2': (88, 96), 'temp': (97.0, 99.0)
-            },
-            '2301019': {  # Cardiac Arrest/Death
-                'impression': 'CARDIAC',
-                'treat': ['CPR','OXYGEN'],
-                'meds': [],
-                'bp': (0, 0, 0, 0), 'hr': (0, 0), 'rr': (0, 0), 'spo2': (60, 85), 'temp': (96.0, 99.0)
-            },
-            '2301045': {  # Hemorrhage/Laceration
-                'impression': 'TRAUMA',
-                'treat': ['IV_FLUIDS','BANDAGING','OXYGEN'],
-                'meds': ['MORPHINE'],
-                'bp': (80, 110, 40, 70), 'hr': (100, 140), 'rr': (18, 28), 'spo2': (90, 98), 'temp': (97.0, 99.0)
-            },
-            '2301067': {  # Stroke/CVA
-                'impression': 'MEDICAL',
-                'treat': ['OXYGEN'],
-                'meds': [],
-                'bp': (150, 200, 90, 120), 'hr': (70, 100), 'rr': (14, 22), 'spo2': (95, 100), 'temp': (97.0, 99.0)
-            },
-        }
-        prof = profile.get(incident_type_code if 'incident_type_code' in locals() else '2301001', profile['2301001'])  # Default to Abdominal Pain
+        prof = EMS_VITALS_PROFILES.get(incident_type_code if 'incident_type_code' in locals() else '2301001', EMS_VITALS_PROFILES['2301001'])  # Default to Abdominal Pain
         # generate vitals within ranges, with small random noise chance
         sys_lo, sys_hi, dia_lo, dia_hi = prof['bp']
         hr_lo, hr_hi = prof['hr']
@@ -2277,9 +3768,9 @@ class EMSDataGenerator:
         primary_unit_role = self._generate_primary_unit_role()
         
         incident = EMSIncident(
-            incident_id=str(uuid.uuid4()),
-            incident_number=f"EMS{incident_datetime.year}{random.randint(100000, 999999)}",
-            call_number=f"E{incident_datetime.year}{random.randint(1000000, 9999999)}",
+            incident_id=self._new_uuid(),
+            incident_number=f"EMS{incident_datetime.year}{self._ids.number('ems_incident')}",
+            call_number=f"E{incident_datetime.year}{self._ids.number('ems_call', digits=7)}",
             incident_type=incident_type,
             incident_type_code=incident_type_code if 'incident_type_code' in locals() else '2301051',  # Default to "No Other Appropriate Choice"
             incident_type_description=incident_type_description if 'incident_type_description' in locals() else 'No Other Appropriate Choice',
@@ -2358,7 +3849,7 @@ class EMSDataGenerator:
             crew_member_level=provider_type,
             crew_badge_number=f"EMS{random.randint(1000, 9999)}",
             # Patient Details
-            patient_id=patient_person.person_id if patient_person else str(uuid.uuid4()),
+            patient_id=patient_person.person_id if patient_person else self._new_uuid(),
             patient_date_of_birth=self.fake.date_of_birth(minimum_age=5, maximum_age=85).strftime('%Y-%m-%d'),
             patient_weight=patient_weight,
             patient_home_address=address,
@@ -2384,7 +3875,7 @@ class EMSDataGenerator:
             # Ungrouped Properties
             incident_status=incident_status,
             created_by='SYSTEM',
-            patient_pk=str(uuid.uuid4()),
+            patient_pk=self._new_uuid(),
             primary_patient_caregiver_on_scene=random.choice(['FAMILY_MEMBER', 'BYSTANDER', 'NONE']),
             crew_with_als_pt_contact_response_role=random.choice(['PRIMARY', 'SECONDARY']),
             
@@ -2436,10 +3927,12 @@ class EMSDataGenerator:
             'current_medications': incident.patient_current_medications
         }
         self._patient_pool.append(new_patient_data)
+        self._patient_reuse_index.add_patient(new_patient_data)
         self._update_patient_incident_history(incident.patient_person_id, incident_datetime)
         
         return incident
 
+    @METRICS.timed('ems.medication')
     def generate_ems_medication(self, ems_incident=None):
         """Generate EMS medication administration record consistent with incident type"""
         if not ems_incident:
@@ -2457,349 +3950,47 @@ class EMSDataGenerator:
         # Select one medication from the appropriate list
         selected_medication_name = random.choice(appropriate_medications)
         
-        # Medication distribution with real medication names
-        medications = [
-            {'name': 'NORMAL SALINE', 'code': '7820', 'routes': {'INTRAVENC': 0.957, 'IV_DRIP': 0.001, 'INTRAMUSI': 0.005, 'INTRANASA': 0.0002, 'INTRAOSSE': 0.020, 'ORAL': 0.0003, 'RECTAL': 0.0003, 'PORTACATH': 0.0001, 'ENDOTRAC': 0.002, 'NASAL_CAN': 0.009, 'NON_REBRE': 0.0001, 'BLOW_BY': 0.002}, 'dosage': (500, 1000), 'unit': 'ML', 'weight': 13747},
-            {'name': 'ONDANSETRON', 'code': '7941', 'routes': {'INTRAVENC': 0.929, 'INTRAMUSI': 0.069, 'INTRANASA': 0.001, 'INTRAOSSE': 0.0002, 'ORAL': 0.0001, 'RECTAL': 0.0003, 'BUCCAL': 0.0001}, 'dosage': (4, 8), 'unit': 'MG', 'weight': 10205},
-            {'name': 'OXYGEN', 'code': '7781', 'routes': {'IV_PIGGYBA': 0.453, 'INHALATIO': 0.082, 'INTRANASA': 0.036, 'NASAL_CAN': 0.157, 'ORAL': 0.020, 'BUCCAL': 0.001, 'ENDOTRAC': 0.006, 'TRACHEOST': 0.001, 'INTRAMUSI': 0.0002, 'INTRAOSSE': 0.0001, 'INTRAVENC': 0.002, 'BLOW_BY': 0.014, 'OPHTHALM': 0.002}, 'dosage': (2, 15), 'unit': 'L/MIN', 'weight': 7550},
-            {'name': 'FENTANYL', 'code': '4337', 'routes': {'INTRAVENC': 0.741, 'INTRANASA': 0.179, 'INTRAMUSI': 0.032, 'INTRAOSSE': 0.001, 'INHALATIO': 0.001, 'IV_DRIP': 0.0001, 'BUCCAL': 0.0001, 'SUBLINGUA': 0.0001}, 'dosage': (25, 100), 'unit': 'MCG', 'weight': 6615},
-            {'name': 'ASPIRIN', 'code': '1191', 'routes': {'ORAL': 1.0}, 'dosage': (81, 325), 'unit': 'MG', 'weight': 5223},
-            {'name': 'NITROGLYCERIN', 'code': '7417', 'routes': {'SUBLINGUA': 0.972, 'ORAL': 0.028}, 'dosage': (0.3, 0.4), 'unit': 'MG', 'weight': 3647},
-            {'name': 'ALBUTEROL', 'code': '435', 'route': 'INHALED', 'dosage': (90, 180), 'unit': 'MCG', 'weight': 3640},
-            {'name': 'IPRATROPIUM', 'code': '5737', 'route': 'INHALED', 'dosage': (250, 500), 'unit': 'MCG', 'weight': 3565},
-            {'name': 'METHYLPREDNISOLONE', 'code': '7021', 'route': 'INTRAVENOUS', 'dosage': (125, 250), 'unit': 'MG', 'weight': 1999},
-            {'name': 'EPI 1:10,000', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.1, 1.0), 'unit': 'MG', 'weight': 1788},
-            {'name': 'NALOXONE', 'code': '7517', 'route': 'INTRAMUSCULAR', 'dosage': (0.4, 2.0), 'unit': 'MG', 'weight': 1378},
-            {'name': 'DIPHENHYDRAMINE', 'code': '3498', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'MG', 'weight': 1040},
-            {'name': 'GLUCOSE', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 821},
-            {'name': 'ACETAMINOPHEN', 'code': '161', 'route': 'ORAL', 'dosage': (325, 650), 'unit': 'MG', 'weight': 701},
-            {'name': 'EPI 1:1,000', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.3, 0.5), 'unit': 'MG', 'weight': 693},
-            {'name': 'DEXTROSE 50%', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 664},
-            {'name': 'SODIUM BICARBONATE', 'code': '1778', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'MEQ', 'weight': 618},
-            {'name': 'METOPROLOL', 'code': '6918', 'route': 'INTRAVENOUS', 'dosage': (5, 15), 'unit': 'MG', 'weight': 594},
-            {'name': 'MORPHINE', 'code': '7054', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 591},
-            {'name': 'DEXTROSE 10%', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (250, 500), 'unit': 'ML', 'weight': 484},
-            {'name': 'MIDAZOLAM 5 MG/ML [VERSED]', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 466},
-            {'name': 'KETAMINE', 'code': '5901', 'route': 'INTRAVENOUS', 'dosage': (0.5, 2.0), 'unit': 'MG/KG', 'weight': 461},
-            {'name': 'MIDAZOLAM', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 384},
-            {'name': 'GLUCAGON', 'code': '4761', 'route': 'INTRAMUSCULAR', 'dosage': (0.5, 1.0), 'unit': 'MG', 'weight': 348},
-            {'name': 'ADENOSINE', 'code': '197', 'route': 'INTRAVENOUS', 'dosage': (6, 12), 'unit': 'MG', 'weight': 299},
-            {'name': 'ROCURONIUM', 'code': '7949', 'route': 'INTRAVENOUS', 'dosage': (0.6, 1.2), 'unit': 'MG/KG', 'weight': 293},
-            {'name': 'AMIODARONE', 'code': '177', 'route': 'INTRAVENOUS', 'dosage': (150, 300), 'unit': 'MG', 'weight': 261},
-            {'name': 'LABETALOL', 'code': '3827', 'route': 'INTRAVENOUS', 'dosage': (10, 20), 'unit': 'MG', 'weight': 260},
-            {'name': 'ATROPINE', 'code': '174', 'route': 'INTRAVENOUS', 'dosage': (0.5, 1.0), 'unit': 'MG', 'weight': 227},
-            {'name': 'CALCIUM CHLORIDE', 'code': '1754', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'MG', 'weight': 134},
-            {'name': 'MIDAZOLAM 1 MG/ML [VERSED]', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (1, 5), 'unit': 'MG', 'weight': 130},
-            {'name': 'EPINEPHRINE 0.1 MG/ML', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.1, 0.5), 'unit': 'MG', 'weight': 87},
-            {'name': 'DOPAMINE', 'code': '3842', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/KG/MIN', 'weight': 81},
-            {'name': 'MAGNESIUM SULFATE', 'code': '6349', 'route': 'INTRAVENOUS', 'dosage': (1, 4), 'unit': 'GM', 'weight': 70},
-            {'name': 'LIDOCAINE', 'code': '6183', 'route': 'INTRAVENOUS', 'dosage': (50, 100), 'unit': 'MG', 'weight': 67},
-            {'name': 'MIDAZOLAM 10MG/2ML', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 59},
-            {'name': 'EPI 1:100,000 PDP', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.2, 0.5), 'unit': 'MG', 'weight': 54},
-            {'name': 'EPINEPHRINE', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.3, 0.5), 'unit': 'MG', 'weight': 46},
-            {'name': 'FUROSEMIDE', 'code': '4603', 'route': 'INTRAVENOUS', 'dosage': (20, 80), 'unit': 'MG', 'weight': 45},
-            {'name': 'HALOPERIDOL', 'code': '5259', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 36},
-            {'name': 'LEVOPHED', 'code': '7419', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/MIN', 'weight': 35},
-            {'name': 'TETRACAINE', 'code': '10370', 'route': 'TOPICAL', 'dosage': (0.5, 1.0), 'unit': '%', 'weight': 32},
-            {'name': 'EPI 1:100,000 (PDP)', 'code': '3292', 'route': 'INTRAMUSCULAR', 'dosage': (0.2, 0.5), 'unit': 'MG', 'weight': 29},
-            {'name': 'SODIUM CHLORIDE', 'code': '7820', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'ML', 'weight': 19},
-            {'name': 'GLUCOSE 100 MG/ML', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 16},
-            {'name': 'MIDAZOLAM 5MG/5ML', 'code': '7018', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 15},
-            {'name': 'SUCCINYLCHOLINE', 'code': '10305', 'route': 'INTRAVENOUS', 'dosage': (1, 2), 'unit': 'MG/KG', 'weight': 9},
-            {'name': 'ETOMIDATE', 'code': '3873', 'route': 'INTRAVENOUS', 'dosage': (0.2, 0.3), 'unit': 'MG/KG', 'weight': 7},
-            {'name': 'IBUPROFEN', 'code': '5640', 'route': 'ORAL', 'dosage': (400, 800), 'unit': 'MG', 'weight': 5},
-            {'name': 'VECURONIUM', 'code': '11170', 'route': 'INTRAVENOUS', 'dosage': (0.08, 0.1), 'unit': 'MG/KG', 'weight': 5},
-            {'name': 'STERILE WATER', 'code': '11324', 'route': 'INTRAVENOUS', 'dosage': (5, 10), 'unit': 'ML', 'weight': 4},
-            {'name': 'ACTIVATED CHARCOAL', 'code': '435', 'route': 'ORAL', 'dosage': (25, 50), 'unit': 'GM', 'weight': 3},
-            {'name': 'NOREPINEPHRINE', 'code': '7419', 'route': 'INTRAVENOUS', 'dosage': (2, 20), 'unit': 'MCG/MIN', 'weight': 3},
-            {'name': 'HYDROXOCOBALAMIN', 'code': '6178', 'route': 'INTRAVENOUS', 'dosage': (2.5, 5), 'unit': 'GM', 'weight': 2},
-            {'name': 'POTASSIUM CHLORIDE', 'code': '8584', 'route': 'INTRAVENOUS', 'dosage': (10, 20), 'unit': 'MEQ', 'weight': 2},
-            {'name': 'CALCIUM GLUCONATE', 'code': '1754', 'route': 'INTRAVENOUS', 'dosage': (500, 1000), 'unit': 'MG', 'weight': 1},
-            {'name': 'EPINEPHRINE 0.01 MG/ML', 'code': '3292', 'route': 'INTRAVENOUS', 'dosage': (0.01, 0.1), 'unit': 'MG', 'weight': 1},
-            {'name': 'GLUCOSE 500 MG/ML', 'code': '3143', 'route': 'INTRAVENOUS', 'dosage': (25, 50), 'unit': 'ML', 'weight': 1},
-            {'name': 'HYDROXOCOBALAMIN INJECTION [CYANOKIT]', 'code': '6178', 'route': 'INTRAVENOUS', 'dosage': (2.5, 5), 'unit': 'GM', 'weight': 1},
-            {'name': 'DIAZEPAM', 'code': '3610', 'route': 'INTRAVENOUS', 'dosage': (2, 10), 'unit': 'MG', 'weight': 200}
-        ]
-        
         # Find the selected medication in the medication database
         selected_med_name = selected_medication_name
         
         # Find the selected medication
-        med = next(med for med in medications if med['name'] == selected_med_name)
+        med = EMS_MEDICATIONS_BY_NAME[selected_med_name]
         
         # Select route based on realistic distribution for this medication
         if 'routes' in med:
-            route_names = list(med['routes'].keys())
-            route_weights = list(med['routes'].values())
-            selected_route = random.choices(route_names, weights=route_weights, k=1)[0]
+            selected_route = SAMPLERS.sample(('medication_route', med['name']))
         else:
             # Fallback to original route
             selected_route = med['route']
         
-        # Determine dosage based on realistic medication dosage data
-        medication_dosages = {
-            'ALBUTEROL': {'2.5': 10, '5': 1},
-            'DEXTROSE 10%': {'250': 1, '500': 1},
-            'DIAZEPAM': {'2': 1, '5': 1, '10': 1},
-            'DIPHENHYDRAMINE': {'25': 1, '50': 1},
-            'EPI 1:1,000': {'0.3': 1, '0.5': 1},
-            'EPI 1:10,000': {'0.1': 1, '1.0': 1},
-            'EPI 1:100,000 (PDP)': {'0.2': 1, '0.5': 1},
-            'EPI 1:100,000 PDP': {'0.2': 1, '0.5': 1},
-            'FENTANYL': {'25': 1, '50': 1, '75': 1, '100': 1},
-            'GLUCOSE': {'25': 1, '50': 1},
-            'IPRATROPIUM': {'250': 1, '500': 1},
-            'KETAMINE': {'50': 1, '100': 1},
-            'LABETALOL': {'10': 1, '20': 1},
-            'LEVOPHED': {'2': 1, '20': 1},
-            'METHYLPREDNISOLONE': {'125': 1, '250': 1},
-            'METOPROLOL': {'5': 1, '15': 1},
-            'MIDAZOLAM 1 MG/ML [VERSED]': {'1': 1, '5': 1},
-            'MIDAZOLAM 5 MG/ML [VERSED]': {'2': 1, '10': 1},
-            'MIDAZOLAM 5MG/5ML': {'2': 1, '10': 1},
-            'MIDAZOLAM': {'2': 1, '10': 1},
-            'MORPHINE': {'2': 1, '4': 1, '10': 1},
-            'MED_J001': {'0.4': 1, '2': 1},
-            'MED_E002': {'0.3': 1, '0.4': 1},
-            'MED_K001': {'250': 1, '500': 1, '1000': 1},
-            'MED_H001': {'4': 1, '8': 1},
-            'MED_D001': {'2': 1, '4': 1, '6': 1, '10': 1, '15': 1},
-            'MED_O001': {'0.6': 1, '1.2': 1},
-            'MED_U001': {'1': 1, '2': 1},
-            'MED_I001': {'25': 1, '50': 1},
-            'MED_B005': {'0.5': 1, '1': 1},
-            'MED_N001': {'6': 1, '12': 1},
-            'MED_E005': {'150': 1, '300': 1},
-            'MED_E003': {'0.5': 1, '1': 1},
-            'MED_I002': {'500': 1, '1000': 1},
-            'MED_P001': {'2': 1, '20': 1},
-            'MED_Q001': {'1': 1, '4': 1},
-            'MED_R001': {'50': 1, '100': 1},
-            'MED_S001': {'20': 1, '80': 1},
-            'MED_F006': {'2': 1, '10': 1},
-            'MED_L001': {'0.5': 1, '1': 1},
-            'MED_K002': {'500': 1, '1000': 1},
-            'MED_B006': {'25': 1, '50': 1},
-            'MED_V001': {'0.2': 1, '0.3': 1},
-            'MED_W001': {'400': 1, '800': 1},
-            'MED_X001': {'0.08': 1, '0.1': 1},
-            'MED_Y001': {'5': 1, '10': 1},
-            'MED_Z001': {'25': 1, '50': 1},
-            'MED_T002': {'2': 1, '20': 1},
-            'MED_AA001': {'2.5': 1, '5': 1},
-            'MED_BB001': {'10': 1, '20': 1},
-            'MED_CC001': {'500': 1, '1000': 1},
-            'MED_E010': {'0.01': 1, '0.1': 1},
-            'MED_B007': {'25': 1, '50': 1},
-            'MED_DD001': {'2.5': 1, '5': 1},
-            'MED_E001': {'81': 1, '325': 1},
-            'MED_E006': {'0.1': 1, '0.5': 1},
-            'MED_B003': {'25': 1, '50': 1}
-        }
-        
         # Get dosage distribution for this medication
-        if med['name'] in medication_dosages:
-            dosage_dist = medication_dosages[med['name']]
-            dosage_values = list(dosage_dist.keys())
-            dosage_weights = list(dosage_dist.values())
-            selected_dosage = random.choices(dosage_values, weights=dosage_weights, k=1)[0]
+        if med['name'] in MEDICATION_DOSAGE_DISTRIBUTIONS:
+            selected_dosage = SAMPLERS.sample(('medication_dosage', med['name']))
             dosage = float(selected_dosage)
         else:
-            # Default dosage based on original range for medications not in the data
+            # Default dosage based on original range for EMS_MEDICATIONS not in the data
             dosage_range = med['dosage']
             dosage = round(random.uniform(dosage_range[0], dosage_range[1]), 1)
         
-        # Determine dosage unit based on realistic medication dosage unit data
-        medication_units = {
-            'ACETAMINOPHEN': {'MG': 631, 'ML': 65},
-            'ACTIVATED CHARCOAL': {'DROPS': 2, 'G': 3},
-            'ADENOSINE': {'MG': 465},
-            'ALBUTEROL': {'MG': 4422, 'PUFFS': 1},
-            'AMIODARONE': {'MG': 345},
-            'MED_E001': {'MG': 5255, 'UNITS_PER_I': 1},
-            'ATROPINE': {'MG': 277},
-            'CALCIUM CHLORIDE': {'G': 102, 'MG': 22, 'ML': 1},
-            'CALCIUM GLUCONATE': {'MCG': 1, 'MG': 23, 'ML': 9},
-            'DEXTROSE 10%': {'G': 172, 'KEEP_VEIN': 2, 'L': 1, 'MG': 297, 'UNITS': 1},
-            'DIAZEPAM': {'MG': 200},
-            'DEXTROSE 50%': {'G': 696, 'MG': 6},
-            'DIPHENHYDRAMINE': {'MG': 1037, 'ML': 7},
-            'DOPAMINE': {'DROPS': 2, 'MCG': 78, 'MEQ': 2, 'MG': 3, 'ML': 4},
-            'EPI 1:1,000': {'MCG': 5, 'MEQ': 2, 'MG': 1178, 'ML': 4},
-            'EPI 1:10,000': {'MCG': 109, 'MG': 6809, 'ML': 2, 'UNITS_PER_I': 1},
-            'EPI 1:100,000 (PDP)': {'MCG': 68, 'MEQ': 1, 'MG': 1, 'ML': 2},
-            'EPI 1:100,000 PDP': {'MCG': 124, 'MEQ': 1, 'MG': 4, 'ML': 9},
-            'MED_E008': {'MCG': 8, 'MG': 41, 'ML': 1},
-            'MED_E010': {'MG': 1},
-            'MED_E006': {'MCG': 3, 'MG': 302, 'ML': 12, 'UNITS_PER_I': 2},
-            'ETOMIDATE': {'MG': 7},
-            'FENTANYL': {'MCG': 8446, 'MG': 1, 'ML': 5},
-            'FUROSEMIDE': {'MG': 45},
-            'GLUCAGON': {'MG': 353},
-            'GLUCOSE': {'G': 996, 'MG': 1, 'ML': 1, 'UNITS': 1, 'UNITS_PER_I': 2},
-            'GLUCOSE 100 MG/ML': {'G': 18, 'MG': 1},
-            'GLUCOSE 500 MG/ML': {'G': 1, 'MG': 1},
-            'HALOPERIDOL': {'MG': 36},
-            'HYDROXOCOBALAMIN': {'G': 2, 'MG': 2},
-            'HYDROXOCOBALAMIN INJECTION [CYANOKIT]': {'G': 1},
-            'IBUPROFEN': {'MCG': 2, 'MG': 4304, 'ML': 1},
-            'IPRATROPIUM': {'MCG': 2, 'MG': 721, 'ML': 4},
-            'KETAMINE': {'MG': 276},
-            'LABETALOL': {'MCG': 40, 'MG': 1, 'ML': 1},
-            'LEVOPHED': {'MG': 78},
-            'LIDOCAINE': {'MG': 1},
-            'MAGNESIUM SULFATE': {'G': 71, 'MG': 1865, 'MEQ': 131, 'ML': 8},
-            'METHYLPREDNISOLONE': {'MG': 605},
-            'METOPROLOL': {'MG': 447},
-            'MIDAZOLAM': {'MCG': 1, 'MG': 140, 'ML': 3},
-            'MIDAZOLAM 1 MG/ML [VERSED]': {'MCG': 1, 'MG': 71, 'ML': 6, 'UNITS_PER_I': 1},
-            'MIDAZOLAM 10MG/2ML': {'MCG': 1, 'MG': 511, 'ML': 26},
-            'MIDAZOLAM 5 MG/ML [VERSED]': {'MCG': 4, 'MG': 13},
-            'MIDAZOLAM 5MG/5ML': {'MCG': 6, 'MG': 748, 'ML': 3},
-            'MED_G002': {'MCG': 1, 'MG': 1730},
-            'MED_J001': {'MCG': 1, 'MG': 5129, 'UNITS': 1},
-            'NITROGLYCERIN': {'MCG': 3},
-            'MED_T002': {'MCG': 4},
-            'NORMAL SALINE': {'DROPS': 29, 'G': 22, 'KEEP_VEIN': 696, 'L': 442, 'LITERS_BO': 29, 'LITERS_PER': 47, 'LOCK_FLUSH': 4, 'MEQ': 11, 'MG': 88, 'ML': 13216, 'NOT_APPLIC': 9, 'NOT_RECORDED': 1, 'OTHER': 22, 'PUFFS': 9, 'UNITS': 54, 'UNITS_PER_I': 9},
-            'ONDANSETRON': {'MG': 10241},
-            'MED_D001': {'DROPS': 5, 'G': 1, 'KEEP_VEIN': 1, 'L': 1374, 'LITERS_BO': 869, 'LITERS_PER': 5718, 'LOCK_FLUSH': 3, 'METERED_D': 9, 'MEQ': 2, 'MG': 18, 'ML': 85, 'NOT_APPLIC': 4, 'OTHER': 26, 'UNITS_PER_I': 13},
-            'POTASSIUM CHLORIDE': {'MG': 2},
-            'ROCURONIUM': {'MG': 287, 'ML': 10},
-            'SODIUM BICARBONATE': {'MCG': 653, 'MG': 2, 'ML': 19, 'UNITS_PER_I': 1},
-            'SODIUM CHLORIDE': {'G': 1, 'MG': 2},
-            'STERILE WATER': {'G': 1, 'MG': 1},
-            'SUCCINYLCHOLINE': {'G': 1, 'MG': 8, 'ML': 1},
-            'TETRACAINE': {'G': 39},
-            'VECURONIUM': {'MG': 5}
-        }
-        
         # Get unit distribution for this medication
-        if med['name'] in medication_units:
-            unit_dist = medication_units[med['name']]
-            unit_names = list(unit_dist.keys())
-            unit_weights = list(unit_dist.values())
-            selected_unit = random.choices(unit_names, weights=unit_weights, k=1)[0]
-            # Map to standard unit abbreviations
-            unit_mapping = {
-                'MG': 'MG', 'ML': 'ML', 'MCG': 'MCG', 'G': 'G', 'L': 'L', 
-                'MEQ': 'MEQ', 'UNITS': 'UNITS', 'PUFFS': 'PUFFS', 'DROPS': 'DROPS',
-                'KEEP_VEIN': 'ML', 'LITERS_BO': 'L', 'LITERS_PER': 'L/MIN', 
-                'LOCK_FLUSH': 'ML', 'METERED_D': 'PUFFS', 'UNITS_PER_I': 'UNITS',
-                'NOT_APPLIC': 'UNITS', 'NOT_RECORDED': 'UNITS', 'OTHER': 'UNITS'
-            }
-            dosage_unit = unit_mapping.get(selected_unit, selected_unit)
+        if med['name'] in MEDICATION_UNIT_DISTRIBUTIONS:
+            selected_unit = SAMPLERS.sample(('medication_unit', med['name']))
+            dosage_unit = MEDICATION_UNIT_MAPPING.get(selected_unit, selected_unit)
         else:
             # Default unit from medication definition
             dosage_unit = med['unit']
-        # Determine patient response based on realistic medication patient response data
-        medication_response_probs = {
-            'ACETAMINOPHEN': {'IMPROVED': 0.286, 'NOT_RECORDED': 0.269, 'UNCHANGED': 0.445, 'WORSE': 0.0},
-            'ACTIVATED CHARCOAL': {'IMPROVED': 0.0, 'NOT_RECORDED': 1.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
-            'ADENOSINE': {'IMPROVED': 0.406, 'NOT_RECORDED': 0.164, 'UNCHANGED': 0.429, 'WORSE': 0.002},
-            'ALBUTEROL': {'IMPROVED': 0.641, 'NOT_RECORDED': 0.241, 'UNCHANGED': 0.116, 'WORSE': 0.002},
-            'AMIODARONE': {'IMPROVED': 0.145, 'NOT_RECORDED': 0.298, 'UNCHANGED': 0.551, 'WORSE': 0.006},
-            'MED_E001': {'IMPROVED': 0.186, 'NOT_RECORDED': 0.255, 'UNCHANGED': 0.558, 'WORSE': 0.002},
-            'ATROPINE': {'IMPROVED': 0.537, 'NOT_RECORDED': 0.169, 'UNCHANGED': 0.290, 'WORSE': 0.004},
-            'CALCIUM CHLORIDE': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.321, 'UNCHANGED': 0.597, 'WORSE': 0.0},
-            'DEXTROSE 10%': {'IMPROVED': 0.800, 'NOT_RECORDED': 0.086, 'UNCHANGED': 0.112, 'WORSE': 0.004},
-            'DEXTROSE 50%': {'IMPROVED': 0.504, 'NOT_RECORDED': 0.419, 'UNCHANGED': 0.075, 'WORSE': 0.0},
-            'DIPHENHYDRAMINE': {'IMPROVED': 0.584, 'NOT_RECORDED': 0.214, 'UNCHANGED': 0.202, 'WORSE': 0.001},
-            'DOPAMINE': {'IMPROVED': 0.458, 'NOT_RECORDED': 0.289, 'UNCHANGED': 0.241, 'WORSE': 0.012},
-            'EPI 1:1,000': {'IMPROVED': 0.384, 'NOT_RECORDED': 0.316, 'UNCHANGED': 0.300, 'WORSE': 0.001},
-            'EPI 1:10,000': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.299, 'UNCHANGED': 0.613, 'WORSE': 0.001},
-            'EPI 1:100,000 (PDP)': {'IMPROVED': 0.620, 'NOT_RECORDED': 0.239, 'UNCHANGED': 0.127, 'WORSE': 0.014},
-            'EPI 1:100,000 PDP': {'IMPROVED': 0.787, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.202, 'WORSE': 0.007},
-            'MED_E008': {'IMPROVED': 0.673, 'NOT_RECORDED': 0.102, 'UNCHANGED': 0.224, 'WORSE': 0.0},
-            'MED_E010': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 1.0, 'WORSE': 0.0},
-            'MED_E006': {'IMPROVED': 0.102, 'NOT_RECORDED': 0.255, 'UNCHANGED': 0.643, 'WORSE': 0.0},
-            'ETOMIDATE': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.8, 'UNCHANGED': 0.2, 'WORSE': 0.0},
-            'FENTANYL': {'IMPROVED': 0.673, 'NOT_RECORDED': 0.170, 'UNCHANGED': 0.154, 'WORSE': 0.002},
-            'FUROSEMIDE': {'IMPROVED': 0.444, 'NOT_RECORDED': 0.244, 'UNCHANGED': 0.311, 'WORSE': 0.0},
-            'GLUCAGON': {'IMPROVED': 0.531, 'NOT_RECORDED': 0.272, 'UNCHANGED': 0.196, 'WORSE': 0.006},
-            'GLUCOSE': {'IMPROVED': 0.491, 'NOT_RECORDED': 0.301, 'UNCHANGED': 0.202, 'WORSE': 0.006},
-            'GLUCOSE 100 MG/ML': {'IMPROVED': 0.105, 'NOT_RECORDED': 0.316, 'UNCHANGED': 0.579, 'WORSE': 0.0},
-            'GLUCOSE 500 MG/ML': {'IMPROVED': 1.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
-            'HALOPERIDOL': {'IMPROVED': 0.611, 'NOT_RECORDED': 0.222, 'UNCHANGED': 0.167, 'WORSE': 0.0},
-            'HYDROXOCOBALAMIN': {'IMPROVED': 0.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 1.0, 'WORSE': 0.0},
-            'HYDROXOCOBALAMIN INJECTION [CYANOKIT]': {'IMPROVED': 1.0, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.0, 'WORSE': 0.0},
-            'IBUPROFEN': {'IMPROVED': 0.4, 'NOT_RECORDED': 0.6, 'UNCHANGED': 0.0, 'WORSE': 0.0},
-            'IPRATROPIUM': {'IMPROVED': 0.629, 'NOT_RECORDED': 0.260, 'UNCHANGED': 0.110, 'WORSE': 0.003},
-            'KETAMINE': {'IMPROVED': 0.569, 'NOT_RECORDED': 0.150, 'UNCHANGED': 0.276, 'WORSE': 0.003},
-            'LABETALOL': {'IMPROVED': 0.681, 'NOT_RECORDED': 0.220, 'UNCHANGED': 0.097, 'WORSE': 0.0},
-            'LEVOPHED': {'IMPROVED': 0.707, 'NOT_RECORDED': 0.049, 'UNCHANGED': 0.244, 'WORSE': 0.0},
-            'LIDOCAINE': {'IMPROVED': 0.346, 'NOT_RECORDED': 0.244, 'UNCHANGED': 0.410, 'WORSE': 0.0},
-            'MAGNESIUM SULFATE': {'IMPROVED': 0.208, 'NOT_RECORDED': 0.278, 'UNCHANGED': 0.514, 'WORSE': 0.0},
-            'METHYLPREDNISOLONE': {'IMPROVED': 0.398, 'NOT_RECORDED': 0.266, 'UNCHANGED': 0.336, 'WORSE': 0.001},
-            'METOPROLOL': {'IMPROVED': 0.669, 'NOT_RECORDED': 0.170, 'UNCHANGED': 0.158, 'WORSE': 0.0},
-            'MIDAZOLAM': {'IMPROVED': 0.513, 'NOT_RECORDED': 0.319, 'UNCHANGED': 0.166, 'WORSE': 0.0},
-            'MIDAZOLAM 1 MG/ML [VERSED]': {'IMPROVED': 0.748, 'NOT_RECORDED': 0.082, 'UNCHANGED': 0.163, 'WORSE': 0.007},
-            'MIDAZOLAM 10MG/2ML': {'IMPROVED': 0.671, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.329, 'WORSE': 0.0},
-            'MIDAZOLAM 5 MG/ML [VERSED]': {'IMPROVED': 0.740, 'NOT_RECORDED': 0.076, 'UNCHANGED': 0.183, 'WORSE': 0.002},
-            'MIDAZOLAM 5MG/5ML': {'IMPROVED': 0.938, 'NOT_RECORDED': 0.0, 'UNCHANGED': 0.062, 'WORSE': 0.0},
-            'MED_G002': {'IMPROVED': 0.559, 'NOT_RECORDED': 0.231, 'UNCHANGED': 0.204, 'WORSE': 0.003},
-            'MED_J001': {'IMPROVED': 0.373, 'NOT_RECORDED': 0.219, 'UNCHANGED': 0.405, 'WORSE': 0.001},
-            'NITROGLYCERIN': {'IMPROVED': 0.540, 'NOT_RECORDED': 0.185, 'UNCHANGED': 0.266, 'WORSE': 0.010},
-            'MED_T002': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.25, 'UNCHANGED': 0.5, 'WORSE': 0.0},
-            'NORMAL SALINE': {'IMPROVED': 0.297, 'NOT_RECORDED': 0.212, 'UNCHANGED': 0.492, 'WORSE': 0.003},
-            'ONDANSETRON': {'IMPROVED': 0.484, 'NOT_RECORDED': 0.234, 'UNCHANGED': 0.305, 'WORSE': 0.001},
-            'MED_D001': {'IMPROVED': 0.617, 'NOT_RECORDED': 0.211, 'UNCHANGED': 0.172, 'WORSE': 0.003},
-            'ROCURONIUM': {'IMPROVED': 0.509, 'NOT_RECORDED': 0.263, 'UNCHANGED': 0.229, 'WORSE': 0.0},
-            'SODIUM BICARBONATE': {'IMPROVED': 0.082, 'NOT_RECORDED': 0.271, 'UNCHANGED': 0.643, 'WORSE': 0.0},
-            'SODIUM CHLORIDE': {'IMPROVED': 0.1, 'NOT_RECORDED': 0.05, 'UNCHANGED': 0.85, 'WORSE': 0.0},
-            'STERILE WATER': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0},
-            'SUCCINYLCHOLINE': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0},
-            'TETRACAINE': {'IMPROVED': 0.718, 'NOT_RECORDED': 0.154, 'UNCHANGED': 0.103, 'WORSE': 0.026},
-            'VECURONIUM': {'IMPROVED': 0.25, 'NOT_RECORDED': 0.5, 'UNCHANGED': 0.25, 'WORSE': 0.0}
-        }
-        
         # Get patient response distribution for this medication
-        if med['name'] in medication_response_probs:
-            response_dist = medication_response_probs[med['name']]
-            response_names = list(response_dist.keys())
-            response_weights = list(response_dist.values())  # Pre-calculated probabilities
-            patient_response = random.choices(response_names, weights=response_weights, k=1)[0]
+        if med['name'] in MEDICATION_RESPONSE_DISTRIBUTIONS:
+            patient_response = SAMPLERS.sample(('medication_response', med['name']))
         else:
             # Default patient response
             patient_response = random.choice(['IMPROVED', 'NOT_RECORDED', 'UNCHANGED', 'WORSE'])
         
-        # Determine appropriate site based on realistic medication administration site data
-        medication_sites = {
-            'ALBUTEROL': {'ANTECUBIT ARM-LEFT': 1, 'MOUTH': 10},
-            'DEXTROSE 10%': {'ANTECUBIT ARM-LEFT': 1, 'HAND-LEFT': 1},
-            'DIPHENHYDRAMINE': {'ANTECUBITAL-LEFT': 2, 'ARM-RIGHT': 2, 'LOWER EXT': 1},
-            'EPI 1:1,000': {'HUMERAL I': 1, 'OTHER': 1},
-            'EPI 1:10,000': {'ANTECUBIT ARM-LEFT': 1},
-            'EPI 1:100,000 (PDP)': {'HUMERAL': 2},
-            'EPI 1:100,000 PDP': {'ANTECUBITAL-LEFT': 2},
-            'FENTANYL': {'ANTECUBITAL-LEFT': 11, 'ANTECUBIT ARM-LEFT': 7, 'ARM-RIGHT': 4, 'HUMERAL I': 1, 'NOSE': 3, 'OTHER': 1},
-            'GLUCOSE': {'MOUTH': 7},
-            'IPRATROPIUM': {'MOUTH': 11},
-            'KETAMINE': {'ANTECUBITAL-LEFT': 2, 'ANTECUBIT ARM-LEFT': 4, 'ARM-RIGHT': 1, 'HAND-LEFT': 1, 'HUMERAL I': 1},
-            'LABETALOL': {'ANTECUBITAL-LEFT': 1},
-            'LEVOPHED': {'ARM-RIGHT': 1, 'HUMERAL I': 1},
-            'METHYLPREDNISOLONE': {'ANTECUBITAL-LEFT': 2, 'ANTECUBIT ARM-LEFT': 1},
-            'METOPROLOL': {'ARM-RIGHT': 1},
-            'MIDAZOLAM 1 MG/ML [VERSED]': {'LOWER EXT': 1},
-            'MIDAZOLAM 5 MG/ML [VERSED]': {'ANTECUBITAL-LEFT': 1, 'ARM-RIGHT': 1},
-            'MIDAZOLAM 5MG/5ML': {'LOWER EXT': 1},
-            'MED_G002': {'ANTECUBITAL-LEFT': 1},
-            'MED_J001': {'ANTECUBITAL-LEFT': 1, 'HUMERAL I': 1, 'NOSE': 2},
-            'NITROGLYCERIN': {'MOUTH': 13},
-            'NORMAL SALINE': {'ANTECUBITAL-LEFT': 6, 'ANTECUBIT ARM-LEFT': 7, 'ARM-RIGHT': 2, 'HAND-LEFT': 1},
-            'ONDANSETRON': {'ANTECUBITAL-LEFT': 9, 'ANTECUBIT ARM-LEFT': 9, 'ARM-RIGHT': 3, 'HAND-LEFT': 1, 'HUMERAL I': 1},
-            'MED_D001': {'MOUTH': 2, 'OTHER': 9},
-            'ROCURONIUM': {'ANTECUBIT ARM-LEFT': 1, 'HUMERAL I': 1, 'OTHER': 1},
-            'SUCCINYLCHOLINE': {'ANTECUBITAL-LEFT': 1}
-        }
-        
         # Get site distribution for this medication
-        if med['name'] in medication_sites:
-            site_dist = medication_sites[med['name']]
-            site_names = list(site_dist.keys())
-            site_weights = list(site_dist.values())
-            medication_site = random.choices(site_names, weights=site_weights, k=1)[0]
+        if med['name'] in MEDICATION_SITE_DISTRIBUTIONS:
+            medication_site = SAMPLERS.sample(('medication_site', med['name']))
         else:
-            # Default site assignment based on selected route for medications not in the data
+            # Default site assignment based on selected route for EMS_MEDICATIONS not in the data
             if selected_route == 'ORAL':
                 medication_site = 'MOUTH'
             elif selected_route == 'SUBLINGUAL':
@@ -2812,7 +4003,7 @@ class EMSDataGenerator:
                 medication_site = random.choice(['ANTECUBITAL-LEFT', 'ANTECUBIT ARM-LEFT', 'ARM-RIGHT', 'HAND-LEFT', 'HUMERAL I', 'MOUTH'])
         
         medication = EMSMedication(
-            medication_id=str(uuid.uuid4()),
+            medication_id=self._new_uuid(),
             administered_prior_to_ems_care=random.choice(['YES', 'NO', 'UNKNOWN']),
             medication_rxcui_code=med['code'],
             medication_name=med['name'],
@@ -2826,15 +4017,16 @@ class EMSDataGenerator:
             crew_member_level=ems_incident.get('crew_member_level', 'PARAMEDIC') if isinstance(ems_incident, dict) else ems_incident.crew_member_level,
             crew_badge_number=f"EMS{random.randint(1000, 9999)}",
             medication_authorization=random.choice(['PROTOCOL', 'ONLINE_MEDICAL_CONTROL', 'STANDING_ORDER']),                                                                                                           
-            last_modified=ems_incident.get('call_datetime', self.fake.date_time_between(start_date='-30d', end_date='now')) if isinstance(ems_incident, dict) else ems_incident.call_datetime,
-            incident_id=ems_incident.get('incident_id', str(uuid.uuid4())) if isinstance(ems_incident, dict) else ems_incident.incident_id,
-            created_date=ems_incident.get('call_datetime', self.fake.date_time_between(start_date='-30d', end_date='now')) if isinstance(ems_incident, dict) else ems_incident.call_datetime,
-            administered_datetime=ems_incident.get('arrive_datetime', self.fake.date_time_between(start_date='-30d', end_date='now')) if isinstance(ems_incident, dict) else ems_incident.arrive_datetime,
+            last_modified=ems_incident.get('call_datetime', self.fake.date_time_between(start_date=self._now() - timedelta(days=30), end_date=self._now())) if isinstance(ems_incident, dict) else ems_incident.call_datetime,
+            incident_id=ems_incident.get('incident_id', self._new_uuid()) if isinstance(ems_incident, dict) else ems_incident.incident_id,
+            created_date=ems_incident.get('call_datetime', self.fake.date_time_between(start_date=self._now() - timedelta(days=30), end_date=self._now())) if isinstance(ems_incident, dict) else ems_incident.call_datetime,
+            administered_datetime=ems_incident.get('arrive_datetime', self.fake.date_time_between(start_date=self._now() - timedelta(days=30), end_date=self._now())) if isinstance(ems_incident, dict) else ems_incident.arrive_datetime,
             broken_seal=random.choice(['YES', 'NO'])
         )
         
         return medication
 
+    @METRICS.timed('ems.patient')
     def generate_ems_patient(self, ems_incident=None):
         """Generate comprehensive EMS patient record with realistic demographics"""
         if not ems_incident:
@@ -2871,11 +4063,11 @@ class EMSDataGenerator:
         if patient_age < 18:
             patient_marital_status = 'SINGLE'
         elif patient_age < 25:
-            patient_marital_status = random.choices(['SINGLE', 'MARRIED'], weights=[0.8, 0.2], k=1)[0]
+            patient_marital_status = SAMPLERS.sample('marital_status_18_24')
         elif patient_age < 65:
-            patient_marital_status = random.choices(['MARRIED', 'SINGLE', 'DIVORCED', 'WIDOWED'], weights=[0.6, 0.25, 0.1, 0.05], k=1)[0]
+            patient_marital_status = SAMPLERS.sample('marital_status_25_64')
         else:
-            patient_marital_status = random.choices(['MARRIED', 'WIDOWED', 'SINGLE', 'DIVORCED'], weights=[0.4, 0.35, 0.15, 0.1], k=1)[0]
+            patient_marital_status = SAMPLERS.sample('marital_status_65_plus')
         
         # Generate realistic height based on age and gender
         if patient_age < 18:
@@ -2913,8 +4105,7 @@ class EMSDataGenerator:
         emergency_contact_phone = self.fake.phone_number()
         
         # Generate insurance information
-        insurance_providers = ['AETNA', 'ANTHEM', 'BLUE_CROSS_BLUE_SHIELD', 'CIGNA', 'HUMANA', 'KAISER_PERMANENTE', 'MEDICARE', 'MEDICAID', 'UNITED_HEALTHCARE', 'SELF_PAY']
-        insurance_provider = random.choices(insurance_providers, weights=[0.15, 0.15, 0.20, 0.10, 0.10, 0.05, 0.10, 0.05, 0.08, 0.02], k=1)[0]
+        insurance_provider = SAMPLERS.sample('insurance_provider')
         insurance_policy_number = f"{random.randint(100000000, 999999999)}"
         insurance_group_number = f"{random.randint(100000, 999999)}"
         
@@ -2922,13 +4113,12 @@ class EMSDataGenerator:
         occupation = self._generate_realistic_occupation(patient_age, patient_gender)
         employer = self.fake.company() if occupation != 'UNEMPLOYED' and occupation != 'RETIRED' else 'N/A'
         
-        education_levels = ['LESS_THAN_HIGH_SCHOOL', 'HIGH_SCHOOL', 'SOME_COLLEGE', 'BACHELORS_DEGREE', 'GRADUATE_DEGREE']
         if patient_age < 18:
             education_level = random.choice(['LESS_THAN_HIGH_SCHOOL', 'HIGH_SCHOOL'])
         elif patient_age < 25:
-            education_level = random.choices(['HIGH_SCHOOL', 'SOME_COLLEGE'], weights=[0.6, 0.4], k=1)[0]
+            education_level = SAMPLERS.sample('education_level_18_24')
         else:
-            education_level = random.choices(education_levels, weights=[0.15, 0.35, 0.25, 0.15, 0.10], k=1)[0]
+            education_level = SAMPLERS.sample('education_level_25_plus')
         
         # Generate medical information
         primary_care_physician = f"Dr. {self.fake.last_name()}"
@@ -2956,27 +4146,27 @@ class EMSDataGenerator:
         
         # Generate social history
         social_history = {
-            'smoking_status': random.choices(['NEVER', 'FORMER', 'CURRENT'], weights=[0.6, 0.25, 0.15], k=1)[0],
-            'alcohol_use': random.choices(['NONE', 'OCCASIONAL', 'MODERATE', 'HEAVY'], weights=[0.4, 0.35, 0.2, 0.05], k=1)[0],
-            'drug_use': random.choices(['NONE', 'RECREATIONAL', 'PRESCRIPTION_MISUSE'], weights=[0.85, 0.1, 0.05], k=1)[0],
-            'exercise_frequency': random.choices(['NONE', 'OCCASIONAL', 'REGULAR', 'DAILY'], weights=[0.3, 0.4, 0.25, 0.05], k=1)[0]
+            'smoking_status': SAMPLERS.sample('smoking_status'),
+            'alcohol_use': SAMPLERS.sample('alcohol_use'),
+            'drug_use': SAMPLERS.sample('drug_use'),
+            'exercise_frequency': SAMPLERS.sample('exercise_frequency')
         }
         
         # Generate functional status
-        mobility_status = random.choices(['INDEPENDENT', 'ASSISTED', 'WHEELCHAIR', 'BEDBOUND'], weights=[0.8, 0.15, 0.04, 0.01], k=1)[0]
-        cognitive_status = random.choices(['NORMAL', 'MILD_IMPAIRMENT', 'MODERATE_IMPAIRMENT', 'SEVERE_IMPAIRMENT'], weights=[0.85, 0.1, 0.04, 0.01], k=1)[0]
-        living_situation = random.choices(['ALONE', 'WITH_FAMILY', 'WITH_SPOUSE', 'ASSISTED_LIVING', 'NURSING_HOME'], weights=[0.3, 0.35, 0.25, 0.08, 0.02], k=1)[0]
-        caregiver_status = random.choices(['NONE', 'FAMILY', 'PAID_CAREGIVER', 'HEALTHCARE_FACILITY'], weights=[0.6, 0.3, 0.08, 0.02], k=1)[0]
+        mobility_status = SAMPLERS.sample('mobility_status')
+        cognitive_status = SAMPLERS.sample('cognitive_status')
+        living_situation = SAMPLERS.sample('living_situation')
+        caregiver_status = SAMPLERS.sample('caregiver_status')
         
         # Generate additional demographics
-        preferred_language = random.choices(['ENGLISH', 'SPANISH', 'CHINESE', 'OTHER'], weights=[0.85, 0.1, 0.02, 0.03], k=1)[0]
+        preferred_language = SAMPLERS.sample('preferred_language')
         interpreter_needed = preferred_language != 'ENGLISH' and random.random() < 0.8
         veteran_status = patient_age > 18 and random.random() < 0.1
-        disability_status = random.choices(['NONE', 'PHYSICAL', 'COGNITIVE', 'BOTH'], weights=[0.9, 0.06, 0.03, 0.01], k=1)[0]
+        disability_status = SAMPLERS.sample('disability_status')
         
         patient = EMSPatient(
             # Basic Demographics
-            patient_id=ems_incident.patient_id if hasattr(ems_incident, 'patient_id') else ems_incident.get('patient_id', str(uuid.uuid4())),
+            patient_id=ems_incident.patient_id if hasattr(ems_incident, 'patient_id') else ems_incident.get('patient_id', self._new_uuid()),
             patient_full_name=patient_full_name,
             patient_date_of_birth=patient_date_of_birth,
             patient_age=patient_age,
@@ -3056,16 +4246,11 @@ class EMSDataGenerator:
         if age < 16:
             return 'STUDENT'
         elif age < 18:
-            return random.choices(['STUDENT', 'PART_TIME_WORKER', 'UNEMPLOYED'], weights=[0.8, 0.15, 0.05], k=1)[0]
+            return SAMPLERS.sample('occupation_16_17')
         elif age < 65:
-            occupations = [
-                'OFFICE_WORKER', 'HEALTHCARE_WORKER', 'EDUCATOR', 'RETAIL_WORKER', 'CONSTRUCTION_WORKER',
-                'TECHNICAL_WORKER', 'SERVICE_WORKER', 'MANAGER', 'SELF_EMPLOYED', 'UNEMPLOYED'
-            ]
-            weights = [0.25, 0.15, 0.10, 0.15, 0.10, 0.10, 0.08, 0.05, 0.02, 0.05]
-            return random.choices(occupations, weights=weights, k=1)[0]
+            return SAMPLERS.sample('occupation_18_64')
         else:
-            return random.choices(['RETIRED', 'PART_TIME_WORKER', 'UNEMPLOYED'], weights=[0.85, 0.10, 0.05], k=1)[0]
+            return SAMPLERS.sample('occupation_65_plus')
 
     def _generate_realistic_allergies(self, age):
         """Generate realistic allergies based on age"""
@@ -3073,7 +4258,7 @@ class EMSDataGenerator:
         common_allergies = ['PENICILLIN', 'SULFONAMIDES', 'ASPIRIN', 'NUTS', 'SHELLFISH', 'POLLEN', 'DUST', 'NONE']
         
         if random.random() < 0.3:  # 30% have allergies
-            num_allergies = random.choices([1, 2, 3, 4], weights=[0.6, 0.25, 0.10, 0.05], k=1)[0]
+            num_allergies = SAMPLERS.sample('allergy_count')
             selected_allergies = random.sample(common_allergies[:-1], num_allergies)  # Exclude 'NONE'
             allergies.extend(selected_allergies)
         
@@ -3097,7 +4282,7 @@ class EMSDataGenerator:
                 'AMLODIPINE', 'SERTRALINE', 'LEVOTHYROXINE', 'ALBUTEROL', 'PREDNISONE',
                 'WARFARIN', 'FUROSEMIDE', 'GABAPENTIN', 'TRAMADOL', 'CYCLOBENZAPRINE'
             ]
-            num_meds = random.choices([1, 2, 3, 4, 5], weights=[0.4, 0.3, 0.15, 0.10, 0.05], k=1)[0]
+            num_meds = SAMPLERS.sample('current_medication_count')
             selected_meds = random.sample(common_medications, num_meds)
             medications.extend(selected_meds)
         
@@ -3123,7 +4308,7 @@ class EMSDataGenerator:
                 'ARTHRITIS', 'DEPRESSION', 'ANXIETY', 'HEART_DISEASE', 'KIDNEY_DISEASE',
                 'THYROID_DISORDER', 'MIGRAINE', 'BACK_PAIN', 'OSTEOPOROSIS'
             ]
-            num_conditions = random.choices([1, 2, 3, 4], weights=[0.5, 0.3, 0.15, 0.05], k=1)[0]
+            num_conditions = SAMPLERS.sample('chronic_condition_count')
             selected_conditions = random.sample(common_conditions, num_conditions)
             conditions.extend(selected_conditions)
         
@@ -3137,7 +4322,7 @@ class EMSDataGenerator:
         family_conditions = ['HEART_DISEASE', 'CANCER', 'DIABETES', 'HYPERTENSION', 'STROKE', 'ALZHEIMERS', 'DEPRESSION', 'ASTHMA']
         
         if random.random() < 0.6:  # 60% have family history
-            num_conditions = random.choices([1, 2, 3], weights=[0.6, 0.3, 0.1], k=1)[0]
+            num_conditions = SAMPLERS.sample('family_history_count')
             selected_conditions = random.sample(family_conditions, num_conditions)
             family_history.extend(selected_conditions)
         
@@ -3210,32 +4395,25 @@ class EMSDataGenerator:
         
         return adjusted_weights
 
+    @METRICS.timed('ems.geocode')
     def _generate_gps_coordinates_from_address(self, address, city, state, zip_code):
         """Generate GPS coordinates for an address using existing coordinates from address pool"""
-        # First, try to find the exact address in our pool with coordinates
-        if not self._pool_initialized:
-            self._load_address_library()
-            
-        for addr_tuple in self._real_address_pool:
-            if len(addr_tuple) >= 6:  # Has coordinates
-                addr, addr_city, addr_state, addr_zip, lat, lon = addr_tuple[:6]
-                if (addr == address and addr_city.upper() == city.upper() and 
-                    addr_state.upper() == state.upper() and addr_zip == zip_code):
-                    return float(lat), float(lon), "EXACT_MATCH"
-        
-        # If no exact match, use geocoding for real addresses
-        from geopy.geocoders import Nominatim
-        from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
-        
-        try:
-            geolocator = Nominatim(user_agent="seattle_data_generator")
-            full_address = f"{address}, {city}, {state} {zip_code}"
-            location = geolocator.geocode(full_address, timeout=5)
-            
-            if location:
-                return location.latitude, location.longitude, "GEOCODED"
-        except (GeocoderTimedOut, GeocoderUnavailable, Exception):
-            pass
+        # First, look the address up in the offline index (bundled files + address library)
+        location = self._get_offline_geocoder().geocode(address, city, state, zip_code)
+        if location and location[2] == "EXACT_MATCH":
+            return location
+        
+        # If no exact match, use network geocoding results cached on disk (misses are queued)
+        if self._use_network_geocoding:
+            cached = self._geocode_cache.get_forward(GeocodeCache.address_key(address, city, state, zip_code))
+            if cached:
+                return cached[0], cached[1], "GEOCODED"
+            self._geocode_worker.submit_forward(address, city, state, zip_code)
+        
+        # ZIP/city centroid of the known addresses, with some random variation
+        if location:
+            lat, lon, accuracy = location
+            return lat + random.uniform(-0.01, 0.01), lon + random.uniform(-0.01, 0.01), accuracy
         
         # Fallback: Use ZIP code based approximation
         seattle_zip_coords = {
@@ -3384,56 +4562,14 @@ class EMSDataGenerator:
         
         # Realistic frequent caller patterns
         # 70% new patients, 20% 2-3 incidents, 10% frequent callers (4+ incidents)
-        reuse_decision = random.choices(
-            ['NEW_PATIENT', 'REUSE_EXISTING', 'FREQUENT_CALLER'],
-            weights=[0.70, 0.20, 0.10],
-            k=1
-        )[0]
+        reuse_decision = SAMPLERS.sample('patient_reuse_decision')
         
         if reuse_decision == 'NEW_PATIENT':
             return None, False
         
-        # For existing patients, filter by realistic criteria
-        eligible_patients = []
-        for patient in self._patient_pool:
-            patient_id = patient['patient_id']
-            incident_count = len(self._patient_incident_history.get(patient_id, []))
-            
-            # Skip patients who already have too many incidents
-            if incident_count >= 8:  # Max 8 incidents per patient
-                continue
-                
-            # Check if enough time has passed since last incident
-            if patient_id in self._patient_incident_history:
-                last_incident_date = max(self._patient_incident_history[patient_id])
-                days_since_last = (incident_datetime - last_incident_date).days
-                
-                # Realistic time gaps between incidents
-                if incident_count == 0:  # First reuse
-                    min_days = 1  # Can reuse same day
-                elif incident_count == 1:  # Second incident
-                    min_days = 7  # At least a week
-                elif incident_count < 4:  # 3rd-4th incident
-                    min_days = 14  # At least 2 weeks
-                else:  # Frequent caller (5+ incidents)
-                    min_days = 30  # At least a month
-                
-                if days_since_last >= min_days:
-                    eligible_patients.append(patient)
-            else:
-                eligible_patients.append(patient)
-        
-        if eligible_patients:
-            # Weight selection based on incident frequency (more incidents = higher chance of reuse)
-            weights = []
-            for patient in eligible_patients:
-                patient_id = patient['patient_id']
-                incident_count = len(self._patient_incident_history.get(patient_id, []))
-                # Higher weight for patients with more incidents (frequent callers)
-                weight = 1 + (incident_count * 0.5)
-                weights.append(weight)
-            
-            selected_patient = random.choices(eligible_patients, weights=weights, k=1)[0]
+        # For existing patients, pick among those past their minimum gap since the last incident
+        selected_patient = self._patient_reuse_index.choose(incident_datetime)
+        if selected_patient is not None:
             return selected_patient, True
         
         return None, False
@@ -3443,6 +4579,8 @@ class EMSDataGenerator:
         if patient_id not in self._patient_incident_history:
             self._patient_incident_history[patient_id] = []
         self._patient_incident_history[patient_id].append(incident_datetime)
+        self._patient_reuse_index.record_incident(patient_id, incident_datetime)
+    @METRICS.timed('ems.existing_patient')
     def _generate_incident_for_existing_patient(self, existing_patient, incident_datetime):
         """Generate an incident for an existing patient with realistic progression"""
         patient_id = existing_patient['patient_id']
@@ -3470,7 +4608,7 @@ class EMSDataGenerator:
         patient_race = existing_patient['patient_race']
         
         # Generate new incident location (may be different from home)
-        incident_address, incident_city, incident_state, incident_zip = self._get_cached_address()
+        incident_address, incident_city, incident_state, incident_zip = self._get_cached_address()[:4]
         
         # Generate incident-specific details
         priority = self._determine_priority_from_incident_type(incident_type_code)
@@ -3506,9 +4644,9 @@ class EMSDataGenerator:
         
         # Create incident with existing patient data
         incident = EMSIncident(
-            incident_id=str(uuid.uuid4()),
-            incident_number=f"EMS{incident_datetime.year}{random.randint(100000, 999999)}",
-            call_number=f"E{incident_datetime.year}{random.randint(1000000, 9999999)}",
+            incident_id=self._new_uuid(),
+            incident_number=f"EMS{incident_datetime.year}{self._ids.number('ems_incident')}",
+            call_number=f"E{incident_datetime.year}{self._ids.number('ems_call', digits=7)}",
             incident_type=incident_type_description,
             incident_type_code=incident_type_code,
             incident_type_description=incident_type_description,
@@ -3667,40 +4805,14 @@ class EMSDataGenerator:
             return random.choice(applicable_incidents)
         
         # Otherwise, use regular incident selection
-        incident_code, _ = self._choose_ems_incident_type(datetime.now())
+        incident_code, _ = self._choose_ems_incident_type(self._now())
         return incident_code
 
     def _determine_priority_from_incident_type(self, incident_type_code):
         """Determine incident priority based on incident type code"""
-        priority_map = {
-            '2301019': 'HIGH',  # Cardiac Arrest/Death
-            '2301067': 'HIGH',  # Stroke/CVA
-            '2301053': 'HIGH',  # Overdose/Poisoning/Ingestion
-            '2301077': 'HIGH',  # Unconscious/Fainting/Near-Fainting
-            '2301073': 'HIGH',  # Traumatic Injury
-            '2301021': 'HIGH',  # Chest Pain (Non-Traumatic)
-            '2301013': 'HIGH',  # Breathing Problem
-            '2301045': 'HIGH',  # Hemorrhage/Laceration
-            '2301025': 'HIGH',  # Convulsions/Seizure
-            '2301061': 'MEDIUM',  # Sick Person
-            '2301033': 'MEDIUM',  # Falls
-            '2301001': 'MEDIUM',  # Abdominal Pain/Problems
-            '2301027': 'MEDIUM',  # Diabetic Problem
-            '2301003': 'HIGH',  # Allergic Reaction/Stings
-            '2301057': 'HIGH',  # Pregnancy/Childbirth/Miscarriage
-            '2301043': 'HIGH',  # Heat/Cold Exposure
-            '2301063': 'HIGH',  # Stab/Gunshot Wound/Penetrating Trauma
-            '2301059': 'HIGH',  # Psychiatric Problem/Abnormal Behavior/Suicide Attempt
-            '2301069': 'HIGH',  # Traffic/Transportation Incident
-            '2301007': 'HIGH',  # Assault
-            '2301035': 'HIGH',  # Fire
-            '2301005': 'MEDIUM',  # Animal Bite
-            '2301023': 'HIGH',  # Choking
-            '2301037': 'MEDIUM',  # Headache
-            '2301011': 'LOW',  # Back Pain (Non-Traumatic)
-        }
-        return priority_map.get(incident_type_code, 'MEDIUM')
+        return EMS_PRIORITY_MAP.get(incident_type_code, 'MEDIUM')
 
+    @METRICS.timed('ems.vitals')
     def _generate_vital_signs_for_incident(self, incident_type_code):
         """Generate realistic vital signs based on incident type"""
         # Base vital signs by incident type
@@ -3878,7 +4990,7 @@ class EMSDataGenerator:
         medications = medication_profiles.get(incident_type_code, medication_profiles['default'])
         
         # Determine number of medications (1-3, weighted toward fewer medications)
-        num_medications = random.choices([1, 2, 3], weights=[0.5, 0.35, 0.15], k=1)[0]
+        num_medications = SAMPLERS.sample('medications_per_incident')
         
         # Always include OXYGEN for most incident types (except where inappropriate)
         oxygen_inappropriate = ['2301027', '2301031']  # Diabetic Problem, Eye Problem
@@ -3893,8 +5005,22 @@ class EMSDataGenerator:
             return random.sample(medications, min(num_medications, len(medications)))
 
     # Copula modeling methods removed for performance
+    def generate_linked_reports(self, incidents, patients, medications):
+        """Yield a report for each incident, joining its patient and medications via EMSRecordLinker"""
+        for incident, patient, incident_medications in EMSRecordLinker(patients, medications).link(incidents):
+            report = self.generate_ems_report(incident, incident_medications, patient)
+            if report:
+                yield report
+
+    @METRICS.timed('ems.report')
     def generate_ems_report(self, ems_incident=None, ems_medications=None, ems_patient=None):
-        """Generate comprehensive EMS report linking incident, patient, and medications"""
+        """Generate comprehensive EMS report linking incident, patient, and medications.
+
+        Records may be dataclass instances, namespaces or plain dicts (e.g. parsed JSON);
+        fields are read in place through record_accessors. Older exports' field names
+        (en_route_datetime, arrive_datetime, patient_sex, patient_home_address_geo)
+        stand in for missing newer ones.
+        """
         if not ems_incident:
             return None
         
@@ -3904,68 +5030,82 @@ class EMSDataGenerator:
         if not ems_medications:
             ems_medications = [self.generate_ems_medication(ems_incident)]
         
-        # Handle both dict and object formats
-        def get_attr(obj, attr, default=''):
-            if isinstance(obj, dict):
-                return obj.get(attr, default)
-            else:
-                return getattr(obj, attr, default)
+        get, has = record_accessors(ems_incident)
+        patient_get, patient_has = record_accessors(ems_patient)
+        medications = [record_accessors(med)[0] for med in ems_medications]
+        
+        # Older exports name these fields differently
+        unit_enroute_datetime = get('unit_enroute_datetime' if has('unit_enroute_datetime') else 'en_route_datetime', None)
+        unit_arrived_at_patient_datetime = get('unit_arrived_at_patient_datetime' if has('unit_arrived_at_patient_datetime')
+                                               else 'arrive_datetime', None)
+        patient_gender_field = 'patient_gender' if patient_has('patient_gender') else 'patient_sex'
+        if patient_has('patient_home_address'):
+            patient_home_address = patient_get('patient_home_address', '')
+        elif patient_has('patient_home_address_geo'):
+            geo = patient_get('patient_home_address_geo', '') or ''
+            patient_home_address = geo.split(',')[0].strip() if geo else ''
+        else:
+            patient_home_address = get('patient_home_address', '')
         
         # Generate report-specific fields
-        incident_number = get_attr(ems_incident, 'incident_number', 'UNKNOWN')
+        incident_number = get('incident_number', 'UNKNOWN')
         report_number = f"RPT-{incident_number}-{random.randint(1000, 9999)}"
         
         # Create comprehensive narrative
         narrative_parts = [
-            f"EMS Response Report - {get_attr(ems_incident, 'incident_type_description', 'Unknown Incident')}",
-            f"Patient: {get_attr(ems_patient, 'patient_full_name', 'Unknown Patient')} ({get_attr(ems_patient, 'patient_age', 'Unknown')}yo {get_attr(ems_patient, 'patient_gender', 'Unknown')})",
-            f"Incident: {get_attr(ems_incident, 'incident_type_description', 'Unknown')} at {get_attr(ems_incident, 'address', 'Unknown Location')}",
-            f"Dispatch: {get_attr(ems_incident, 'dispatch_datetime', 'Unknown')}",
-            f"Arrival: {get_attr(ems_incident, 'arrive_datetime', 'Unknown')}",
-            f"Chief Complaint: {get_attr(ems_incident, 'chief_complaint', 'Unknown')}",
-            f"Primary Impression: {get_attr(ems_incident, 'primary_impression', 'Unknown')}",
+            f"EMS Response Report - {get('incident_type_description', 'Unknown Incident')}",
+            f"Patient: {patient_get('patient_full_name', 'Unknown Patient')} ({patient_get('patient_age', 'Unknown')}yo {patient_get(patient_gender_field, 'Unknown')})",
+            f"Incident: {get('incident_type_description', 'Unknown')} at {get('address', 'Unknown Location')}",
+            f"Dispatch: {get('dispatch_datetime', 'Unknown')}",
+            f"Arrival: {get('arrive_datetime', 'Unknown')}",
+            f"Chief Complaint: {get('chief_complaint', 'Unknown')}",
+            f"Primary Impression: {get('primary_impression', 'Unknown')}",
         ]
         
         # Add medication details
         if ems_medications:
-            med_names = [get_attr(med, 'medication_name', 'Unknown') for med in ems_medications]
+            med_names = [med('medication_name', 'Unknown') for med in medications]
             narrative_parts.append(f"Medications Administered: {', '.join(med_names)}")
         
         # Add procedure details
-        attempted_procedures = get_attr(ems_incident, 'attempted_procedures', [])
+        attempted_procedures = get('attempted_procedures', [])
         if attempted_procedures:
             narrative_parts.append(f"Procedures Attempted: {', '.join(attempted_procedures)}")
-        successful_procedures = get_attr(ems_incident, 'successful_procedures', [])
+        successful_procedures = get('successful_procedures', [])
         if successful_procedures:
             narrative_parts.append(f"Procedures Successful: {', '.join(successful_procedures)}")
         
         # Add disposition
         narrative_parts.extend([
-            f"Patient Disposition: {get_attr(ems_incident, 'patient_disposition', 'Unknown')}",
-            f"Transport Destination: {get_attr(ems_incident, 'transfer_destination', 'Unknown')}",
-            f"Transport Method: {get_attr(ems_incident, 'transportation_method', 'Unknown')}",
-            f"Incident Status: {get_attr(ems_incident, 'incident_status', 'Unknown')}"
+            f"Patient Disposition: {get('patient_disposition', 'Unknown')}",
+            f"Transport Destination: {get('transfer_destination', 'Unknown')}",
+            f"Transport Method: {get('transportation_method', 'Unknown')}",
+            f"Incident Status: {get('incident_status', 'Unknown')}"
         ])
         
         report_narrative = "\n".join(narrative_parts)
         
         # Generate medication summary
         medications_summary = "; ".join([
-            f"{med.medication_name} {med.dosage}{med.dosage_unit} {med.medication_administration_route}"
-            for med in ems_medications
-        ]) if ems_medications else "None"
+            f"{med('medication_name', None)} {med('dosage', None)}{med('dosage_unit', None)} "
+            f"{med('medication_administration_route', None)}"
+            for med in medications
+        ]) if medications else "None"
         
         # Generate procedure summaries
-        attempted_procedures_summary = "; ".join(ems_incident.attempted_procedures) if ems_incident.attempted_procedures else "None"
-        successful_procedures_summary = "; ".join(ems_incident.successful_procedures) if ems_incident.successful_procedures else "None"
+        attempted_procedures_summary = "; ".join(attempted_procedures) if attempted_procedures else "None"
+        successful_procedures_summary = "; ".join(successful_procedures) if successful_procedures else "None"
         
         # Generate location string
-        location = f"{ems_incident.incident_location_latitude},{ems_incident.incident_location_longitude}" if hasattr(ems_incident, 'incident_location_latitude') else f"{ems_incident.address}, {ems_incident.city}, {ems_incident.state}"
+        if has('incident_location_latitude'):
+            location = f"{get('incident_location_latitude', None)},{get('incident_location_longitude', None)}"
+        else:
+            location = f"{get('address', None)}, {get('city', None)}, {get('state', None)}"
         
         # Generate linked entity IDs
-        linked_medications = [med.medication_id for med in ems_medications] if ems_medications else []
-        linked_patients = [ems_patient.patient_id] if ems_patient else []
-        linked_incidents = [ems_incident.incident_id]
+        linked_medications = [med('medication_id', None) for med in medications]
+        linked_patients = [patient_get('patient_id', None)] if ems_patient else []
+        linked_incidents = [get('incident_id', None)]
         
         # Generate quality assurance and billing fields
         quality_assurance = random.choice(['COMPLETE', 'PENDING_REVIEW', 'APPROVED', 'REQUIRES_CORRECTION']) if random.random() < 0.8 else None
@@ -3973,95 +5113,95 @@ class EMSDataGenerator:
         
         report = EMSReport(
             # Report Identification
-            report_id=str(uuid.uuid4()),
+            report_id=self._new_uuid(),
             report_number=report_number,
-            report_date=get_attr(ems_incident, 'call_datetime', ''),
-            created_date=get_attr(ems_incident, 'call_datetime', ''),
-            last_modified=get_attr(ems_incident, 'call_datetime', ''),
-            created_by=get_attr(ems_incident, 'crew_member_name', 'Unknown'),
+            report_date=get('call_datetime', ''),
+            created_date=get('call_datetime', ''),
+            last_modified=get('call_datetime', ''),
+            created_by=get('crew_member_name', 'Unknown'),
             
             # Incident Linkage
-            incident_id=get_attr(ems_incident, 'incident_id', ''),
-            incident_number=get_attr(ems_incident, 'incident_number', ''),
-            call_number=get_attr(ems_incident, 'call_number', ''),
+            incident_id=get('incident_id', ''),
+            incident_number=get('incident_number', ''),
+            call_number=get('call_number', ''),
             
             # Patient Linkage and Demographics
-            patient_id=get_attr(ems_patient, 'patient_id', get_attr(ems_incident, 'patient_id', '')),
-            patient_pk=get_attr(ems_patient, 'patient_pk', get_attr(ems_incident, 'patient_pk', '')),
-            patient_full_name=get_attr(ems_patient, 'patient_full_name', get_attr(ems_incident, 'patient_full_name', 'Unknown')),
-            patient_gender=get_attr(ems_patient, 'patient_gender', get_attr(ems_incident, 'patient_sex', 'Unknown')),
-            patient_age=get_attr(ems_patient, 'patient_age', get_attr(ems_incident, 'patient_age', 0)),
-            patient_date_of_birth=get_attr(ems_patient, 'patient_date_of_birth', get_attr(ems_incident, 'patient_date_of_birth', '')),
-            patient_weight=get_attr(ems_patient, 'patient_weight', get_attr(ems_incident, 'patient_weight', 0.0)),
-            patient_home_address=get_attr(ems_patient, 'patient_home_address', get_attr(ems_incident, 'patient_home_address', '')),
-            patient_race=get_attr(ems_patient, 'patient_race', get_attr(ems_incident, 'patient_race', 'Unknown')),
-            patient_ethnicity=get_attr(ems_patient, 'patient_ethnicity', 'UNKNOWN'),
+            patient_id=patient_get('patient_id', get('patient_id', '')),
+            patient_pk=patient_get('patient_pk', get('patient_pk', '')),
+            patient_full_name=patient_get('patient_full_name', get('patient_full_name', 'Unknown')),
+            patient_gender=patient_get(patient_gender_field, get('patient_sex', 'Unknown')),
+            patient_age=patient_get('patient_age', get('patient_age', 0)),
+            patient_date_of_birth=patient_get('patient_date_of_birth', get('patient_date_of_birth', '')),
+            patient_weight=patient_get('patient_weight', get('patient_weight', 0.0)),
+            patient_home_address=patient_home_address,
+            patient_race=patient_get('patient_race', get('patient_race', 'Unknown')),
+            patient_ethnicity=patient_get('patient_ethnicity', 'UNKNOWN'),
             
             # Incident Overview
-            incident_datetime=ems_incident.call_datetime,
-            complaint_reported_by_dispatch=ems_incident.complaint_reported_by_dispatch,
-            complaint_reported_by_dispatch_code=ems_incident.complaint_reported_by_dispatch_code,
-            unit_call_sign=ems_incident.unit_call_sign,
+            incident_datetime=get('call_datetime', None),
+            complaint_reported_by_dispatch=get('complaint_reported_by_dispatch', None),
+            complaint_reported_by_dispatch_code=get('complaint_reported_by_dispatch_code', None),
+            unit_call_sign=get('unit_call_sign', None),
             location=location,
             
             # Disposition Details
-            patient_contact=ems_incident.patient_contact,
-            patient_disposition=ems_incident.patient_disposition,
-            crew_disposition=ems_incident.crew_disposition,
-            patient_evaluation_care_disposition=ems_incident.patient_evaluation_care_disposition,
-            transport_disposition=ems_incident.transport_disposition,
-            transfer_destination=ems_incident.transfer_destination,
-            destination_type=ems_incident.destination_type,
-            transportation_method=ems_incident.transportation_method,
-            unit_level_of_care=ems_incident.unit_level_of_care,
-            cad_emd_code=ems_incident.cad_emd_code,
-            prearrival_activation=ems_incident.prearrival_activation,
+            patient_contact=get('patient_contact', None),
+            patient_disposition=get('patient_disposition', None),
+            crew_disposition=get('crew_disposition', None),
+            patient_evaluation_care_disposition=get('patient_evaluation_care_disposition', None),
+            transport_disposition=get('transport_disposition', None),
+            transfer_destination=get('transfer_destination', None),
+            destination_type=get('destination_type', None),
+            transportation_method=get('transportation_method', None),
+            unit_level_of_care=get('unit_level_of_care', None),
+            cad_emd_code=get('cad_emd_code', None),
+            prearrival_activation=get('prearrival_activation', None),
             
             # Medical Details
-            patient_acuity=ems_incident.patient_acuity,
-            situation_patient_acuity=ems_incident.situation_patient_acuity,
+            patient_acuity=get('patient_acuity', None),
+            situation_patient_acuity=get('situation_patient_acuity', None),
             medications_given=medications_summary,
             attempted_procedures=attempted_procedures_summary,
             successful_procedures=successful_procedures_summary,
-            cardiac_arrest_datetime=ems_incident.cardiac_arrest_datetime,
-            cardiac_arrest_resuscitation_discontinuation_datetime=ems_incident.cardiac_arrest_resuscitation_discontinuation_datetime,
-            ecg_findings=ems_incident.ecg_findings,
-            incident_emd_performed=ems_incident.incident_emd_performed,
-            incident_emd_performed_code=ems_incident.incident_emd_performed_code,
-            cad_level_of_care_provided=ems_incident.cad_level_of_care_provided,
-            incident_level_of_care_provided=ems_incident.incident_level_of_care_provided,
-            provider_primary_impression=ems_incident.provider_primary_impression,
+            cardiac_arrest_datetime=get('cardiac_arrest_datetime', None),
+            cardiac_arrest_resuscitation_discontinuation_datetime=get('cardiac_arrest_resuscitation_discontinuation_datetime', None),
+            ecg_findings=get('ecg_findings', None),
+            incident_emd_performed=get('incident_emd_performed', None),
+            incident_emd_performed_code=get('incident_emd_performed_code', None),
+            cad_level_of_care_provided=get('cad_level_of_care_provided', None),
+            incident_level_of_care_provided=get('incident_level_of_care_provided', None),
+            provider_primary_impression=get('provider_primary_impression', None),
             
             # Crew Details
-            crew_member_name=ems_incident.crew_member_name,
-            crew_member_level=ems_incident.crew_member_level,
-            crew_badge_number=ems_incident.crew_badge_number,
-            primary_patient_caregiver_on_scene=ems_incident.primary_patient_caregiver_on_scene,
-            crew_with_als_pt_contact_response_role=ems_incident.crew_with_als_pt_contact_response_role,
+            crew_member_name=get('crew_member_name', None),
+            crew_member_level=get('crew_member_level', None),
+            crew_badge_number=get('crew_badge_number', None),
+            primary_patient_caregiver_on_scene=get('primary_patient_caregiver_on_scene', None),
+            crew_with_als_pt_contact_response_role=get('crew_with_als_pt_contact_response_role', None),
             
             # Unit Details
-            agency_number=ems_incident.agency_number,
-            agency_name=ems_incident.agency_name,
-            agency_affiliation=ems_incident.agency_affiliation,
-            primary_unit_role=ems_incident.primary_unit_role,
+            agency_number=get('agency_number', None),
+            agency_name=get('agency_name', None),
+            agency_affiliation=get('agency_affiliation', None),
+            primary_unit_role=get('primary_unit_role', None),
             
             # Incident Timeline
-            total_commit_time=ems_incident.total_commit_time,
-            unit_notified_by_dispatch_datetime=ems_incident.unit_notified_by_dispatch_datetime,
-            unit_en_route_datetime=ems_incident.unit_enroute_datetime,
-            unit_arrived_on_scene_datetime=ems_incident.unit_arrived_at_patient_datetime,
-            unit_arrived_at_patient_datetime=ems_incident.unit_arrived_at_patient_datetime,
-            transfer_of_ems_patient_care_datetime=ems_incident.transfer_of_ems_patient_care_datetime,
-            arrival_at_destination_landing_area_datetime=ems_incident.arrival_at_destination_landing_area_datetime,
-            unit_left_scene_datetime=ems_incident.unit_left_scene_datetime,
-            patient_arrived_at_destination_datetime=ems_incident.patient_arrived_at_destination_datetime,
-            unit_back_in_service_datetime=ems_incident.unit_back_in_service_datetime,
+            total_commit_time=get('total_commit_time', None),
+            unit_notified_by_dispatch_datetime=get('unit_notified_by_dispatch_datetime', None),
+            unit_en_route_datetime=unit_enroute_datetime,
+            unit_arrived_on_scene_datetime=unit_arrived_at_patient_datetime,
+            unit_arrived_at_patient_datetime=unit_arrived_at_patient_datetime,
+            transfer_of_ems_patient_care_datetime=get('transfer_of_ems_patient_care_datetime', None),
+            arrival_at_destination_landing_area_datetime=get('arrival_at_destination_landing_area_datetime', None),
+            unit_left_scene_datetime=get('unit_left_scene_datetime', None),
+            patient_arrived_at_destination_datetime=get('patient_arrived_at_destination_datetime', None),
+            unit_back_in_service_datetime=get('unit_back_in_service_datetime', None),
             
             # Status and Classification
-            incident_status=ems_incident.incident_status,
-            incident_type=ems_incident.incident_type,
-            incident_type_code=ems_incident.incident_type_code,
-            priority=ems_incident.priority,
+            incident_status=get('incident_status', None),
+            incident_type=get('incident_type', None),
+            incident_type_code=get('incident_type_code', None),
+            priority=get('priority', None),
             
             # Linked Entity References
             linked_medications=linked_medications,
@@ -4078,20 +5218,53 @@ class EMSDataGenerator:
         )
         
         return report
+    
+    def generate_ems_report_batch(self, ems_incidents, ems_medications_lists=None, ems_patients=None):
+        """generate_ems_report over parallel lists: one medication list and one patient per incident.
+
+        Records can be in any form generate_ems_report takes; None lists (or None entries)
+        are generated like the scalar defaults.
+        """
+        count = len(ems_incidents)
+        if ems_medications_lists is None:
+            ems_medications_lists = [None] * count
+        if ems_patients is None:
+            ems_patients = [None] * count
+        if len(ems_medications_lists) != count or len(ems_patients) != count:
+            raise ValueError("ems_incidents, ems_medications_lists and ems_patients must be the same length")
+        generate = self.generate_ems_report
+        return [generate(incident, medications, patient)
+                for incident, medications, patient in zip(ems_incidents, ems_medications_lists, ems_patients)]
 
 
 if __name__ == "__main__":
     """Main execution block - creates EMS entities when run directly"""
-    import json
+    import argparse
     import os
     from faker import Faker
+    from record_io import RECORD_FORMATS
+    from metrics import print_progress
     
     print("EMS Data Generator - Creating EMS Entities")
     print("=" * 50)
     
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--format', choices=sorted(RECORD_FORMATS), default=DEFAULT_RECORD_FORMAT,
+                        help='ndjson streams one record per line; json writes pretty JSON arrays; '
+                             'parquet writes columnar row groups (needs pyarrow); csv writes one row per record')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='Collect per-stage / per-method timings and write them to PATH as JSON')
+    parser.add_argument('--fast-vocabulary', action='store_true',
+                        help='Draw names, timestamps and birth dates from precomputed vocabulary pools instead of Faker')
+    args = parser.parse_args()
+    
+    METRICS.add_observer(print_progress)
+    if args.metrics:
+        METRICS.enable()
+    
     # Initialize
     fake = Faker()
-    ems_generator = EMSDataGenerator(fake)
+    ems_generator = EMSDataGenerator(fake, fast_vocabulary=args.fast_vocabulary)
     
     # Copula initialization removed for performance
     
@@ -4101,95 +5274,54 @@ if __name__ == "__main__":
     
     # Generate sample data - 10x scale using batch processing
     num_incidents = 1000
-    print(f"Generating {num_incidents} EMS incidents using optimized batch processing...")
-    
-    # Generate incidents in parallel using batch processing
-    incidents = ems_generator.generate_incidents_batch(num_incidents)
-    print(f"Generated {len(incidents)} incidents using parallel processing")
-    
-    # Generate patients and medications for each incident
-    patients = []
-    medications = []
-    
-    print("Generating patients and medications...")
-    for i, incident in enumerate(incidents):
-        if (i + 1) % 200 == 0:
-            print(f"  Generated {i + 1}/{len(incidents)} patients and medications...")
-        
-        # Generate patient for this incident
-        patient = ems_generator.generate_ems_patient(incident)
-        patients.append(patient.__dict__)
-        
-        # Generate medications for this incident (0-3 medications per incident)
-        num_meds = random.randint(0, 3)
-        for _ in range(num_meds):
-            medication = ems_generator.generate_ems_medication(incident)
-            medications.append(medication.__dict__)
-    
-    # Generate EMS reports linking all entities (keep incidents as objects for now)
-    print("Generating EMS reports...")
-    reports = []
-    for i, incident in enumerate(incidents):
-        if i % 100 == 0:
-            print(f"  Generated {i}/{len(incidents)} reports...")
-        
-        # Find related patient and medications for this incident
-        related_patient = next((p for p in patients if p['patient_id'] == incident.patient_id), None)
-        related_medications = [m for m in medications if m['incident_id'] == incident.incident_id]
-        
-        # Generate report
-        report = ems_generator.generate_ems_report(incident, related_medications, related_patient)
-        if report:
-            reports.append(report.__dict__)
-    
-    # Convert incidents to dict format for JSON serialization after report generation
-    incidents = [incident.__dict__ for incident in incidents]
-    
-    print(f"Generated {len(reports)} EMS reports")
-    
-    # Save to JSON files
-    print(f"\nSaving generated data...")
-    
-    # Save EMS incidents
-    incidents_file = os.path.join(output_dir, "ems_incidents.json")
-    with open(incidents_file, 'w') as f:
-        json.dump(incidents, f, indent=2)
-    print(f"Saved {len(incidents)} EMS incidents to {incidents_file}")
-    
-    # Save EMS patients
-    patients_file = os.path.join(output_dir, "ems_patients.json")
-    with open(patients_file, 'w') as f:
-        json.dump(patients, f, indent=2)
-    print(f"Saved {len(patients)} EMS patients to {patients_file}")
+    print(f"Generating {num_incidents} EMS incidents with patients, medications and reports...")
     
-    # Save EMS medications
-    medications_file = os.path.join(output_dir, "ems_medications.json")
-    with open(medications_file, 'w') as f:
-        json.dump(medications, f, indent=2)
-    print(f"Saved {len(medications)} EMS medications to {medications_file}")
+    # Each worker generates a shard of incidents together with their patients, medications and reports;
+    # shards are written out record by record as they arrive, so only the shards in flight stay in memory
+    entity_names = ['ems_incidents', 'ems_patients', 'ems_medications', 'ems_reports']
+    writers = {
+        name: open_record_writer(record_path(output_dir, name, args.format), args.format, EMS_RECORD_TYPES[name])
+        for name in entity_names
+    }
+    sample = None
+    num_shards = 0
+    try:
+        with METRICS.stage('ems_shards', label='EMS incidents') as stage:
+            for shard in ems_generator.iter_ems_shards(num_incidents):
+                for name, records in shard.to_dicts().items():
+                    writers[name].write_many(records)
+                if sample is None and shard.incidents:
+                    sample = record_to_dict(shard.incidents[0])
+                num_shards += 1
+                METRICS.progress('ems_shards', writers['ems_incidents'].count, num_incidents, label='EMS incidents')
+            stage['records'] = writers['ems_incidents'].count
+    finally:
+        for writer in writers.values():
+            writer.close()
+    print(f"Generated {writers['ems_incidents'].count} incidents in {num_shards} shards using parallel processing")
     
-    # Save EMS reports
-    reports_file = os.path.join(output_dir, "ems_reports.json")
-    with open(reports_file, 'w') as f:
-        json.dump(reports, f, indent=2)
-    print(f"Saved {len(reports)} EMS reports to {reports_file}")
+    print(f"\nSaved generated data:")
+    for name, writer in writers.items():
+        print(f"Saved {writer.count} {name.replace('_', ' ').replace('ems', 'EMS')} to {writer.path}")
 
     print(f"\nEMS data generation completed!")
     print(f"Summary:")
-    print(f"   - {len(incidents)} EMS incidents")
-    print(f"   - {len(patients)} EMS patients")
-    print(f"   - {len(medications)} EMS medications")
-    print(f"   - {len(reports)} EMS reports")
+    print(f"   - {writers['ems_incidents'].count} EMS incidents")
+    print(f"   - {writers['ems_patients'].count} EMS patients")
+    print(f"   - {writers['ems_medications'].count} EMS medications")
+    print(f"   - {writers['ems_reports'].count} EMS reports")
     print(f"   - All files saved to {output_dir}/")
     
     # Show sample of generated data
     print(f"\nSample EMS Incident:")
-    if incidents:
-        sample = incidents[0]
+    if sample:
         print(f"   Incident ID: {sample['incident_id']}")
         print(f"   Type: {sample['incident_type_description']}")
         print(f"   Address: {sample['address']}, {sample['city']}, {sample['state']} {sample['zip_code']}")
         print(f"   Priority: {sample['priority']}")
         print(f"   Unit: {sample['unit_call_sign']}")
         print(f"   Patient: {sample['patient_full_name']} ({sample['patient_age']} years old, {sample['patient_sex']})")
-        print(f"   Primary Impression: {sample['primary_impression']}")
\ No newline at end of file
+        print(f"   Primary Impression: {sample['primary_impression']}")    
+    if args.metrics:
+        METRICS.dump_json(args.metrics)
+        print(f"\nMetrics written to {args.metrics}")
@@ -1,136 +1,152 @@
 #!/usr/bin/env python3
 """
 Generate EMS Reports from existing incidents/patients/medications.
-- Loads JSON from data/json
+- Streams JSON / NDJSON from data/json, staging patients and medications on disk for the join
 - Uses EMSDataGenerator.generate_ems_report to build reports
-- Optionally replaces report narrative via local Ollama for higher fidelity
-- Saves to data/json/ems_reports.json
+- Optionally replaces report narrative via local Ollama for higher fidelity (several requests in flight)
+- Saves to data/json/ems_reports.json, journaling reports as they finish so an
+  interrupted run resumes where it stopped; --only-new adds reports for new incidents only
 """
 import os
 import json
 import argparse
-import time
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from faker import Faker
-from types import SimpleNamespace
 
-from ems_data_generator import EMSDataGenerator
-
-try:
-    import requests  # For Ollama
-except Exception:
-    requests = None
+from ems_data_generator import EMSDataGenerator, StagedRecordLinker
+from metrics import METRICS, print_progress
+from narrative_cache import DEFAULT_MAX_BYTES, NARRATIVE_CACHE_PATH, NarrativeCache, narrative_key
+from record_io import RecordWriter, find_record_file, iter_records, record_accessors, record_to_dict, repair_journal
 
 BASE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'json')
 INCIDENTS_PATH = os.path.join(BASE_DIR, 'ems_incidents.json')
 PATIENTS_PATH = os.path.join(BASE_DIR, 'ems_patients.json')
 MEDS_PATH = os.path.join(BASE_DIR, 'ems_medications.json')
 REPORTS_PATH = os.path.join(BASE_DIR, 'ems_reports.json')
+# Reports of the current run, one NDJSON line each as they finish; folded into REPORTS_PATH at the end
+JOURNAL_PATH = os.path.join(BASE_DIR, 'ems_reports.journal.ndjson')
 
 # Default to a more verbose local model; can be overridden via env
 OLLAMA_URL = os.environ.get('OLLAMA_URL', 'http://localhost:11434')
 OLLAMA_MODEL = os.environ.get('OLLAMA_MODEL', 'mixtral:8x7b')
-
-
-def load_json(path):
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
-
-
-def to_ns(obj):
-    if isinstance(obj, dict):
-        return SimpleNamespace(**{k: to_ns(v) for k, v in obj.items()})
-    if isinstance(obj, list):
-        return [to_ns(v) for v in obj]
-    return obj
-
-
-def ensure_patient_fields(pat_ns: SimpleNamespace) -> SimpleNamespace:
-    if not hasattr(pat_ns, 'patient_home_address'):
-        geo = getattr(pat_ns, 'patient_home_address_geo', '') or ''
-        pat_ns.patient_home_address = geo.split(',')[0].strip() if geo else ''
-    if not hasattr(pat_ns, 'patient_ethnicity'):
-        pat_ns.patient_ethnicity = 'UNKNOWN'
-    if not hasattr(pat_ns, 'patient_gender') and hasattr(pat_ns, 'patient_sex'):
-        pat_ns.patient_gender = pat_ns.patient_sex
-    return pat_ns
-
-
-def ensure_incident_fields(inc_ns: SimpleNamespace) -> SimpleNamespace:
-    # Map timeline names the report expects
-    if not hasattr(inc_ns, 'unit_enroute_datetime') and hasattr(inc_ns, 'en_route_datetime'):
-        inc_ns.unit_enroute_datetime = inc_ns.en_route_datetime
-    if not hasattr(inc_ns, 'unit_arrived_at_patient_datetime') and hasattr(inc_ns, 'arrive_datetime'):
-        inc_ns.unit_arrived_at_patient_datetime = inc_ns.arrive_datetime
-    # patient fields
-    if not hasattr(inc_ns, 'patient_sex') and hasattr(inc_ns, 'patient_gender'):
-        inc_ns.patient_sex = inc_ns.patient_gender
-    if not hasattr(inc_ns, 'patient_home_address') and hasattr(inc_ns, 'patient_home_address_geo'):
-        inc_ns.patient_home_address = inc_ns.patient_home_address_geo.split(',')[0]
-    return inc_ns
-
-
-def build_ollama_prompt(incident: SimpleNamespace, patient: SimpleNamespace, medications_list):
+# Narrative requests in flight at once (also the HTTP connection pool size)
+OLLAMA_CONCURRENCY = int(os.environ.get('OLLAMA_CONCURRENCY', '4'))
+# Narratives shorter than this many sentences are requested again with build_retry_prompt
+MIN_NARRATIVE_SENTENCES = 10
+# Streaming mode stops reading (and Ollama stops generating) once a narrative has this many
+MAX_NARRATIVE_SENTENCES = 16
+# Sampling options sent with every request (part of the narrative cache key)
+OLLAMA_OPTIONS = {
+    'temperature': 0.3,
+    'top_p': 0.9,
+    'repeat_penalty': 1.07,
+    'num_predict': 1200
+}
+
+
+def reported_incident_ids(path):
+    """incident_id of every report in a reports file (empty if it doesn't exist)"""
+    if not os.path.exists(path):
+        return set()
+    return {report.get('incident_id') for report in iter_records(path)}
+
+
+def open_journal(path=JOURNAL_PATH, restart=False):
+    """(writer, incident ids already journaled) for a journal, resuming an interrupted run's one if present"""
+    if restart and os.path.exists(path):
+        os.remove(path)
+    done = set()
+    if os.path.exists(path):
+        if repair_journal(path):
+            print(f'Dropped an incomplete last report from {path}')
+        done = reported_incident_ids(path)
+    # Flush every report so a crash loses at most the one being written
+    return RecordWriter(path, 'ndjson', flush_every=1, append=True), done
+
+
+def finish_reports(journal_path=JOURNAL_PATH, reports_path=REPORTS_PATH, keep_existing=False):
+    """Write reports_path from the journal (after the existing reports, if keep_existing); returns the count.
+
+    An existing report for an incident the journal also has is replaced by the journal's.
+    """
+    temp_path = reports_path + '.tmp'
+    with RecordWriter(temp_path, 'json') as writer:
+        if keep_existing and os.path.exists(reports_path):
+            replaced = reported_incident_ids(journal_path)
+            writer.write_many(report for report in iter_records(reports_path)
+                              if report.get('incident_id') not in replaced)
+        writer.write_many(iter_records(journal_path))
+    os.replace(temp_path, reports_path)
+    os.remove(journal_path)
+    return writer.count
+
+
+def build_ollama_prompt(incident, patient, medications_list):
+    """Prompt for one report; records can be dicts (as loaded) or dataclass records"""
+    get, has = record_accessors(incident)
+    patient_get, patient_has = record_accessors(patient)
+    medications = [record_accessors(m)[0] for m in (medications_list or [])]
     context = {
         'incident': {
-            'type': getattr(incident, 'incident_type_description', ''),
-            'subtype': getattr(incident, 'incident_subtype', ''),
-            'address': getattr(incident, 'address', ''),
-            'city': getattr(incident, 'city', ''),
-            'district': getattr(incident, 'district', ''),
-            'datetime': getattr(incident, 'call_datetime', ''),
-            'complaint_reported_by_dispatch': getattr(incident, 'complaint_reported_by_dispatch', ''),
-            'complaint_reported_by_dispatch_code': getattr(incident, 'complaint_reported_by_dispatch_code', ''),
-            'chief_complaint': getattr(incident, 'chief_complaint', ''),
-            'primary_impression': getattr(incident, 'primary_impression', ''),
-            'provider_primary_impression': getattr(incident, 'provider_primary_impression', ''),
-            'cad_emd_code': getattr(incident, 'cad_emd_code', ''),
-            'unit_call_sign': getattr(incident, 'unit_call_sign', ''),
-            'unit_level_of_care': getattr(incident, 'unit_level_of_care', ''),
-            'transportation_method': getattr(incident, 'transportation_method', ''),
-            'disposition': getattr(incident, 'patient_disposition', ''),
-            'destination': getattr(incident, 'transfer_destination', ''),
-            'destination_type': getattr(incident, 'destination_type', ''),
-            'patient_acuity': getattr(incident, 'patient_acuity', ''),
-            'situation_patient_acuity': getattr(incident, 'situation_patient_acuity', ''),
-            'ecg_findings': getattr(incident, 'ecg_findings', ''),
-            'procedures_attempted': getattr(incident, 'attempted_procedures', []),
-            'procedures_successful': getattr(incident, 'successful_procedures', []),
+            'type': get('incident_type_description', ''),
+            'subtype': get('incident_subtype', ''),
+            'address': get('address', ''),
+            'city': get('city', ''),
+            'district': get('district', ''),
+            'datetime': get('call_datetime', ''),
+            'complaint_reported_by_dispatch': get('complaint_reported_by_dispatch', ''),
+            'complaint_reported_by_dispatch_code': get('complaint_reported_by_dispatch_code', ''),
+            'chief_complaint': get('chief_complaint', ''),
+            'primary_impression': get('primary_impression', ''),
+            'provider_primary_impression': get('provider_primary_impression', ''),
+            'cad_emd_code': get('cad_emd_code', ''),
+            'unit_call_sign': get('unit_call_sign', ''),
+            'unit_level_of_care': get('unit_level_of_care', ''),
+            'transportation_method': get('transportation_method', ''),
+            'disposition': get('patient_disposition', ''),
+            'destination': get('transfer_destination', ''),
+            'destination_type': get('destination_type', ''),
+            'patient_acuity': get('patient_acuity', ''),
+            'situation_patient_acuity': get('situation_patient_acuity', ''),
+            'ecg_findings': get('ecg_findings', ''),
+            'procedures_attempted': get('attempted_procedures', []),
+            'procedures_successful': get('successful_procedures', []),
             'timeline': {
-                'dispatch': getattr(incident, 'unit_notified_by_dispatch_datetime', ''),
-                'enroute': getattr(incident, 'unit_enroute_datetime', ''),
-                'arrival': getattr(incident, 'unit_arrived_at_patient_datetime', ''),
-                'left_scene': getattr(incident, 'unit_left_scene_datetime', ''),
-                'arrival_at_destination': getattr(incident, 'patient_arrived_at_destination_datetime', ''),
-                'transfer_of_care': getattr(incident, 'transfer_of_ems_patient_care_datetime', ''),
-                'back_in_service': getattr(incident, 'unit_back_in_service_datetime', ''),
+                'dispatch': get('unit_notified_by_dispatch_datetime', ''),
+                'enroute': get('unit_enroute_datetime' if has('unit_enroute_datetime') else 'en_route_datetime', ''),
+                'arrival': get('unit_arrived_at_patient_datetime' if has('unit_arrived_at_patient_datetime')
+                               else 'arrive_datetime', ''),
+                'left_scene': get('unit_left_scene_datetime', ''),
+                'arrival_at_destination': get('patient_arrived_at_destination_datetime', ''),
+                'transfer_of_care': get('transfer_of_ems_patient_care_datetime', ''),
+                'back_in_service': get('unit_back_in_service_datetime', ''),
             },
-            'status': getattr(incident, 'incident_status', ''),
-            'priority': getattr(incident, 'priority', ''),
+            'status': get('incident_status', ''),
+            'priority': get('priority', ''),
         },
         'crew': {
-            'member_name': getattr(incident, 'crew_member_name', ''),
-            'member_level': getattr(incident, 'crew_member_level', ''),
-            'crew_disposition': getattr(incident, 'crew_disposition', ''),
-            'primary_patient_caregiver_on_scene': getattr(incident, 'primary_patient_caregiver_on_scene', ''),
+            'member_name': get('crew_member_name', ''),
+            'member_level': get('crew_member_level', ''),
+            'crew_disposition': get('crew_disposition', ''),
+            'primary_patient_caregiver_on_scene': get('primary_patient_caregiver_on_scene', ''),
         },
         'patient': {
-            'name': getattr(patient, 'patient_full_name', ''),
-            'age': getattr(patient, 'patient_age', ''),
-            'gender': getattr(patient, 'patient_gender', ''),
-            'race': getattr(patient, 'patient_race', ''),
-            'weight': getattr(patient, 'patient_weight', ''),
+            'name': patient_get('patient_full_name', ''),
+            'age': patient_get('patient_age', ''),
+            'gender': patient_get('patient_gender' if patient_has('patient_gender') else 'patient_sex', ''),
+            'race': patient_get('patient_race', ''),
+            'weight': patient_get('patient_weight', ''),
         },
         'medications': [
             {
-                'name': getattr(m, 'medication_name', ''),
-                'dosage': f"{getattr(m, 'dosage', '')}{getattr(m, 'dosage_unit', '')}",
-                'route': getattr(m, 'medication_administration_route', ''),
-                'time': getattr(m, 'medication_administration_time', ''),
+                'name': med('medication_name', ''),
+                'dosage': f"{med('dosage', '')}{med('dosage_unit', '')}",
+                'route': med('medication_administration_route', ''),
+                'time': med('medication_administration_time', ''),
             }
-            for m in (medications_list or [])
+            for med in medications
         ],
     }
     instructions = (
@@ -152,22 +168,43 @@ def build_ollama_prompt(incident: SimpleNamespace, patient: SimpleNamespace, med
 
 def build_retry_prompt(prev_prompt: str) -> str:
     return prev_prompt + "\n\nThe previous narrative was too brief. Expand to 10–16 sentences and ensure each required item is covered explicitly, without adding new facts. Output only the narrative text."
-def ollama_generate(prompt: str, model: str = OLLAMA_MODEL, timeout: int = 120) -> str:
-    if requests is None:
+
+
+def build_continue_prompt() -> str:
+    # Sent with the previous reply's context, so the original prompt isn't sent (or evaluated) again
+    return ("Continue the narrative from where it stopped with further sentences covering any required items "
+            "not yet mentioned, without repeating earlier sentences or adding new facts. "
+            "Output only the additional narrative text.")
+
+
+def ollama_session(pool_size: int = OLLAMA_CONCURRENCY):
+    """requests.Session keeping up to pool_size connections to Ollama alive (None without requests)"""
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except Exception:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def ollama_generate(prompt: str, model: str = OLLAMA_MODEL, timeout: int = 120, session=None) -> str:
+    try:
+        import requests  # For Ollama; only needed with --use-ollama
+    except Exception:
         return ''
+    post = session.post if session is not None else requests.post
     try:
-        resp = requests.post(
+        resp = post(
             f"{OLLAMA_URL}/api/generate",
             json={
                 'model': model,
                 'prompt': prompt,
                 'stream': False,
-                'options': {
-                    'temperature': 0.3,
-                    'top_p': 0.9,
-                    'repeat_penalty': 1.07,
-                    'num_predict': 1200
-                }
+                'options': OLLAMA_OPTIONS
             },
             timeout=timeout,
         )
@@ -182,6 +219,52 @@ def ollama_generate(prompt: str, model: str = OLLAMA_MODEL, timeout: int = 120)
         return ''
 
 
+def ollama_generate_stream(prompt: str, model: str = OLLAMA_MODEL, timeout: int = 120, session=None,
+                           context=None, stop_after: int = MAX_NARRATIVE_SENTENCES):
+    """Stream a completion, counting sentences as tokens arrive.
+
+    Closes the stream once stop_after sentences have arrived (dropping any partial
+    sentence after them). Returns (text, context); context is Ollama's conversation
+    state for continuing this reply, None if the stream was cut short or failed.
+    """
+    try:
+        import requests  # For Ollama; only needed with --use-ollama
+    except Exception:
+        return '', None
+    post = session.post if session is not None else requests.post
+    payload = {'model': model, 'prompt': prompt, 'stream': True, 'options': OLLAMA_OPTIONS}
+    if context:
+        payload['context'] = context
+    parts = []
+    sentences = 0
+    tokens = 0
+    try:
+        with post(f"{OLLAMA_URL}/api/generate", json=payload, timeout=timeout, stream=True) as resp:
+            if resp.status_code != 200:
+                return '', None
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                text = chunk.get('response', '')
+                parts.append(text)
+                tokens += 1 if text else 0
+                sentences += count_sentences(text)
+                if chunk.get('done'):
+                    METRICS.incr('ollama.stream_tokens', tokens)
+                    return ''.join(parts), chunk.get('context')
+                if sentences >= stop_after:
+                    # Leaving the block closes the connection, which makes Ollama stop generating
+                    METRICS.incr('ollama.stream_tokens', tokens)
+                    METRICS.incr('ollama.early_stops')
+                    text = ''.join(parts)
+                    end = max(text.rfind(x) for x in ['.', '!', '?'])
+                    return text[:end + 1], None
+    except Exception:
+        pass
+    return ''.join(parts), None
+
+
 def count_sentences(text: str) -> int:
     # Count rough number of sentences by ., !, ?
     if not text:
@@ -189,77 +272,195 @@ def count_sentences(text: str) -> int:
     return sum(text.count(x) for x in ['.', '!', '?'])
 
 
+@METRICS.timed('ollama.narrative')
+def generate_narrative(prompt: str, model: str = OLLAMA_MODEL, session=None, stream: bool = False) -> str:
+    """Narrative for one prompt; asks once more with the retry prompt if it comes back too short.
+
+    With stream, the reply is capped at MAX_NARRATIVE_SENTENCES as it arrives, and a
+    short reply is continued from its context instead of re-sending the whole prompt.
+    """
+    if not stream:
+        narrative = ollama_generate(prompt, model, session=session)
+        if count_sentences(narrative) < MIN_NARRATIVE_SENTENCES:
+            METRICS.incr('ollama.retries')
+            narrative = ollama_generate(build_retry_prompt(prompt), model, session=session)
+    else:
+        narrative, context = ollama_generate_stream(prompt, model, session=session)
+        sentences = count_sentences(narrative)
+        if sentences < MIN_NARRATIVE_SENTENCES and context:
+            METRICS.incr('ollama.continuations')
+            more, _ = ollama_generate_stream(build_continue_prompt(), model, session=session, context=context,
+                                             stop_after=MAX_NARRATIVE_SENTENCES - sentences)
+            narrative = f"{narrative.rstrip()} {more.strip()}".strip()
+        elif sentences < MIN_NARRATIVE_SENTENCES:
+            METRICS.incr('ollama.retries')
+            narrative, _ = ollama_generate_stream(build_retry_prompt(prompt), model, session=session)
+    if not narrative:
+        METRICS.incr('ollama.empty')
+    return narrative.strip()
+
+
+def narrative_settings(stream: bool = False):
+    """Everything besides prompt and model that changes what generate_narrative returns"""
+    settings = {'options': OLLAMA_OPTIONS, 'min_sentences': MIN_NARRATIVE_SENTENCES}
+    if stream:
+        settings.update(stream=True, max_sentences=MAX_NARRATIVE_SENTENCES)
+    return settings
+
+
+def iter_narratives(jobs, concurrency: int = OLLAMA_CONCURRENCY, model: str = OLLAMA_MODEL, session=None,
+                    cache=None, stream: bool = False):
+    """Yield (item, narrative) for each (item, prompt) in jobs, in input order.
+
+    Up to `concurrency` requests run at once on a thread pool sharing one pooled
+    session. jobs is consumed lazily, only a few requests ahead of the caller.
+    With a NarrativeCache, cached prompts skip the request and new narratives are stored.
+    """
+    if session is None:
+        session = ollama_session(concurrency)
+    settings = narrative_settings(stream)
+    # Queue a couple of requests per thread so a free thread never waits on the caller
+    window = concurrency * 2
+    pending = deque()
+
+    def finish():
+        item, key, future, narrative = pending.popleft()
+        if future is not None:
+            narrative = future.result()
+            if cache is not None:
+                cache.put(key, narrative, model)
+        return item, narrative
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='ollama') as executor:
+        for item, prompt in jobs:
+            key = narrative = future = None
+            if cache is not None:
+                key = narrative_key(prompt, model, settings)
+                narrative = cache.get(key)
+            if narrative is None:
+                future = executor.submit(generate_narrative, prompt, model, session, stream)
+            pending.append((item, key, future, narrative))
+            if len(pending) >= window:
+                yield finish()
+        while pending:
+            yield finish()
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--use-ollama', action='store_true', help='Generate report narrative via Ollama')
     parser.add_argument('--limit', type=int, default=None, help='Limit number of reports to generate')
+    parser.add_argument('--only-new', action='store_true',
+                        help=f'Keep the reports already in {os.path.basename(REPORTS_PATH)} and only add reports '
+                             'for incidents without one')
+    parser.add_argument('--restart', action='store_true',
+                        help="Discard an interrupted run's journal instead of resuming it")
+    parser.add_argument('--ollama-concurrency', type=int, default=OLLAMA_CONCURRENCY,
+                        help='Narrative requests to keep in flight with --use-ollama')
+    parser.add_argument('--ollama-stream', action='store_true',
+                        help=f'Stream narratives: stop at {MAX_NARRATIVE_SENTENCES} sentences and continue short ones '
+                             'in the same Ollama context instead of re-sending the prompt')
+    parser.add_argument('--narrative-cache', metavar='PATH', default=NARRATIVE_CACHE_PATH,
+                        help='SQLite cache of generated narratives, reused when the prompt, model and options match')
+    parser.add_argument('--narrative-cache-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help='Evict least recently used narratives beyond this size')
+    parser.add_argument('--no-narrative-cache', action='store_true', help='Always request fresh narratives')
+    parser.add_argument('--metrics', metavar='PATH', help='Write per-stage / per-method timings to PATH as JSON')
     args = parser.parse_args()
 
+    METRICS.add_observer(print_progress)
+    if args.metrics:
+        METRICS.enable()
+
     fake = Faker()
     gen = EMSDataGenerator(fake)
 
-    incidents = load_json(INCIDENTS_PATH)
-    patients = load_json(PATIENTS_PATH)
-    meds = load_json(MEDS_PATH)
+    # The generator may have written <name>.ndjson instead of <name>.json; read whichever is newest
+    incidents_path = find_record_file(INCIDENTS_PATH)
+    patients_path = find_record_file(PATIENTS_PATH)
+    meds_path = find_record_file(MEDS_PATH)
 
-    if not incidents or not patients:
+    if incidents_path is None or patients_path is None:
         print('Missing incidents or patients; cannot generate reports.')
         return
 
-    if args.limit is not None:
-        incidents = incidents[: args.limit]
+    journal, done = open_journal(restart=args.restart)
+    if done:
+        print(f'Resuming: {len(done)} reports already journaled in {JOURNAL_PATH}')
+    if args.only_new:
+        existing = reported_incident_ids(REPORTS_PATH)
+        print(f'Only new incidents: {len(existing)} already reported in {REPORTS_PATH}')
+        done |= existing
+
+    def iter_incidents():
+        # Incidents are streamed; --limit stops reading after the first N
+        for inc in itertools.islice(iter_records(incidents_path), args.limit):
+            if inc.get('incident_id') not in done:
+                yield inc
+
+    # With --limit or incidents already done, a first pass collects which incidents (and their
+    # patient ids) to report on, so only their patients and medications get staged
+    selected = None
+    if args.limit is not None or done:
+        selected = {inc.get('incident_id'): inc.get('patient_id') or inc.get('patient_person_id')
+                    for inc in iter_incidents()}
+    linker = StagedRecordLinker(
+        iter_records(patients_path), iter_records(meds_path) if meds_path else [],
+        incident_ids=selected.keys() if selected is not None else None,
+        patient_ids=selected.values() if selected is not None else None,
+    )
+    total_incidents = len(selected) if selected is not None else None
 
-    patient_by_incident = {}
-    for p in patients:
-        inc_id = p.get('incident_id')
-        if inc_id and inc_id not in patient_by_incident:
-            patient_by_incident[inc_id] = p
+    skipped_no_patient = 0
 
-    meds_by_incident = {}
-    for m in meds:
-        inc_id = m.get('incident_id')
-        if not inc_id:
-            continue
-        meds_by_incident.setdefault(inc_id, []).append(m)
+    def report_jobs():
+        # (report, Ollama prompt or None) per incident that has a patient; records stay as loaded dicts
+        nonlocal skipped_no_patient
+        for i, (inc, related_patient, related_meds) in enumerate(linker.link(iter_incidents())):
+            if i and i % 200 == 0:
+                METRICS.progress('ems_reports', i, total_incidents, label='EMS reports')
+            if not related_patient:
+                skipped_no_patient += 1
+                continue
+
+            report = gen.generate_ems_report(inc, related_meds, related_patient)
+            if report:
+                prompt = build_ollama_prompt(inc, related_patient, related_meds)['prompt'] if args.use_ollama else None
+                yield report, prompt
+
+    cache = None
+    if args.use_ollama and not args.no_narrative_cache:
+        cache = NarrativeCache(args.narrative_cache, max_bytes=args.narrative_cache_mb * 1024 * 1024)
 
-    reports = []
-    skipped_no_patient = 0
-    for i, inc in enumerate(incidents):
-        if i % 200 == 0:
-            print(f'Generating reports: {i}/{len(incidents)}')
-        related_patient = patient_by_incident.get(inc.get('incident_id'))
-        if not related_patient:
-            skipped_no_patient += 1
-            continue
-        related_meds = meds_by_incident.get(inc.get('incident_id'), [])
-
-        # Convert to attribute-access objects expected by generator
-        inc_ns = ensure_incident_fields(to_ns(inc))
-        pat_ns = ensure_patient_fields(to_ns(related_patient))
-        meds_ns = to_ns(related_meds)
-
-        report = gen.generate_ems_report(inc_ns, meds_ns, pat_ns)
-
-        if args.use_ollama:
-            prompt_obj = build_ollama_prompt(inc_ns, pat_ns, meds_ns)
-            narrative = ollama_generate(prompt_obj['prompt'])
-            if count_sentences(narrative) < 10:
-                narrative = ollama_generate(build_retry_prompt(prompt_obj['prompt']))
-            if narrative:
-                report.report_narrative = narrative.strip()
-
-        if report:
-            reports.append(report.__dict__)
-        # Gentle pacing if using Ollama
-        if args.use_ollama and (i % 10 == 0):
-            time.sleep(0.2)
-
-    with open(REPORTS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(reports, f, indent=2)
-
-    print(f'Saved {len(reports)} EMS reports to {REPORTS_PATH} (skipped {skipped_no_patient} without patient)')
+    try:
+        with METRICS.stage('ems_reports', label='EMS reports') as stage, journal:
+            jobs = report_jobs()
+            if args.use_ollama:
+                # Narratives are fetched concurrently; results still come back in report order
+                jobs = iter_narratives(jobs, concurrency=args.ollama_concurrency, cache=cache,
+                                       stream=args.ollama_stream)
+            for report, narrative in jobs:
+                if narrative:
+                    report.report_narrative = narrative
+                journal.write(record_to_dict(report))
+            stage['records'] = journal.count
+    finally:
+        linker.close()
+        if cache is not None:
+            cache.close()
+
+    total = finish_reports(keep_existing=args.only_new)
+    print(f'Saved {total} EMS reports to {REPORTS_PATH} ({journal.count} generated this run, '
+          f'skipped {skipped_no_patient} without patient)')
     if args.use_ollama:
-        print('Narratives generated via Ollama model:', OLLAMA_MODEL)
+        print(f'Narratives generated via Ollama model: {OLLAMA_MODEL} ({args.ollama_concurrency} requests in flight)')
+    if cache is not None:
+        print(f'Narrative cache: {cache.hits} reused, {cache.misses} requested ({args.narrative_cache})')
+        METRICS.incr('ollama.cache_hits', cache.hits)
+        METRICS.incr('ollama.cache_misses', cache.misses)
+    if args.metrics:
+        METRICS.dump_json(args.metrics)
+        print(f'Metrics written to {args.metrics}')
 
 
 if __name__ == '__main__':
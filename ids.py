@@ -0,0 +1,196 @@
+"""
+IDs
+
+Collision-free record identifiers shared by synthetic_data.py and ems_data_generator.py.
+- Every ID kind ('person', 'arrest', ...) counts up, so IDs are unique by construction
+  instead of drawn at random and hoped distinct
+- A parallel run splits each counter into blocks: block b of n owns counter values
+  b, b + n, b + 2n, ..., so workers never coordinate and IDs don't depend on scheduling
+- UUIDs are shared by every kind of record; runs whose parts are blocked separately (e.g.
+  one set of blocks per pipeline stage) give each part its own UUID stream
+- Counter values go through a format-preserving permutation of the ID space (a keyed
+  Feistel network), so IDs still look random, the same seed gives the same IDs, and no
+  set of used values is kept or retried against
+- Numbers and license plates keep their existing shape (e.g. 6 digits, no leading zero);
+  a kind that outgrows that space moves on to one digit / letter more rather than repeating
+"""
+
+import os
+import math
+import random
+
+# Rounds per Feistel permutation
+FEISTEL_ROUNDS = 4
+
+# SSNs as Faker's en_US provider draws them: area 001-899 except 666, group 01-99, serial 0001-9999
+SSN_AREAS = 898
+SSN_GROUPS = 99
+SSN_SERIALS = 9999
+
+# VINs and plates in the shapes generate_vehicle has always used: 17 characters from VIN_ALPHABET,
+# and letters followed by a number from 100 to 999
+VIN_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+VIN_LENGTH = 17
+PLATE_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+PLATE_NUMBERS = 900
+
+_MASK64 = (1 << 64) - 1
+
+# Counter values are scrambled over 62 bits, the part of a UUID4 not fixed by version/variant
+_UUID_BITS = 62
+_UUID_MASK = (1 << _UUID_BITS) - 1
+_UUID_HIGH_MASK = (1 << 60) - 1
+_UUID_COUNTER = ('uuid',)  # Counter key; a tuple so no number kind can share it
+_UUID_STREAM_BITS = 48  # Counter values per UUID stream: 2**48; the stream fills the bits above
+
+
+class FeistelPermutation:
+    """Keyed permutation of range(size).
+
+    A value is split into a left half in range(a) and a right half in range(b),
+    a * b >= size with a ~ sqrt(size), and the rounds alternate adding a keyed
+    hash of one half to the other, modulo its range. Results past size are fed
+    back in (cycle walking), which is rare: a * b - size < a.
+    """
+
+    def __init__(self, size, key, rounds=FEISTEL_ROUNDS):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self._left_size = math.isqrt(size - 1) + 1
+        self._right_size = -(-size // self._left_size)
+        keys = random.Random(key)
+        self._round_keys = [keys.getrandbits(64) for _ in range(rounds)]
+
+    def __call__(self, value):
+        if not 0 <= value < self.size:
+            raise IndexError(f"{value} is outside range({self.size})")
+        value = self._encrypt(value)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def _encrypt(self, value):
+        left_size, right_size = self._left_size, self._right_size
+        left, right = divmod(value, right_size)
+        for i, key in enumerate(self._round_keys):
+            # Round function: splitmix64's finalizer over one half and the round key
+            x = (left if i & 1 else right) ^ key
+            x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+            x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+            x ^= x >> 31
+            if i & 1:
+                right = (right + x) % right_size
+            else:
+                left = (left + x) % left_size
+        return left * right_size + right
+
+
+class IdService:
+    """Unique IDs per kind for one block of a (possibly parallel) run.
+
+    Services built from the same seed share their permutations; give each worker
+    or chunk its own block (for_block) and their IDs never overlap. Services on
+    different streams never share a UUID, whatever their blocks. Without a seed
+    the permutations are keyed from os.urandom.
+    """
+
+    def __init__(self, seed=None, block=0, num_blocks=1, stream=0):
+        if not 0 <= block < num_blocks:
+            raise ValueError(f"block must be in [0, {num_blocks}), got {block}")
+        if not 0 <= stream < 1 << (_UUID_BITS - _UUID_STREAM_BITS):
+            raise ValueError(f"stream must be in [0, {1 << (_UUID_BITS - _UUID_STREAM_BITS)}), got {stream}")
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(16), 'little')
+        self.block = block
+        self.num_blocks = num_blocks
+        self.stream = stream
+        self._counters = {}
+        self._permutations = {}  # (kind, tier) -> FeistelPermutation
+        keys = random.Random(f"ids:{self.seed}")
+        self._uuid_namespace = keys.getrandbits(60)
+        self._uuid_keys = (keys.getrandbits(_UUID_BITS), keys.getrandbits(_UUID_BITS) | 1,
+                           keys.getrandbits(_UUID_BITS) | 1)
+
+    def for_block(self, block, num_blocks=None, stream=None):
+        """Fresh service with the same seed for another block (and stream)"""
+        return IdService(self.seed, block, self.num_blocks if num_blocks is None else num_blocks,
+                         self.stream if stream is None else stream)
+
+    def _next_index(self, kind):
+        count = self._counters.get(kind, 0)
+        self._counters[kind] = count + 1
+        return count * self.num_blocks + self.block
+
+    def _permuted(self, kind, tier, size, index):
+        """index's place in the seeded permutation of range(size) for kind (tier: which width of it)"""
+        permutation = self._permutations.get((kind, tier))
+        if permutation is None:
+            permutation = self._permutations[(kind, tier)] = FeistelPermutation(size, f"ids:{self.seed}:{kind}:{tier}")
+        return permutation(index)
+
+    def number(self, kind, digits=6):
+        """Next number of kind as a digits-wide string without a leading zero"""
+        index = self._next_index(kind)
+        # Values past the digits-wide space continue in the next width up
+        while index >= 9 * 10 ** (digits - 1):
+            index -= 9 * 10 ** (digits - 1)
+            digits += 1
+        return str(10 ** (digits - 1) + self._permuted(kind, digits, 9 * 10 ** (digits - 1), index))
+
+    def ssn(self):
+        """Next SSN, formatted like Faker's ('123-45-6789')"""
+        index = self._next_index('ssn')
+        if index >= SSN_AREAS * SSN_GROUPS * SSN_SERIALS:
+            raise OverflowError("SSN space exhausted")
+        area, rest = divmod(self._permuted('ssn', 0, SSN_AREAS * SSN_GROUPS * SSN_SERIALS, index), SSN_GROUPS * SSN_SERIALS)
+        group, serial = divmod(rest, SSN_SERIALS)
+        area += 1
+        if area >= 666:
+            area += 1
+        return f"{area:03d}-{group + 1:02d}-{serial + 1:04d}"
+
+    def vin(self):
+        """Next VIN_LENGTH-character VIN"""
+        index = self._next_index('vin')
+        space = len(VIN_ALPHABET) ** VIN_LENGTH
+        if index >= space:
+            raise OverflowError("VIN space exhausted")
+        value = self._permuted('vin', 0, space, index)
+        chars = []
+        for _ in range(VIN_LENGTH):
+            value, digit = divmod(value, len(VIN_ALPHABET))
+            chars.append(VIN_ALPHABET[digit])
+        return ''.join(chars)
+
+    def license_plate(self):
+        """Next plate: two letters and 100-999 ('AB123'), then three letters once those run out"""
+        index = self._next_index('license_plate')
+        letters = 2
+        while index >= len(PLATE_LETTERS) ** letters * PLATE_NUMBERS:
+            index -= len(PLATE_LETTERS) ** letters * PLATE_NUMBERS
+            letters += 1
+        value, number = divmod(self._permuted('license_plate', letters, len(PLATE_LETTERS) ** letters * PLATE_NUMBERS,
+                                              index), PLATE_NUMBERS)
+        chars = []
+        for _ in range(letters):
+            value, letter = divmod(value, len(PLATE_LETTERS))
+            chars.append(PLATE_LETTERS[letter])
+        return f"{''.join(chars)}{100 + number}"
+
+    def uuid(self):
+        """Next UUID4-formatted ID; one counter serves every UUID field, so they never repeat across fields"""
+        index = self._next_index(_UUID_COUNTER)
+        if index >> _UUID_STREAM_BITS:
+            raise OverflowError("UUID counter exhausted")
+        index |= self.stream << _UUID_STREAM_BITS
+        # Bijective mix of the 62-bit index: xor, odd multiplies and xorshifts are all invertible
+        xor_key, multiplier_1, multiplier_2 = self._uuid_keys
+        x = ((index ^ xor_key) * multiplier_1) & _UUID_MASK
+        x ^= x >> 31
+        x = (x * multiplier_2) & _UUID_MASK
+        x ^= x >> 29
+        # The low 62 bits alone keep IDs unique; the other 60 are the namespace scrambled by them
+        high = (self._uuid_namespace ^ (x * multiplier_1 >> 2)) & _UUID_HIGH_MASK
+        value = ((high >> 12) << 80) | (0x4000 | high & 0xFFF) << 64 | 0x8000000000000000 | x
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -0,0 +1,260 @@
+"""
+Metrics
+
+Lightweight instrumentation for the generators:
+- counters, timers and histograms keyed by stage / sub-sampler name
+- stage and progress events delivered to observer callbacks (e.g. console progress)
+- a JSON metrics report at the end of a run
+
+Collection is off by default. While disabled, counters/timers return immediately
+and @METRICS.timed wrappers add a single attribute check per call. Stage and
+progress events always reach observers (they are rare, and drive CLI progress output).
+"""
+
+import json
+import math
+import time
+import functools
+import threading
+from contextlib import contextmanager
+
+
+class Histogram:
+    """Count / sum / min / max plus power-of-two buckets (in microseconds for timings)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def observe(self, value, scale=1.0):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        # Bucket k holds values in [2**(k-1), 2**k) scaled units
+        bucket = math.frexp(value * scale)[1] if value > 0 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def quantile(self, q, scale=1.0):
+        """Upper bound (in value units) of the bucket holding the q-quantile"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2.0 ** bucket / scale, self.max)
+        return self.max
+
+    def merge(self, other):
+        self.count += other['count']
+        self.total += other['total']
+        if other['min'] is not None:
+            self.min = other['min'] if self.min is None else min(self.min, other['min'])
+        if other['max'] is not None:
+            self.max = other['max'] if self.max is None else max(self.max, other['max'])
+        for bucket, count in other['buckets'].items():
+            self.buckets[int(bucket)] = self.buckets.get(int(bucket), 0) + count
+
+    def to_dict(self, scale=1.0):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5, scale),
+            'p90': self.quantile(0.9, scale),
+            'p99': self.quantile(0.99, scale),
+            'buckets': {str(bucket): count for bucket, count in sorted(self.buckets.items())},
+        }
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+# Timings are bucketed in microseconds
+_TIMER_SCALE = 1e6
+
+
+class Metrics:
+    """Counters, timers and histograms plus an observer API for stage/progress events.
+
+    Observers are callables observer(event, payload) where event is one of
+    'stage_start', 'stage_end' or 'progress' and payload a dict (stage, label,
+    total, done, seconds, ...).
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._observers = []
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """Drop everything collected so far (observers stay)"""
+        with self._lock:
+            self.counters = {}
+            self.timers = {}
+            self.histograms = {}
+            self.stages = {}
+
+    # Observers
+
+    def add_observer(self, observer):
+        self._observers.append(observer)
+        return observer
+
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
+
+    def emit(self, event, **payload):
+        for observer in self._observers:
+            observer(event, payload)
+
+    # Collection
+
+    def incr(self, name, amount=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name, value):
+        """Add a value to the histogram called name"""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def record_time(self, name, seconds):
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = Histogram()
+            histogram.observe(seconds, _TIMER_SCALE)
+
+    def timer(self, name):
+        """Context manager timing a block into the timer called name"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timer(name)
+
+    @contextmanager
+    def _timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Decorator timing every call of a function into the timer called name"""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record_time(name, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    # Stages and progress
+
+    @contextmanager
+    def stage(self, name, total=None, label=None):
+        """Time a pipeline stage and tell observers when it starts and ends.
+
+        Yields a dict; set its 'records' key to report how many records the stage made.
+        """
+        label = label or name.replace('_', ' ')
+        info = {'records': None}
+        self.emit('stage_start', stage=name, label=label, total=total)
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            seconds = time.perf_counter() - start
+            if self.enabled:
+                with self._lock:
+                    stage = self.stages.setdefault(name, {'runs': 0, 'seconds': 0.0, 'records': 0})
+                    stage['runs'] += 1
+                    stage['seconds'] += seconds
+                    stage['records'] += info['records'] or 0
+            self.emit('stage_end', stage=name, label=label, total=total, records=info['records'], seconds=seconds)
+
+    def progress(self, stage, done, total=None, label=None):
+        """Tell observers how far a stage has got"""
+        self.emit('progress', stage=stage, label=label or stage.replace('_', ' '), done=done, total=total)
+
+    # Reports
+
+    def report(self):
+        """Everything collected so far as a JSON-serializable dict"""
+        with self._lock:
+            stages = {}
+            for name, stage in self.stages.items():
+                rate = stage['records'] / stage['seconds'] if stage['records'] and stage['seconds'] else None
+                stages[name] = dict(stage, records_per_sec=rate)
+            return {
+                'counters': dict(self.counters),
+                'timers': {name: dict(h.to_dict(_TIMER_SCALE), unit='seconds')
+                           for name, h in sorted(self.timers.items())},
+                'histograms': {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+                'stages': stages,
+            }
+
+    def merge(self, report):
+        """Fold another Metrics.report() (e.g. from a worker process) into this one"""
+        with self._lock:
+            for name, value in report['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for attr, key in (('timers', 'timers'), ('histograms', 'histograms')):
+                target = getattr(self, attr)
+                for name, data in report[key].items():
+                    target.setdefault(name, Histogram()).merge(data)
+            for name, data in report['stages'].items():
+                stage = self.stages.setdefault(name, {'runs': 0, 'seconds': 0.0, 'records': 0})
+                for key in ('runs', 'seconds', 'records'):
+                    stage[key] += data[key]
+
+    def dump_json(self, path):
+        """Write report() to path"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def print_progress(event, payload):
+    """Observer printing the console progress lines the generators have always printed"""
+    if event == 'stage_start' and payload['total'] is not None:
+        print(f"Generating {payload['total']:,} {payload['label']}...")
+    elif event == 'progress':
+        print(f"   Generated {payload['done']:,} {payload['label']}...")
+
+
+# Process-wide metrics used by the generator modules
+METRICS = Metrics()
@@ -0,0 +1,140 @@
+"""
+Narrative Cache
+
+Persistent prompt -> narrative cache for LLM-generated report text, so reruns of
+generate_ems_reports.py only pay for reports whose inputs changed.
+- Entries are content-addressed: the key hashes the prompt together with the model
+  and generation settings, so changing any of them misses instead of serving stale text
+- Stored in one SQLite file; least-recently-used entries are evicted past a size budget
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+NARRATIVE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'narrative_cache.sqlite')
+
+# Cache size budget; eviction trims back to EVICT_TO_RATIO of it so it doesn't run on every store
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+EVICT_TO_RATIO = 0.9
+
+# Pending stores / last-used updates per commit
+COMMIT_EVERY = 100
+
+
+def narrative_key(prompt, model, settings=None):
+    """Content hash of everything that determines a narrative"""
+    payload = json.dumps({'model': model, 'settings': settings or {}, 'prompt': prompt},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class NarrativeCache:
+    """SQLite-backed narrative cache keyed by narrative_key, with LRU eviction by total stored bytes.
+
+    Writes are committed in batches of COMMIT_EVERY and on close(); use as a
+    context manager or call close().
+    """
+
+    def __init__(self, path=NARRATIVE_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS narratives ("
+                "key TEXT PRIMARY KEY, model TEXT, narrative TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_narratives_last_used ON narratives (last_used)")
+            self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM narratives").fetchone()[0]
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM narratives").fetchone()[0]
+
+    @property
+    def size(self):
+        """Bytes of narrative text (plus keys) currently stored"""
+        return self._size
+
+    def get(self, key):
+        """Cached narrative for key, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT narrative FROM narratives WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE narratives SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._wrote()
+            return row[0]
+
+    def put(self, key, narrative, model=None):
+        """Store narrative under key (empty narratives are not cached)"""
+        if not narrative:
+            return
+        size = len(key) + len(narrative.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM narratives WHERE key = ?", (key,)).fetchone()
+            self._conn.execute("INSERT OR REPLACE INTO narratives VALUES (?, ?, ?, ?, ?, ?)",
+                               (key, model, narrative, size, now, now))
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict(int(self.max_bytes * EVICT_TO_RATIO))
+            self._wrote()
+
+    def _evict(self, target_bytes):
+        """Drop least recently used entries until at most target_bytes are stored"""
+        freed = []
+        excess = self._size - target_bytes
+        cursor = self._conn.execute("SELECT key, size FROM narratives ORDER BY last_used")
+        for key, size in cursor:
+            if excess <= 0:
+                break
+            freed.append((key,))
+            excess -= size
+            self._size -= size
+        cursor.close()
+        self._conn.executemany("DELETE FROM narratives WHERE key = ?", freed)
+
+    def _wrote(self):
+        self._pending += 1
+        if self._pending >= COMMIT_EVERY:
+            self._conn.commit()
+            self._pending = 0
+
+    def commit(self):
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM narratives")
+            self._size = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
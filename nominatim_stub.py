@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Stand-in for a local Nominatim server, for exercising network geocoding offline.
+- Answers GET /search and GET /reverse with format=jsonv2 like Nominatim
+- Answers are deterministic: the same query always gets the same point in
+  Seattle (or the same street address); --miss-rate of queries have no match
+- Waits --latency seconds per request, to mimic a remote server
+- Answers --error-rate of requests with HTTP 503 (--throttle-rate with 429 and a
+  Retry-After), to exercise the worker's retry path
+
+Usage:
+  python nominatim_stub.py --port 8088 --latency 0.05 --error-rate 0.1
+  then in ems_data_generator: enable_network_geocoding(base_url="http://localhost:8088", rate_limit=0)
+"""
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8088
+DEFAULT_LATENCY = 0.0
+
+# Seattle bounding box (south, north, west, east)
+LAT_RANGE = (47.49, 47.73)
+LON_RANGE = (-122.43, -122.24)
+ROADS = ["Pine Street", "Pike Street", "Aurora Avenue North", "Rainier Avenue South", "15th Avenue Northeast",
+         "California Avenue Southwest", "Madison Street", "Broadway East", "Market Street", "Lake City Way Northeast"]
+
+
+def _fraction(*parts):
+    """Deterministic value in [0, 1) for a query"""
+    digest = hashlib.sha256('|'.join(map(str, parts)).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+
+class NominatimStubHandler(BaseHTTPRequestHandler):
+    """GET /search and /reverse -> Nominatim jsonv2 answers after the server's latency"""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so client connections get reused
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path not in ('/search', '/reverse'):
+            self._send(404, {'error': 'not found'})
+            return
+        if params.get('format') != 'jsonv2':
+            self._send(400, {'error': 'only format=jsonv2 is supported'})
+            return
+        self.server.requests_served += 1
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            roll = self.server.rng.random()
+        if roll < self.server.throttle_rate:
+            self.server.errors_served += 1
+            self._send(429, {'error': 'rate limited'}, {'Retry-After': '1'})
+            return
+        if roll < self.server.throttle_rate + self.server.error_rate:
+            self.server.errors_served += 1
+            self._send(503, {'error': 'service unavailable'})
+            return
+        if url.path == '/search':
+            self._send(200, self._search(params.get('q', '')))
+        else:
+            try:
+                lat, lon = float(params['lat']), float(params['lon'])
+            except (KeyError, ValueError):
+                self._send(400, {'error': 'lat and lon are required'})
+                return
+            self._send(200, self._reverse(lat, lon))
+
+    def _search(self, query):
+        if not query or _fraction('miss', query) < self.server.miss_rate:
+            return []
+        lat = LAT_RANGE[0] + _fraction('lat', query) * (LAT_RANGE[1] - LAT_RANGE[0])
+        lon = LON_RANGE[0] + _fraction('lon', query) * (LON_RANGE[1] - LON_RANGE[0])
+        return [{'lat': f"{lat:.7f}", 'lon': f"{lon:.7f}", 'display_name': f"{query}, Seattle, Washington",
+                 'category': 'place', 'type': 'house', 'importance': 0.5}]
+
+    def _reverse(self, lat, lon):
+        key = f"{lat:.5f},{lon:.5f}"
+        if _fraction('miss', key) < self.server.miss_rate:
+            return {'error': 'Unable to geocode'}
+        house_number = str(100 + int(_fraction('house', key) * 9900))
+        road = ROADS[int(_fraction('road', key) * len(ROADS))]
+        return {'lat': f"{lat:.7f}", 'lon': f"{lon:.7f}",
+                'display_name': f"{house_number}, {road}, Seattle, Washington, United States",
+                'address': {'house_number': house_number, 'road': road, 'city': 'Seattle',
+                            'state': 'Washington', 'country': 'United States'}}
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host='127.0.0.1', port=DEFAULT_PORT, latency=DEFAULT_LATENCY, miss_rate=0.0, error_rate=0.0,
+                throttle_rate=0.0, seed=0, verbose=False):
+    """Stub server bound to (host, port); port 0 picks a free port (see server.server_port)"""
+    server = ThreadingHTTPServer((host, port), NominatimStubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.miss_rate = miss_rate
+    server.error_rate = error_rate
+    server.throttle_rate = throttle_rate
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.verbose = verbose
+    server.requests_served = 0
+    server.errors_served = 0
+    return server
+
+
+def serve_in_thread(**kwargs):
+    """Start a stub server on a daemon thread (on a free port unless given one); returns (server, base_url).
+
+    Call server.shutdown() when done.
+    """
+    kwargs.setdefault('port', 0)
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY, help='Seconds to wait per request')
+    parser.add_argument('--miss-rate', type=float, default=0.0, help='Fraction of queries with no match')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 503')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with HTTP 429 and Retry-After: 1')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for which requests get errors')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.miss_rate, args.error_rate, args.throttle_rate,
+                         args.seed, args.verbose)
+    print(f"Nominatim stub listening on http://{args.host}:{server.server_port} "
+          f"({args.latency}s per request, {args.miss_rate:.0%} misses, "
+          f"{args.error_rate:.0%} 503s, {args.throttle_rate:.0%} 429s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.requests_served} requests, {server.errors_served} errors")
+
+
+if __name__ == '__main__':
+    main()
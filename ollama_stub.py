@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Stand-in for a local Ollama server, for benchmarking the narrative stage.
+- Answers POST /api/generate like Ollama: one JSON object with 'stream': false,
+  otherwise NDJSON chunks (one word each) ending in a 'done' chunk with a context
+- Waits --latency seconds before the first word and --token-latency per word,
+  to mimic prompt evaluation and generation time
+- Stops generating when a streaming client disconnects, as Ollama does
+- Serves requests concurrently, like a server with several parallel slots
+
+Usage:
+  python ollama_stub.py --port 11435 --latency 2.0 --token-latency 0.02
+  OLLAMA_URL=http://localhost:11435 python generate_ems_reports.py --use-ollama --ollama-concurrency 8
+"""
+import json
+import time
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 11435
+DEFAULT_LATENCY = 1.0
+DEFAULT_TOKEN_LATENCY = 0.0
+# Sentences per canned narrative; generate_ems_reports retries anything under 10
+DEFAULT_SENTENCES = 12
+
+NARRATIVE_SENTENCE = "Crew assessed the patient and documented findings consistent with the dispatch complaint."
+
+
+class OllamaStubHandler(BaseHTTPRequestHandler):
+    """POST /api/generate -> canned narrative after the server's latency"""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled client connections get reused
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.path != '/api/generate':
+            self._send(404, {'error': 'not found'})
+            return
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            self._send(400, {'error': 'invalid JSON'})
+            return
+        self.server.requests_served += 1
+        start = time.perf_counter()
+        words = ' '.join([NARRATIVE_SENTENCE] * self.server.sentences).split(' ')
+        tokens = [word if i == 0 else ' ' + word for i, word in enumerate(words)]
+        # A continuation (context from an earlier reply) carries on after the tokens already produced
+        context = list(request.get('context') or []) + list(range(len(tokens)))
+        time.sleep(self.server.latency)
+        if not request.get('stream', True):
+            time.sleep(self.server.token_latency * len(tokens))
+            self.server.tokens_generated += len(tokens)
+            self._send(200, self._chunk(request, ''.join(tokens), True, start, context=context, eval_count=len(tokens)))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for token in tokens:
+                time.sleep(self.server.token_latency)
+                self._write_chunk(self._chunk(request, token, False, start))
+                self.server.tokens_generated += 1
+            self._write_chunk(self._chunk(request, '', True, start, context=context, eval_count=len(tokens)))
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading early; stop generating like Ollama does
+            self.close_connection = True
+
+    def _chunk(self, request, text, done, start, **extra):
+        chunk = {
+            'model': request.get('model', ''),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'response': text,
+            'done': done,
+        }
+        if done:
+            chunk['total_duration'] = int((time.perf_counter() - start) * 1e9)
+            chunk.update(extra)
+        return chunk
+
+    def _write_chunk(self, payload):
+        data = json.dumps(payload).encode('utf-8') + b'\n'
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b'\r\n')
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host='127.0.0.1', port=DEFAULT_PORT, latency=DEFAULT_LATENCY, sentences=DEFAULT_SENTENCES,
+                verbose=False, token_latency=DEFAULT_TOKEN_LATENCY):
+    """Stub server bound to (host, port); port 0 picks a free port (see server.server_port)"""
+    server = ThreadingHTTPServer((host, port), OllamaStubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.token_latency = token_latency
+    server.sentences = sentences
+    server.verbose = verbose
+    server.requests_served = 0
+    server.tokens_generated = 0
+    return server
+
+
+def serve_in_thread(**kwargs):
+    """Start a stub server on a daemon thread (on a free port unless given one); returns (server, base_url).
+
+    Call server.shutdown() when done.
+    """
+    kwargs.setdefault('port', 0)
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY,
+                        help='Seconds to wait per request before the first word')
+    parser.add_argument('--token-latency', type=float, default=DEFAULT_TOKEN_LATENCY,
+                        help='Seconds to wait per generated word')
+    parser.add_argument('--sentences', type=int, default=DEFAULT_SENTENCES, help='Sentences per narrative')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.latency, args.sentences, args.verbose, args.token_latency)
+    print(f"Ollama stub listening on http://{args.host}:{server.server_port} "
+          f"({args.latency}s per request, {args.token_latency}s per word)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.requests_served} requests, {server.tokens_generated} words")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,772 @@
+"""
+Record I/O
+
+Streaming writers for the generated entity files. Records are written one at a
+time as they are generated instead of building a list and json.dump-ing it:
+- ndjson: one compact JSON object per line (the streaming format)
+- json: a pretty-printed JSON array, byte-for-byte what json.dump(records, indent=2) writes
+- parquet: columnar row groups with typed timestamps and dictionary-encoded categoricals (needs pyarrow)
+- csv: one row per record under a header of the dataclass fields
+
+SqliteDatabase bulk-loads the same records into typed tables of one SQLite file,
+and RecordStore keeps generated records in memory packed a row at a time.
+"""
+
+import json
+import marshal
+import os
+import sys
+import dataclasses
+import typing
+from array import array
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from functools import partial
+from operator import attrgetter
+
+# pyarrow is optional and slow to import; _import_pyarrow() loads it when Parquet is written
+pa = None
+pq = None
+
+# Output formats and the file extension each one is written with
+RECORD_FORMATS = {
+    'ndjson': '.ndjson',
+    'json': '.json',
+    'parquet': '.parquet',
+    'csv': '.csv',
+}
+DEFAULT_RECORD_FORMAT = 'ndjson'
+# Formats iter_records can read back as plain JSON records
+TEXT_RECORD_FORMATS = ['ndjson', 'json']
+
+# Flush to disk every N records so partial output is readable while generation runs
+DEFAULT_FLUSH_EVERY = 1000
+
+# Characters read at a time when parsing a JSON array file incrementally
+READ_CHUNK_SIZE = 1 << 16
+
+# Parquet: records per row group, and the share of distinct values (in the first
+# row group) at or below which a string column is stored as a dictionary/categorical
+DEFAULT_ROW_GROUP_SIZE = 10_000
+CATEGORICAL_MAX_DISTINCT_RATIO = 0.5
+
+# SQLite: rows per executemany (and per transaction) while bulk loading
+DEFAULT_SQLITE_BATCH_SIZE = 50_000
+
+# RecordStore: distinct values per string field stored as one-byte codes (later ones are stored
+# as text), and records per block of packed rows
+STORE_MAX_CODES = 255
+STORE_BLOCK_ROWS = 256
+
+
+def record_path(output_dir, name, fmt=DEFAULT_RECORD_FORMAT):
+    """<output_dir>/<name>.<ext> for the given format"""
+    if fmt not in RECORD_FORMATS:
+        raise ValueError(f"Unknown record format {fmt!r}; expected one of {sorted(RECORD_FORMATS)}")
+    return os.path.join(output_dir, name + RECORD_FORMATS[fmt])
+
+
+def record_to_dict(record):
+    """Field name -> value for a dataclass record, in field order.
+
+    Records are slotted (no per-instance __dict__); this is the shallow
+    replacement for record.__dict__ and serializes the same as asdict().
+    """
+    return {name: getattr(record, name) for name in _field_names(type(record))}
+
+
+def record_accessors(record):
+    """(get, has) for reading a record's fields, whatever form the record is in.
+
+    get(name, default) and has(name) act like dict.get and `in` for mappings
+    (records parsed from JSON) and like getattr and hasattr for dataclass
+    records and namespaces, so readers need no per-field type checks or copies.
+    """
+    if isinstance(record, Mapping):
+        return record.get, record.__contains__
+    return partial(getattr, record), partial(hasattr, record)
+
+
+def intern_fields(record, names):
+    """Intern the named string fields of record so equal values share one object"""
+    for name in names:
+        value = getattr(record, name)
+        if type(value) is str:
+            setattr(record, name, sys.intern(value))
+
+
+_FIELD_NAMES = {}
+
+
+def _field_names(record_type):
+    names = _FIELD_NAMES.get(record_type)
+    if names is None:
+        names = _FIELD_NAMES[record_type] = tuple(f.name for f in dataclasses.fields(record_type))
+    return names
+
+
+class RecordStore:
+    """Append-only list of dataclass records, packed to a fraction of their in-memory size.
+
+    Each record is kept as a marshal'd row, STORE_BLOCK_ROWS rows to a block:
+    the first STORE_MAX_CODES distinct values of each string field become
+    one-byte codes, and 'YYYY-MM-DD HH:MM:SS' timestamps (see _column_kind)
+    become integer seconds. Reading rebuilds the exact values, so records,
+    iter_dicts() and column() serialize the same as the records appended.
+    Records are rebuilt on every read: changing one does not change the store.
+    A record holding values marshal can't pack (e.g. datetime objects) is kept as is.
+    """
+
+    def __init__(self, record_type):
+        self.record_type = record_type
+        self._names = _field_names(record_type)
+        self._index = {name: i for i, name in enumerate(self._names)}
+        self._values = attrgetter(*self._names)
+        kinds = [_column_kind(f.name, f.type) for f in dataclasses.fields(record_type)]
+        self._string_columns = [i for i, kind in enumerate(kinds) if kind == 'string']
+        self._timestamp_columns = [i for i, kind in enumerate(kinds) if kind == 'timestamp']
+        self._codes = [{} for _ in self._string_columns]  # value -> code, per string field
+        self._tables = [[] for _ in self._string_columns]  # code -> value, per string field
+        self._blocks = []  # Full blocks are bytes, the last one a bytearray still being filled
+        self._starts = array('I')  # Offset of each row in its block
+        self._unpacked = {}  # Row index -> record, for records marshal can't pack
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        for index in range(len(self._starts)):
+            yield self._record(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self._starts)))]
+        if index < 0:
+            index += len(self._starts)
+        if not 0 <= index < len(self._starts):
+            raise IndexError("RecordStore index out of range")
+        return self._record(index)
+
+    def append(self, record):
+        values = list(self._values(record))
+        codes = bytearray(len(self._string_columns))
+        for j, (i, value_codes, table) in enumerate(zip(self._string_columns, self._codes, self._tables)):
+            value = values[i]
+            if type(value) is str:
+                code = value_codes.get(value)
+                if code is None and len(table) < STORE_MAX_CODES:
+                    code = value_codes[value] = len(table)
+                    table.append(value)
+                if code is not None:
+                    codes[j] = code
+                    values[i] = None
+                    continue
+            codes[j] = STORE_MAX_CODES  # Not coded: the value is in the row itself
+        for i in self._timestamp_columns:
+            value = values[i]
+            if type(value) is str:
+                seconds = _pack_timestamp(value)
+                if seconds is not None:
+                    values[i] = seconds
+            elif value is not None:
+                values[i] = (value,)  # Boxed, so it can't be mistaken for packed seconds
+        values.append(bytes(codes))
+        try:
+            row = marshal.dumps(tuple(values))
+        except ValueError:
+            self._unpacked[len(self._starts)] = record
+            row = b''
+        if len(self._starts) % STORE_BLOCK_ROWS == 0:
+            if self._blocks:
+                self._blocks[-1] = bytes(self._blocks[-1])
+            self._blocks.append(bytearray())
+        block = self._blocks[-1]
+        self._starts.append(len(block))
+        block += row
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def iter_dicts(self):
+        """Field name -> value for each record, as record_to_dict gives, without rebuilding the records"""
+        names = self._names
+        for index in range(len(self._starts)):
+            yield dict(zip(names, self._row_values(index)))
+
+    def column(self, name):
+        """Iterate over one field's values"""
+        i = self._index[name]
+        for index in range(len(self._starts)):
+            yield self._row_values(index)[i]
+
+    def _row_values(self, index):
+        if index in self._unpacked:
+            return self._values(self._unpacked[index])
+        block = self._blocks[index // STORE_BLOCK_ROWS]
+        # marshal.loads ignores the rows after this one
+        values = list(marshal.loads(memoryview(block)[self._starts[index]:]))
+        codes = values.pop()
+        for j, i in enumerate(self._string_columns):
+            if codes[j] != STORE_MAX_CODES:
+                values[i] = self._tables[j][codes[j]]
+        for i in self._timestamp_columns:
+            value = values[i]
+            if type(value) is int:
+                values[i] = _unpack_timestamp(value)
+            elif type(value) is tuple:
+                values[i] = value[0]
+        return values
+
+    def _record(self, index):
+        if index in self._unpacked:
+            return self._unpacked[index]
+        record = object.__new__(self.record_type)
+        for name, value in zip(self._names, self._row_values(index)):
+            object.__setattr__(record, name, value)
+        return record
+
+
+# Packed timestamps count from here so recent ones fit marshal's 4-byte ints
+_EPOCH = datetime(2020, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def _pack_timestamp(value):
+    """Seconds since _EPOCH (doubled, plus 1 for a 'T' separator) for a 'YYYY-MM-DD HH:MM:SS' string, else None"""
+    # fromisoformat also reads forms (week dates, other separators) that wouldn't print back the same
+    if len(value) != 19 or value[10] not in ' T' or value[4] != '-' or value[7] != '-' \
+            or value[13] != ':' or value[16] != ':':
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return int((parsed - _EPOCH).total_seconds()) * 2 + (value[10] == 'T')
+
+
+def _unpack_timestamp(packed):
+    return (_EPOCH + (packed >> 1) * _SECOND).isoformat('T' if packed & 1 else ' ')
+
+
+def open_record_writer(path, fmt=DEFAULT_RECORD_FORMAT, record_type=None, **kwargs):
+    """RecordWriter, or ParquetRecordWriter / CsvRecordWriter for fmt 'parquet' / 'csv' (which need the record dataclass)"""
+    if fmt in ('parquet', 'csv'):
+        if record_type is None:
+            raise ValueError(f"{fmt.capitalize()} output needs the record dataclass for its columns")
+        if fmt == 'csv':
+            return CsvRecordWriter(path, record_type, **kwargs)
+        return ParquetRecordWriter(path, record_type, **kwargs)
+    return RecordWriter(path, fmt, **kwargs)
+
+
+class RecordWriter:
+    """Write records to one file as NDJSON lines or as a pretty JSON array.
+
+    Use as a context manager (or call close()); the JSON array is only
+    terminated on close. Pass path to open (and own) a file, or stream to
+    write into an already open text file at the given base indent (used to
+    nest an array inside a larger document). append=True adds to an existing
+    NDJSON file (e.g. a journal being resumed; see repair_journal).
+    """
+
+    def __init__(self, path=None, fmt=DEFAULT_RECORD_FORMAT, flush_every=DEFAULT_FLUSH_EVERY,
+                 default=str, ensure_ascii=True, stream=None, base_indent=0, append=False):
+        if fmt not in TEXT_RECORD_FORMATS:
+            raise ValueError(f"Unknown record format {fmt!r}; expected one of {TEXT_RECORD_FORMATS}")
+        if (path is None) == (stream is None):
+            raise ValueError("Pass exactly one of path or stream")
+        if append and fmt != 'ndjson':
+            raise ValueError("Only ndjson files can be appended to")
+        self.path = path
+        self.fmt = fmt
+        self.flush_every = flush_every
+        self.count = 0
+        self._default = default
+        self._ensure_ascii = ensure_ascii
+        self._owns_stream = stream is None
+        self._stream = open(path, 'a' if append else 'w', encoding='utf-8') if stream is None else stream
+        self._newline = '\n' + ' ' * base_indent
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record):
+        """Append one record"""
+        if self.fmt == 'ndjson':
+            self._stream.write(json.dumps(record, default=self._default, ensure_ascii=self._ensure_ascii))
+            self._stream.write('\n')
+        else:
+            text = json.dumps(record, indent=2, default=self._default, ensure_ascii=self._ensure_ascii)
+            # JSON strings can't hold a raw newline, so re-indenting line by line is safe
+            self._stream.write(('[' if self.count == 0 else ',') + self._newline + '  ')
+            self._stream.write(text.replace('\n', self._newline + '  '))
+        self.count += 1
+        if self.flush_every and self.count % self.flush_every == 0:
+            self._stream.flush()
+
+    def write_many(self, records):
+        """Append every record from an iterable; returns the number written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def close(self):
+        """Terminate the JSON array (if any) and flush; closes the file when this writer opened it"""
+        if self._closed:
+            return
+        self._closed = True
+        if self.fmt == 'json':
+            self._stream.write('[]' if self.count == 0 else self._newline + ']')
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+
+class ParquetRecordWriter:
+    """Write dataclass records (or their dicts) to Parquet, one row group at a time.
+
+    Column types come from the dataclass annotations: str fields named *_date /
+    *_datetime become second-resolution timestamps, List[str] a list column, other
+    containers JSON text. String columns whose first row group is mostly repeats
+    are dictionary-encoded, so they load as categoricals. Same interface as
+    RecordWriter (write / write_many / close / count / path).
+    """
+
+    def __init__(self, path, record_type, row_group_size=DEFAULT_ROW_GROUP_SIZE, compression='snappy',
+                 flush_every=None, ensure_ascii=None):
+        # flush_every / ensure_ascii are accepted for RecordWriter compatibility; row groups are the flush unit
+        _import_pyarrow()
+        self.path = path
+        self.fmt = 'parquet'
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._compression = compression
+        self._fields = [(f.name, _column_kind(f.name, f.type)) for f in dataclasses.fields(record_type)]
+        self._columns = {name: [] for name, _ in self._fields}
+        self._schema = None
+        self._writer = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record):
+        """Append one record (a dataclass instance or a dict with its fields)"""
+        if not isinstance(record, dict):
+            record = record_to_dict(record)
+        for name, kind in self._fields:
+            self._columns[name].append(_to_arrow_value(kind, record.get(name)))
+        self.count += 1
+        if self.count % self.row_group_size == 0:
+            self._write_row_group()
+
+    def write_many(self, records):
+        """Append every record from an iterable; returns the number written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def close(self):
+        """Write the last partial row group and the file footer"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._columns[self._fields[0][0]] or self._writer is None:
+            self._write_row_group()
+        self._writer.close()
+
+    def _write_row_group(self):
+        if self._schema is None:
+            self._schema = pa.schema([
+                pa.field(name, self._arrow_type(name, kind)) for name, kind in self._fields
+            ])
+            self._writer = pq.ParquetWriter(self.path, self._schema, compression=self._compression)
+        self._writer.write_table(pa.table(self._columns, schema=self._schema))
+        self._columns = {name: [] for name, _ in self._fields}
+
+    def _arrow_type(self, name, kind):
+        if kind != 'string':
+            return _ARROW_TYPES[kind]()
+        # Decide categorical vs plain string from the first row group
+        values = [value for value in self._columns[name] if value is not None]
+        if values and len(set(values)) <= CATEGORICAL_MAX_DISTINCT_RATIO * len(values):
+            return pa.dictionary(pa.int32(), pa.string())
+        return pa.string()
+
+
+class CsvRecordWriter:
+    """Write dataclass records (or their dicts) as CSV rows under a header of the dataclass fields.
+
+    Lists and dicts are written as JSON text, None as an empty cell. Same interface
+    as RecordWriter (write / write_many / close / count / path).
+    """
+
+    def __init__(self, path, record_type, flush_every=DEFAULT_FLUSH_EVERY, ensure_ascii=True):
+        self.path = path
+        self.fmt = 'csv'
+        self.flush_every = flush_every
+        self.count = 0
+        self._names, self._json_columns = _record_columns(record_type)
+        self._values = attrgetter(*self._names)
+        self._encode = json.JSONEncoder(default=str, ensure_ascii=ensure_ascii).encode
+        self._stream = open(path, 'w', encoding='utf-8', newline='')
+        import csv
+        self._writer = csv.writer(self._stream)
+        self._writer.writerow(self._names)
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record):
+        """Append one record (a dataclass instance or a dict with its fields)"""
+        self._writer.writerow(_record_row(record, self._names, self._values, self._json_columns, self._encode))
+        self.count += 1
+        if self.flush_every and self.count % self.flush_every == 0:
+            self._stream.flush()
+
+    def write_many(self, records):
+        """Append every record from an iterable; returns the number written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.close()
+
+
+class SqliteDatabase:
+    """Bulk-load dataclass records into a SQLite file, one typed table per record type.
+
+    The load runs with journal_mode=WAL and synchronous=OFF, inserting batch_size
+    rows per executemany and transaction. Indexes are only built on close(), one
+    sort per index instead of an index update per row; close() then goes back to
+    a rollback journal so the result is a single self-contained file. An existing
+    database at path is replaced.
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_SQLITE_BATCH_SIZE):
+        for stale in (path, path + '-wal', path + '-shm'):
+            if os.path.exists(stale):
+                os.remove(stale)
+        self.path = path
+        self.batch_size = batch_size
+        import sqlite3  # Imported here so loading record_io doesn't load sqlite3
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self._writers = []
+        self._indexes = []  # (table, columns, unique), built on close
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def writer(self, table, record_type, indexes=None):
+        """SqliteTableWriter into a new table for record_type.
+
+        indexes lists (columns, unique) to build after the load; by default every
+        *_id column is indexed, the first field uniquely when it is one (the record's ID).
+        """
+        names = _field_names(record_type)
+        if indexes is None:
+            indexes = [((name,), i == 0) for i, name in enumerate(names) if name.endswith('_id')]
+        columns = ', '.join(f'"{f.name}" {_SQLITE_TYPES[_column_kind(f.name, f.type)]}'
+                            for f in dataclasses.fields(record_type))
+        self.connection.execute(f'CREATE TABLE "{table}" ({columns})')
+        self._indexes.extend((table, tuple(index_columns), unique) for index_columns, unique in indexes)
+        writer = SqliteTableWriter(self, table, record_type)
+        self._writers.append(writer)
+        return writer
+
+    def close(self):
+        """Flush every table writer, build the indexes and close the database"""
+        if self._closed:
+            return
+        self._closed = True
+        for writer in self._writers:
+            writer.close()
+        for table, columns, unique in self._indexes:
+            name = f"idx_{table}_{'_'.join(columns)}"
+            column_list = ', '.join(f'"{column}"' for column in columns)
+            self.connection.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX "{name}" ON "{table}" ({column_list})')
+        self.connection.commit()
+        self.connection.execute("PRAGMA journal_mode=DELETE")
+        self.connection.close()
+
+
+class SqliteTableWriter:
+    """Insert records into one table of a SqliteDatabase, batch_size rows per executemany.
+
+    Same interface as RecordWriter (write / write_many / close / count / path);
+    lists and dicts are stored as JSON text.
+    """
+
+    def __init__(self, database, table, record_type):
+        self.path = database.path
+        self.fmt = 'sqlite'
+        self.table = table
+        self.count = 0
+        self._database = database
+        self._names, self._json_columns = _record_columns(record_type)
+        self._values = attrgetter(*self._names)
+        self._encode = json.JSONEncoder(default=str, ensure_ascii=False).encode
+        self._insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(self._names))})'
+        self._rows = []
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, record):
+        """Append one record (a dataclass instance or a dict with its fields)"""
+        self._rows.append(_record_row(record, self._names, self._values, self._json_columns, self._encode))
+        self.count += 1
+        if len(self._rows) >= self._database.batch_size:
+            self._flush()
+
+    def write_many(self, records):
+        """Append every record from an iterable; returns the number written"""
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def close(self):
+        """Insert the rows still buffered"""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
+
+    def _flush(self):
+        if self._rows:
+            connection = self._database.connection
+            connection.executemany(self._insert, self._rows)
+            connection.commit()
+            self._rows = []
+
+
+def _record_columns(record_type):
+    """(field names, indexes of the fields stored as JSON text) for a record dataclass"""
+    fields = dataclasses.fields(record_type)
+    return ([f.name for f in fields],
+            [i for i, f in enumerate(fields) if _column_kind(f.name, f.type) in ('string_list', 'json')])
+
+
+def _record_row(record, names, values, json_columns, encode):
+    """A record's values in names order (values: attrgetter of names), the json_columns encoded as JSON text"""
+    if isinstance(record, dict):
+        row = [record.get(name) for name in names]
+    else:
+        row = list(values(record))
+    for i in json_columns:
+        if row[i] is not None:
+            row[i] = encode(row[i])
+    return row
+
+
+def _import_pyarrow():
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow (pip install pyarrow)") from None
+        pa, pq = pyarrow, pyarrow.parquet
+
+
+# Arrow column type per field kind (see _column_kind); built lazily since pyarrow is optional
+_ARROW_TYPES = {
+    'string': lambda: pa.string(),
+    'timestamp': lambda: pa.timestamp('s'),
+    'int': lambda: pa.int64(),
+    'float': lambda: pa.float64(),
+    'bool': lambda: pa.bool_(),
+    'string_list': lambda: pa.list_(pa.string()),
+    'json': lambda: pa.string(),
+}
+
+
+# SQLite column type per field kind; timestamps stay ISO text, which SQLite's date functions read
+_SQLITE_TYPES = {
+    'string': 'TEXT',
+    'timestamp': 'TEXT',
+    'int': 'INTEGER',
+    'float': 'REAL',
+    'bool': 'INTEGER',
+    'string_list': 'TEXT',
+    'json': 'TEXT',
+}
+
+
+def _column_kind(name, annotation):
+    """Column kind for a dataclass field annotation"""
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if typing.get_origin(annotation) is typing.Union and len(args) == 1:
+        annotation = args[0]
+    if annotation is str:
+        if name.endswith('_date') or name.endswith('_datetime') or name == 'date_of_birth':
+            return 'timestamp'
+        return 'string'
+    if annotation is bool:
+        return 'bool'
+    if annotation is int:
+        return 'int'
+    if annotation is float:
+        return 'float'
+    if typing.get_origin(annotation) is list and typing.get_args(annotation) == (str,):
+        return 'string_list'
+    return 'json'
+
+
+def _to_arrow_value(kind, value):
+    """Convert a record value to what its Arrow column expects (None stays null)"""
+    if value is None:
+        return None
+    if kind == 'timestamp':
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value) if value else None
+    if kind == 'json':
+        return json.dumps(value, default=str)
+    if kind == 'string':
+        return str(value)
+    return value
+
+
+def iter_records(path):
+    """Yield the records of an NDJSON file (line by line) or a JSON array file (item by item).
+
+    Neither format is read into memory whole, so a caller that stops early only
+    reads as far as it got.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(RECORD_FORMATS['ndjson']):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _iter_json_array(f)
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_NUMBER_CHARS = '0123456789.eE+-'
+
+
+def _iter_json_array(f, chunk_size=READ_CHUNK_SIZE):
+    """Yield the items of the JSON array in text file f, reading chunk_size characters at a time"""
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def more():
+        # Drop what has been consumed and read the next chunk; False at end of file
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return not eof
+
+    def next_char():
+        # Skip whitespace; the next significant character (not consumed), or '' at end of file
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not more():
+                return buffer[pos:pos + 1]
+
+    if next_char() != '[':
+        raise ValueError(f"{getattr(f, 'name', 'input')} does not hold a JSON array")
+    pos += 1
+    if next_char() == ']':
+        return
+    while True:
+        next_char()
+        while True:
+            try:
+                item, end = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if more():
+                    continue
+                raise
+            # A number cut off by the chunk boundary (e.g. '2.' + '5') decodes early; read on and retry
+            if (not eof and type(item) in (int, float)
+                    and (end == len(buffer) or buffer[end] in _JSON_NUMBER_CHARS) and more()):
+                continue
+            break
+        pos = end
+        yield item
+        separator = next_char()
+        pos += 1
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f"Malformed JSON array in {getattr(f, 'name', 'input')}: expected ',' or ']'")
+
+
+def repair_journal(path):
+    """Make an NDJSON journal safe to append to after a crash.
+
+    A record is only complete once its newline is written, so a torn last
+    line (no newline) is cut off. Returns True if anything was removed.
+    """
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        # Scan back in blocks for the last newline
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            block = f.read(end - start)
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        if end == size:
+            return False
+        f.truncate(end)
+        return True
+
+
+def find_record_file(path):
+    """The newest existing file among path and its other-format siblings, or None"""
+    stem = os.path.splitext(path)[0]
+    candidates = [stem + RECORD_FORMATS[fmt] for fmt in TEXT_RECORD_FORMATS
+                  if os.path.exists(stem + RECORD_FORMATS[fmt])]
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
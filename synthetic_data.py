@@ -1,42 +1,86 @@
 import json
-import csv
+import os
 import random
-import sqlite3
 from datetime import datetime, timedelta
-from faker import Faker
-import uuid
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter, namedtuple
 import time
 from enum import Enum
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Set
+from dataclasses import dataclass
+from typing import ClassVar, List, Dict, Optional, Set
 import math
+from record_io import (RecordStore, RecordWriter, SqliteDatabase, intern_fields, open_record_writer, record_path,
+                       record_to_dict)
+from metrics import METRICS, print_progress
+from ids import IdService
 
-# Initialize Faker with multiple providers
-fake = Faker('en_US')
-Faker.seed(42)
 random.seed(42)
 
-# Add additional providers
-fake.add_provider('faker.providers.automotive')
-fake.add_provider('faker.providers.bank')
+_faker_seeded = False
+
+
+class LazyFaker:
+    """Stand-in for a Faker instance that only builds it on first use.
+
+    Importing faker and building each locale dominates import time, and most
+    runs never touch some locales. The shared Faker seed (42) is set when the
+    first instance is built, before anything has drawn from it.
+    """
+
+    def __init__(self, locale, providers=()):
+        self._locale = locale
+        self._providers = providers
+        self._faker = None
+
+    def __getattr__(self, name):
+        if self._faker is None:
+            self._faker = self._build()
+        return getattr(self._faker, name)
+
+    def _build(self):
+        global _faker_seeded
+        from faker import Faker
+        faker = Faker(self._locale)
+        for provider in self._providers:
+            faker.add_provider(provider)
+        if not _faker_seeded:
+            Faker.seed(42)  # Use class method
+            _faker_seeded = True
+        return faker
+
+
+# Initialize Faker with multiple providers
+fake = LazyFaker('en_US', providers=['faker.providers.automotive', 'faker.providers.bank'])
 
 # Create locale-specific faker instances for consistent ethnicity-name mapping
 faker_locales = {
-    'WHITE': Faker('en_US'),  
-    'BLACK': Faker('en_US'),  
-    'HISPANIC': Faker('es_ES'), 
-    'ASIAN': [Faker('ja_JP'), Faker('zh_CN'), Faker('ko_KR'), Faker('vi_VN'), Faker('en_IN')],
-    'OTHER': Faker('en_US')
+    'WHITE': LazyFaker('en_US'),
+    'BLACK': LazyFaker('en_US'),
+    'HISPANIC': LazyFaker('es_ES'),
+    'ASIAN': [LazyFaker('ja_JP'), LazyFaker('zh_CN'), LazyFaker('ko_KR'), LazyFaker('vi_VN'), LazyFaker('en_IN')],
+    'NATIVE_AMERICAN': LazyFaker('en_US'),
+    'OTHER': LazyFaker('en_US')
 }
 
-# Set seeds for consistent results - use class method instead of instance method
-for locale_fake in faker_locales.values():
-    if isinstance(locale_fake, list):
-        for fake_instance in locale_fake:
-            Faker.seed(42)  # Use class method
-    else:
-        Faker.seed(42)  # Use class method
+
+def use_fast_vocabulary(seed=42):
+    """Swap fake and faker_locales for FastFaker wrappers (see vocabulary.py).
+
+    Names, SSNs, phone digits, zip codes, email domains and timestamps then come from
+    the same Faker word lists and ranges via batched NumPy draws, several times faster;
+    everything else still goes to Faker. Output differs from the plain-Faker run.
+    """
+    global fake, faker_locales
+    from itertools import count
+    from vocabulary import FastFaker
+    if isinstance(fake, FastFaker):
+        return
+    streams = count(1)  # Each wrapper draws from its own stream of the seed
+    fake = FastFaker(fake, seed=[seed, 0])
+    faker_locales = {
+        ethnicity: ([FastFaker(f, seed=[seed, next(streams)]) for f in locale_fake] if isinstance(locale_fake, list)
+                    else FastFaker(locale_fake, seed=[seed, next(streams)]))
+        for ethnicity, locale_fake in faker_locales.items()
+    }
 
 # Enhanced Configuration for comprehensive data generation
 CONFIG = {
@@ -49,7 +93,13 @@ CONFIG = {
     'num_arrests': 25_000,
     'num_jail_bookings': 20_000,
     'simulation_years': 5,
-    'output_formats': ['json', 'csv', 'sqlite'],
+    'output_formats': ['json', 'csv', 'sqlite'],  # 'json' writes record_format files; 'sqlite' one SQLITE_DATABASE_NAME file
+    'record_format': 'ndjson',  # 'ndjson' streams records as they are generated; 'json' pretty JSON arrays; 'parquet' (needs pyarrow)
+    'record_flush_every': 1000,
+    'output_dir': '.',
+    'metrics_path': None,  # Write a JSON metrics report (per-stage timings, per-method timers) here
+    'fast_vocabulary': False,  # Draw names, SSNs, phones, zip codes and dates from precomputed pools instead of Faker
+    'stage_workers': None,  # Processes generate_all_data runs its stages on (None = one per CPU, 1 = this process only)
     'enable_cross_agency_sharing': True,
     'generate_rms_data': True,
     'generate_cad_data': True,
@@ -164,8 +214,13 @@ BELLEVUE_HOSPITALS = {
 }
 
 # Enhanced data structures
-@dataclass
+# Records are slotted (no per-instance __dict__). Each lists the string fields that are
+# built per record but only take a handful of values; those are interned on creation
+# so equal values share one object.
+@dataclass(slots=True)
 class Person:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('height', 'zip_code', 'created_date')
+
     person_id: str
     ssn: str
     first_name: str
@@ -189,8 +244,13 @@ class Person:
     created_date: str
     created_by_agency: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class Vehicle:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('registration_expiry', 'created_date')
+
     vehicle_id: str
     vin: str
     license_plate: str
@@ -207,8 +267,13 @@ class Vehicle:
     created_date: str
     created_by_agency: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class PoliceIncident:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('incident_date', 'location', 'beat')
+
     incident_id: str
     incident_type: str
     incident_date: str
@@ -233,8 +298,13 @@ class PoliceIncident:
     created_date: str
     created_by_agency: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class Arrest:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('arrest_location', 'created_date')
+
     arrest_id: str
     cad_incident_id: str
     person_id: str
@@ -265,8 +335,13 @@ class Arrest:
     created_date: str
     created_by_agency: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class JailBooking:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('housing_assignment',)
+
     booking_id: str
     person_id: str
     arrest_id: str
@@ -299,8 +374,13 @@ class JailBooking:
     days_served: int
     created_date: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class Property:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('found_location', 'evidence_locker', 'destruction_date')
+
     property_id: str
     property_type: str  # EVIDENCE, FOUND, STOLEN, SEIZED
     case_number: str
@@ -325,8 +405,13 @@ class Property:
     created_date: str
     agency: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class FireIncident:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('incident_subtype', 'address')
+
     incident_id: str
     incident_number: str
     call_number: str
@@ -363,8 +448,13 @@ class FireIncident:
     injuries: int
     created_date: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class EMSIncident:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('incident_subtype', 'address', 'responding_unit')
+
     incident_id: str
     incident_number: str
     call_number: str
@@ -397,8 +487,13 @@ class EMSIncident:
     transport_mode: str
     created_date: str
 
-@dataclass
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+@dataclass(slots=True)
 class CADIncident:
+    CATEGORICAL_FIELDS: ClassVar[tuple] = ('location', 'beat')
+
     cad_id: str
     incident_number: str
     call_type: str
@@ -425,29 +520,105 @@ class CADIncident:
     created_date: str
     created_by_agency: str
 
+    def __post_init__(self):
+        intern_fields(self, self.CATEGORICAL_FIELDS)
+
+# Entity types in output order -> record dataclass; each is also the generator's list attribute
+ENTITY_TYPES = {
+    'persons': Person,
+    'vehicles': Vehicle,
+    'properties': Property,
+    'police_incidents': PoliceIncident,
+    'arrests': Arrest,
+    'jail_bookings': JailBooking,
+    'fire_incidents': FireIncident,
+    'ems_incidents': EMSIncident,
+}
+
+# What later stages read from a record; records only reach another stage as these references
+PersonRef = namedtuple('PersonRef', ['person_id'])
+IncidentRef = namedtuple('IncidentRef', ['incident_id', 'cad_id', 'call_datetime', 'location', 'latitude',
+                                         'longitude', 'primary_officer', 'backup_officers'])
+ArrestRef = namedtuple('ArrestRef', ['arrest_id', 'person_id', 'agency'])
+
+# generate_all_data stages: entity type -> (CONFIG count, stages it draws references from,
+# reference type other stages get from it, progress label)
+ENTITY_STAGES = {
+    'persons': ('num_persons', (), PersonRef, None),
+    'vehicles': ('num_vehicles', ('persons',), None, None),
+    'police_incidents': ('num_police_incidents', (), IncidentRef, None),
+    'arrests': ('num_arrests', ('persons', 'police_incidents'), ArrestRef, None),
+    'jail_bookings': ('num_jail_bookings', ('arrests',), None, None),
+    'properties': ('num_properties', ('persons', 'police_incidents'), None, 'properties/evidence'),
+    'fire_incidents': ('num_fire_incidents', (), None, None),
+    'ems_incidents': ('num_ems_incidents', (), None, 'EMS incidents'),
+}
+
+# Database written for the 'sqlite' output format, one table per entity type
+SQLITE_DATABASE_NAME = 'multi_agency_data.db'
+
+# Records per seeded stage chunk (fixed, so output doesn't depend on the worker count)
+STAGE_CHUNK_SIZE = 5000
+
+# Generator built once per stage worker process (see _init_stage_worker)
+_stage_worker_generator = None
+
+
+def _faker_instances():
+    """fake and every faker_locales instance, in a fixed order"""
+    instances = [fake]
+    for locale_fake in faker_locales.values():
+        instances.extend(locale_fake if isinstance(locale_fake, list) else [locale_fake])
+    return instances
+
+
+def _init_stage_worker(metrics_enabled=False, fast_vocabulary=False):
+    """Pool initializer: build this worker's generator once (collecting metrics if the parent is)"""
+    global _stage_worker_generator
+    if metrics_enabled:
+        METRICS.enable()
+    if fast_vocabulary:
+        use_fast_vocabulary()
+    _stage_worker_generator = EnhancedDataGenerator()
+    METRICS.reset()
+
+
+def _run_stage_worker(task):
+    """Worker function: one stage chunk, plus the metrics it collected for the parent to merge"""
+    records = _stage_worker_generator.generate_stage_chunk(*task)
+    metrics = None
+    if METRICS.enabled:
+        metrics = METRICS.report()
+        METRICS.reset()
+    return records, metrics
+
+
 class EnhancedDataGenerator:
     def __init__(self):
-        self.persons = []
-        self.vehicles = []
-        self.properties = []
-        self.police_incidents = []
-        self.arrests = []
-        self.jail_bookings = []
-        self.fire_incidents = []
-        self.ems_incidents = []
-        
-        # Tracking sets for unique identifiers
-        self.used_ssns = set()
-        self.used_license_plates = set()
-        self.used_vins = set()
-        self.used_incident_numbers = set()
-        self.used_booking_numbers = set()
+        # Generated records, packed in memory (see RecordStore); iterating rebuilds them
+        self.persons = RecordStore(Person)
+        self.vehicles = RecordStore(Vehicle)
+        self.properties = RecordStore(Property)
+        self.police_incidents = RecordStore(PoliceIncident)
+        self.arrests = RecordStore(Arrest)
+        self.jail_bookings = RecordStore(JailBooking)
+        self.fire_incidents = RecordStore(FireIncident)
+        self.ems_incidents = RecordStore(EMSIncident)
+        
+        # Record IDs, SSNs, VINs and plates: unique per kind by construction (no sets of used
+        # values), reproducible under the random seed
+        self.ids = IdService(random.getrandbits(64))
         
         # Cross-reference tracking
         self.person_incident_history = defaultdict(list)
         self.vehicle_owner_map = {}
         self.address_resident_map = defaultdict(list)
         
+        # Open record writers per entity type while streaming output (see open_record_writers)
+        self.record_writers = {}
+        self.database = None
+        
+    @METRICS.timed('agency.arrest')
     def generate_arrest(self, cad_incident, person):
         """Generate an arrest record linked to a CAD incident and person"""
         # Arrest types and methods
@@ -515,7 +686,7 @@ class EnhancedDataGenerator:
         search_authorization = random.choice(search_types)
         
         return Arrest(
-            arrest_id=f"AR-{datetime.now().year}-{random.randint(100000, 999999)}",
+            arrest_id=f"AR-{datetime.now().year}-{self.ids.number('arrest')}",
             cad_incident_id=cad_incident.cad_id,
             person_id=person.person_id,
             arrest_datetime=arrest_datetime.strftime('%Y-%m-%d %H:%M:%S'),
@@ -546,6 +717,7 @@ class EnhancedDataGenerator:
             created_by_agency=random.choice(['KCSO', 'BELLEVUE_PD'])
         )
     
+    @METRICS.timed('agency.arrest.charges')
     def generate_arrest_charges(self, arrest_type):
         """Generate realistic charges based on arrest type"""
         charge_mappings = {
@@ -642,7 +814,7 @@ class EnhancedDataGenerator:
         associate_phone = f"({area_code}){fake.msisdn()[:3]}-{fake.msisdn()[:4]}"
         
         return {
-            'associate_id': f"A-{datetime.now().year}-{random.randint(100000, 999999)}",
+            'associate_id': f"A-{datetime.now().year}-{self.ids.number('associate')}",
             'person_id': person_id,
             'name': f"{associate_first_name} {associate_last_name}",
             'type': associate_type,
@@ -682,7 +854,7 @@ class EnhancedDataGenerator:
             arrest_date = fake.date_time_between(start_date='-30d', end_date='now').strftime('%Y-%m-%d %H:%M:%S')
         
         return {
-            'suspect_id': f"S-{datetime.now().year}-{random.randint(100000, 999999)}",
+            'suspect_id': f"S-{datetime.now().year}-{self.ids.number('suspect')}",
             'incident_id': incident_id,
             'person_id': person_id,
             'status': suspect_status,
@@ -703,7 +875,7 @@ class EnhancedDataGenerator:
         booking_datetime = arrest_datetime + timedelta(hours=random.randint(1, 6))
         
         return {
-            'arrestee_id': f"AR-{datetime.now().year}-{random.randint(100000, 999999)}",
+            'arrestee_id': f"AR-{datetime.now().year}-{self.ids.number('arrest')}",
             'incident_id': incident_id,
             'person_id': person_id,
             'arrest_datetime': arrest_datetime.strftime('%Y-%m-%d %H:%M:%S'),
@@ -717,6 +889,7 @@ class EnhancedDataGenerator:
             'created_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
     
+    @METRICS.timed('agency.arrest.location')
     def generate_arrest_location(self):
         """Generate realistic arrest location in Seattle area"""
         locations = [
@@ -745,6 +918,7 @@ class EnhancedDataGenerator:
             'statute': f"RCW {random.randint(9, 69)}.{random.randint(10, 999)}"
         }
     
+    @METRICS.timed('agency.person.criminal_history')
     def generate_criminal_history(self):
         """Generate realistic criminal history"""
         history = []
@@ -761,6 +935,7 @@ class EnhancedDataGenerator:
         
         return history
     
+    @METRICS.timed('agency.jail_booking')
     def generate_jail_booking(self, person_id, arrest_id, agency='KCSO'):
         """Generate comprehensive jail booking record"""
         booking_datetime = fake.date_time_between(start_date='-2y', end_date='now')
@@ -791,11 +966,11 @@ class EnhancedDataGenerator:
         release_type = random.choices(release_types, release_weights)[0]
         
         booking = JailBooking(
-            booking_id=str(uuid.uuid4()),
+            booking_id=self.ids.uuid(),
             person_id=person_id,
             arrest_id=arrest_id,
-            booking_number=f"BK{booking_datetime.year}{random.randint(100000, 999999)}",
-            inmate_number=f"IN{random.randint(100000, 999999)}",
+            booking_number=f"BK{booking_datetime.year}{self.ids.number('booking')}",
+            inmate_number=f"IN{self.ids.number('inmate')}",
             booking_datetime=booking_datetime.strftime('%Y-%m-%d %H:%M:%S'),
             booking_officer=f"{random.randint(1000, 9999)}, {fake.last_name().upper()}",
             booking_type='NEW_ARREST',
@@ -826,6 +1001,7 @@ class EnhancedDataGenerator:
         
         return booking
     
+    @METRICS.timed('agency.property')
     def generate_property(self, incident_id=None, person_id=None, agency='KCSO'):
         """Generate comprehensive property/evidence record"""
         property_types = ['EVIDENCE', 'FOUND', 'STOLEN', 'SEIZED']
@@ -863,9 +1039,9 @@ class EnhancedDataGenerator:
         value_estimated = random.randint(value_range[0], value_range[1])
         
         property_record = Property(
-            property_id=str(uuid.uuid4()),
+            property_id=self.ids.uuid(),
             property_type=property_type,
-            case_number=f"PROP{random.randint(100000, 999999)}",
+            case_number=f"PROP{self.ids.number('property_case')}",
             incident_number=incident_id or '',
             description=f"{subcategory} - {fake.sentence()}",
             category=category,
@@ -890,14 +1066,10 @@ class EnhancedDataGenerator:
         
         return property_record
 
+    @METRICS.timed('agency.person')
     def generate_person(self, agency='KCSO'):
         """Generate a sample person with consistent name-ethnicity mapping"""
-        # Generate unique SSN
-        while True:
-            ssn = fake.ssn()
-            if ssn not in self.used_ssns:
-                self.used_ssns.add(ssn)
-                break
+        ssn = self.ids.ssn()
         
         # Choose ethnicity first, then get appropriate names
         ethnicity = random.choice(['WHITE', 'BLACK', 'HISPANIC', 'ASIAN', 'NATIVE_AMERICAN', 'OTHER'])
@@ -938,7 +1110,7 @@ class EnhancedDataGenerator:
         address = f"{street_number} {street_name}"
         
         return Person(
-            person_id=f"P-{datetime.now().year}-{random.randint(100000, 999999)}",
+            person_id=f"P-{datetime.now().year}-{self.ids.number('person')}",
             ssn=ssn,
             first_name=first_name,
             last_name=last_name,
@@ -962,21 +1134,11 @@ class EnhancedDataGenerator:
             created_by_agency=agency
         )
         
+    @METRICS.timed('agency.vehicle')
     def generate_vehicle(self, owner_id=None, agency='KCSO'):
         """Generate a sample vehicle"""
-        # Generate unique VIN
-        while True:
-            vin = ''.join([random.choice('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(17)])
-            if vin not in self.used_vins:
-                self.used_vins.add(vin)
-                break
-        
-        # Generate unique license plate
-        while True:
-            plate = f"{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{random.randint(100, 999)}"
-            if plate not in self.used_license_plates:
-                self.used_license_plates.add(plate)
-                break
+        vin = self.ids.vin()
+        plate = self.ids.license_plate()
         
         # Vehicle characteristics
         makes = ['TOYOTA', 'HONDA', 'FORD', 'CHEVROLET', 'NISSAN', 'BMW', 'MERCEDES', 'AUDI', 'VOLKSWAGEN', 'HYUNDAI']
@@ -998,7 +1160,7 @@ class EnhancedDataGenerator:
         stolen_status = 'STOLEN' if random.random() < 0.02 else 'NOT_STOLEN'  # 2% stolen rate
         
         vehicle = Vehicle(
-            vehicle_id=str(uuid.uuid4()),
+            vehicle_id=self.ids.uuid(),
             vin=vin,
             license_plate=plate,
             state='WA',
@@ -1017,6 +1179,7 @@ class EnhancedDataGenerator:
         
         return vehicle
     
+    @METRICS.timed('agency.police_incident')
     def generate_police_incident(self, agency='KCSO'):
         """Generate a sample police incident"""
         incident_types = [
@@ -1039,15 +1202,15 @@ class EnhancedDataGenerator:
         city = random.choice(cities)
         
         # Generate incident number
-        incident_number = f"{agency}{call_datetime.year}{random.randint(100000, 999999)}"
+        incident_number = f"{agency}{call_datetime.year}{self.ids.number('police_incident')}"
         
         incident = PoliceIncident(
-            incident_id=str(uuid.uuid4()),
+            incident_id=self.ids.uuid(),
             incident_type=incident_type,
             incident_date=call_datetime.strftime('%Y-%m-%d'),
             incident_time=call_datetime.strftime('%H:%M:%S'),
             call_datetime=call_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-            cad_id=str(uuid.uuid4()),  # Add this missing attribute
+            cad_id=self.ids.uuid(),  # Add this missing attribute
             location=fake.street_address(),
             latitude=random.uniform(47.5, 47.8),
             longitude=random.uniform(-122.5, -122.1),
@@ -1058,9 +1221,9 @@ class EnhancedDataGenerator:
             incident_description=f"{incident_type.lower().replace('_', ' ')} incident reported. {fake.sentence()}",
             primary_officer=f"Officer {fake.last_name()}",
             backup_officers=[f"Officer {fake.last_name()}" for _ in range(random.randint(0, 2))],
-            suspect_id=str(uuid.uuid4()),
-            victim_id=str(uuid.uuid4()),
-            witness_id=str(uuid.uuid4()),
+            suspect_id=self.ids.uuid(),
+            victim_id=self.ids.uuid(),
+            witness_id=self.ids.uuid(),
             evidence_collected=random.sample(['PHOTOGRAPHS', 'VIDEO_RECORDING', 'PHYSICAL_EVIDENCE', 'BODY_CAMERA', 'DASH_CAMERA'], random.randint(1, 3)) if random.random() < 0.7 else [],
             case_status=random.choice(['OPEN', 'CLOSED', 'PENDING']),
             created_date=call_datetime.strftime('%Y-%m-%d %H:%M:%S'),
@@ -1069,6 +1232,7 @@ class EnhancedDataGenerator:
         
         return incident
 
+    @METRICS.timed('agency.fire_incident')
     def generate_fire_incident(self):
         """Generate a sample fire incident"""
         incident_types = ['STRUCTURE_FIRE', 'VEHICLE_FIRE', 'BRUSH_FIRE', 'ALARM_ACTIVATION', 'MEDICAL_EMERGENCY']
@@ -1082,9 +1246,9 @@ class EnhancedDataGenerator:
         clear_delay = timedelta(minutes=random.randint(30, 180))
         
         incident = FireIncident(
-            incident_id=str(uuid.uuid4()),
-            incident_number=f"SFD{alarm_datetime.year}{random.randint(100000, 999999)}",
-            call_number=f"F{alarm_datetime.year}{random.randint(1000000, 9999999)}",
+            incident_id=self.ids.uuid(),
+            incident_number=f"SFD{alarm_datetime.year}{self.ids.number('fire_incident')}",
+            call_number=f"F{alarm_datetime.year}{self.ids.number('fire_call', digits=7)}",
             incident_type=incident_type,
             incident_subtype=f"{incident_type}_SUBTYPE",
             nfirs_code=f"{random.randint(100, 999)}",
@@ -1121,6 +1285,7 @@ class EnhancedDataGenerator:
         
         return incident
     
+    @METRICS.timed('agency.ems_incident')
     def generate_ems_incident(self):
         """Generate a sample EMS incident"""
         incident_types = ['MEDICAL_EMERGENCY', 'TRAUMA', 'CARDIAC_ARREST', 'OVERDOSE', 'STROKE', 'DIABETIC_EMERGENCY']
@@ -1135,9 +1300,9 @@ class EnhancedDataGenerator:
         clear_delay = timedelta(minutes=random.randint(30, 90))
         
         incident = EMSIncident(
-            incident_id=str(uuid.uuid4()),
-            incident_number=f"EMS{call_datetime.year}{random.randint(100000, 999999)}",
-            call_number=f"E{call_datetime.year}{random.randint(1000000, 9999999)}",
+            incident_id=self.ids.uuid(),
+            incident_number=f"EMS{call_datetime.year}{self.ids.number('ems_incident')}",
+            call_number=f"E{call_datetime.year}{self.ids.number('ems_call', digits=7)}",
             incident_type=incident_type,
             incident_subtype=f"{incident_type}_SUBTYPE",
             priority=random.choice(['LOW', 'MEDIUM', 'HIGH', 'EMERGENCY']),
@@ -1155,7 +1320,7 @@ class EnhancedDataGenerator:
             district=random.choice(['NORTH', 'SOUTH', 'EAST', 'WEST', 'CENTRAL']),
             responding_unit=f"MEDIC_{random.randint(1, 20)}",
             crew_members=[f"PARAMEDIC_{fake.last_name().upper()}", f"EMT_{fake.last_name().upper()}"],
-            patient_person_id=str(uuid.uuid4()),
+            patient_person_id=self.ids.uuid(),
             patient_age=random.randint(5, 85),
             patient_sex=random.choice(['M', 'F']),
             chief_complaint=random.choice(['CHEST_PAIN', 'DIFFICULTY_BREATHING', 'UNCONSCIOUS', 'INJURY', 'OVERDOSE']),
@@ -1297,8 +1462,8 @@ class EnhancedDataGenerator:
                 })
         
         return CADIncident(
-            cad_id=f"CAD-{datetime.now().year}-{random.randint(100000, 999999)}",
-            incident_number=f"24-{random.randint(10000, 99999)}",
+            cad_id=f"CAD-{datetime.now().year}-{self.ids.number('cad')}",
+            incident_number=f"24-{self.ids.number('cad_incident', digits=5)}",
             call_type=call_type,
             priority=priority,
             status='CLOSED',
@@ -1324,6 +1489,7 @@ class EnhancedDataGenerator:
             created_by_agency='KCSO'
         )
 
+    @METRICS.timed('agency.person.emergency_contact')
     def generate_emergency_contact(self, person_ethnicity):
         """Generate realistic emergency contact with consistent ethnicity for family relationships"""
         # 70% chance of family relationship (should share ethnicity), 30% chance of other relationship
@@ -1377,35 +1543,75 @@ class EnhancedDataGenerator:
         """Create cross-agency relationships"""
         pass  # Placeholder for now
 
+    def open_record_writers(self):
+        """Start streaming each entity type to every CONFIG['output_formats'] output as records are generated"""
+        fmt = CONFIG['record_format']
+        formats = CONFIG['output_formats']
+        os.makedirs(CONFIG['output_dir'], exist_ok=True)
+        if 'sqlite' in formats:
+            self.database = SqliteDatabase(os.path.join(CONFIG['output_dir'], SQLITE_DATABASE_NAME))
+        for entity_type, record_type in ENTITY_TYPES.items():
+            writers = []
+            for output_fmt in ([fmt] if 'json' in formats else []) + (['csv'] if 'csv' in formats else []):
+                writers.append(open_record_writer(
+                    record_path(CONFIG['output_dir'], entity_type, output_fmt), output_fmt, record_type,
+                    flush_every=CONFIG['record_flush_every'], ensure_ascii=False
+                ))
+            if self.database is not None:
+                writers.append(self.database.writer(entity_type, record_type))
+            self.record_writers[entity_type] = writers
+
+    def close_record_writers(self):
+        """Finish every open record file and the database (building its indexes); returns (entity type, path, count)s"""
+        written = []
+        for entity_type, writers in self.record_writers.items():
+            for writer in writers:
+                writer.close()
+                written.append((entity_type, writer.path, writer.count))
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+        self.record_writers = {}
+        return written
+
+    def add_record(self, entity_type, record):
+        """Keep a generated record and stream it out to any open writers"""
+        getattr(self, entity_type).append(record)
+        writers = self.record_writers.get(entity_type)
+        if writers:
+            row = record_to_dict(record)
+            for writer in writers:
+                writer.write(row)
+
     def save_data(self):
-        """Save data to JSON files"""
-        print("Saving data to JSON files...")
-        
-        # Convert dataclass objects to dictionaries
-        data_to_save = {
-            'persons': [asdict(p) for p in self.persons],
-            'vehicles': [asdict(v) for v in self.vehicles],
-            'properties': [asdict(p) for p in self.properties],
-            'police_incidents': [asdict(i) for i in self.police_incidents],
-            'arrests': [asdict(a) for a in self.arrests],
-            'jail_bookings': [asdict(b) for b in self.jail_bookings],
-            'fire_incidents': [asdict(f) for f in self.fire_incidents],
-            'ems_incidents': [asdict(e) for e in self.ems_incidents]
-        }
-        
-        # Save each entity type to separate JSON files
-        for entity_type, data in data_to_save.items():
-            filename = f"{entity_type}.json"
-            with open(filename, 'w', encoding='utf-8') as f:  # Add UTF-8 encoding
-                json.dump(data, f, indent=2, ensure_ascii=False)  # Set ensure_ascii=False
-            print(f"Saved {len(data)} {entity_type} to {filename}")
-        
-        # Save combined data
-        with open('all_sample_data.json', 'w', encoding='utf-8') as f:  # Add UTF-8 encoding
-            json.dump(data_to_save, f, indent=2, ensure_ascii=False)  # Set ensure_ascii=False
-        print("Saved combined data to all_sample_data.json")
-        
-        print("JSON export completed!")
+        """Save data in every CONFIG['output_formats'] format"""
+        fmt = CONFIG['record_format']
+        print(f"Saving data as {', '.join(CONFIG['output_formats'])}...")
+        
+        if not self.record_writers:
+            self.open_record_writers()
+            for entity_type, writers in self.record_writers.items():
+                for row in getattr(self, entity_type).iter_dicts():
+                    for writer in writers:
+                        writer.write(row)
+        # Records streamed during generation just need their files finished
+        for entity_type, filename, count in self.close_record_writers():
+            print(f"Saved {count} {entity_type} to {filename}")
+        
+        if fmt == 'json' and 'json' in CONFIG['output_formats']:
+            # Combined file, streamed one record at a time like the per-entity files
+            combined_path = os.path.join(CONFIG['output_dir'], 'all_sample_data.json')
+            with open(combined_path, 'w', encoding='utf-8') as f:
+                f.write('{')
+                for i, entity_type in enumerate(ENTITY_TYPES):
+                    f.write(('' if i == 0 else ',') + f'\n  {json.dumps(entity_type)}: ')
+                    with RecordWriter(stream=f, fmt='json', flush_every=CONFIG['record_flush_every'],
+                                      ensure_ascii=False, base_indent=2) as writer:
+                        writer.write_many(getattr(self, entity_type).iter_dicts())
+                f.write('\n}')
+            print(f"Saved combined data to {combined_path}")
+        
+        print("Export completed!")
 
     def generate_all_data(self):
         """Generate all comprehensive synthetic data"""
@@ -1413,91 +1619,11 @@ class EnhancedDataGenerator:
         print("Generating comprehensive data for Seattle, King County, Bellevue, and EMS scenarios")
         start_time = time.time()
         
-        # Generate persons
-        print(f"Generating {CONFIG['num_persons']:,} persons...")
-        for i in range(CONFIG['num_persons']):
-            agency = random.choices(['KCSO', 'BELLEVUE_PD'], weights=[70, 30])[0]
-            person = self.generate_person(agency)
-            self.persons.append(person)
-            
-            if (i + 1) % 10000 == 0:
-                print(f"   Generated {i + 1:,} persons...")
-        
-        # Generate vehicles
-        print(f"Generating {CONFIG['num_vehicles']:,} vehicles...")
-        for i in range(CONFIG['num_vehicles']):
-            owner_id = random.choice(self.persons).person_id if random.random() < 0.7 else None
-            vehicle = self.generate_vehicle(owner_id)
-            self.vehicles.append(vehicle)
-            
-            if (i + 1) % 10000 == 0:
-                print(f"   Generated {i + 1:,} vehicles...")
-        
-        # Generate police incidents
-        print(f"Generating {CONFIG['num_police_incidents']:,} police incidents...")
-        for i in range(CONFIG['num_police_incidents']):
-            agency = random.choices(['KCSO', 'BELLEVUE_PD'], weights=[75, 25])[0]
-            incident = self.generate_police_incident(agency)
-            self.police_incidents.append(incident)
-            
-            if (i + 1) % 10000 == 0:
-                print(f"   Generated {i + 1:,} police incidents...")
-        
-        # Generate arrests
-        print(f"Generating {CONFIG['num_arrests']:,} arrests...")
-        for i in range(CONFIG['num_arrests']):
-            person = random.choice(self.persons)
-            incident = random.choice(self.police_incidents)
-            arrest = self.generate_arrest(incident, person)
-            self.arrests.append(arrest)
-            
-            if (i + 1) % 5000 == 0:
-                print(f"   Generated {i + 1:,} arrests...")
-        
-        # Generate jail bookings
-        print(f"Generating {CONFIG['num_jail_bookings']:,} jail bookings...")
-        for i in range(CONFIG['num_jail_bookings']):
-            arrest = random.choice(self.arrests)
-            booking = self.generate_jail_booking(arrest.person_id, arrest.arrest_id, arrest.agency)
-            self.jail_bookings.append(booking)
-            
-            if (i + 1) % 5000 == 0:
-                print(f"   Generated {i + 1:,} jail bookings...")
-        
-        # Generate properties/evidence
-        print(f"Generating {CONFIG['num_properties']:,} properties/evidence...")
-        for i in range(CONFIG['num_properties']):
-            incident = random.choice(self.police_incidents) if random.random() < 0.6 else None
-            person = random.choice(self.persons) if random.random() < 0.4 else None
-            property_record = self.generate_property(
-                incident.incident_id if incident else None,
-                person.person_id if person else None,
-                random.choice(['KCSO', 'BELLEVUE_PD'])
-            )
-            self.properties.append(property_record)
-            
-            if (i + 1) % 10000 == 0:
-                print(f"   Generated {i + 1:,} properties...")
-        
-        # Generate fire incidents
-        if CONFIG['generate_fire_data']:
-            print(f"Generating {CONFIG['num_fire_incidents']:,} fire incidents...")
-            for i in range(CONFIG['num_fire_incidents']):
-                incident = self.generate_fire_incident()
-                self.fire_incidents.append(incident)
-                
-                if (i + 1) % 5000 == 0:
-                    print(f"   Generated {i + 1:,} fire incidents...")
-        
-        # Generate EMS incidents
-        if CONFIG['generate_ems_data']:
-            print(f"Generating {CONFIG['num_ems_incidents']:,} EMS incidents...")
-            for i in range(CONFIG['num_ems_incidents']):
-                incident = self.generate_ems_incident()
-                self.ems_incidents.append(incident)
-                
-                if (i + 1) % 10000 == 0:
-                    print(f"   Generated {i + 1:,} EMS incidents...")
+        # Stream each record to its outputs as it is generated; save_data finishes them
+        if CONFIG['output_formats']:
+            self.open_record_writers()
+        
+        self.run_stages(CONFIG['stage_workers'])
         
         # Create cross-agency relationships
         if CONFIG['enable_cross_agency_sharing']:
@@ -1509,6 +1635,162 @@ class EnhancedDataGenerator:
         
         self.print_summary()
 
+    def run_stages(self, num_workers=None):
+        """Generate every ENTITY_STAGES stage in seeded chunks of STAGE_CHUNK_SIZE records.
+
+        A stage starts once the stages it draws references from are done, and the chunks
+        of every started stage run side by side on num_workers processes (default: one
+        per CPU). A chunk is sent only the references it uses, one per record from each
+        dependency, drawn by the parent. Chunks are seeded by stage and index and draw
+        IDs from their own block, so the same seed gives the same records for any
+        num_workers. Finished chunks are added (and streamed out) in chunk order.
+        """
+        from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        
+        counts = {stage: CONFIG[count_key] for stage, (count_key, *_) in ENTITY_STAGES.items()}
+        if not CONFIG['generate_fire_data']:
+            counts['fire_incidents'] = 0
+        if not CONFIG['generate_ems_data']:
+            counts['ems_incidents'] = 0
+        references = {stage: [] for stage in ENTITY_STAGES}
+        finished = {stage for stage, count in counts.items() if not count}
+        contexts = {}  # started stage -> (METRICS.stage context, its info dict)
+        num_chunks = {}
+        next_chunk = {}
+        waiting = {}  # stage -> chunk index -> records finished ahead of their turn
+        pending = {}  # future -> (stage, chunk index)
+        
+        pool = None
+        generator = None
+        queued = deque()  # (future, task) still to run in this process, in submission order
+        random_state = random.getstate()
+        if num_workers > 1:
+            pool = ProcessPoolExecutor(num_workers, initializer=_init_stage_worker,
+                                       initargs=(METRICS.enabled, CONFIG['fast_vocabulary']))
+        
+        def submit(task):
+            if pool is not None:
+                return pool.submit(_run_stage_worker, task)
+            # Same seeded chunk in this process, run when the loop gets to it so only
+            # one chunk's records are held unpacked at a time
+            future = Future()
+            queued.append((future, task))
+            return future
+        
+        def start_ready_stages():
+            for stage, (_, dependencies, _, label) in ENTITY_STAGES.items():
+                if stage in contexts or stage in finished or not all(d in finished for d in dependencies):
+                    continue
+                context = METRICS.stage(stage, total=counts[stage], label=label)
+                contexts[stage] = (context, context.__enter__())
+                tasks = self._stage_tasks(stage, counts[stage], references)
+                num_chunks[stage], next_chunk[stage], waiting[stage] = len(tasks), 0, {}
+                for task in tasks:
+                    pending[submit(task)] = (stage, task[1])
+        
+        try:
+            start_ready_stages()
+            while pending:
+                if queued:
+                    future, task = queued.popleft()
+                    if generator is None:
+                        generator = EnhancedDataGenerator()
+                    future.set_result((generator.generate_stage_chunk(*task), None))
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, index = pending.pop(future)
+                    records, metrics = future.result()
+                    if metrics is not None:
+                        METRICS.merge(metrics)
+                    waiting[stage][index] = records
+                    while next_chunk[stage] in waiting[stage]:
+                        self._add_stage_records(stage, waiting[stage].pop(next_chunk[stage]), references)
+                        next_chunk[stage] += 1
+                        METRICS.progress(stage, len(getattr(self, stage)), counts[stage], label=ENTITY_STAGES[stage][3])
+                    if next_chunk[stage] == num_chunks[stage]:
+                        context, info = contexts[stage]
+                        info['records'] = len(getattr(self, stage))
+                        context.__exit__(None, None, None)
+                        finished.add(stage)
+                        start_ready_stages()
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            random.setstate(random_state)
+    
+    def _stage_tasks(self, stage, count, references):
+        """generate_stage_chunk arguments for each chunk of stage"""
+        stage_index = list(ENTITY_STAGES).index(stage)
+        num_chunks = -(-count // STAGE_CHUNK_SIZE)
+        tasks = []
+        for index in range(num_chunks):
+            chunk_count = min(STAGE_CHUNK_SIZE, count - index * STAGE_CHUNK_SIZE)
+            chunk_random = random.Random(f"stages:{self.ids.seed}:{stage}:{index}")
+            chunk_seed = chunk_random.getrandbits(64)
+            refs = {dependency: [chunk_random.choice(references[dependency]) for _ in range(chunk_count)]
+                    for dependency in ENTITY_STAGES[stage][1]}
+            ids = self.ids.for_block(index, num_chunks, stream=stage_index)
+            tasks.append((stage, index, chunk_count, chunk_seed, ids, refs))
+        return tasks
+    
+    def _add_stage_records(self, stage, records, references):
+        """Keep one chunk's records and the references later stages will draw from them"""
+        reference_type = ENTITY_STAGES[stage][2]
+        for record in records:
+            self.add_record(stage, record)
+            if reference_type is not None:
+                references[stage].append(reference_type._make(getattr(record, f) for f in reference_type._fields))
+    
+    def generate_stage_chunk(self, stage, index, count, chunk_seed, ids, refs):
+        """count records of stage from chunk_seed; refs holds, per dependency, one reference per record"""
+        random.seed(chunk_seed)
+        for n, instance in enumerate(_faker_instances()):
+            instance.seed_instance((chunk_seed << 8) | n)
+        self.ids = ids
+        return getattr(self, f"_generate_{stage}_chunk")(count, refs)
+    
+    def _generate_persons_chunk(self, count, refs):
+        persons = []
+        for _ in range(count):
+            agency = random.choices(['KCSO', 'BELLEVUE_PD'], weights=[70, 30])[0]
+            persons.append(self.generate_person(agency))
+        return persons
+    
+    def _generate_vehicles_chunk(self, count, refs):
+        return [self.generate_vehicle(person.person_id if random.random() < 0.7 else None)
+                for person in refs['persons']]
+    
+    def _generate_police_incidents_chunk(self, count, refs):
+        incidents = []
+        for _ in range(count):
+            agency = random.choices(['KCSO', 'BELLEVUE_PD'], weights=[75, 25])[0]
+            incidents.append(self.generate_police_incident(agency))
+        return incidents
+    
+    def _generate_arrests_chunk(self, count, refs):
+        return [self.generate_arrest(incident, person)
+                for person, incident in zip(refs['persons'], refs['police_incidents'])]
+    
+    def _generate_jail_bookings_chunk(self, count, refs):
+        return [self.generate_jail_booking(arrest.person_id, arrest.arrest_id, arrest.agency)
+                for arrest in refs['arrests']]
+    
+    def _generate_properties_chunk(self, count, refs):
+        properties = []
+        for person, incident in zip(refs['persons'], refs['police_incidents']):
+            incident_id = incident.incident_id if random.random() < 0.6 else None
+            person_id = person.person_id if random.random() < 0.4 else None
+            properties.append(self.generate_property(incident_id, person_id, random.choice(['KCSO', 'BELLEVUE_PD'])))
+        return properties
+    
+    def _generate_fire_incidents_chunk(self, count, refs):
+        return [self.generate_fire_incident() for _ in range(count)]
+    
+    def _generate_ems_incidents_chunk(self, count, refs):
+        return [self.generate_ems_incident() for _ in range(count)]
+
     def print_summary(self):
         """Print comprehensive data summary"""
         print(f"\n" + "="*80)
@@ -1531,26 +1813,26 @@ class EnhancedDataGenerator:
         
         # Agency breakdown
         if self.persons:
-            agency_counts = Counter(p.created_by_agency for p in self.persons)
+            agency_counts = Counter(self.persons.column('created_by_agency'))
             print(f"\nPersons by Creating Agency:")
             for agency, count in agency_counts.items():
                 print(f"  • {agency}: {count:,}")
         
         # Incident type breakdown
         if self.police_incidents:
-            incident_counts = Counter(i.incident_type for i in self.police_incidents)
+            incident_counts = Counter(self.police_incidents.column('incident_type'))
             print(f"\nTop Police Incident Types:")
             for inc_type, count in incident_counts.most_common(5):
                 print(f"  • {inc_type}: {count:,}")
         
         if self.fire_incidents:
-            fire_counts = Counter(i.incident_type for i in self.fire_incidents)
+            fire_counts = Counter(self.fire_incidents.column('incident_type'))
             print(f"\nTop Fire Incident Types:")
             for inc_type, count in fire_counts.most_common(3):
                 print(f"  • {inc_type}: {count:,}")
         
         if self.ems_incidents:
-            ems_counts = Counter(i.incident_type for i in self.ems_incidents)
+            ems_counts = Counter(self.ems_incidents.column('incident_type'))
             print(f"\nTop EMS Incident Types:")
             for inc_type, count in ems_counts.most_common(5):
                 print(f"  • {inc_type}: {count:,}")
@@ -1563,6 +1845,12 @@ def main():
     print("Generating comprehensive data for Seattle, King County, Bellevue, and EMS scenarios")
     print(f"Configuration: {CONFIG}")
     
+    METRICS.add_observer(print_progress)
+    if CONFIG['metrics_path']:
+        METRICS.enable()
+    if CONFIG['fast_vocabulary']:
+        use_fast_vocabulary()
+    
     generator = EnhancedDataGenerator()
     
     try:
@@ -1576,11 +1864,11 @@ def main():
         print("Files created:")
         
         if 'json' in CONFIG['output_formats']:
-            print("   • *.json files for each data type")
+            print(f"   • *.{CONFIG['record_format']} files for each data type")
         if 'csv' in CONFIG['output_formats']:
             print("   • *.csv files for each data type")
         if 'sqlite' in CONFIG['output_formats']:
-            print("   • multi_agency_data.db (SQLite database)")
+            print(f"   • {SQLITE_DATABASE_NAME} (SQLite database, one table per data type)")
         
         total = sum([
             len(generator.persons),
@@ -1595,6 +1883,10 @@ def main():
 
         print(f"\nTotal records: {total:,}")
         
+        if CONFIG['metrics_path']:
+            METRICS.dump_json(CONFIG['metrics_path'])
+            print(f"Metrics written to {CONFIG['metrics_path']}")
+        
     except Exception as e:
         print(f"Error during generation: {str(e)}")
         raise
@@ -0,0 +1,239 @@
+"""
+Vocabulary
+
+Faker-free fast path for the fields the generators draw on every record:
+names by locale and sex, SSNs, phone digits, zip codes, email domains,
+timestamps and birth dates.
+- Word lists are read once from the Faker locale's own providers (with Faker's
+  frequency weights where it has them) into NumPy arrays
+- Draws come from a seeded NumPy Generator BATCH_SIZE at a time per field and are
+  handed out one by one, so per-record code keeps calling fake.last_name() etc.
+- Numeric fields use the same ranges and formats as the Faker providers
+
+FastFaker wraps a Faker instance; anything it doesn't implement (company(),
+sentence(), ...) is delegated to the wrapped instance.
+"""
+
+import re
+import random
+from datetime import date, datetime, timedelta
+
+# Values drawn per refill of one field's buffer
+BATCH_SIZE = 1024
+
+# Faker method -> provider word list it draws from (the base Provider implementations)
+WORD_LISTS = {
+    'first_name': 'first_names',
+    'first_name_male': 'first_names_male',
+    'first_name_female': 'first_names_female',
+    'last_name': 'last_names',
+    'free_email_domain': 'free_email_domains',
+}
+
+# Faker relative dates ('-30d', '+2y', ...); a year is 365.25 days as in Faker
+_RELATIVE_DATE = re.compile(r'^([+-]?\d+)([ywdhms])$')
+_RELATIVE_UNITS = {'y': 365.25 * 86400, 'w': 7 * 86400, 'd': 86400, 'h': 3600, 'm': 60, 's': 1}
+
+# Word lists by (provider class, method), shared by every FastFaker
+_VOCABULARIES = {}
+
+
+class Vocabulary:
+    """One word list as a NumPy array, plus the cumulative distribution of its weights (None = uniform)"""
+
+    def __init__(self, elements):
+        import numpy as np
+        if isinstance(elements, dict):
+            weights = np.array(list(elements.values()), dtype=float)
+            self.cdf = np.cumsum(weights) / weights.sum()
+            elements = list(elements.keys())
+        else:
+            self.cdf = None
+        self.values = np.empty(len(elements), dtype=object)
+        self.values[:] = list(elements)
+
+    def __len__(self):
+        return len(self.values)
+
+    def sample(self, rng, size):
+        """List of size values drawn with rng"""
+        import numpy as np
+        if self.cdf is None:
+            picks = rng.integers(0, len(self.values), size=size)
+        else:
+            picks = np.minimum(np.searchsorted(self.cdf, rng.random(size), side='right'), len(self.values) - 1)
+        return self.values[picks].tolist()
+
+
+def provider_vocabulary(faker, method):
+    """Vocabulary behind faker.<method>(), or None if that method isn't a plain word-list draw"""
+    bound = getattr(faker, method)
+    provider = bound.__self__
+    key = (type(provider), method)
+    if key not in _VOCABULARIES:
+        vocabulary = None
+        words = getattr(provider, WORD_LISTS[method], None)
+        pairs = getattr(provider, f"{method}_pairs", None)
+        base = next((getattr(cls, method) for cls in reversed(type(provider).__mro__) if method in vars(cls)), None)
+        if words is not None and bound.__func__ is base:
+            vocabulary = Vocabulary(words)
+        elif pairs is not None:
+            # ja_JP draws (kanji, kana, romaji) pairs and returns the first element
+            if isinstance(pairs, dict):
+                weights = {}
+                for pair, weight in pairs.items():
+                    weights[pair[0]] = weights.get(pair[0], 0) + weight
+                vocabulary = Vocabulary(weights)
+            else:
+                vocabulary = Vocabulary([pair[0] for pair in pairs])
+        _VOCABULARIES[key] = vocabulary
+    return _VOCABULARIES[key]
+
+
+class FastFaker:
+    """Faker stand-in serving the generators' hot methods from batched NumPy draws.
+
+    seed_instance() reseeds both the draws and the wrapped Faker, so seeded
+    output stays reproducible; unsupported methods fall through to the wrapped Faker.
+    """
+
+    def __init__(self, faker, seed=None, batch_size=BATCH_SIZE):
+        self._faker = faker
+        self._batch_size = batch_size
+        self._draws = {}  # key -> remaining draws of the current batch, last one next
+        self._rng = None
+        self._seed = seed
+        self._vocabularies = {}  # method -> Vocabulary, or None to call Faker
+        self._states_postcode = None
+
+    def __getattr__(self, name):
+        return getattr(self._faker, name)
+
+    def seed_instance(self, seed=None):
+        self._faker.seed_instance(seed)
+        self._seed = seed
+        self._rng = None
+        self._draws = {}
+
+    def _next(self, key, refill, *args):
+        """Next value of the draws under key; refill(rng, size, *args) makes a new batch when they run out"""
+        draws = self._draws.get(key)
+        if not draws:
+            if self._rng is None:
+                import numpy as np
+                self._rng = np.random.default_rng(self._seed if self._seed is not None else random.getrandbits(128))
+            draws = self._draws[key] = refill(self._rng, self._batch_size, *args)
+            draws.reverse()
+        return draws.pop()
+
+    def _word(self, method):
+        vocabulary = self._vocabularies.get(method, False)
+        if vocabulary is False:
+            vocabulary = self._vocabularies[method] = provider_vocabulary(self._faker, method)
+        if vocabulary is None:
+            return getattr(self._faker, method)()
+        return self._next(method, vocabulary.sample)
+
+    # Names and words
+
+    def first_name(self):
+        return self._word('first_name')
+
+    def first_name_male(self):
+        return self._word('first_name_male')
+
+    def first_name_female(self):
+        return self._word('first_name_female')
+
+    def last_name(self):
+        return self._word('last_name')
+
+    def free_email_domain(self):
+        return self._word('free_email_domain')
+
+    # Numbers
+
+    def ssn(self):
+        return self._next('ssn', _ssns)
+
+    def msisdn(self):
+        return self._next('msisdn', _digit_strings, 13)
+
+    def zipcode_in_state(self, state_abbr=None):
+        if self._states_postcode is None:
+            self._states_postcode = getattr(self._faker.zipcode_in_state.__self__, 'states_postcode', {})
+        postcode_range = self._states_postcode.get(state_abbr)
+        if postcode_range is None:
+            return self._faker.zipcode_in_state(state_abbr)
+        return self._next(('zipcode', state_abbr), _zipcodes, *postcode_range)
+
+    # Dates
+
+    def date_time_between(self, start_date='-30y', end_date='now'):
+        start, end = _parse_datetime(start_date), _parse_datetime(end_date)
+        return start + timedelta(seconds=self._next('uniform', _uniforms) * (end - start).total_seconds())
+
+    def date_between(self, start_date='-30y', end_date='today'):
+        start, end = _parse_datetime(start_date).date(), _parse_datetime(end_date).date()
+        return start + timedelta(days=int(self._next('uniform', _uniforms) * ((end - start).days + 1)))
+
+    def date_of_birth(self, minimum_age=0, maximum_age=115):
+        """Birth date for an age in [minimum_age, maximum_age] as of today"""
+        return self._next(('date_of_birth', date.today(), minimum_age, maximum_age), _dates_of_birth,
+                          date.today(), minimum_age, maximum_age)
+
+
+# Batch refills: (rng, size, *args) -> list of values
+
+def _uniforms(rng, size):
+    return rng.random(size).tolist()
+
+
+def _ssns(rng, size):
+    """US SSNs as faker.providers.ssn.en_US draws them: area 001-899 except 666, group 01-99, serial 0001-9999"""
+    areas = rng.integers(1, 900, size=size)
+    areas[areas == 666] += 1
+    return [f"{area:03d}-{group:02d}-{serial:04d}" for area, group, serial in
+            zip(areas.tolist(), rng.integers(1, 100, size=size).tolist(), rng.integers(1, 10000, size=size).tolist())]
+
+
+def _digit_strings(rng, size, length):
+    return [f"{value:0{length}d}" for value in rng.integers(0, 10 ** length, size=size, dtype='int64').tolist()]
+
+
+def _zipcodes(rng, size, low, high):
+    return [f"{value:05d}" for value in rng.integers(low, high + 1, size=size).tolist()]
+
+
+def _dates_of_birth(rng, size, today, minimum_age, maximum_age):
+    """Faker's date_of_birth: uniform between (maximum_age + 1) and minimum_age years ago, never the first day"""
+    start = _change_year(today, -(maximum_age + 1))
+    end = _change_year(today, -minimum_age)
+    first = start.toordinal()
+    offsets = rng.integers(0, (end - start).days, size=size)
+    offsets[offsets == 0] = 1
+    return [date.fromordinal(first + offset) for offset in offsets.tolist()]
+
+
+def _change_year(day, years):
+    try:
+        return day.replace(year=day.year + years)
+    except ValueError:
+        return day.replace(year=day.year + years, day=28)  # Feb 29 in a non-leap year
+
+
+def _parse_datetime(value):
+    """datetime for a Faker date argument: datetime, date, timedelta, 'now'/'today' or a relative '-30d'"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    now = datetime.now()
+    if isinstance(value, timedelta):
+        return now + value
+    if value in ('now', 'today'):
+        return now
+    match = _RELATIVE_DATE.match(value)
+    if match is None:
+        raise ValueError(f"Unsupported date: {value!r}")
+    return now + timedelta(seconds=int(match.group(1)) * _RELATIVE_UNITS[match.group(2)])